@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""Benchmark generated ``from_dict`` parsing against a baseline revision.
+
+Compares parse throughput of the generated models in the working tree with
+the same model modules as they were at a git revision (``HEAD`` by default),
+so the effect of a regeneration or post-processing change can be measured
+before committing it. Payloads are synthetic: every scalar field of the model
+is populated, nested lists are left out.
+
+Usage:
+    python scripts/benchmark_from_dict.py
+    python scripts/benchmark_from_dict.py --baseline-ref v0.13.0 --rows 20000
+    python scripts/benchmark_from_dict.py --model products_response_dto
+"""
+
+import argparse
+import datetime
+import importlib
+import subprocess
+import sys
+import time
+import types
+import uuid
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import attrs
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+MODELS_PACKAGE = "stocktrim_public_api_client.generated.models"
+DEFAULT_MODELS = ["sku_optimized_results_dto", "products_response_dto"]
+
+
+def _sample_value(annotation: str, index: int) -> Any:
+    """Plausible value for a field annotated with ``annotation``, or None."""
+    if annotation.startswith(("list[", "dict[")):
+        return None
+    if "datetime.datetime" in annotation:
+        return datetime.datetime(2024, 1, 1, tzinfo=datetime.UTC) + datetime.timedelta(
+            minutes=index
+        )
+    if "datetime.date" in annotation:
+        return datetime.date(2024, 1, 1) + datetime.timedelta(days=index % 365)
+    if "UUID" in annotation:
+        return uuid.UUID(int=index)
+    for type_name, value in (
+        ("bool", index % 2 == 0),
+        ("int", index),
+        ("float", index * 1.5),
+        ("str", f"SKU-{index:06d}"),
+    ):
+        if type_name in annotation.split(" | "):
+            return value
+    return None
+
+
+def sample_payload(model: type, index: int = 0) -> dict[str, Any]:
+    """Build the JSON dict of a ``model`` instance with every scalar field set.
+
+    Args:
+        model: Generated attrs model class.
+        index: Varies the values so rows are not identical.
+
+    Returns:
+        The instance's ``to_dict()`` output, i.e. an API-shaped payload.
+    """
+    kwargs = {}
+    for field in attrs.fields(model):
+        if not field.init:
+            continue
+        value = _sample_value(str(field.type), index)
+        if value is not None:
+            kwargs[field.name] = value
+    return model(**kwargs).to_dict()
+
+
+def load_baseline(module_name: str, ref: str) -> types.ModuleType:
+    """Import ``MODELS_PACKAGE.module_name`` as it was at git revision ``ref``."""
+    path = f"{MODELS_PACKAGE.replace('.', '/')}/{module_name}.py"
+    source = subprocess.run(
+        ["git", "show", f"{ref}:{path}"],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    module = types.ModuleType(f"{MODELS_PACKAGE}._baseline_{module_name}")
+    module.__package__ = MODELS_PACKAGE
+    exec(compile(source, f"{ref}:{path}", "exec"), module.__dict__)
+    return module
+
+
+def _model_class(module: types.ModuleType) -> type:
+    """The attrs model class defined in a generated model module."""
+    return next(
+        obj
+        for obj in vars(module).values()
+        if isinstance(obj, type)
+        and attrs.has(obj)
+        and obj.__module__ == module.__name__
+    )
+
+
+def measure(
+    parse: Callable[[dict[str, Any]], Any], payloads: list, repeat: int
+) -> float:
+    """Best-of-``repeat`` rows per second for ``parse`` over ``payloads``."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for payload in payloads:
+            parse(payload)
+        best = min(best, time.perf_counter() - start)
+    return len(payloads) / best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--baseline-ref", default="HEAD", help="git revision")
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--model",
+        action="append",
+        dest="models",
+        help=f"model module name (default: {', '.join(DEFAULT_MODELS)})",
+    )
+    args = parser.parse_args()
+
+    print(f"Baseline: {args.baseline_ref}   rows: {args.rows}   best of {args.repeat}")
+    print(f"{'model':<32}{'baseline rows/s':>18}{'current rows/s':>18}{'speedup':>10}")
+    for module_name in args.models or DEFAULT_MODELS:
+        current = _model_class(
+            importlib.import_module(f"{MODELS_PACKAGE}.{module_name}")
+        )
+        baseline = _model_class(load_baseline(module_name, args.baseline_ref))
+        payloads = [sample_payload(current, i) for i in range(args.rows)]
+
+        # Both versions must produce the same model before timing means anything
+        for payload in payloads[:100]:
+            if (
+                baseline.from_dict(payload).to_dict()
+                != current.from_dict(payload).to_dict()
+            ):
+                sys.exit(f"❌ {module_name}: parse results differ from baseline")
+
+        old = measure(baseline.from_dict, payloads, args.repeat)
+        new = measure(current.from_dict, payloads, args.repeat)
+        print(f"{current.__name__:<32}{old:>18,.0f}{new:>18,.0f}{new / old:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
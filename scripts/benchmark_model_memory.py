@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""Measure memory retained by parsed models for each generator model option.
+
+Parses a synthetic catalog (100k ``ProductsResponseDto`` rows by default) from
+JSON and reports the memory still held once only the parsed rows remain. The
+checked-in models are compared with the same modules rewritten for the
+``--frozen`` / ``--compact`` options of ``regenerate_client.py``, alongside
+plain JSON dicts and lazy views for reference.
+
+Usage:
+    python scripts/benchmark_model_memory.py
+    python scripts/benchmark_model_memory.py --rows 20000 \
+        --model sku_optimized_results_dto
+"""
+
+import argparse
+import gc
+import importlib
+import inspect
+import json
+import sys
+import time
+import tracemalloc
+import types
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from benchmark_from_dict import MODELS_PACKAGE, _model_class, sample_payload
+from regenerate_client import apply_model_options
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from stocktrim_public_api_client.lazy_models import lazy_model  # noqa: E402
+
+VARIANTS = {
+    "default": {},
+    "frozen": {"frozen": True},
+    "compact": {"compact": True},
+    "frozen + compact": {"frozen": True, "compact": True},
+}
+
+
+def load_variant(module_name: str, **options: bool) -> type:
+    """Model class of ``module_name`` rewritten with the given model options."""
+    module = importlib.import_module(f"{MODELS_PACKAGE}.{module_name}")
+    source = apply_model_options(inspect.getsource(module), **options)
+    variant = types.ModuleType(f"{module.__name__}_{'_'.join(options) or 'default'}")
+    variant.__package__ = MODELS_PACKAGE
+    exec(compile(source, module.__file__ or module_name, "exec"), variant.__dict__)
+    return _model_class(variant)
+
+
+def retained_bytes(build: Callable[[list[dict[str, Any]]], list], data: bytes) -> int:
+    """Bytes still allocated after decoding ``data`` and building the rows.
+
+    The decoded JSON list is dropped once ``build`` returns, as it would be
+    after a real API call, so only what the rows keep alive is counted.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        rows = build(json.loads(data))
+        gc.collect()
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del rows
+    return current
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--model", default="products_response_dto")
+    args = parser.parse_args()
+
+    model = _model_class(importlib.import_module(f"{MODELS_PACKAGE}.{args.model}"))
+    data = json.dumps([sample_payload(model, i) for i in range(args.rows)]).encode()
+    lazy = lazy_model(model)
+
+    builds: dict[str, Callable[[list[dict[str, Any]]], list]] = {
+        "JSON dicts": lambda rows: rows,
+        "lazy views": lambda rows: [lazy(row) for row in rows],
+    }
+    for name, options in VARIANTS.items():
+        variant = load_variant(args.model, **options)
+        builds[name] = lambda rows, cls=variant: [cls.from_dict(row) for row in rows]
+
+    print(f"{model.__name__}   rows: {args.rows:,}   JSON: {len(data) / 1e6:,.1f} MB")
+    print(f"{'representation':<20}{'retained MB':>14}{'bytes/row':>12}{'parse s':>10}")
+    for name, build in builds.items():
+        start = time.perf_counter()
+        size = retained_bytes(build, data)
+        elapsed = time.perf_counter() - start
+        print(
+            f"{name:<20}{size / 1e6:>14,.1f}{size / args.rows:>12,.0f}{elapsed:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -12,16 +12,26 @@ This script:
    - Fixes all imports to use client_types
    - Modernizes Union types to use | syntax
    - Fixes RST docstring formatting
+   - Inlines/hoists the per-field parser closures in model from_dict methods
+   - Records each model's attribute -> JSON key map (``_JSON_KEYS``)
+   - Optionally makes models frozen (--frozen) and/or compact (--compact)
 6. Runs ruff auto-fixes
 7. Validates the generated code with tests
+
+Usage:
+    python scripts/regenerate_client.py [--frozen] [--compact]
 """
 
+import argparse
+import ast
+import builtins
 import logging
 import re
 import shutil
 import subprocess
 import sys
 import tempfile
+import textwrap
 from pathlib import Path
 
 import httpx
@@ -725,8 +735,16 @@ def post_process_generated_docstrings(workspace_path: Path) -> bool:
     return True
 
 
-def fix_specific_generated_issues(workspace_path: Path) -> bool:
-    """Fix specific issues in generated code."""
+def fix_specific_generated_issues(
+    workspace_path: Path, *, frozen: bool = False, compact: bool = False
+) -> bool:
+    """Fix specific issues in generated code.
+
+    Args:
+        workspace_path: Root of the workspace holding the client package.
+        frozen: Generate immutable models (see :func:`apply_model_options`).
+        compact: Generate compact models (see :func:`apply_model_options`).
+    """
     logger.info("Fixing specific generated code issues")
 
     # Fix 1: Modernize Union types to use | syntax in client_types.py (at package root)
@@ -772,6 +790,15 @@ def fix_specific_generated_issues(workspace_path: Path) -> bool:
     # Modernize (str, Enum) → StrEnum (Python 3.11+; satisfies ruff UP042)
     _modernize_str_enum_classes(workspace_path)
 
+    # Stop from_dict() re-creating a closure per field on every call
+    _hoist_from_dict_parsers(workspace_path)
+
+    # Record each model's attribute -> JSON key map for lazy/columnar decoding
+    _emit_json_keys(workspace_path)
+
+    # Opt-in lower-overhead model variants
+    _apply_model_options(workspace_path, frozen=frozen, compact=compact)
+
     logger.info("✅ Fixed specific generated code issues")
     return True
 
@@ -890,6 +917,538 @@ def _fix_from_dict_type_issues(workspace_path: Path) -> None:
     )
 
 
+def _hoist_from_dict_parsers(workspace_path: Path) -> None:
+    """Remove the per-call parser closures from generated ``from_dict`` methods.
+
+    openapi-python-client emits a nested ``def _parse_<field>(data)`` for every
+    nullable field, so each ``from_dict`` call allocates dozens of function
+    objects before it parses anything (~80 for ``SkuOptimizedResultsDto``).
+    See :func:`optimize_from_dict_parsers` for the rewrite.
+    """
+    logger.info("Hoisting parser closures out of generated from_dict methods")
+
+    models_dir = workspace_path / "stocktrim_public_api_client" / "generated" / "models"
+    if not models_dir.exists():
+        logger.warning(f"⚠️  Models directory not found: {models_dir}")
+        return
+
+    total_inlined = total_hoisted = 0
+    for model_file in sorted(models_dir.glob("*.py")):
+        try:
+            content = model_file.read_text()
+            new_content, inlined, hoisted = optimize_from_dict_parsers(content)
+            if new_content != content:
+                model_file.write_text(new_content)
+                total_inlined += inlined
+                total_hoisted += hoisted
+        except Exception as e:
+            logger.warning(f"⚠️  Failed to optimize {model_file.name}: {e}")
+
+    logger.info(
+        f"   ✅ Inlined {total_inlined} and hoisted {total_hoisted} "
+        "from_dict parser closure(s)"
+    )
+
+
+_PASSTHROUGH_GUARDS = """
+if data is None:
+    return data
+if isinstance(data, Unset):
+    return data
+"""
+
+
+def optimize_from_dict_parsers(source: str) -> tuple[str, int, int]:
+    """Rewrite the nested ``_parse_*`` closures of a generated model module.
+
+    Two rewrites are applied to each ``_parse_*`` function defined directly
+    inside a ``from_dict`` method:
+
+    - Pass-through parsers (return ``data`` unchanged whatever it is, the
+      common case for nullable scalars) are dropped and their call site
+      becomes an annotated assignment: ``name: None | str | Unset = d.pop(...)``.
+    - Parsers that only use module-level names (datetime, UUID and enum
+      parsing) are moved to module level so they are created once at import.
+
+    Parsers that depend on names imported inside ``from_dict`` (nested models,
+    imported locally to avoid import cycles) are left in place.
+
+    Args:
+        source: Source code of one generated model module.
+
+    Returns:
+        Tuple of (new source, parsers inlined, parsers hoisted).
+    """
+    tree = ast.parse(source)
+    lines = source.splitlines(keepends=True)
+    module_names = _module_level_names(tree)
+    guards = ast.dump(ast.parse(_PASSTHROUGH_GUARDS))
+
+    # (first line, last line, replacement) using 1-based inclusive line numbers
+    edits: list[tuple[int, int, str]] = []
+    hoisted_defs: list[str] = []
+    inlined = 0
+
+    for cls in (node for node in tree.body if isinstance(node, ast.ClassDef)):
+        from_dict = next(
+            (
+                node
+                for node in cls.body
+                if isinstance(node, ast.FunctionDef) and node.name == "from_dict"
+            ),
+            None,
+        )
+        if from_dict is None:
+            continue
+        local_names = _bound_names(from_dict)
+
+        for parser in from_dict.body:
+            if not (
+                isinstance(parser, ast.FunctionDef)
+                and parser.name.startswith("_parse_")
+                and len(parser.args.args) == 1
+            ):
+                continue
+
+            call_sites = _call_sites(from_dict, parser.name)
+            if call_sites is None:
+                continue
+
+            removal = _statement_lines(parser, lines)
+            param = parser.args.args[0].arg
+            passthrough_type = _passthrough_type(parser, param, guards, source)
+
+            targets = [
+                target.id
+                for site in call_sites
+                if isinstance(target := site.targets[0], ast.Name)
+            ]
+            if passthrough_type is not None and len(targets) == len(call_sites):
+                for site, target in zip(call_sites, targets, strict=True):
+                    value = ast.get_source_segment(source, site.value.args[0])
+                    indent = " " * site.col_offset
+                    edits.append(
+                        (
+                            site.lineno,
+                            site.end_lineno or site.lineno,
+                            f"{indent}{target}: {passthrough_type} = {value}\n",
+                        )
+                    )
+                edits.append((*removal, ""))
+                inlined += 1
+                continue
+
+            if parser.name not in module_names and _is_hoistable(
+                parser, local_names, module_names
+            ):
+                segment = "".join(lines[parser.lineno - 1 : parser.end_lineno])
+                hoisted_defs.append(textwrap.dedent(segment))
+                module_names.add(parser.name)
+                edits.append((*removal, ""))
+
+    if not edits:
+        return source, 0, 0
+
+    for first, last, replacement in sorted(edits, reverse=True):
+        lines[first - 1 : last] = [replacement] if replacement else []
+
+    new_source = "".join(lines)
+    if hoisted_defs:
+        new_source = new_source.rstrip("\n") + "\n\n\n" + "\n\n".join(hoisted_defs)
+    return new_source, inlined, len(hoisted_defs)
+
+
+def _module_level_names(tree: ast.Module) -> set[str]:
+    """Names bound at module level, including ``if TYPE_CHECKING:`` imports."""
+    names: set[str] = set()
+    for node in tree.body:
+        statements = node.body if isinstance(node, ast.If) else [node]
+        for stmt in statements:
+            if isinstance(stmt, ast.Import | ast.ImportFrom):
+                names.update(
+                    (alias.asname or alias.name).split(".")[0] for alias in stmt.names
+                )
+            elif isinstance(stmt, ast.FunctionDef | ast.ClassDef):
+                names.add(stmt.name)
+            elif isinstance(stmt, ast.Assign):
+                names.update(
+                    target.id for target in stmt.targets if isinstance(target, ast.Name)
+                )
+    return names
+
+
+def _bound_names(function: ast.FunctionDef) -> set[str]:
+    """Names bound directly in ``function``'s own scope."""
+    names = {arg.arg for arg in function.args.args}
+    for stmt in function.body:
+        for node in ast.walk(stmt):
+            if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Store):
+                names.add(node.id)
+            elif isinstance(node, ast.Import | ast.ImportFrom):
+                names.update(alias.asname or alias.name for alias in node.names)
+            elif isinstance(node, ast.FunctionDef) and node is not function:
+                names.add(node.name)
+    return names
+
+
+def _call_sites(function: ast.FunctionDef, name: str) -> list[ast.Assign] | None:
+    """Statements of the form ``x = name(arg)`` in ``function``.
+
+    Returns None if ``name`` is used in any other way.
+    """
+    sites = [
+        stmt
+        for stmt in function.body
+        if isinstance(stmt, ast.Assign)
+        and len(stmt.targets) == 1
+        and isinstance(stmt.value, ast.Call)
+        and isinstance(stmt.value.func, ast.Name)
+        and stmt.value.func.id == name
+        and len(stmt.value.args) == 1
+        and not stmt.value.keywords
+    ]
+    uses = sum(
+        1
+        for node in ast.walk(function)
+        if isinstance(node, ast.Name)
+        and node.id == name
+        and isinstance(node.ctx, ast.Load)
+    )
+    return sites if sites and uses == len(sites) else None
+
+
+def _passthrough_type(
+    parser: ast.FunctionDef, param: str, guards: str, source: str
+) -> str | None:
+    """Declared type if ``parser`` returns its argument unchanged, else None."""
+    if param != "data" or len(parser.body) != 3:
+        return None
+    if ast.dump(ast.Module(body=parser.body[:2], type_ignores=[])) != guards:
+        return None
+    final = parser.body[2]
+    if not (
+        isinstance(final, ast.Return)
+        and isinstance(final.value, ast.Call)
+        and isinstance(final.value.func, ast.Name)
+        and final.value.func.id == "cast"
+        and len(final.value.args) == 2
+        and isinstance(final.value.args[1], ast.Name)
+        and final.value.args[1].id == param
+    ):
+        return None
+    return ast.get_source_segment(source, final.value.args[0])
+
+
+def _is_hoistable(
+    parser: ast.FunctionDef, local_names: set[str], module_names: set[str]
+) -> bool:
+    """Whether ``parser`` only needs names available at module level."""
+    own_names = _bound_names(parser)
+    for stmt in parser.body:
+        for node in ast.walk(stmt):
+            if (
+                isinstance(node, ast.Name)
+                and isinstance(node.ctx, ast.Load)
+                and node.id not in own_names
+                and node.id in local_names
+            ):
+                return False
+    annotations = [arg.annotation for arg in parser.args.args] + [parser.returns]
+    for annotation in filter(None, annotations):
+        for node in ast.walk(annotation):
+            if (
+                isinstance(node, ast.Name)
+                and node.id not in module_names
+                and not hasattr(builtins, node.id)
+            ):
+                return False
+    return True
+
+
+def _statement_lines(node: ast.stmt, lines: list[str]) -> tuple[int, int]:
+    """Line span of ``node`` plus one trailing blank line, if present."""
+    last = node.end_lineno or node.lineno
+    if last < len(lines) and not lines[last].strip():
+        last += 1
+    return node.lineno, last
+
+
+def _emit_json_keys(workspace_path: Path) -> None:
+    """Add a ``_JSON_KEYS`` class attribute to every generated model.
+
+    See :func:`emit_json_keys` for the attribute it adds.
+    """
+    logger.info("Emitting JSON key maps for generated models")
+
+    models_dir = workspace_path / "stocktrim_public_api_client" / "generated" / "models"
+    if not models_dir.exists():
+        logger.warning(f"⚠️  Models directory not found: {models_dir}")
+        return
+
+    changed = 0
+    for model_file in sorted(models_dir.glob("*.py")):
+        try:
+            content = model_file.read_text()
+            new_content = emit_json_keys(content)
+            if new_content != content:
+                model_file.write_text(new_content)
+                changed += 1
+        except Exception as e:
+            logger.warning(f"⚠️  Failed to emit JSON keys for {model_file.name}: {e}")
+
+    logger.info(f"   ✅ Emitted JSON key maps in {changed} model file(s)")
+
+
+def emit_json_keys(source: str) -> str:
+    """Add ``_JSON_KEYS = {attribute name: JSON key}`` to each generated model.
+
+    The keys are taken from the ``field_dict["key"] = name`` and
+    ``field_dict.update({"key": name, ...})`` statements of ``to_dict``. The
+    generator's snake_case conversion can't be inverted in general
+    (``last120Days`` and ``2ndOrder`` both end up with the number as a
+    separate word), so consumers such as
+    :func:`stocktrim_public_api_client.lazy_models.json_keys` read this map
+    instead of guessing.
+
+    Classes without a ``to_dict`` (enums) and classes that already have a
+    ``_JSON_KEYS`` attribute are left unchanged.
+
+    Args:
+        source: Source code of one generated model module.
+
+    Returns:
+        The rewritten source.
+    """
+    tree = ast.parse(source)
+    lines = source.splitlines(keepends=True)
+    inserts: list[tuple[int, str]] = []
+
+    for cls in (node for node in tree.body if isinstance(node, ast.ClassDef)):
+        to_dict = next(
+            (
+                node
+                for node in cls.body
+                if isinstance(node, ast.FunctionDef) and node.name == "to_dict"
+            ),
+            None,
+        )
+        if to_dict is None or any(
+            isinstance(node, ast.AnnAssign)
+            and isinstance(node.target, ast.Name)
+            and node.target.id == "_JSON_KEYS"
+            for node in cls.body
+        ):
+            continue
+
+        keys = _to_dict_keys(to_dict)
+        indent = " " * to_dict.col_offset
+        entries = "".join(
+            f'{indent}    "{name}": "{key}",\n' for name, key in keys.items()
+        )
+        first_line = min([to_dict.lineno, *(d.lineno for d in to_dict.decorator_list)])
+        inserts.append(
+            (
+                first_line,
+                f"{indent}_JSON_KEYS: ClassVar[dict[str, str]] = {{\n"
+                f"{entries}{indent}}}\n\n",
+            )
+        )
+
+    if not inserts:
+        return source
+
+    for line, text in sorted(inserts, reverse=True):
+        lines.insert(line - 1, text)
+    return _import_from_typing("".join(lines), "ClassVar")
+
+
+def _to_dict_keys(to_dict: ast.FunctionDef) -> dict[str, str]:
+    """``{variable name: JSON key}`` written to ``field_dict`` in ``to_dict``."""
+    pairs: list[tuple[ast.expr | None, ast.expr]] = []
+    for node in ast.walk(to_dict):
+        if (
+            isinstance(node, ast.Assign)
+            and len(node.targets) == 1
+            and isinstance(target := node.targets[0], ast.Subscript)
+            and isinstance(target.value, ast.Name)
+            and target.value.id == "field_dict"
+        ):
+            pairs.append((target.slice, node.value))
+        elif (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Attribute)
+            and node.func.attr == "update"
+            and isinstance(node.func.value, ast.Name)
+            and node.func.value.id == "field_dict"
+            and len(node.args) == 1
+            and isinstance(node.args[0], ast.Dict)
+        ):
+            pairs.extend(zip(node.args[0].keys, node.args[0].values, strict=True))
+
+    keys: dict[str, str] = {}
+    for key, value in pairs:
+        if (
+            isinstance(key, ast.Constant)
+            and isinstance(key.value, str)
+            and isinstance(value, ast.Name)
+        ):
+            keys.setdefault(value.id, key.value)
+    return keys
+
+
+def _import_from_typing(source: str, name: str) -> str:
+    """Add ``name`` to the module's ``from typing import ...`` line."""
+    match = re.search(r"^from typing import (.+)$", source, flags=re.MULTILINE)
+    if match is None:
+        return source.replace(
+            "from __future__ import annotations\n",
+            f"from __future__ import annotations\n\nfrom typing import {name}\n",
+            1,
+        )
+    names = {n.strip() for n in match.group(1).split(",")}
+    if name in names:
+        return source
+    # isort order: constants, then classes, then functions
+    ordered = sorted(
+        names | {name}, key=lambda n: (not n.isupper(), n[:1].islower(), n)
+    )
+    return source[: match.start(1)] + ", ".join(ordered) + source[match.end(1) :]
+
+
+def _apply_model_options(
+    workspace_path: Path, *, frozen: bool = False, compact: bool = False
+) -> None:
+    """Apply the opt-in ``--frozen`` / ``--compact`` options to generated models.
+
+    See :func:`apply_model_options` for what each option changes.
+    """
+    if not (frozen or compact):
+        return
+    options = ", ".join(
+        name for name, enabled in (("frozen", frozen), ("compact", compact)) if enabled
+    )
+    logger.info(f"Applying model options: {options}")
+
+    models_dir = workspace_path / "stocktrim_public_api_client" / "generated" / "models"
+    if not models_dir.exists():
+        logger.warning(f"⚠️  Models directory not found: {models_dir}")
+        return
+
+    changed = 0
+    for model_file in sorted(models_dir.glob("*.py")):
+        content = model_file.read_text()
+        new_content = apply_model_options(content, frozen=frozen, compact=compact)
+        if new_content != content:
+            model_file.write_text(new_content)
+            changed += 1
+
+    logger.info(f"   ✅ Applied model options to {changed} model file(s)")
+
+
+_ADDITIONAL_PROPERTIES_FIELD = (
+    "additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)"
+)
+
+_NO_ADDITIONAL_PROPERTIES = """
+
+# Shared by every instance without additional properties (--compact)
+_NO_ADDITIONAL_PROPERTIES: dict[str, Any] = MappingProxyType({})  # type: ignore[assignment]
+"""
+
+
+def apply_model_options(
+    source: str, *, frozen: bool = False, compact: bool = False
+) -> str:
+    """Rewrite a generated model module for lower per-instance overhead.
+
+    Models are already slotted (``attrs.define`` defaults to ``slots=True``).
+    The options tighten that further:
+
+    - ``frozen``: ``@_attrs_define(frozen=True)``. Instances become immutable
+      (use ``attrs.evolve`` to derive modified copies); assignments the
+      generated code itself makes after construction go through
+      ``object.__setattr__``.
+    - ``compact``: drops the ``__weakref__`` slot from every model, and models
+      with ``additional_properties`` share one read-only empty mapping instead
+      of allocating a dict per instance. The dict is created on the first
+      ``model[key] = value``; writing to ``model.additional_properties``
+      directly is not supported while it is empty.
+
+    Args:
+        source: Source code of one generated model module.
+        frozen: Generate immutable models.
+        compact: Generate models without per-instance weakref slot and empty
+            ``additional_properties`` dict.
+
+    Returns:
+        The rewritten source (unchanged if neither option is set).
+    """
+    options = [
+        option
+        for option, enabled in (
+            ("frozen=True", frozen),
+            ("weakref_slot=False", compact),
+        )
+        if enabled
+    ]
+    if not options:
+        return source
+    source = re.sub(
+        r"^@_attrs_define$",
+        f"@_attrs_define({', '.join(options)})",
+        source,
+        flags=re.MULTILINE,
+    )
+
+    if compact and _ADDITIONAL_PROPERTIES_FIELD in source:
+        source = source.replace(
+            _ADDITIONAL_PROPERTIES_FIELD,
+            "additional_properties: dict[str, Any] = _attrs_field(\n"
+            "        init=False, default=_NO_ADDITIONAL_PROPERTIES\n"
+            "    )",
+        )
+        # from_dict() keeps the shared mapping when no unknown keys are left
+        source = re.sub(
+            r"^( +)(\w+)\.additional_properties = d$",
+            r"\1if d:\n\1    \2.additional_properties = d",
+            source,
+            flags=re.MULTILINE,
+        )
+        source = source.replace(
+            "        self.additional_properties[key] = value",
+            "        if self.additional_properties is _NO_ADDITIONAL_PROPERTIES:\n"
+            "            self.additional_properties = {}\n"
+            "        self.additional_properties[key] = value",
+        )
+        source = source.replace(
+            "        del self.additional_properties[key]",
+            "        if key not in self.additional_properties:\n"
+            "            raise KeyError(key)\n"
+            "        del self.additional_properties[key]",
+        )
+        source = source.replace(
+            "from __future__ import annotations\n",
+            "from __future__ import annotations\n\nfrom types import MappingProxyType\n",
+            1,
+        )
+        source = re.sub(
+            r"^(T = TypeVar\(.*\))$",
+            lambda match: match.group(1) + _NO_ADDITIONAL_PROPERTIES.rstrip("\n"),
+            source,
+            count=1,
+            flags=re.MULTILINE,
+        )
+
+    if frozen:
+        source = re.sub(
+            r"^( +)([\w.]+)\.additional_properties = (.+)$",
+            r'\1object.__setattr__(\2, "additional_properties", \3)',
+            source,
+            flags=re.MULTILINE,
+        )
+    return source
+
+
 def run_ruff_fixes(workspace_path: Path) -> bool:
     """Run ruff auto-fixes on the generated code."""
     logger.info("Running ruff auto-fixes")
@@ -975,8 +1534,30 @@ def run_tests(workspace_path: Path) -> bool:
         return False
 
 
+def parse_args() -> argparse.Namespace:
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(
+        description="Regenerate the StockTrim API client from the OpenAPI spec."
+    )
+    parser.add_argument(
+        "--frozen",
+        action="store_true",
+        help="generate immutable (frozen) attrs models",
+    )
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help=(
+            "drop the per-instance __weakref__ slot and share one empty "
+            "additional_properties mapping between instances"
+        ),
+    )
+    return parser.parse_args()
+
+
 def main() -> None:
     """Main function to regenerate the StockTrim API client."""
+    args = parse_args()
     logger.info("🚀 Starting StockTrim API client regeneration")
     logger.info("")
 
@@ -1074,7 +1655,7 @@ def main() -> None:
     logger.info("=" * 60)
     logger.info("STEP 7: Fix Specific Generated Issues")
     logger.info("=" * 60)
-    fix_specific_generated_issues(Path.cwd())
+    fix_specific_generated_issues(Path.cwd(), frozen=args.frozen, compact=args.compact)
     logger.info("")
 
     # Step 8: Run ruff fixes
@@ -1106,6 +1687,10 @@ def main() -> None:
     logger.info("✅ Modernized Union types to use | syntax")
     logger.info("✅ Fixed RST docstring formatting")
     logger.info("✅ Made date/time fields nullable (handles null API responses)")
+    if args.frozen:
+        logger.info("✅ Generated frozen models")
+    if args.compact:
+        logger.info("✅ Generated compact models")
     logger.info("✅ Ran ruff auto-fixes")
 
     if tests_passed:
@@ -0,0 +1,324 @@
+"""Persistent, shareable storage backends for the response cache.
+
+``ResponseCachingMiddleware`` keeps its entries in memory by default, so every
+server replica warms its own cache and a restart empties it. The backends here
+let replicas share one cache that survives restarts:
+
+- ``sqlite:////path/to/cache.db`` - :class:`SQLiteStore`, a single SQLite file
+  (WAL mode) that any number of processes on the host, or on a shared volume,
+  can use at once. Needs only the standard library.
+- ``redis://host:6379/0`` (or ``rediss://``) - any server speaking the Redis
+  protocol (Redis, Valkey, a local stand-in). Requires ``pip install redis``.
+- ``memory://`` or unset - the middleware's default in-process store.
+
+Select one with :func:`create_cache_storage`; the server reads the URL from
+``STOCKTRIM_MCP_CACHE_URL``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+import threading
+import time
+from collections.abc import Callable, Mapping, Sequence
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, SupportsFloat, TypeVar
+
+# py-key-value-aio has no public home for these; the dependency is pinned to
+# its 0.4 series and tests/test_cache_store.py guards the imports
+from key_value.aio._utils.managed_entry import ManagedEntry
+from key_value.aio._utils.serialization import BasicSerializationAdapter
+from key_value.aio.protocols.key_value import AsyncKeyValue
+from key_value.aio.stores.base import (
+    BaseContextManagerStore,
+    BaseDestroyStore,
+    BaseEnumerateKeysStore,
+    BaseStore,
+)
+from key_value.aio.stores.memory import MemoryStore
+
+T = TypeVar("T")
+
+# Puts between sweeps of expired rows
+_PURGE_EVERY = 256
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache_entries (
+    collection TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    created_at REAL,
+    expires_at REAL,
+    PRIMARY KEY (collection, key)
+)
+"""
+
+
+def _timestamp(value: datetime | None) -> float | None:
+    return value.timestamp() if value is not None else None
+
+
+def _datetime(value: float | None) -> datetime | None:
+    return datetime.fromtimestamp(value, tz=UTC) if value is not None else None
+
+
+class SQLiteStore(
+    BaseEnumerateKeysStore, BaseDestroyStore, BaseContextManagerStore, BaseStore
+):
+    """Key-value store in a SQLite file, shareable between processes.
+
+    The database runs in WAL mode so readers in other processes don't block
+    writers. Expired rows are never returned and are swept out periodically.
+    Queries run in a worker thread so the event loop never waits on disk.
+
+    Args:
+        path: Database file; parent directories are created if needed.
+        default_collection: Collection used when none is given.
+        clock: Wall-clock time source, overridable for testing.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        default_collection: str | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._clock = clock
+        self._connection = sqlite3.connect(
+            self.path, timeout=30.0, isolation_level=None, check_same_thread=False
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(_SCHEMA)
+        self._lock = threading.Lock()
+        self._puts = 0
+        super().__init__(
+            default_collection=default_collection,
+            serialization_adapter=BasicSerializationAdapter(date_format=None),
+            stable_api=True,
+        )
+
+    async def _setup(self) -> None:
+        self._exit_stack.callback(self._connection.close)
+
+    async def _run(self, query: Callable[[sqlite3.Connection], T]) -> T:
+        def locked() -> T:
+            with self._lock:
+                return query(self._connection)
+
+        return await asyncio.to_thread(locked)
+
+    async def _get_managed_entry(
+        self, *, key: str, collection: str
+    ) -> ManagedEntry | None:
+        row = await self._run(
+            lambda db: db.execute(
+                "SELECT value, created_at, expires_at FROM cache_entries "
+                "WHERE collection = ? AND key = ? "
+                "AND (expires_at IS NULL OR expires_at > ?)",
+                (collection, key, self._clock()),
+            ).fetchone()
+        )
+        if row is None:
+            return None
+        entry = self._serialization_adapter.load_json(json_str=row[0])
+        entry.created_at = _datetime(row[1])
+        entry.expires_at = _datetime(row[2])
+        return entry
+
+    async def _put_managed_entry(
+        self, *, key: str, collection: str, managed_entry: ManagedEntry
+    ) -> None:
+        value = self._serialization_adapter.dump_json(
+            entry=managed_entry, key=key, collection=collection
+        )
+        row = (
+            collection,
+            key,
+            value,
+            _timestamp(managed_entry.created_at),
+            _timestamp(managed_entry.expires_at),
+        )
+        self._puts += 1
+        purge = self._puts % _PURGE_EVERY == 0
+        now = self._clock()
+
+        def put(db: sqlite3.Connection) -> None:
+            db.execute(
+                "INSERT OR REPLACE INTO cache_entries VALUES (?, ?, ?, ?, ?)", row
+            )
+            if purge:
+                db.execute("DELETE FROM cache_entries WHERE expires_at <= ?", (now,))
+
+        await self._run(put)
+
+    async def _delete_managed_entry(self, *, key: str, collection: str) -> bool:
+        deleted = await self._run(
+            lambda db: (
+                db.execute(
+                    "DELETE FROM cache_entries WHERE collection = ? AND key = ?",
+                    (collection, key),
+                ).rowcount
+            )
+        )
+        return deleted > 0
+
+    async def _get_collection_keys(
+        self, *, collection: str, limit: int | None = None
+    ) -> list[str]:
+        rows = await self._run(
+            lambda db: db.execute(
+                "SELECT key FROM cache_entries WHERE collection = ? "
+                "AND (expires_at IS NULL OR expires_at > ?) LIMIT ?",
+                (collection, self._clock(), -1 if limit is None else limit),
+            ).fetchall()
+        )
+        return [row[0] for row in rows]
+
+    async def _delete_store(self) -> bool:
+        await self._run(lambda db: db.execute("DELETE FROM cache_entries"))
+        return True
+
+
+def create_cache_storage(url: str | None) -> AsyncKeyValue | None:
+    """Build the response cache backend named by ``url``.
+
+    Args:
+        url: ``sqlite:///relative.db`` or ``sqlite:////absolute.db``,
+            ``redis://...``/``rediss://...``,
+            ``memory://``, or None/empty for the in-memory default.
+
+    Returns:
+        The store, or None to use the middleware's in-memory default.
+
+    Raises:
+        ValueError: If the URL scheme is not supported.
+        ImportError: If a Redis URL is given but ``redis`` is not installed.
+    """
+    if not url or url == "memory://":
+        return None
+    scheme, _, rest = url.partition("://")
+    # As in SQLAlchemy: sqlite:///cache.db is relative, sqlite:////var/cache.db absolute
+    path = rest.removeprefix("/")
+    if scheme == "sqlite" and path:
+        return SQLiteStore(path)
+    if scheme in ("redis", "rediss"):
+        try:
+            from key_value.aio.stores.redis import RedisStore
+        except ImportError as e:
+            raise ImportError(
+                "Redis cache storage requires the 'redis' package. "
+                "Install it with: pip install redis"
+            ) from e
+        return RedisStore(url=url)
+    raise ValueError(
+        f"Unsupported cache URL {url!r}; use sqlite:///file.db, redis://host or memory://"
+    )
+
+
+class LazyCacheStorage:
+    """Response cache backend that is created on first use.
+
+    The server builds its caching middleware when its module is imported, which
+    must not read the environment or open database files. This stand-in only
+    resolves ``url`` and creates the store (see :func:`create_cache_storage`)
+    when it is opened or first used, falling back to an in-memory store.
+
+    Args:
+        url: Returns the cache URL, e.g. reading ``STOCKTRIM_MCP_CACHE_URL``.
+    """
+
+    def __init__(self, url: Callable[[], str | None]) -> None:
+        self._url = url
+        self._store: AsyncKeyValue | None = None
+        self._description: str | None = None
+
+    @property
+    def store(self) -> AsyncKeyValue:
+        """The underlying store, created on first access.
+
+        Raises:
+            ValueError: If the URL scheme is not supported.
+            ImportError: If a Redis URL is given but ``redis`` is not installed.
+        """
+        if self._store is None:
+            url = self._url()
+            self._store = create_cache_storage(url) or MemoryStore()
+            self._description = describe_cache_storage(url)
+        return self._store
+
+    @property
+    def description(self) -> str:
+        """Log-safe name of the backend (see :func:`describe_cache_storage`)."""
+        _ = self.store
+        return self._description or "memory"
+
+    async def close(self) -> None:
+        """Close the underlying store, if one was created."""
+        store, self._store = self._store, None
+        if isinstance(store, BaseContextManagerStore):
+            await store.close()
+
+    async def get(
+        self, key: str, *, collection: str | None = None
+    ) -> dict[str, Any] | None:
+        return await self.store.get(key, collection=collection)
+
+    async def ttl(
+        self, key: str, *, collection: str | None = None
+    ) -> tuple[dict[str, Any] | None, float | None]:
+        return await self.store.ttl(key, collection=collection)
+
+    async def put(
+        self,
+        key: str,
+        value: Mapping[str, Any],
+        *,
+        collection: str | None = None,
+        ttl: SupportsFloat | None = None,
+    ) -> None:
+        await self.store.put(key, value, collection=collection, ttl=ttl)
+
+    async def delete(self, key: str, *, collection: str | None = None) -> bool:
+        return await self.store.delete(key, collection=collection)
+
+    async def get_many(
+        self, keys: Sequence[str], *, collection: str | None = None
+    ) -> list[dict[str, Any] | None]:
+        return await self.store.get_many(keys, collection=collection)
+
+    async def ttl_many(
+        self, keys: Sequence[str], *, collection: str | None = None
+    ) -> list[tuple[dict[str, Any] | None, float | None]]:
+        return await self.store.ttl_many(keys, collection=collection)
+
+    async def put_many(
+        self,
+        keys: Sequence[str],
+        values: Sequence[Mapping[str, Any]],
+        *,
+        collection: str | None = None,
+        ttl: SupportsFloat | None = None,
+    ) -> None:
+        await self.store.put_many(keys, values, collection=collection, ttl=ttl)
+
+    async def delete_many(
+        self, keys: Sequence[str], *, collection: str | None = None
+    ) -> int:
+        return await self.store.delete_many(keys, collection=collection)
+
+
+def describe_cache_storage(url: str | None) -> str:
+    """Log-safe description of a cache URL (scheme only, no credentials)."""
+    return (url or "memory://").partition("://")[0]
+
+
+__all__ = [
+    "LazyCacheStorage",
+    "SQLiteStore",
+    "create_cache_storage",
+    "describe_cache_storage",
+]
@@ -0,0 +1,484 @@
+"""Entity-tagged invalidation for the MCP response cache.
+
+``ResponseCachingMiddleware`` only forgets an entry when its TTL runs out, so a
+read cached just before ``configure_product`` keeps being served for the rest
+of its TTL. :class:`TaggedResponseCachingMiddleware` closes that window:
+
+- every cached tool call and resource read carries entity tags derived from
+  its name and arguments, e.g. ``get_product(code="WIDGET-001")`` is tagged
+  ``product:WIDGET-001`` and ``list_suppliers`` is tagged ``supplier:*``;
+- every successful mutating tool purges the tags it touches, e.g.
+  ``set_product_inventory(product_id="WIDGET-001")`` purges
+  ``product:WIDGET-001``.
+
+Purging ``kind:id`` drops the entries tagged ``kind:id`` and the collection
+reads tagged ``kind:*`` (a listing may contain the changed entity); purging
+``kind:*`` drops every entry of that kind. A mutation whose identifying
+argument is missing purges the whole kind.
+
+Purges work by generation: each tag has a generation token kept in the cache
+backend, and it is mixed into the cache key of every entry carrying the tag.
+Purging a tag replaces its token, so the old entries are never looked up again
+and age out through their TTL. Tokens live in the same backend as the entries,
+so with a shared backend (see :mod:`stocktrim_mcp_server.cache_store`) a write
+on one replica purges the matching entries on all of them.
+
+Writes made outside this server (the StockTrim web app, other integrations)
+are not seen, so TTLs still bound staleness for those.
+
+Resource reads can additionally be refreshed ahead of expiry or served
+stale-while-revalidate, so readers of expensive report resources never wait on
+the upstream call once the entry exists.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import hashlib
+import json
+import re
+import uuid
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from datetime import UTC, datetime
+from typing import Any
+
+import mcp.types
+from fastmcp.resources.base import ResourceResult
+from fastmcp.server.context import Context
+from fastmcp.server.dependencies import get_access_token
+from fastmcp.server.middleware.caching import (
+    CachableResourceResult,
+    CachableToolResult,
+    ResponseCachingMiddleware,
+)
+from fastmcp.server.middleware.middleware import CallNext, MiddlewareContext
+from fastmcp.tools.base import ToolResult
+
+from stocktrim_mcp_server.logging_config import get_logger
+from stocktrim_public_api_client import Priority, request_priority
+
+logger = get_logger(__name__)
+
+_TAG_COLLECTION = "cache-tags"
+
+# Tags of cached reads. "{arg}" is replaced by the tool argument; a missing
+# argument widens the tag to the whole kind.
+TOOL_TAGS: dict[str, tuple[str, ...]] = {
+    "get_product": ("product:{code}",),
+    "search_products": ("product:*",),
+    "get_customer": ("customer:{code}",),
+    "list_customers": ("customer:*",),
+    "get_supplier": ("supplier:{code}",),
+    "list_suppliers": ("supplier:*",),
+    "list_locations": ("location:*",),
+    "get_purchase_order": ("purchase_order:{reference_number}",),
+    "list_purchase_orders": ("purchase_order:*",),
+    "get_sales_orders": ("sales_order:{product_id}",),
+    "list_sales_orders": ("sales_order:{product_id}",),
+}
+
+# Tags of cached resources, matched against the URI without its query string.
+RESOURCE_TAGS: list[tuple[re.Pattern[str], tuple[str, ...]]] = [
+    (re.compile(r"stocktrim://products/catalog"), ("product:*",)),
+    (re.compile(r"stocktrim://products/(?P<code>[^/]+)"), ("product:{code}",)),
+    (re.compile(r"stocktrim://customers/(?P<code>[^/]+)"), ("customer:{code}",)),
+    (re.compile(r"stocktrim://suppliers/(?P<code>[^/]+)"), ("supplier:{code}",)),
+    (re.compile(r"stocktrim://locations/(?P<code>[^/]+)"), ("location:{code}",)),
+    (
+        re.compile(r"stocktrim://inventory/[^/]+/(?P<code>[^/]+)"),
+        ("product:{code}",),
+    ),
+    (
+        re.compile(r"stocktrim://reports/(inventory-status|urgent-orders)"),
+        ("order_plan:*",),
+    ),
+    (re.compile(r"stocktrim://reports/supplier-directory"), ("supplier:*",)),
+]
+
+# Tags purged by each mutating tool once it succeeds. Anything that changes
+# stock, orders or forecast settings also stales the order plan.
+MUTATION_TAGS: dict[str, tuple[str, ...]] = {
+    "create_product": ("product:{code}",),
+    "delete_product": ("product:{code}",),
+    "create_supplier": ("supplier:{code}",),
+    "delete_supplier": ("supplier:{code}",),
+    "create_location": ("location:{code}",),
+    "set_product_inventory": ("product:{product_id}", "order_plan:*"),
+    "create_purchase_order": ("purchase_order:{reference_number}", "order_plan:*"),
+    "delete_purchase_order": ("purchase_order:{reference_number}", "order_plan:*"),
+    "create_sales_order": ("sales_order:{product_id}", "order_plan:*"),
+    "delete_sales_orders": ("sales_order:{product_id}", "order_plan:*"),
+    "configure_product": ("product:{product_code}", "order_plan:*"),
+    "products_configure_lifecycle": ("product:{product_code}", "order_plan:*"),
+    "manage_forecast_group": ("product:{product_codes}", "order_plan:*"),
+    "update_forecast_settings": ("product:{product_code}", "order_plan:*"),
+    "forecasts_update_and_monitor": ("order_plan:*",),
+    "create_supplier_with_products": ("supplier:{supplier_code}", "product:*"),
+    "generate_purchase_orders_from_urgent_items": (
+        "purchase_order:*",
+        "order_plan:*",
+    ),
+}
+
+_PLACEHOLDER_RE = re.compile(r"\{(\w+)\}")
+
+
+def expand_tags(
+    templates: Iterable[str], arguments: Mapping[str, Any] | None
+) -> list[str]:
+    """Fill tag templates from call arguments.
+
+    List arguments produce one tag per item; a missing or empty argument
+    produces the ``kind:*`` wildcard.
+    """
+    arguments = arguments or {}
+    tags: list[str] = []
+    for template in templates:
+        kind, _, ident = template.partition(":")
+        placeholder = _PLACEHOLDER_RE.fullmatch(ident)
+        if placeholder is None:
+            tags.append(template)
+            continue
+        value = arguments.get(placeholder.group(1))
+        values = value if isinstance(value, list) else [value]
+        values = [v for v in values if v not in (None, "")]
+        if not values:
+            tags.append(f"{kind}:*")
+        else:
+            tags.extend(f"{kind}:{v}" for v in values)
+    return sorted(set(tags))
+
+
+def tool_tags(name: str, arguments: Mapping[str, Any] | None) -> list[str]:
+    """Entity tags of a cached tool call (empty if the tool is not tagged)."""
+    return expand_tags(TOOL_TAGS.get(name, ()), arguments)
+
+
+def resource_tags(uri: str) -> list[str]:
+    """Entity tags of a cached resource read (empty if the URI is not tagged)."""
+    path = uri.partition("?")[0]
+    for pattern, templates in RESOURCE_TAGS:
+        match = pattern.fullmatch(path)
+        if match is not None:
+            return expand_tags(templates, match.groupdict())
+    return []
+
+
+def mutation_tags(name: str, arguments: Mapping[str, Any] | None) -> list[str]:
+    """Tags purged by a successful call of a mutating tool."""
+    return expand_tags(MUTATION_TAGS.get(name, ()), arguments)
+
+
+def _generation_keys(tag: str) -> list[str]:
+    """Generation tokens an entry tagged ``tag`` depends on.
+
+    ``kind:id`` entries depend on their own token and on the ``kind`` token
+    (replaced when the whole kind is purged); ``kind:*`` entries depend on the
+    ``kind:*`` token (replaced by any purge of the kind).
+    """
+    kind, _, ident = tag.partition(":")
+    return [tag] if ident == "*" else [tag, kind]
+
+
+def _purged_keys(tag: str) -> list[str]:
+    """Generation tokens replaced when ``tag`` is purged."""
+    kind, _, ident = tag.partition(":")
+    return [f"{kind}:*", kind] if ident == "*" else [tag, f"{kind}:*"]
+
+
+def _auth_partition() -> str:
+    """Per-token cache partition, as in ``ResponseCachingMiddleware``."""
+    token = get_access_token()
+    if token is None:
+        return "__anonymous__"
+    return hashlib.sha256(token.token.encode()).hexdigest()
+
+
+class TaggedResponseCachingMiddleware(ResponseCachingMiddleware):
+    """``ResponseCachingMiddleware`` that purges entries on successful writes.
+
+    Tool calls and resources with tags (see :data:`TOOL_TAGS` and
+    :data:`RESOURCE_TAGS`) are cached under keys that include the generation
+    of each tag, and the tools in :data:`MUTATION_TAGS` purge their tags after
+    succeeding. Untagged tools are cached exactly as by the base class.
+
+    Resource reads can also be refreshed in the background: with
+    ``refresh_ahead`` an entry nearing expiry, and with
+    ``stale_while_revalidate`` an expired one, is still returned immediately
+    while a single low-priority task per entry fetches a replacement. Purged
+    entries are never served stale.
+
+    Args:
+        tagged_call_tool_ttl: TTL of tagged tool call entries; since our own
+            writes purge them, it can be longer than the ``call_tool_settings``
+            TTL (default: that TTL).
+        tagged_read_resource_ttl: TTL of tagged resource entries (default: the
+            ``read_resource_settings`` TTL).
+        excluded_resources: Resource URIs that are never cached, e.g. live
+            status resources.
+        refresh_ahead: Fraction of a resource entry's TTL after which a read
+            still returns it but also refreshes it in the background, e.g.
+            0.75 refreshes a 60s entry once it is 45s old (default: off).
+        stale_while_revalidate: Seconds an expired resource entry keeps being
+            served while a background refresh replaces it (default: 0).
+        **kwargs: Passed to ``ResponseCachingMiddleware``.
+
+    Raises:
+        ValueError: If ``refresh_ahead`` is not in (0, 1] or
+            ``stale_while_revalidate`` is negative.
+    """
+
+    def __init__(
+        self,
+        *,
+        tagged_call_tool_ttl: int | None = None,
+        tagged_read_resource_ttl: int | None = None,
+        excluded_resources: Sequence[str] = (),
+        refresh_ahead: float | None = None,
+        stale_while_revalidate: int = 0,
+        **kwargs: Any,
+    ) -> None:
+        if refresh_ahead is not None and not 0 < refresh_ahead <= 1:
+            raise ValueError(f"refresh_ahead must be in (0, 1], got {refresh_ahead}")
+        if stale_while_revalidate < 0:
+            raise ValueError(
+                f"stale_while_revalidate must be >= 0, got {stale_while_revalidate}"
+            )
+        super().__init__(**kwargs)
+        self._excluded_resources = frozenset(excluded_resources)
+        self._refresh_ahead = refresh_ahead
+        self._stale_while_revalidate = stale_while_revalidate
+        self._refreshing: dict[str, asyncio.Task[None]] = {}
+        self._invalidation_listeners: list[Callable[[Sequence[str]], None]] = []
+        self._tagged_call_tool_ttl = (
+            tagged_call_tool_ttl or self._call_tool_settings.get("ttl", 3600)
+        )
+        self._tagged_read_resource_ttl = (
+            tagged_read_resource_ttl or self._read_resource_settings.get("ttl", 3600)
+        )
+        # A token must outlive every entry keyed on it: once it expires the
+        # "never purged" generation is reused, and older entries must be gone.
+        self._generation_ttl = 2 * max(
+            self._tagged_call_tool_ttl,
+            self._tagged_read_resource_ttl + stale_while_revalidate,
+        )
+
+    def add_invalidation_listener(
+        self, listener: Callable[[Sequence[str]], None]
+    ) -> Callable[[], None]:
+        """Call ``listener`` with the purged tags after every invalidation.
+
+        Lets in-process caches outside the middleware (such as the order plan
+        snapshot) follow the same purges. Listeners only see purges made by
+        this process.
+
+        Args:
+            listener: Callable receiving the purged tags
+
+        Returns:
+            A callable that removes the listener
+        """
+        self._invalidation_listeners.append(listener)
+        return lambda: self._invalidation_listeners.remove(listener)
+
+    async def close(self) -> None:
+        """Cancel background resource refreshes still running.
+
+        Call on shutdown, before the cache storage is closed.
+        """
+        tasks = list(self._refreshing.values())
+        self._refreshing.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def invalidate(self, *tags: str) -> None:
+        """Purge every cached entry carrying one of ``tags``.
+
+        Args:
+            *tags: Tags such as ``"product:WIDGET-001"`` or ``"order_plan:*"``.
+        """
+        keys = sorted({key for tag in tags for key in _purged_keys(tag)})
+        if not keys:
+            return
+        await self._backend.put_many(
+            keys,
+            [{"generation": uuid.uuid4().hex} for _ in keys],
+            collection=_TAG_COLLECTION,
+            ttl=self._generation_ttl,
+        )
+        for listener in list(self._invalidation_listeners):
+            listener(tags)
+        logger.info("response_cache_invalidated", tags=sorted(tags))
+
+    async def _cache_key(self, identity: str, tags: Sequence[str]) -> str:
+        keys = sorted({key for tag in tags for key in _generation_keys(tag)})
+        tokens = await self._backend.get_many(keys, collection=_TAG_COLLECTION)
+        generations = [
+            f"{key}={(token or {}).get('generation', '0')}"
+            for key, token in zip(keys, tokens, strict=True)
+        ]
+        value = "\n".join([_auth_partition(), identity, *generations])
+        return hashlib.sha256(value.encode()).hexdigest()
+
+    async def on_call_tool(
+        self,
+        context: MiddlewareContext[mcp.types.CallToolRequestParams],
+        call_next: CallNext[mcp.types.CallToolRequestParams, ToolResult],
+    ) -> ToolResult:
+        name = context.message.name
+        arguments = context.message.arguments
+        if name in MUTATION_TAGS:
+            result = await call_next(context)
+            if not result.is_error:
+                await self.invalidate(*mutation_tags(name, arguments))
+            return result
+
+        tags = tool_tags(name, arguments)
+        if (
+            not tags
+            or self._call_tool_settings.get("enabled") is False
+            or not self._matches_tool_cache_settings(tool_name=name)
+        ):
+            return await super().on_call_tool(context, call_next)
+
+        identity = f"tool:{name}:{json.dumps(arguments, sort_keys=True, default=str)}"
+        key = await self._cache_key(identity, tags)
+        if cached := await self._call_tool_cache.get(key=key):
+            return cached.unwrap()
+        entry = CachableToolResult.wrap(value=await call_next(context))
+        await self._call_tool_cache.put(
+            key=key, value=entry, ttl=self._tagged_call_tool_ttl
+        )
+        return entry.unwrap()
+
+    async def on_read_resource(
+        self,
+        context: MiddlewareContext[mcp.types.ReadResourceRequestParams],
+        call_next: CallNext[mcp.types.ReadResourceRequestParams, ResourceResult],
+    ) -> ResourceResult:
+        uri = str(context.message.uri)
+        if (
+            uri.partition("?")[0] in self._excluded_resources
+            or self._read_resource_settings.get("enabled") is False
+        ):
+            return await call_next(context)
+
+        tags = resource_tags(uri)
+        ttl = self._resource_ttl(tags)
+        key = await self._cache_key(f"resource:{uri}", tags)
+        cached, remaining = await self._read_resource_cache.ttl(key=key)
+        if cached is None:
+            return (await self._store_resource(key, ttl, context, call_next)).unwrap()
+        if self._due_for_refresh(ttl, remaining) and key not in self._refreshing:
+            # The refresh outlives this request, so it must not inherit any of
+            # its request-scoped state (session, HTTP request, context vars)
+            task = asyncio.create_task(
+                self._refresh_resource(key, ttl, context, call_next),
+                context=contextvars.Context(),
+            )
+            self._refreshing[key] = task
+            task.add_done_callback(lambda _: self._refreshing.pop(key, None))
+        return cached.unwrap()
+
+    async def prime_resource(self, uri: str, result: ResourceResult) -> bool:
+        """Store ``result`` as the cached read of ``uri``.
+
+        Used by cache warm-up to fill report resources from data it already
+        fetched. Outside a request the entry lands in the anonymous partition,
+        so it serves clients that do not authenticate (e.g. stdio).
+
+        Args:
+            uri: Resource URI, e.g. ``"stocktrim://reports/supplier-directory"``
+            result: Result a read of ``uri`` would return
+
+        Returns:
+            Whether the entry was stored (reads of ``uri`` may not be cached)
+        """
+        if (
+            uri.partition("?")[0] in self._excluded_resources
+            or self._read_resource_settings.get("enabled") is False
+        ):
+            return False
+        tags = resource_tags(uri)
+        key = await self._cache_key(f"resource:{uri}", tags)
+        await self._read_resource_cache.put(
+            key=key,
+            value=CachableResourceResult.wrap(result),
+            ttl=self._resource_ttl(tags) + self._stale_while_revalidate,
+        )
+        return True
+
+    def _resource_ttl(self, tags: Sequence[str]) -> int:
+        if tags:
+            return self._tagged_read_resource_ttl
+        return self._read_resource_settings.get("ttl", 3600)
+
+    def _due_for_refresh(self, ttl: int, remaining: float | None) -> bool:
+        """Whether a served resource entry should be refreshed in the background.
+
+        Entries are stored for ``ttl + stale_while_revalidate`` seconds, so the
+        entry is stale once less than ``stale_while_revalidate`` remains.
+        """
+        if remaining is None:
+            return False
+        fresh_for = remaining - self._stale_while_revalidate
+        if self._refresh_ahead is not None:
+            return fresh_for <= ttl * (1 - self._refresh_ahead)
+        return self._stale_while_revalidate > 0 and fresh_for <= 0
+
+    async def _store_resource(
+        self,
+        key: str,
+        ttl: int,
+        context: MiddlewareContext[mcp.types.ReadResourceRequestParams],
+        call_next: CallNext[mcp.types.ReadResourceRequestParams, ResourceResult],
+    ) -> CachableResourceResult:
+        entry = CachableResourceResult.wrap(await call_next(context))
+        await self._read_resource_cache.put(
+            key=key, value=entry, ttl=ttl + self._stale_while_revalidate
+        )
+        return entry
+
+    async def _refresh_resource(
+        self,
+        key: str,
+        ttl: int,
+        context: MiddlewareContext[mcp.types.ReadResourceRequestParams],
+        call_next: CallNext[mcp.types.ReadResourceRequestParams, ResourceResult],
+    ) -> None:
+        """Replace a resource entry; on failure the current entry stays.
+
+        The request that scheduled the refresh has usually returned by now, so
+        the read runs under a new server-level ``Context`` rather than the
+        request's one.
+        """
+        uri = str(context.message.uri)
+        try:
+            with request_priority(Priority.LOW):
+                if context.fastmcp_context is None:
+                    await self._store_resource(key, ttl, context, call_next)
+                    return
+                async with Context(
+                    fastmcp=context.fastmcp_context.fastmcp
+                ) as fastmcp_context:
+                    refresh_context = context.copy(
+                        fastmcp_context=fastmcp_context,
+                        timestamp=datetime.now(UTC),
+                    )
+                    await self._store_resource(key, ttl, refresh_context, call_next)
+        except Exception as e:
+            logger.warning("resource_refresh_failed", uri=uri, error=str(e))
+
+
+__all__ = [
+    "MUTATION_TAGS",
+    "RESOURCE_TAGS",
+    "TOOL_TAGS",
+    "TaggedResponseCachingMiddleware",
+    "expand_tags",
+    "mutation_tags",
+    "resource_tags",
+    "tool_tags",
+]
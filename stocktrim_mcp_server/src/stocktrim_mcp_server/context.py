@@ -2,13 +2,18 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
+
+from stocktrim_mcp_server.services.catalog import CatalogSnapshot
 from stocktrim_mcp_server.services.customers import CustomerService
 from stocktrim_mcp_server.services.inventory import InventoryService
 from stocktrim_mcp_server.services.locations import LocationService
+from stocktrim_mcp_server.services.order_plan import OrderPlanSnapshot
 from stocktrim_mcp_server.services.products import ProductService
 from stocktrim_mcp_server.services.purchase_orders import PurchaseOrderService
 from stocktrim_mcp_server.services.sales_orders import SalesOrderService
 from stocktrim_mcp_server.services.suppliers import SupplierService
+from stocktrim_mcp_server.services.warmup import CacheWarmer
 from stocktrim_public_api_client import StockTrimClient
 
 
@@ -31,3 +36,27 @@ class ServerContext:
         self.purchase_orders = PurchaseOrderService(client)
         self.sales_orders = SalesOrderService(client)
         self.suppliers = SupplierService(client)
+
+        # Shared, indexed product catalog (loaded on first use)
+        self.catalog = CatalogSnapshot(client)
+
+        # Shared order plan, fetched once per forecast run and filter criteria
+        self.order_plan = OrderPlanSnapshot(client)
+
+        # Background prefetch of hot data (started by the server lifespan)
+        self.warmer = CacheWarmer(self)
+
+    def purge_snapshots(self, tags: Sequence[str]) -> None:
+        """Drop the shared snapshots holding data purged under ``tags``.
+
+        Registered as a response cache invalidation listener, so a write that
+        purges cached product or order plan responses also stops the catalog
+        and order plan snapshots from serving the data it changed.
+
+        Args:
+            tags: Purged cache tags, e.g. ``("product:WIDGET-001",)``
+        """
+        if any(tag.startswith("product:") for tag in tags):
+            self.catalog.invalidate()
+        if any(tag.startswith("order_plan:") for tag in tags):
+            self.order_plan.invalidate()
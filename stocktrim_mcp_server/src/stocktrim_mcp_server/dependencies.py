@@ -13,6 +13,9 @@ def get_services(context: Context) -> ServerContext:
     This helper function provides a clean way to access the service layer
     from MCP tool functions.
 
+    Outside a client request, e.g. in a background cache refresh, the
+    services are taken from the server's lifespan instead.
+
     Args:
         context: FastMCP context from tool invocation
 
@@ -24,4 +27,7 @@ def get_services(context: Context) -> ServerContext:
             services = get_services(context)
             return await services.products.get_by_code(request.code)
     """
-    return context.request_context.lifespan_context
+    request_context = context.request_context
+    if request_context is None:
+        return context.lifespan_context
+    return request_context.lifespan_context
@@ -0,0 +1,102 @@
+"""Batch analytics over order plan rows.
+
+Order plan summaries (urgent items, per-supplier cost rollups) need a handful
+of fields from every row. Instead of unwrapping each field of each row while
+filtering, sorting and grouping, the functions here pull one field out of all
+rows at a time and work on those columns:
+
+- the threshold filter and urgency sort read only ``days_until_stock_out``
+  across the whole plan; other fields are read for the selected rows only;
+- grouping and cost totals are a single pass over the selected columns.
+
+Rows can be generated ``SkuOptimizedResultsDto`` models or lazy rows from
+``order_plan.query(lazy=True)``, in which case fields of rows that aren't
+selected are never decoded.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+from stocktrim_mcp_server.utils import unwrap_unset
+
+
+def column(rows: Sequence[Any], name: str) -> list[Any]:
+    """Values of one field across ``rows``, with ``UNSET`` mapped to None."""
+    return [unwrap_unset(getattr(row, name)) for row in rows]
+
+
+def select_urgent(
+    rows: Sequence[Any], days_threshold: float, fields: Iterable[str]
+) -> dict[str, list[Any]]:
+    """Columns of the rows running out within ``days_threshold`` days.
+
+    Rows without ``days_until_stock_out`` are skipped. Selected rows are
+    ordered most urgent first; rows with equal days keep their plan order.
+
+    Args:
+        rows: Order plan rows.
+        days_threshold: Keep rows with ``days_until_stock_out`` below this.
+        fields: Field names to return columns for. ``days_until_stock_out``
+            is always included.
+
+    Returns:
+        ``{field name: values}`` with one entry per selected row in each list.
+    """
+    days = column(rows, "days_until_stock_out")
+    selected = sorted(
+        (i for i, d in enumerate(days) if d is not None and d < days_threshold),
+        key=days.__getitem__,
+    )
+    columns = {"days_until_stock_out": [days[i] for i in selected]}
+    for name in fields:
+        if name not in columns:
+            columns[name] = [unwrap_unset(getattr(rows[i], name)) for i in selected]
+    return columns
+
+
+@dataclass
+class CostGroup:
+    """Rows sharing a group key, with their combined estimated cost.
+
+    Attributes:
+        key: Group key (e.g. supplier code).
+        positions: Positions of the group's rows in the input columns.
+        total_cost: Sum of ``unit_cost x quantity`` over rows that have both,
+            or None if none do.
+    """
+
+    key: str
+    positions: list[int] = field(default_factory=list)
+    total_cost: float | None = None
+
+
+def group_costs(
+    keys: Sequence[str],
+    unit_costs: Sequence[float | None],
+    quantities: Sequence[float | None],
+) -> list[CostGroup]:
+    """Group rows by key and total their estimated costs in one pass.
+
+    Args:
+        keys: Group key of each row.
+        unit_costs: Unit cost of each row (None if unknown).
+        quantities: Quantity of each row (None if unknown).
+
+    Returns:
+        Groups ordered by row count, largest first; groups of equal size keep
+        the order in which their keys first appear.
+    """
+    groups: dict[str, CostGroup] = {}
+    for position, (key, cost, quantity) in enumerate(
+        zip(keys, unit_costs, quantities, strict=True)
+    ):
+        group = groups.get(key)
+        if group is None:
+            group = groups[key] = CostGroup(key)
+        group.positions.append(position)
+        if cost is not None and quantity is not None:
+            group.total_cost = (group.total_cost or 0.0) + cost * quantity
+    return sorted(groups.values(), key=lambda g: len(g.positions), reverse=True)
@@ -6,12 +6,14 @@ without making tool calls. Resources provide context and enable discovery.
 Resources are organized into:
 - Foundation: Core entity resources (products, customers, suppliers, etc.)
 - Reports: Aggregated data resources (inventory status, urgent orders, etc.)
+- Status: Server readiness and cache warm-up progress
 """
 
 from fastmcp import FastMCP
 
 from stocktrim_mcp_server.resources.foundation import register_foundation_resources
 from stocktrim_mcp_server.resources.reports import register_report_resources
+from stocktrim_mcp_server.resources.status import register_status_resources
 
 
 def register_all_resources(mcp: FastMCP) -> None:
@@ -22,6 +24,7 @@ def register_all_resources(mcp: FastMCP) -> None:
     """
     register_foundation_resources(mcp)
     register_report_resources(mcp)
+    register_status_resources(mcp)
 
 
 __all__ = ["register_all_resources"]
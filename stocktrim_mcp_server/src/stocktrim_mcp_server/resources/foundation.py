@@ -66,7 +66,12 @@ async def _get_products_catalog_resource(context: Context) -> dict:
         Product catalog with pagination info
     """
     services = get_services(context)
-    products = await services.products.list_all()
+    # Serve from the shared catalog snapshot once it is loaded (e.g. by cache
+    # warm-up); until then one page from the API is enough for 50 products
+    if services.catalog.is_loaded:
+        products = (await services.catalog.ensure_fresh()).products
+    else:
+        products = await services.products.list_all()
 
     product_list = []
     # Limit to 50 products for token budget
@@ -5,14 +5,19 @@ and supplier directories. These resources compute data from multiple sources
 to provide business intelligence context.
 """
 
+from collections.abc import Sequence
+
 from fastmcp import Context, FastMCP
 
 from stocktrim_mcp_server.dependencies import get_services
 from stocktrim_mcp_server.logging_config import get_logger
 from stocktrim_mcp_server.utils import unwrap_unset
+from stocktrim_public_api_client.generated.models import SupplierResponseDto
 
 logger = get_logger(__name__)
 
+SUPPLIER_DIRECTORY_URI = "stocktrim://reports/supplier-directory"
+
 
 # ============================================================================
 # Inventory Status Report
@@ -32,14 +37,10 @@ async def _get_inventory_status_report(days_threshold: int, context: Context) ->
     services = get_services(context)
 
     try:
-        # Get all forecast data
+        # Get all forecast data (shared snapshot, see OrderPlanSnapshot)
         # Note: The API doesn't support filtering by days_threshold directly,
         # so we query all items and filter in memory
-        all_items = await services.client.order_plan.query()
-
-        # Handle both list and single object responses
-        if not isinstance(all_items, list):
-            all_items = [all_items] if all_items else []
+        all_items = await services.order_plan.query()
 
         # Filter by days threshold
         forecast_items = []
@@ -109,11 +110,7 @@ async def _get_urgent_orders_report(context: Context) -> dict:
         # Get all items and filter for < 7 days until stockout
         # Note: The API doesn't support filtering by days_threshold directly,
         # so we query all items and filter in memory
-        all_items = await services.client.order_plan.query()
-
-        # Handle both list and single object responses
-        if not isinstance(all_items, list):
-            all_items = [all_items] if all_items else []
+        all_items = await services.order_plan.query()
 
         # Filter for urgent items (< 7 days)
         forecast_items = []
@@ -165,6 +162,37 @@ async def _get_urgent_orders_report(context: Context) -> dict:
 # ============================================================================
 
 
+def build_supplier_directory(suppliers: Sequence[SupplierResponseDto]) -> dict:
+    """Build the supplier directory report from a supplier listing.
+
+    Also used by cache warm-up to prime the response cache with this report.
+
+    Args:
+        suppliers: Suppliers as returned by ``SupplierService.list_all``
+
+    Returns:
+        Supplier directory as dictionary
+    """
+    supplier_list = []
+    for supplier in suppliers[:50]:  # Limit to 50 for token budget
+        supplier_list.append(
+            {
+                "supplier_code": unwrap_unset(supplier.supplier_code),
+                "name": unwrap_unset(supplier.supplier_name),
+                "email": unwrap_unset(supplier.email_address),
+                "primary_contact": unwrap_unset(supplier.primary_contact_name),
+                "default_lead_time": unwrap_unset(supplier.default_lead_time),
+            }
+        )
+
+    return {
+        "report_type": "supplier_directory",
+        "suppliers": supplier_list,
+        "total_suppliers": len(supplier_list),
+        "note": "All suppliers. Limited to 50 suppliers.",
+    }
+
+
 async def _get_supplier_directory_report(context: Context) -> dict:
     """Get supplier directory with all active suppliers.
 
@@ -177,32 +205,9 @@ async def _get_supplier_directory_report(context: Context) -> dict:
     services = get_services(context)
 
     try:
-        # Get all suppliers
-        suppliers = await services.suppliers.list_all(active_only=False)
-
-        # Handle both list and single object responses
-        if not isinstance(suppliers, list):
-            suppliers = [suppliers] if suppliers else []
-
-        # Build directory
-        supplier_list = []
-        for supplier in suppliers[:50]:  # Limit to 50 for token budget
-            supplier_list.append(
-                {
-                    "supplier_code": unwrap_unset(supplier.supplier_code),
-                    "name": unwrap_unset(supplier.supplier_name),
-                    "email": unwrap_unset(supplier.email_address),
-                    "primary_contact": unwrap_unset(supplier.primary_contact_name),
-                    "default_lead_time": unwrap_unset(supplier.default_lead_time),
-                }
-            )
-
-        return {
-            "report_type": "supplier_directory",
-            "suppliers": supplier_list,
-            "total_suppliers": len(supplier_list),
-            "note": "All suppliers. Limited to 50 suppliers.",
-        }
+        return build_supplier_directory(
+            await services.suppliers.list_all(active_only=False)
+        )
 
     except Exception as e:
         logger.error(f"Error generating supplier directory: {e}")
@@ -249,7 +254,7 @@ def register_report_resources(mcp: FastMCP) -> None:
         return await _get_urgent_orders_report(context)
 
     @mcp.resource(
-        uri="stocktrim://reports/supplier-directory",
+        uri=SUPPLIER_DIRECTORY_URI,
         name="Supplier Directory",
         description="Get directory of all suppliers with contact information",
         mime_type="application/json",
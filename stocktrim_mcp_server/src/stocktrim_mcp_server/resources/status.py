@@ -0,0 +1,45 @@
+"""Server status resources for StockTrim MCP Server.
+
+Exposes operational state such as cache warm-up progress, so agents and
+operators can tell whether the server is still warming up after a deploy.
+"""
+
+from fastmcp import Context, FastMCP
+
+from stocktrim_mcp_server.dependencies import get_services
+
+STATUS_URI = "stocktrim://server/status"
+
+
+async def _get_server_status(context: Context) -> dict:
+    """Get server readiness and cache warm-up progress.
+
+    Args:
+        context: Request context with services
+
+    Returns:
+        Status report as dictionary
+    """
+    services = get_services(context)
+    return {
+        "report_type": "server_status",
+        "warmup": services.warmer.status(),
+    }
+
+
+def register_status_resources(mcp: FastMCP) -> None:
+    """Register server status resources with FastMCP server.
+
+    Args:
+        mcp: FastMCP server instance
+    """
+
+    @mcp.resource(
+        uri=STATUS_URI,
+        name="Server Status",
+        description="Server readiness and cache warm-up progress",
+        mime_type="application/json",
+    )
+    async def get_server_status(context: Context) -> dict:
+        """Get server status."""
+        return await _get_server_status(context)
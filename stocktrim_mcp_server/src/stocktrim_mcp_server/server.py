@@ -10,28 +10,47 @@ Features:
 - Production-ready with transport-layer resilience
 """
 
+import json
 import os
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Sequence
 from contextlib import asynccontextmanager
 from typing import Any
 
 from dotenv import load_dotenv
 from fastmcp import FastMCP
+from fastmcp.resources import ResourceContent, ResourceResult
 from fastmcp.server.middleware.caching import (
     CallToolSettings,
     ReadResourceSettings,
-    ResponseCachingMiddleware,
 )
 
 from stocktrim_mcp_server import __version__
+from stocktrim_mcp_server.cache_store import LazyCacheStorage
+from stocktrim_mcp_server.cache_tags import TaggedResponseCachingMiddleware
 from stocktrim_mcp_server.context import ServerContext
 from stocktrim_mcp_server.logging_config import configure_logging, get_logger
-from stocktrim_public_api_client import StockTrimClient
+from stocktrim_mcp_server.resources.reports import (
+    SUPPLIER_DIRECTORY_URI,
+    build_supplier_directory,
+)
+from stocktrim_mcp_server.resources.status import STATUS_URI
+from stocktrim_mcp_server.services.warmup import parse_warmup_targets
+from stocktrim_public_api_client import (
+    AdaptiveRateLimiter,
+    EntityCache,
+    ForecastCompleted,
+    HTTPCache,
+    RequestScheduler,
+    StockTrimClient,
+)
 
 # Configure structured logging at module level before any logging calls
 configure_logging()
 logger = get_logger(__name__)
 
+# Per-endpoint concurrency caps: order plan queries are expensive server-side
+_SCHEDULER_LIMITS = {"POST /api/OrderPlan": 2}
+
 
 @asynccontextmanager
 async def lifespan(server: FastMCP) -> AsyncIterator[ServerContext]:
@@ -61,6 +80,21 @@ async def lifespan(server: FastMCP) -> AsyncIterator[ServerContext]:
     api_auth_id = os.getenv("STOCKTRIM_API_AUTH_ID")
     api_auth_signature = os.getenv("STOCKTRIM_API_AUTH_SIGNATURE")
     base_url = os.getenv("STOCKTRIM_BASE_URL", "https://api.stocktrim.com")
+    # Optional: cache product/supplier/customer lookups for this many seconds
+    entity_cache_ttl = float(os.getenv("STOCKTRIM_ENTITY_CACHE_TTL", "0"))
+    # Optional: decode responses with orjson/msgspec ("auto" picks what's installed)
+    json_decoder = os.getenv("STOCKTRIM_JSON_DECODER", "stdlib")
+    # Optional: pace requests to at most this many per second, backing off on 429s
+    rate_limit = float(os.getenv("STOCKTRIM_RATE_LIMIT", "0"))
+    # Optional: cap requests in flight so background jobs can't crowd out tool calls
+    max_concurrency = int(os.getenv("STOCKTRIM_MAX_CONCURRENCY", "0"))
+    # Optional: keep GET responses (revalidated via ETag/Last-Modified when possible)
+    http_cache_ttl = float(os.getenv("STOCKTRIM_HTTP_CACHE_TTL", "0"))
+    http_cache_dir = os.getenv("STOCKTRIM_HTTP_CACHE_DIR") or None
+    # Optional: which caches to prefetch after startup ("none" disables warm-up)
+    warmup_targets = parse_warmup_targets(os.getenv("STOCKTRIM_WARMUP"))
+    # Optional: shared, persistent response cache (opened here, not at import)
+    logger.info("response_cache_backend", backend=_cache_storage.description)
 
     # Validate required configuration
     if not api_auth_id:
@@ -93,18 +127,75 @@ async def lifespan(server: FastMCP) -> AsyncIterator[ServerContext]:
             base_url=base_url,
             timeout=30.0,
             max_retries=5,
+            entity_cache=(
+                EntityCache(ttl=entity_cache_ttl) if entity_cache_ttl > 0 else None
+            ),
+            json_decoder=json_decoder,  # type: ignore[arg-type]
+            rate_limiter=(
+                AdaptiveRateLimiter(rate=rate_limit) if rate_limit > 0 else None
+            ),
+            scheduler=RequestScheduler(
+                max_concurrency=max_concurrency or None,
+                limits=_SCHEDULER_LIMITS,
+            ),
+            # Concurrent sessions asking for the same data share one request
+            coalesce_requests=True,
+            http_cache=(
+                HTTPCache(ttl=http_cache_ttl, directory=http_cache_dir)
+                if http_cache_ttl > 0
+                else None
+            ),
         ) as client:
             logger.info(
-                "client_initialized", base_url=base_url, timeout=30.0, max_retries=5
+                "client_initialized",
+                base_url=base_url,
+                timeout=30.0,
+                max_retries=5,
+                entity_cache_ttl=entity_cache_ttl or None,
+                json_decoder=client.json_decoder,
+                rate_limit=rate_limit or None,
+                max_concurrency=max_concurrency or None,
+                http_cache_ttl=http_cache_ttl or None,
+                http_cache_dir=http_cache_dir,
+                warmup=warmup_targets or None,
             )
 
             # Create context with client for tools to access
             # Note: client is StockTrimClient but mypy sees it as AuthenticatedClient
             context = ServerContext(client=client)  # type: ignore[arg-type]
 
+            # Writes that purge cached product or order plan responses also drop
+            # the shared catalog and order plan snapshots they were built from
+            remove_listener = _response_cache.add_invalidation_listener(
+                context.purge_snapshots
+            )
+
+            # A finished forecast run changes the order plan: start a new
+            # snapshot generation and purge cached order plan reports at once,
+            # whichever session's status check noticed it
+            async def _on_forecast_completed(event: ForecastCompleted) -> None:
+                context.order_plan.forecast_completed()
+                await _response_cache.invalidate("order_plan:*")
+                logger.info("forecast_completion_observed", generation=event.generation)
+
+            unsubscribe_forecasts = client.forecast_events.subscribe(
+                _on_forecast_completed
+            )
+
+            # Prefetch hot data in the background; connections are accepted meanwhile
+            context.warmer.start(warmup_targets, primer=_prime_responses)
+
             # Yield context to server - tools can access via lifespan dependency
             logger.info("server_ready")
-            yield context
+            try:
+                yield context
+            finally:
+                unsubscribe_forecasts()
+                remove_listener()
+                await context.warmer.close()
+                await context.catalog.close()
+                await _response_cache.close()
+                await _cache_storage.close()
 
     except ValueError as e:
         # Authentication or configuration errors
@@ -379,8 +470,9 @@ logger.info("prompts_registered")
 
 
 # Tools that mutate StockTrim state. They never serve cached responses, and
-# their successful execution implicitly stales any cached read for the same
-# entity (TTL keeps the staleness window bounded — defaults to 5 minutes).
+# their successful execution purges the cached reads tagged with the entities
+# they touch (see MUTATION_TAGS in cache_tags.py). Untagged reads are still
+# bounded by TTL only.
 _MUTATING_TOOLS = [
     # Foundation create/delete/set
     "create_product",
@@ -419,21 +511,54 @@ _SESSION_STATEFUL_TOOLS = [
 _CACHE_EXCLUDED_TOOLS = _MUTATING_TOOLS + _SESSION_STATEFUL_TOOLS
 
 
-# Response caching: in-memory by default. Operators can swap in Redis/disk via
-# their own middleware wiring; see docs/mcp-server/observability.md.
-mcp.add_middleware(
-    ResponseCachingMiddleware(
-        call_tool_settings=CallToolSettings(
-            ttl=300,  # 5 min — read-heavy tools (products, suppliers, locations)
-            enabled=True,
-            excluded_tools=_CACHE_EXCLUDED_TOOLS,
-        ),
-        read_resource_settings=ReadResourceSettings(
-            ttl=60,  # 60s — resources are for discovery; favor freshness
-            enabled=True,
-        ),
-    )
+# Response caching: in-memory by default. STOCKTRIM_MCP_CACHE_URL selects a
+# persistent backend shared by every replica (sqlite:///path or redis://host);
+# see docs/mcp-server/observability.md.
+# The backend is created on first use (the lifespan opens it after loading
+# .env), so importing this module neither reads the environment nor opens files.
+_cache_storage = LazyCacheStorage(lambda: os.getenv("STOCKTRIM_MCP_CACHE_URL"))
+_response_cache = TaggedResponseCachingMiddleware(
+    cache_storage=_cache_storage,
+    call_tool_settings=CallToolSettings(
+        ttl=300,  # 5 min — read-heavy tools (products, suppliers, locations)
+        enabled=True,
+        excluded_tools=_CACHE_EXCLUDED_TOOLS,
+    ),
+    read_resource_settings=ReadResourceSettings(
+        ttl=60,  # 60s — resources are for discovery; favor freshness
+        enabled=True,
+    ),
+    # 30 min — entity-tagged reads are purged by our own writes, so the TTL
+    # only bounds changes made outside this server
+    tagged_call_tool_ttl=1800,
+    # Live readiness/progress must never be served from cache
+    excluded_resources=[STATUS_URI],
+    # Report resources are refreshed in the background from 45s of age, and
+    # served up to 60s stale while that refresh runs, so readers never wait
+    # on an order plan query once the entry exists
+    refresh_ahead=0.75,
+    stale_while_revalidate=60,
 )
+mcp.add_middleware(_response_cache)
+
+
+async def _prime_responses(target: str, records: Sequence[Any]) -> None:
+    """Cache the responses warm-up records fully determine.
+
+    The product catalog resource and ``search_products`` read the warmed catalog
+    snapshot directly; the supplier directory report is stored in the response
+    cache, so its first read after a deploy makes no API call either.
+    """
+    if target == "suppliers":
+        report = build_supplier_directory(records)
+        await _response_cache.prime_resource(
+            SUPPLIER_DIRECTORY_URI,
+            ResourceResult(
+                [ResourceContent(json.dumps(report), mime_type="application/json")]
+            ),
+        )
+
+
 logger.info("response_caching_enabled", excluded_tools=len(_CACHE_EXCLUDED_TOOLS))
 
 
@@ -1,16 +1,20 @@
 """Service layer for MCP tools."""
 
 from stocktrim_mcp_server.services.base import BaseService
+from stocktrim_mcp_server.services.catalog import CatalogSnapshot
 from stocktrim_mcp_server.services.inventory import InventoryService
 from stocktrim_mcp_server.services.locations import LocationService
+from stocktrim_mcp_server.services.order_plan import OrderPlanSnapshot
 from stocktrim_mcp_server.services.products import ProductService
 from stocktrim_mcp_server.services.purchase_orders import PurchaseOrderService
 from stocktrim_mcp_server.services.sales_orders import SalesOrderService
 
 __all__ = [
     "BaseService",
+    "CatalogSnapshot",
     "InventoryService",
     "LocationService",
+    "OrderPlanSnapshot",
     "ProductService",
     "PurchaseOrderService",
     "SalesOrderService",
@@ -0,0 +1,219 @@
+"""Indexed, shared snapshot of the product catalog."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import defaultdict
+from collections.abc import Callable, Iterable
+
+from stocktrim_mcp_server.services.base import BaseService
+from stocktrim_public_api_client import Priority, StockTrimClient, request_priority
+from stocktrim_public_api_client.generated.models import ProductsResponseDto
+from stocktrim_public_api_client.utils import unwrap_unset
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_AGE_SECONDS = 300.0
+
+
+class CatalogIndex:
+    """Read-only hash indexes over one download of the product catalog.
+
+    Args:
+        products: Products to index.
+        loaded_at: Monotonic timestamp of the download.
+    """
+
+    def __init__(self, products: Iterable[ProductsResponseDto], loaded_at: float):
+        self.products: list[ProductsResponseDto] = list(products)
+        self.loaded_at = loaded_at
+        self.by_product_id: dict[str, ProductsResponseDto] = {}
+        self.by_code: dict[str, ProductsResponseDto] = {}
+        by_supplier: defaultdict[str, list[ProductsResponseDto]] = defaultdict(list)
+        by_category: defaultdict[str, list[ProductsResponseDto]] = defaultdict(list)
+        self._search_text: list[str] = []
+
+        for product in self.products:
+            if product.product_id:
+                self.by_product_id[product.product_id] = product
+            if code := unwrap_unset(product.product_code_readable):
+                self.by_code[code] = product
+            if supplier_code := unwrap_unset(product.supplier_code):
+                by_supplier[supplier_code].append(product)
+            if category := unwrap_unset(product.category):
+                by_category[category].append(product)
+            self._search_text.append(
+                "\n".join(
+                    unwrap_unset(value) or ""
+                    for value in (
+                        product.product_code_readable,
+                        product.name,
+                        product.category,
+                    )
+                ).casefold()
+            )
+
+        self.by_supplier: dict[str, list[ProductsResponseDto]] = dict(by_supplier)
+        self.by_category: dict[str, list[ProductsResponseDto]] = dict(by_category)
+
+    def search(self, query: str) -> list[ProductsResponseDto]:
+        """Products whose code, name or category contains ``query``, ignoring case."""
+        needle = query.casefold()
+        return [
+            product
+            for product, text in zip(self.products, self._search_text, strict=True)
+            if needle in text
+        ]
+
+
+class CatalogSnapshot(BaseService):
+    """Product catalog loaded once and shared across tool calls.
+
+    The first access downloads the full catalog and builds indexes by
+    ``product_id``, ``product_code_readable``, ``supplier_code`` and
+    ``category``. Once the snapshot is older than ``max_age`` it keeps serving
+    the existing data while a single background task downloads a fresh copy,
+    so lookups never wait on the network after the initial load.
+    """
+
+    def __init__(
+        self,
+        client: StockTrimClient,
+        max_age: float = DEFAULT_MAX_AGE_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize an empty snapshot.
+
+        Args:
+            client: StockTrim API client instance
+            max_age: Seconds before the snapshot is considered stale
+            clock: Monotonic time source, overridable for testing
+        """
+        super().__init__(client)
+        self.max_age = max_age
+        self._clock = clock
+        self._index: CatalogIndex | None = None
+        self._invalidated = False
+        self._lock = asyncio.Lock()
+        self._refresh_task: asyncio.Task[None] | None = None
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the catalog has been downloaded at least once."""
+        return self._index is not None
+
+    @property
+    def is_stale(self) -> bool:
+        """Whether the snapshot is missing or older than ``max_age``."""
+        return (
+            self._index is None
+            or self._invalidated
+            or self._clock() - self._index.loaded_at >= self.max_age
+        )
+
+    @property
+    def index(self) -> CatalogIndex:
+        """The current indexes.
+
+        Raises:
+            RuntimeError: If the catalog has not been loaded yet
+        """
+        if self._index is None:
+            raise RuntimeError("Catalog snapshot not loaded; call ensure_fresh()")
+        return self._index
+
+    async def refresh(self) -> CatalogIndex:
+        """Download the catalog and atomically swap in new indexes.
+
+        Concurrent callers share one download.
+
+        Returns:
+            The freshly built indexes
+
+        Raises:
+            Exception: If the API call fails (existing indexes are kept)
+        """
+        started = self._clock()
+        async with self._lock:
+            # Another caller finished a download while we waited for the lock
+            if (
+                self._index is not None
+                and not self._invalidated
+                and self._index.loaded_at >= started
+            ):
+                return self._index
+
+            logger.info("Loading product catalog snapshot")
+            self._invalidated = False
+            try:
+                products = await self._client.products.get_all_paginated()
+            except Exception:
+                self._invalidated = True
+                raise
+            self._index = CatalogIndex(products, loaded_at=self._clock())
+            logger.info(f"Catalog snapshot loaded: {len(products)} products")
+            return self._index
+
+    async def ensure_fresh(self) -> CatalogIndex:
+        """Return usable indexes, loading or refreshing as needed.
+
+        The first call waits for the download. Later calls return immediately;
+        if the snapshot is stale a background refresh is started.
+
+        Returns:
+            The current indexes
+
+        Raises:
+            Exception: If the initial download fails
+        """
+        if self._index is None:
+            return await self.refresh()
+        if self.is_stale and (self._refresh_task is None or self._refresh_task.done()):
+            self._refresh_task = asyncio.create_task(self._background_refresh())
+        return self._index
+
+    def invalidate(self) -> None:
+        """Mark the snapshot stale so the next access triggers a refresh."""
+        self._invalidated = True
+
+    async def close(self) -> None:
+        """Cancel any in-flight background refresh."""
+        if self._refresh_task is not None and not self._refresh_task.done():
+            self._refresh_task.cancel()
+            await asyncio.gather(self._refresh_task, return_exceptions=True)
+
+    # Lookups (require a loaded snapshot)
+
+    def get_by_product_id(self, product_id: str) -> ProductsResponseDto | None:
+        """Look up a product by its StockTrim product ID."""
+        return self.index.by_product_id.get(product_id)
+
+    def get_by_code(self, code: str) -> ProductsResponseDto | None:
+        """Look up a product by its readable product code."""
+        return self.index.by_code.get(code)
+
+    def list_by_supplier(self, supplier_code: str) -> list[ProductsResponseDto]:
+        """List products whose primary supplier is ``supplier_code``."""
+        return list(self.index.by_supplier.get(supplier_code, ()))
+
+    def list_by_category(self, category: str) -> list[ProductsResponseDto]:
+        """List products in ``category``."""
+        return list(self.index.by_category.get(category, ()))
+
+    def supplier_code_for(self, code: str) -> str | None:
+        """Primary supplier code of the product with readable code ``code``."""
+        product = self.index.by_code.get(code)
+        return unwrap_unset(product.supplier_code) if product else None
+
+    async def _background_refresh(self) -> None:
+        """Refresh without propagating errors; stale data stays in place.
+
+        Runs at low priority so tool calls are served first.
+        """
+        try:
+            with request_priority(Priority.LOW):
+                await self.refresh()
+        except Exception as e:
+            logger.warning(f"Background catalog refresh failed: {e}")
@@ -0,0 +1,157 @@
+"""Shared order plan snapshots keyed by filter criteria."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from stocktrim_mcp_server.services.base import BaseService
+from stocktrim_public_api_client import StockTrimClient
+from stocktrim_public_api_client.generated.models import OrderPlanFilterCriteria
+from stocktrim_public_api_client.helpers.order_plan import LazyOrderPlanRow
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_AGE_SECONDS = 300.0
+DEFAULT_MAX_ENTRIES = 32
+
+
+@dataclass
+class _PlanEntry:
+    rows: list[LazyOrderPlanRow]
+    epoch: int
+    loaded_at: float
+
+
+class OrderPlanSnapshot(BaseService):
+    """Order plan rows fetched once per forecast run and shared across consumers.
+
+    Reports and workflow tools that ask for the order plan with the same
+    filter criteria get the same rows from memory instead of each running an
+    order plan query. An entry is reused until:
+
+    - the forecast generation changes (:meth:`forecast_completed`), since the
+      plan only changes when StockTrim recalculates it;
+    - it is :meth:`invalidate`-d after a write that affects the plan;
+    - it is older than ``max_age``, bounding changes made outside this server.
+
+    Rows are lazy (see ``order_plan.query(lazy=True)``), so fields are decoded
+    on first access and shared by later readers. Callers get their own list
+    and may reorder or filter it, but must not modify the rows.
+    """
+
+    def __init__(
+        self,
+        client: StockTrimClient,
+        max_age: float = DEFAULT_MAX_AGE_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize an empty snapshot.
+
+        Args:
+            client: StockTrim API client instance
+            max_age: Seconds before an entry is fetched again
+            max_entries: Maximum number of distinct filter criteria kept
+            clock: Monotonic time source, overridable for testing
+        """
+        super().__init__(client)
+        self.max_age = max_age
+        self.max_entries = max_entries
+        self._clock = clock
+        self._generation = 0
+        # Advanced by every forecast completion and invalidation; entries and
+        # in-flight loads from an earlier epoch are never served again
+        self._epoch = 0
+        self._entries: OrderedDict[str, _PlanEntry] = OrderedDict()
+        self._loading: dict[str, asyncio.Task[_PlanEntry]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def generation(self) -> int:
+        """Counter advanced every time a forecast run completes."""
+        return self._generation
+
+    @staticmethod
+    def key_for(criteria: OrderPlanFilterCriteria | None) -> str:
+        """Snapshot key of a set of filter criteria."""
+        return json.dumps(
+            (criteria or OrderPlanFilterCriteria()).to_dict(), sort_keys=True
+        )
+
+    async def query(
+        self, criteria: OrderPlanFilterCriteria | None = None
+    ) -> list[LazyOrderPlanRow]:
+        """Order plan rows matching ``criteria``, from the snapshot when current.
+
+        Concurrent callers with the same criteria share one query.
+
+        Args:
+            criteria: Order plan filters (default: the whole plan)
+
+        Returns:
+            A new list of the matching rows
+
+        Raises:
+            Exception: If the order plan query fails
+        """
+        key = self.key_for(criteria)
+        entry = self._entries.get(key)
+        if entry is not None and self._is_current(entry):
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return list(entry.rows)
+
+        self.misses += 1
+        task = self._loading.get(key)
+        if task is None:
+            task = asyncio.create_task(self._load(key, criteria, self._epoch))
+            self._loading[key] = task
+            task.add_done_callback(lambda done: self._forget_load(key, done))
+        return list((await asyncio.shield(task)).rows)
+
+    def forecast_completed(self) -> None:
+        """Start a new forecast generation; every entry is fetched again."""
+        self._generation += 1
+        self.invalidate()
+        logger.info(f"Order plan snapshot generation {self._generation}")
+
+    def invalidate(self) -> None:
+        """Drop every entry so the next query fetches a fresh plan.
+
+        Loads already in flight may return rows from before the change; they
+        still answer their current callers but are not stored, and later
+        queries start a new load instead of joining them.
+        """
+        self._epoch += 1
+        self._entries.clear()
+        self._loading.clear()
+
+    def _forget_load(self, key: str, task: asyncio.Task[_PlanEntry]) -> None:
+        if self._loading.get(key) is task:
+            del self._loading[key]
+
+    def _is_current(self, entry: _PlanEntry) -> bool:
+        return (
+            entry.epoch == self._epoch
+            and self._clock() - entry.loaded_at < self.max_age
+        )
+
+    async def _load(
+        self, key: str, criteria: OrderPlanFilterCriteria | None, epoch: int
+    ) -> _PlanEntry:
+        rows = await self._client.order_plan.query(criteria, lazy=True)
+        entry = _PlanEntry(rows, epoch, self._clock())
+        # A forecast run or write that landed mid-query may have changed the plan
+        if epoch == self._epoch:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry
@@ -0,0 +1,249 @@
+"""Background cache warm-up after server startup."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Literal
+
+from stocktrim_public_api_client import Priority, request_priority
+from stocktrim_public_api_client.entity_cache import PRODUCT, SUPPLIER
+from stocktrim_public_api_client.utils import unwrap_unset
+
+if TYPE_CHECKING:
+    from stocktrim_mcp_server.context import ServerContext
+
+logger = logging.getLogger(__name__)
+
+WARMUP_TARGETS = ("catalog", "suppliers", "locations", "order_plan")
+
+# Called with a warmed target's name and records, e.g. to prime the response
+# cache with a report built from them
+ResponsePrimer = Callable[[str, Sequence[Any]], Awaitable[None]]
+
+StepState = Literal["pending", "running", "done", "failed", "cancelled"]
+
+
+@dataclass
+class WarmupStep:
+    """Progress of one warm-up target.
+
+    Attributes:
+        name: Target name, one of ``WARMUP_TARGETS``.
+        state: Current state of the step.
+        items: Number of records prefetched, once done.
+        seconds: Time the step took, once finished.
+        error: Failure message, if the step failed.
+    """
+
+    name: str
+    state: StepState = "pending"
+    items: int | None = None
+    seconds: float | None = None
+    error: str | None = None
+
+
+def parse_warmup_targets(value: str | None) -> list[str]:
+    """Parse a comma-separated target list such as ``STOCKTRIM_WARMUP``.
+
+    ``None`` or ``"all"`` selects every target; ``""`` or ``"none"`` disables
+    warm-up.
+
+    Raises:
+        ValueError: If a target name is unknown.
+    """
+    if value is None or value.strip().lower() == "all":
+        return list(WARMUP_TARGETS)
+    targets = [t.strip().lower() for t in value.split(",") if t.strip()]
+    if targets in ([], ["none"]):
+        return []
+    unknown = sorted(set(targets) - set(WARMUP_TARGETS))
+    if unknown:
+        raise ValueError(
+            f"Unknown warm-up targets {unknown}; expected any of {list(WARMUP_TARGETS)}"
+        )
+    return [t for t in WARMUP_TARGETS if t in targets]
+
+
+class CacheWarmer:
+    """Prefetches hot data in the background so first requests are served warm.
+
+    Each target runs in turn at low request priority, so tool calls that
+    arrive during warm-up are served first:
+
+    - ``catalog``: downloads the shared product catalog snapshot and seeds the
+      client's entity cache with every product;
+    - ``suppliers``: lists suppliers and seeds the entity cache with them;
+    - ``locations``: lists locations;
+    - ``order_plan``: loads the shared order plan snapshot (whole plan).
+
+    List responses also land in the client's HTTP cache when one is configured,
+    and a ``primer`` passed to :meth:`start` can build cached MCP responses from
+    the fetched records.
+    A failed target is logged and skipped; the server works normally, just cold.
+    """
+
+    def __init__(self, services: ServerContext):
+        """Initialize an idle warmer.
+
+        Args:
+            services: Server context whose caches are warmed
+        """
+        self._services = services
+        self._steps: dict[str, WarmupStep] = {}
+        self._task: asyncio.Task[None] | None = None
+        self._primer: ResponsePrimer | None = None
+        self._started_at: float | None = None
+        self._finished_at: float | None = None
+
+    @property
+    def steps(self) -> list[WarmupStep]:
+        """Progress of each scheduled target, in run order."""
+        return list(self._steps.values())
+
+    @property
+    def ready(self) -> bool:
+        """Whether warm-up has finished (or was never scheduled)."""
+        return self._task is None or self._task.done()
+
+    def start(
+        self,
+        targets: Sequence[str] = WARMUP_TARGETS,
+        primer: ResponsePrimer | None = None,
+    ) -> None:
+        """Start warming ``targets`` in a background task.
+
+        Args:
+            targets: Names from ``WARMUP_TARGETS``, run in the given order
+            primer: Called after each successful target with its records; a
+                failure is logged and does not fail the target
+        """
+        if not targets or self._task is not None:
+            return
+        self._primer = primer
+        self._steps = {name: WarmupStep(name) for name in targets}
+        self._started_at = time.monotonic()
+        self._task = asyncio.create_task(self._run())
+        logger.info(f"Cache warm-up started: {', '.join(targets)}")
+
+    async def wait_ready(self, timeout: float | None = None) -> bool:
+        """Wait for warm-up to finish.
+
+        Args:
+            timeout: Maximum seconds to wait, or None to wait indefinitely
+
+        Returns:
+            Whether warm-up finished within ``timeout``
+        """
+        if self._task is None:
+            return True
+        done, _ = await asyncio.wait({self._task}, timeout=timeout)
+        return bool(done)
+
+    def status(self) -> dict[str, Any]:
+        """Readiness and per-target progress, suitable for a status resource."""
+        finished = sum(s.state in ("done", "failed") for s in self._steps.values())
+        elapsed = None
+        if self._started_at is not None:
+            end = self._finished_at or time.monotonic()
+            elapsed = round(end - self._started_at, 3)
+        return {
+            "ready": self.ready,
+            "progress": finished / len(self._steps) if self._steps else 1.0,
+            "elapsed_seconds": elapsed,
+            "steps": [
+                {
+                    "name": s.name,
+                    "state": s.state,
+                    "items": s.items,
+                    "seconds": s.seconds,
+                    "error": s.error,
+                }
+                for s in self._steps.values()
+            ],
+        }
+
+    async def close(self) -> None:
+        """Cancel warm-up if it is still running."""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+
+    async def _run(self) -> None:
+        runners: dict[str, Callable[[], Awaitable[Sequence[Any]]]] = {
+            "catalog": self._warm_catalog,
+            "suppliers": self._warm_suppliers,
+            "locations": self._warm_locations,
+            "order_plan": self._warm_order_plan,
+        }
+        try:
+            with request_priority(Priority.LOW):
+                for step in self._steps.values():
+                    await self._run_step(step, runners[step.name])
+        finally:
+            for step in self._steps.values():
+                if step.state in ("pending", "running"):
+                    step.state = "cancelled"
+            self._finished_at = time.monotonic()
+        logger.info(f"Cache warm-up finished in {self.status()['elapsed_seconds']}s")
+
+    async def _run_step(
+        self, step: WarmupStep, runner: Callable[[], Awaitable[Sequence[Any]]]
+    ) -> None:
+        step.state = "running"
+        started = time.monotonic()
+        try:
+            records = await runner()
+            step.items = len(records)
+            await self._prime(step.name, records)
+            step.state = "done"
+        except Exception as e:
+            step.state = "failed"
+            step.error = str(e)
+            logger.warning(f"Cache warm-up of {step.name} failed: {e}")
+        finally:
+            step.seconds = round(time.monotonic() - started, 3)
+
+    async def _prime(self, target: str, records: Sequence[Any]) -> None:
+        """Run the primer; its failures leave the warmed data in place."""
+        if self._primer is None:
+            return
+        try:
+            await self._primer(target, records)
+        except Exception as e:
+            logger.warning(f"Priming responses from {target} failed: {e}")
+
+    async def _warm_catalog(self) -> Sequence[Any]:
+        index = await self._services.catalog.refresh()
+        if (cache := self._services.client.entity_cache) is not None:
+            for product in index.products:
+                cache.put(
+                    PRODUCT,
+                    (product.product_id, unwrap_unset(product.product_code_readable)),
+                    product,
+                )
+        return index.products
+
+    async def _warm_suppliers(self) -> Sequence[Any]:
+        result = await self._services.client.suppliers.get_all()
+        suppliers = result if isinstance(result, list) else [result]
+        if (cache := self._services.client.entity_cache) is not None:
+            for supplier in suppliers:
+                cache.put(
+                    SUPPLIER,
+                    (
+                        unwrap_unset(supplier.supplier_code),
+                        unwrap_unset(supplier.supplier_name),
+                    ),
+                    supplier,
+                )
+        return suppliers
+
+    async def _warm_locations(self) -> Sequence[Any]:
+        return await self._services.locations.list_all()
+
+    async def _warm_order_plan(self) -> Sequence[Any]:
+        return await self._services.order_plan.query()
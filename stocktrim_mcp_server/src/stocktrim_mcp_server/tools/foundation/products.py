@@ -119,9 +119,11 @@ async def search_products(
 ) -> ToolResult:
     """Search for products by name, code, or category keywords.
 
-    This tool searches across product fields (name, code, category) using
-    the StockTrim Order Plan API's searchString parameter. Useful for finding
-    products when you don't know the exact product code.
+    This tool searches across product fields (name, code, category). Once the
+    shared catalog snapshot is loaded (by cache warm-up or an earlier call) it
+    is searched in memory; before that, the StockTrim Order Plan API's
+    searchString parameter is used. Useful for finding products when you
+    don't know the exact product code.
 
     Search matches against:
     - Product names (e.g., "blue widget")
@@ -145,6 +147,27 @@ async def search_products(
     """
     services = get_services(context)
 
+    if services.catalog.is_loaded:
+        index = await services.catalog.ensure_fresh()
+        product_infos = [
+            ProductInfo(
+                code=code,
+                description=unwrap_unset(product.name),
+                unit_of_measurement=None,
+                is_active=not unwrap_unset(product.discontinued, False),
+                cost_price=unwrap_unset(product.cost),
+                selling_price=unwrap_unset(product.price),
+            )
+            for product in index.search(request.search_query)
+            if (code := unwrap_unset(product.product_code_readable))
+        ]
+        return make_json_result(
+            SearchProductsResponse(
+                products=product_infos,
+                total_count=len(product_infos),
+            )
+        )
+
     # Use Order Plan API with searchString filter for keyword search
     filter_criteria = OrderPlanFilterCriteria(
         search_string=request.search_query,
@@ -6,7 +6,6 @@ and updating forecast settings for products.
 
 from __future__ import annotations
 
-import asyncio
 import time
 from typing import Annotated, Literal
 
@@ -24,12 +23,16 @@ from stocktrim_public_api_client.client_types import UNSET
 from stocktrim_public_api_client.generated.models.order_plan_filter_criteria import (
     OrderPlanFilterCriteria,
 )
+from stocktrim_public_api_client.generated.models.processing_status_response_dto import (
+    ProcessingStatusResponseDto,
+)
 from stocktrim_public_api_client.generated.models.products_request_dto import (
     ProductsRequestDto,
 )
 from stocktrim_public_api_client.generated.models.sku_optimized_results_dto import (
     SkuOptimizedResultsDto,
 )
+from stocktrim_public_api_client.helpers.order_plan import LazyOrderPlanRow
 
 logger = get_logger(__name__)
 
@@ -325,7 +328,10 @@ class ForecastsUpdateAndMonitorRequest(BaseModel):
         default=True, description="Wait and report progress"
     )
     poll_interval_seconds: int = Field(
-        default=5, description="Status check interval", ge=1, le=60
+        default=5,
+        description="Minimum status check interval (polls adapt to progress)",
+        ge=1,
+        le=60,
     )
     timeout_seconds: int = Field(
         default=600, description="Maximum wait time", ge=30, le=3600
@@ -371,55 +377,69 @@ async def _forecasts_update_and_monitor_impl(
             )
 
         start_time = time.time()
+        last_status: ProcessingStatusResponseDto | None = None
         last_percentage = -1
 
-        while True:
-            status = await client.forecasting.get_processing_status()
-            elapsed = time.time() - start_time
-
+        def _on_status(status: ProcessingStatusResponseDto) -> None:
+            nonlocal last_status, last_percentage
+            last_status = status
             current_percentage = unwrap_unset(status.percentage_complete, 0)
             if current_percentage != last_percentage:
                 logger.info(
                     "forecast_progress",
                     percentage=current_percentage,
-                    elapsed_seconds=round(elapsed, 1),
+                    elapsed_seconds=round(time.time() - start_time, 1),
                     status_message=status.status_message,
                 )
                 last_percentage = current_percentage
 
-            if not status.is_processing:
-                logger.info(
-                    "forecast_complete",
-                    elapsed_seconds=round(elapsed, 1),
-                    final_message=status.status_message,
-                )
-                return ForecastsUpdateAndMonitorResponse(
-                    triggered=True,
-                    completed=True,
-                    status_message=status.status_message or "Calculation complete",
-                    elapsed_seconds=round(elapsed, 1),
-                    progress_percentage=100,
-                )
-
-            if elapsed > request.timeout_seconds:
-                logger.warning(
-                    "forecast_timeout",
-                    elapsed_seconds=round(elapsed, 1),
-                    last_percentage=current_percentage,
-                )
-                return ForecastsUpdateAndMonitorResponse(
-                    triggered=True,
-                    completed=False,
-                    status_message=(
-                        f"Timeout reached after {request.timeout_seconds} seconds; "
-                        f"forecast still processing. Last status: "
-                        f"{status.status_message or 'Processing...'}"
-                    ),
-                    elapsed_seconds=round(elapsed, 1),
-                    progress_percentage=round(current_percentage),
-                )
+        # Polling adapts to reported progress, and sessions waiting on the
+        # same calculation share one poll loop (see wait_for_completion)
+        try:
+            status = await client.forecasting.wait_for_completion(
+                poll_interval=request.poll_interval_seconds,
+                timeout=request.timeout_seconds,
+                on_status=_on_status,
+            )
+        except TimeoutError:
+            elapsed = time.time() - start_time
+            current_percentage = 0
+            last_message = None
+            if last_status is not None:
+                current_percentage = unwrap_unset(last_status.percentage_complete, 0)
+                last_message = last_status.status_message
+            logger.warning(
+                "forecast_timeout",
+                elapsed_seconds=round(elapsed, 1),
+                last_percentage=current_percentage,
+            )
+            return ForecastsUpdateAndMonitorResponse(
+                triggered=True,
+                completed=False,
+                status_message=(
+                    f"Timeout reached after {request.timeout_seconds} seconds; "
+                    f"forecast still processing. Last status: "
+                    f"{last_message or 'Processing...'}"
+                ),
+                elapsed_seconds=round(elapsed, 1),
+                progress_percentage=round(current_percentage),
+            )
 
-            await asyncio.sleep(request.poll_interval_seconds)
+        # Completion is published to client.forecast_events by the status
+        # check itself; the server lifespan refreshes order plan caches
+        elapsed = time.time() - start_time
+        logger.info(
+            "forecast_complete",
+            elapsed_seconds=round(elapsed, 1),
+            final_message=status.status_message,
+        )
+        return ForecastsUpdateAndMonitorResponse(
+            triggered=True,
+            completed=True,
+            status_message=status.status_message or "Calculation complete",
+            elapsed_seconds=round(elapsed, 1),
+            progress_percentage=100,
+        )
 
     except Exception as e:
         # If run_calculations() succeeded but the polling loop blew up, the
@@ -556,7 +576,9 @@ def _priority_for(
     return "LOW"
 
 
-def _to_forecast_item(item: SkuOptimizedResultsDto) -> ForecastItem:
+def _to_forecast_item(
+    item: SkuOptimizedResultsDto | LazyOrderPlanRow,
+) -> ForecastItem:
     """Map an order-plan DTO row to a typed ForecastItem.
 
     Centralises the UNSET → None / default coercion that was inlined six
@@ -614,14 +636,15 @@ async def _forecasts_get_for_products_impl(
 
     try:
         services = get_services(ctx)
-        client = services.client
 
         criteria = OrderPlanFilterCriteria(
             category=category or UNSET,
             supplier=supplier_code or UNSET,
             location=location_code or UNSET,
         )
-        all_items = await client.order_plan.query(criteria)
+        # Shared snapshot of lazy rows: only the handful of the ~80 row
+        # fields read below are decoded (datetimes in particular are skipped)
+        all_items = await services.order_plan.query(criteria)
 
         if request.product_codes:
             all_items = [
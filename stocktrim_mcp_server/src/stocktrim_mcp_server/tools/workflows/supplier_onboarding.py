@@ -6,27 +6,41 @@ with their associated product mappings.
 
 from __future__ import annotations
 
+from collections.abc import Collection
 from typing import Annotated
 
 from fastmcp import Context, FastMCP
 from fastmcp.tools import ToolResult
 from pydantic import BaseModel, Field
 
+from stocktrim_mcp_server.context import ServerContext
 from stocktrim_mcp_server.dependencies import get_services
 from stocktrim_mcp_server.logging_config import get_logger
 from stocktrim_mcp_server.tools.tool_result_utils import make_json_result
 from stocktrim_mcp_server.unpack import Unpack, unpack_pydantic_params
 from stocktrim_mcp_server.utils import to_unset, unwrap_unset
 from stocktrim_public_api_client.client_types import UNSET
+from stocktrim_public_api_client.generated.models import (
+    ProductsResponseDto,
+    SupplierResponseDto,
+)
 from stocktrim_public_api_client.generated.models.product_supplier import (
     ProductSupplier,
 )
 from stocktrim_public_api_client.generated.models.products_request_dto import (
     ProductsRequestDto,
 )
+from stocktrim_public_api_client.helpers.bulk import BulkItemResult, submit_many
 
 logger = get_logger(__name__)
 
+# Maximum product lookups/updates in flight while mapping products
+_MAPPING_CONCURRENCY = 8
+
+# Distinct product codes above which a stale catalog snapshot is downloaded
+# again rather than looking each code up on its own
+_CATALOG_REFRESH_MIN_CODES = 25
+
 # ============================================================================
 # Tool: create_supplier_with_products
 # ============================================================================
@@ -89,6 +103,134 @@ class CreateSupplierWithProductsResponse(BaseModel):
     message: str = Field(description="Summary message")
 
 
+async def _catalog_products(
+    services: ServerContext, codes: Collection[str]
+) -> dict[str, ProductsResponseDto]:
+    """Products for ``codes`` found in the catalog snapshot.
+
+    The products are about to be rewritten, so a stale snapshot is never
+    served. It is downloaded again (one paged download) only when there are
+    at least ``_CATALOG_REFRESH_MIN_CODES`` codes; for fewer, nothing is found
+    and each code is looked up individually, as it is when the catalog can't
+    be loaded.
+    """
+    catalog = services.catalog
+    if catalog.is_stale and len(codes) < _CATALOG_REFRESH_MIN_CODES:
+        return {}
+    try:
+        index = await catalog.refresh() if catalog.is_stale else catalog.index
+    except Exception as e:
+        logger.warning(f"Could not load product catalog for supplier mapping: {e}")
+        return {}
+    return {code: product for code in codes if (product := index.by_code.get(code))}
+
+
+async def _map_products_to_supplier(
+    services: ServerContext,
+    request: CreateSupplierWithProductsRequest,
+    created_supplier: SupplierResponseDto,
+) -> list[ProductMappingSummary]:
+    """Add the new supplier to each mapped product, several products at a time.
+
+    All affected products are resolved up front (each distinct code once):
+    from the shared catalog snapshot when it is fresh (or worth refreshing,
+    see :func:`_catalog_products`), with a ``get_by_code`` lookup for codes
+    it doesn't provide. The updates then run concurrently, at most
+    ``_MAPPING_CONCURRENCY`` requests in flight per phase. Mappings that
+    share a product code are applied in order within one task so each update
+    builds on the previous one's supplier list.
+
+    Returns:
+        One ProductMappingSummary per requested mapping, in request order.
+    """
+    mappings = request.product_mappings
+    by_code: dict[str, list[int]] = {}
+    for index, mapping in enumerate(mappings):
+        by_code.setdefault(mapping.product_code, []).append(index)
+
+    cataloged = await _catalog_products(services, by_code)
+    fetched = await submit_many(
+        [code for code in by_code if code not in cataloged],
+        services.products.get_by_code,
+        concurrency=_MAPPING_CONCURRENCY,
+    )
+    lookups = [
+        BulkItemResult(index, code, product)
+        for index, (code, product) in enumerate(cataloged.items())
+    ] + fetched.results
+    supplier_id = unwrap_unset(created_supplier.id)
+    summaries: dict[int, ProductMappingSummary] = {}
+
+    async def apply(fetch: BulkItemResult[str, ProductsResponseDto | None]) -> None:
+        product_code = fetch.item
+        product = fetch.result
+        suppliers = list(unwrap_unset(product.suppliers, [])) if product else []
+
+        for index in by_code[product_code]:
+            mapping = mappings[index]
+            try:
+                if fetch.error is not None:
+                    raise fetch.error
+
+                if not product:
+                    summaries[index] = ProductMappingSummary(
+                        product_code=product_code,
+                        success=False,
+                        error=f"Product not found: {product_code}",
+                    )
+                    logger.warning(f"Product not found: {product_code}")
+                    continue
+
+                if not supplier_id:
+                    raise ValueError("Created supplier has no ID")
+
+                # Add new mapping to the product's existing suppliers
+                new_suppliers = [
+                    *suppliers,
+                    ProductSupplier(
+                        supplier_id=supplier_id,
+                        supplier_name=request.supplier_name,
+                        supplier_sku_code=mapping.supplier_product_code or UNSET,
+                    ),
+                ]
+
+                # Update product with new supplier mapping
+                update_data = ProductsRequestDto(
+                    product_id=product.product_id,
+                    product_code_readable=to_unset(product.product_code_readable),
+                    suppliers=new_suppliers,
+                )
+
+                # Also update cost if provided
+                if mapping.cost_price is not None:
+                    update_data.cost = mapping.cost_price
+                    # Set the primary supplier code
+                    update_data.supplier_code = request.supplier_code
+
+                # Update product using client directly for complex supplier mapping
+                await services.client.products.create(update_data)
+                suppliers = new_suppliers
+
+                summaries[index] = ProductMappingSummary(
+                    product_code=product_code,
+                    success=True,
+                )
+                logger.info(
+                    f"Product mapping created: {product_code} -> {request.supplier_code}"
+                )
+
+            except Exception as e:
+                summaries[index] = ProductMappingSummary(
+                    product_code=product_code,
+                    success=False,
+                    error=str(e),
+                )
+                logger.error(f"Failed to create mapping for {product_code}: {e}")
+
+    await submit_many(lookups, apply, concurrency=_MAPPING_CONCURRENCY)
+    return [summaries[index] for index in range(len(mappings))]
+
+
 async def _create_supplier_with_products_impl(
     request: CreateSupplierWithProductsRequest, context: Context
 ) -> CreateSupplierWithProductsResponse:
@@ -131,87 +273,10 @@ async def _create_supplier_with_products_impl(
 
         # Step 2: Create product-supplier mappings
         # Only proceed with mappings if supplier creation succeeded
-        mapping_details: list[ProductMappingSummary] = []
-        successful_mappings = 0
-
-        for mapping in request.product_mappings:
-            try:
-                # Fetch existing product
-                existing_product = await services.products.get_by_code(
-                    mapping.product_code
-                )
-
-                if not existing_product:
-                    mapping_details.append(
-                        ProductMappingSummary(
-                            product_code=mapping.product_code,
-                            success=False,
-                            error=f"Product not found: {mapping.product_code}",
-                        )
-                    )
-                    logger.warning(f"Product not found: {mapping.product_code}")
-                    continue
-
-                # Build the product supplier mapping
-                # Get supplier ID from the created supplier
-                supplier_id = unwrap_unset(created_supplier.id)
-
-                if not supplier_id:
-                    raise ValueError("Created supplier has no ID")
-
-                # Get existing suppliers list or create new one
-                existing_suppliers = unwrap_unset(existing_product.suppliers, [])
-
-                # Create new supplier mapping
-                new_supplier_mapping = ProductSupplier(
-                    supplier_id=supplier_id,
-                    supplier_name=request.supplier_name,
-                    supplier_sku_code=mapping.supplier_product_code or UNSET,
-                )
-
-                # Add new mapping to existing suppliers
-                updated_suppliers = [*list(existing_suppliers), new_supplier_mapping]
-
-                # Update product with new supplier mapping
-                update_data = ProductsRequestDto(
-                    product_id=existing_product.product_id,
-                    product_code_readable=to_unset(
-                        existing_product.product_code_readable
-                    ),
-                    suppliers=updated_suppliers,
-                )
-
-                # Also update cost if provided
-                if mapping.cost_price is not None:
-                    update_data.cost = mapping.cost_price
-                    # Set the primary supplier code
-                    update_data.supplier_code = request.supplier_code
-
-                # Update product using client directly for complex supplier mapping
-                await services.client.products.create(update_data)
-
-                mapping_details.append(
-                    ProductMappingSummary(
-                        product_code=mapping.product_code,
-                        success=True,
-                    )
-                )
-                successful_mappings += 1
-                logger.info(
-                    f"Product mapping created: {mapping.product_code} -> {request.supplier_code}"
-                )
-
-            except Exception as e:
-                mapping_details.append(
-                    ProductMappingSummary(
-                        product_code=mapping.product_code,
-                        success=False,
-                        error=str(e),
-                    )
-                )
-                logger.error(
-                    f"Failed to create mapping for {mapping.product_code}: {e}"
-                )
+        mapping_details = await _map_products_to_supplier(
+            services, request, created_supplier
+        )
+        successful_mappings = sum(1 for detail in mapping_details if detail.success)
 
         created_supplier_id = unwrap_unset(created_supplier.id)
         supplier_id = (
@@ -6,7 +6,6 @@ based on forecast data and automatically generating purchase orders.
 
 from __future__ import annotations
 
-from collections import defaultdict
 from typing import Annotated
 
 from fastmcp import Context, FastMCP
@@ -15,6 +14,7 @@ from pydantic import BaseModel, Field
 
 from stocktrim_mcp_server.dependencies import get_services
 from stocktrim_mcp_server.logging_config import get_logger
+from stocktrim_mcp_server.order_plan_analytics import group_costs, select_urgent
 from stocktrim_mcp_server.tools.preferences import load_preferences, resolve
 from stocktrim_mcp_server.tools.tool_result_utils import make_json_result
 from stocktrim_mcp_server.unpack import Unpack, unpack_pydantic_params
@@ -32,6 +32,16 @@ logger = get_logger(__name__)
 
 _NARROWED_LOG_PREVIEW = 5
 
+# Order plan fields copied into each UrgentItemInfo
+_URGENT_ITEM_FIELDS = (
+    "product_code",
+    "name",
+    "stock_on_hand",
+    "order_quantity",
+    "sku_cost",
+    "location_name",
+)
+
 
 def _first_or_unset(values: list[str] | None, field_name: str) -> str | Unset:
     """Narrow a list-shaped MCP request field down to a single API-side filter.
@@ -154,7 +164,6 @@ async def _review_urgent_order_requirements_impl(
     )
 
     try:
-        # Get services from context (note: order_plan not in service layer yet, uses client directly)
         services = get_services(context)
 
         # The /api/OrderPlan endpoint expects an OrderPlanFilterCriteria
@@ -175,30 +184,15 @@ async def _review_urgent_order_requirements_impl(
             category=category or UNSET,
         )
 
-        # Query order plan (uses client directly as order_plan not in service layer)
-        all_items = await services.client.order_plan.query(filter_criteria)
-
-        # Filter items by days threshold
-        urgent_items = []
-        for item in all_items:
-            days = unwrap_unset(item.days_until_stock_out)
-            if days is not None and days < days_threshold:
-                urgent_items.append(item)
-
-        # Sort by urgency (lowest days first)
-        urgent_items.sort(
-            key=lambda x: unwrap_unset(x.days_until_stock_out, float("inf"))
-        )
+        # Query order plan via the shared snapshot. Rows are lazy: only
+        # days_until_stock_out is decoded for non-urgent items.
+        all_items = await services.order_plan.query(filter_criteria)
 
-        # Group by supplier
-        # Note: SkuOptimizedResultsDto doesn't have supplier info directly,
-        # we need to get product details to find the supplier.
-        # We batch fetch products to avoid N+1 queries. This is more efficient
-        # than individual lookups but could be expensive for large catalogs.
-        # Only fetch if we have urgent items to process.
-        supplier_groups: dict[str, list[UrgentItemInfo]] = defaultdict(list)
+        # Threshold filter and urgency sort (lowest days first) over columns
+        urgent = select_urgent(all_items, days_threshold, _URGENT_ITEM_FIELDS)
+        product_codes = urgent["product_code"]
 
-        if not urgent_items:
+        if not product_codes:
             # No urgent items, return empty response early
             return ReviewUrgentOrdersResponse(
                 suppliers=[],
@@ -206,96 +200,83 @@ async def _review_urgent_order_requirements_impl(
                 total_estimated_cost=None,
             )
 
-        # Batch fetch product details for all urgent items
-        product_codes = [
-            item.product_code
-            for item in urgent_items
-            if unwrap_unset(item.product_code) is not None
-        ]
-
-        # Create a mapping of product_code -> supplier_code
-        product_to_supplier = {}
-        if product_codes:
+        # Group by supplier
+        # Note: SkuOptimizedResultsDto doesn't have supplier info directly,
+        # so we look it up in the shared catalog snapshot, which is downloaded
+        # once per server and refreshed in the background when stale.
+        catalog = None
+        if any(product_codes):
             try:
-                # Get all products to build supplier mapping
-                # Note: This fetches the entire product catalog which could be expensive
-                # for large inventories. StockTrim API doesn't provide a batch lookup
-                # method, so this is more efficient than N individual API calls.
-                all_products = await services.products.list_all()
-                for product in all_products:
-                    supplier_code_val = unwrap_unset(product.supplier_code)
-                    if product.product_code_readable and supplier_code_val is not None:
-                        product_to_supplier[product.product_code_readable] = (
-                            supplier_code_val or "UNKNOWN"
-                        )
+                catalog = await services.catalog.ensure_fresh()
             except Exception as e:
                 logger.warning(
-                    f"Could not batch fetch products for supplier mapping: {e}"
+                    f"Could not load product catalog for supplier mapping: {e}"
                 )
                 # Continue without supplier mapping - will use "UNKNOWN"
 
-        for item in urgent_items:
-            # Get supplier from pre-fetched mapping
-            product_code = unwrap_unset(item.product_code)
-            supplier_code = (
-                product_to_supplier.get(product_code, "UNKNOWN")
-                if product_code
-                else "UNKNOWN"
+        by_code = catalog.by_code if catalog else {}
+        supplier_codes = [
+            (
+                unwrap_unset(product.supplier_code)
+                if code and (product := by_code.get(code))
+                else None
             )
+            or "UNKNOWN"
+            for code in product_codes
+        ]
 
-            # Create UrgentItemInfo
-            urgent_item_info = UrgentItemInfo(
+        urgent_item_infos = [
+            UrgentItemInfo(
                 product_code=product_code,
-                description=unwrap_unset(item.name),
-                current_stock=unwrap_unset(item.stock_on_hand),
-                days_until_stock_out=unwrap_unset(item.days_until_stock_out),
-                recommended_order_qty=unwrap_unset(item.order_quantity),
+                description=description,
+                current_stock=current_stock,
+                days_until_stock_out=days,
+                recommended_order_qty=order_qty,
                 supplier_code=supplier_code,
-                estimated_unit_cost=unwrap_unset(item.sku_cost),
-                location_name=unwrap_unset(item.location_name),
+                estimated_unit_cost=unit_cost,
+                location_name=location_name,
             )
-
-            supplier_groups[supplier_code].append(urgent_item_info)
-
-        # Build response with supplier groups
-        supplier_group_infos = []
-        total_cost = 0.0
-        has_cost_data = False
-
-        for supplier_code, items in supplier_groups.items():
-            # Calculate total cost for this supplier
-            supplier_cost = 0.0
-            supplier_has_cost = False
-            for item in items:
-                if (
-                    item.estimated_unit_cost is not None
-                    and item.recommended_order_qty is not None
-                ):
-                    supplier_cost += (
-                        item.estimated_unit_cost * item.recommended_order_qty
-                    )
-                    supplier_has_cost = True
-                    has_cost_data = True
-
-            supplier_group_infos.append(
-                SupplierGroupInfo(
-                    supplier_code=supplier_code,
-                    items=items,
-                    total_items=len(items),
-                    total_estimated_cost=supplier_cost if supplier_has_cost else None,
-                )
+            for (
+                product_code,
+                description,
+                current_stock,
+                days,
+                order_qty,
+                supplier_code,
+                unit_cost,
+                location_name,
+            ) in zip(
+                product_codes,
+                urgent["name"],
+                urgent["stock_on_hand"],
+                urgent["days_until_stock_out"],
+                urgent["order_quantity"],
+                supplier_codes,
+                urgent["sku_cost"],
+                urgent["location_name"],
+                strict=True,
             )
+        ]
 
-            if supplier_has_cost:
-                total_cost += supplier_cost
-
-        # Sort supplier groups by total items (descending)
-        supplier_group_infos.sort(key=lambda x: x.total_items, reverse=True)
+        # Per-supplier cost rollups, largest supplier groups first
+        groups = group_costs(
+            supplier_codes, urgent["sku_cost"], urgent["order_quantity"]
+        )
+        supplier_group_infos = [
+            SupplierGroupInfo(
+                supplier_code=group.key,
+                items=[urgent_item_infos[i] for i in group.positions],
+                total_items=len(group.positions),
+                total_estimated_cost=group.total_cost,
+            )
+            for group in groups
+        ]
+        group_costs_known = [g.total_cost for g in groups if g.total_cost is not None]
 
         response = ReviewUrgentOrdersResponse(
             suppliers=supplier_group_infos,
-            total_items=len(urgent_items),
-            total_estimated_cost=total_cost if has_cost_data else None,
+            total_items=len(product_codes),
+            total_estimated_cost=sum(group_costs_known) if group_costs_known else None,
         )
 
         logger.info(
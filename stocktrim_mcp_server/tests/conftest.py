@@ -4,13 +4,16 @@ from unittest.mock import AsyncMock, MagicMock, create_autospec
 
 import pytest
 
+from stocktrim_mcp_server.services.catalog import CatalogSnapshot
 from stocktrim_mcp_server.services.customers import CustomerService
 from stocktrim_mcp_server.services.inventory import InventoryService
 from stocktrim_mcp_server.services.locations import LocationService
+from stocktrim_mcp_server.services.order_plan import OrderPlanSnapshot
 from stocktrim_mcp_server.services.products import ProductService
 from stocktrim_mcp_server.services.purchase_orders import PurchaseOrderService
 from stocktrim_mcp_server.services.sales_orders import SalesOrderService
 from stocktrim_mcp_server.services.suppliers import SupplierService
+from stocktrim_mcp_server.services.warmup import CacheWarmer
 from stocktrim_public_api_client.generated.models.products_response_dto import (
     ProductsResponseDto,
 )
@@ -65,6 +68,12 @@ def mock_context():
         PurchaseOrderService, instance=True
     )
     lifespan_context.sales_orders = create_autospec(SalesOrderService, instance=True)
+    lifespan_context.catalog = create_autospec(CatalogSnapshot, instance=True)
+    # Cold snapshot: reads fall back to the API until a test loads it
+    lifespan_context.catalog.is_loaded = False
+    lifespan_context.warmer = create_autospec(CacheWarmer, instance=True)
+    # A real (empty) snapshot, so order plan tests keep mocking the client
+    lifespan_context.order_plan = OrderPlanSnapshot(mock_client)
 
     context.request_context.lifespan_context = lifespan_context
 
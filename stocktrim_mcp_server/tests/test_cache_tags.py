@@ -0,0 +1,419 @@
+"""Tests for entity-tagged response cache invalidation."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+
+import pytest
+from fastmcp import Client, Context, FastMCP
+from fastmcp.exceptions import ToolError
+from fastmcp.resources import ResourceResult
+from fastmcp.server.middleware.caching import CallToolSettings, ReadResourceSettings
+
+from stocktrim_mcp_server.cache_tags import (
+    TaggedResponseCachingMiddleware,
+    expand_tags,
+    mutation_tags,
+    resource_tags,
+    tool_tags,
+)
+from stocktrim_mcp_server.dependencies import get_services
+
+
+def _server() -> tuple[FastMCP, dict[str, int]]:
+    """A server whose reads count how often they actually run."""
+    server = FastMCP("test")
+    calls = {"get_product": 0, "search_products": 0, "get_supplier": 0, "report": 0}
+
+    @server.tool
+    def get_product(code: str) -> str:
+        calls["get_product"] += 1
+        return f"{code}#{calls['get_product']}"
+
+    @server.tool
+    def search_products(search_query: str) -> str:
+        calls["search_products"] += 1
+        return f"{search_query}#{calls['search_products']}"
+
+    @server.tool
+    def get_supplier(code: str) -> str:
+        calls["get_supplier"] += 1
+        return code
+
+    @server.tool
+    def configure_product(product_code: str) -> str:
+        return product_code
+
+    @server.tool
+    def delete_product(code: str) -> str:
+        raise ValueError("not allowed")
+
+    @server.tool
+    def create_supplier_with_products(supplier_code: str) -> str:
+        return supplier_code
+
+    @server.resource("stocktrim://reports/urgent-orders")
+    def urgent_orders() -> str:
+        calls["report"] += 1
+        return str(calls["report"])
+
+    @server.tool
+    def forecasts_update_and_monitor() -> str:
+        return "done"
+
+    server.add_middleware(
+        TaggedResponseCachingMiddleware(
+            call_tool_settings=CallToolSettings(
+                ttl=300,
+                excluded_tools=[
+                    "configure_product",
+                    "delete_product",
+                    "create_supplier_with_products",
+                    "forecasts_update_and_monitor",
+                ],
+            ),
+            read_resource_settings=ReadResourceSettings(ttl=60),
+            tagged_call_tool_ttl=1800,
+        )
+    )
+    return server, calls
+
+
+@pytest.mark.asyncio
+async def test_mutation_purges_only_matching_entity():
+    server, calls = _server()
+
+    async with Client(server) as client:
+        await client.call_tool("get_product", {"code": "WIDGET-001"})
+        await client.call_tool("get_product", {"code": "WIDGET-002"})
+        await client.call_tool("get_supplier", {"code": "ACME"})
+        await client.call_tool("configure_product", {"product_code": "WIDGET-001"})
+        refreshed = await client.call_tool("get_product", {"code": "WIDGET-001"})
+        await client.call_tool("get_product", {"code": "WIDGET-002"})
+        await client.call_tool("get_supplier", {"code": "ACME"})
+
+    assert refreshed.data == "WIDGET-001#3"
+    assert calls["get_product"] == 3
+    assert calls["get_supplier"] == 1
+
+
+@pytest.mark.asyncio
+async def test_entity_mutation_purges_collection_reads():
+    server, calls = _server()
+
+    async with Client(server) as client:
+        await client.call_tool("search_products", {"search_query": "WID"})
+        await client.call_tool("search_products", {"search_query": "WID"})
+        await client.call_tool("configure_product", {"product_code": "WIDGET-001"})
+        await client.call_tool("search_products", {"search_query": "WID"})
+
+    assert calls["search_products"] == 2
+
+
+@pytest.mark.asyncio
+async def test_wildcard_mutation_purges_every_entity_of_kind():
+    server, calls = _server()
+
+    async with Client(server) as client:
+        await client.call_tool("get_product", {"code": "WIDGET-001"})
+        await client.call_tool("create_supplier_with_products", {"supplier_code": "S"})
+        await client.call_tool("get_product", {"code": "WIDGET-001"})
+
+    assert calls["get_product"] == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_mutation_keeps_cache():
+    server, calls = _server()
+
+    async with Client(server) as client:
+        await client.call_tool("get_product", {"code": "WIDGET-001"})
+        with pytest.raises(ToolError):
+            await client.call_tool("delete_product", {"code": "WIDGET-001"})
+        await client.call_tool("get_product", {"code": "WIDGET-001"})
+
+    assert calls["get_product"] == 1
+
+
+@pytest.mark.asyncio
+async def test_order_plan_resources_are_purged_by_forecast_run():
+    server, calls = _server()
+
+    async with Client(server) as client:
+        await client.read_resource("stocktrim://reports/urgent-orders")
+        await client.read_resource("stocktrim://reports/urgent-orders")
+        await client.call_tool("forecasts_update_and_monitor", {})
+        await client.read_resource("stocktrim://reports/urgent-orders")
+
+    assert calls["report"] == 2
+
+
+@pytest.mark.asyncio
+async def test_explicit_invalidate():
+    server, calls = _server()
+    middleware = next(
+        m for m in server.middleware if isinstance(m, TaggedResponseCachingMiddleware)
+    )
+
+    async with Client(server) as client:
+        await client.call_tool("get_supplier", {"code": "ACME"})
+        await middleware.invalidate("supplier:ACME")
+        await client.call_tool("get_supplier", {"code": "ACME"})
+
+    assert calls["get_supplier"] == 2
+
+
+@pytest.mark.asyncio
+async def test_invalidation_listeners_see_purged_tags():
+    server, _ = _server()
+    middleware = server.middleware[-1]
+    seen: list[tuple[str, ...]] = []
+    remove = middleware.add_invalidation_listener(seen.append)
+
+    async with Client(server) as client:
+        await client.call_tool("configure_product", {"product_code": "WIDGET-001"})
+        remove()
+        await client.call_tool("forecasts_update_and_monitor", {})
+
+    assert seen == [("order_plan:*", "product:WIDGET-001")]
+
+
+def test_expand_tags():
+    assert expand_tags(["product:{code}"], {"code": "W-1"}) == ["product:W-1"]
+    assert expand_tags(["product:{code}"], {}) == ["product:*"]
+    assert expand_tags(["product:{codes}"], {"codes": ["B", "A"]}) == [
+        "product:A",
+        "product:B",
+    ]
+    assert expand_tags(["order_plan:*"], None) == ["order_plan:*"]
+
+
+def test_tag_tables():
+    assert tool_tags("get_product", {"code": "W-1"}) == ["product:W-1"]
+    assert tool_tags("get_preferences", {}) == []
+    assert mutation_tags("set_product_inventory", {"product_id": "W-1"}) == [
+        "order_plan:*",
+        "product:W-1",
+    ]
+    assert resource_tags("stocktrim://products/catalog") == ["product:*"]
+    assert resource_tags("stocktrim://inventory/MAIN/W-1") == ["product:W-1"]
+    assert resource_tags("stocktrim://reports/inventory-status?days_threshold=7") == [
+        "order_plan:*"
+    ]
+
+
+@pytest.mark.asyncio
+async def test_excluded_resources_are_never_cached():
+    server = FastMCP("test")
+    reads = []
+
+    @server.resource("stocktrim://server/status")
+    def status() -> str:
+        reads.append(1)
+        return str(len(reads))
+
+    server.add_middleware(
+        TaggedResponseCachingMiddleware(
+            excluded_resources=["stocktrim://server/status"]
+        )
+    )
+    async with Client(server) as client:
+        await client.read_resource("stocktrim://server/status")
+        await client.read_resource("stocktrim://server/status")
+
+    assert len(reads) == 2
+
+
+def _report_server(**settings) -> tuple[FastMCP, list[float], asyncio.Event]:
+    """A server with one slow report whose reads are counted."""
+    server = FastMCP("test")
+    reads: list[float] = []
+    release = asyncio.Event()
+    release.set()
+
+    @server.resource("stocktrim://reports/urgent-orders")
+    async def urgent_orders(ctx: Context) -> str:
+        await release.wait()
+        reads.append(time.monotonic())
+        return f"{ctx.fastmcp.name}#{len(reads)}"
+
+    server.add_middleware(
+        TaggedResponseCachingMiddleware(
+            read_resource_settings=ReadResourceSettings(ttl=1), **settings
+        )
+    )
+    return server, reads, release
+
+
+async def _settle() -> None:
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+
+def _age_resources(monkeypatch, middleware, seconds: float) -> None:
+    """Make stored resource entries look ``seconds`` older than they are."""
+    cache = middleware._read_resource_cache
+    ttl = cache.ttl
+
+    async def aged_ttl(**kwargs):
+        value, remaining = await ttl(**kwargs)
+        return value, None if remaining is None else remaining - seconds
+
+    monkeypatch.setattr(cache, "ttl", aged_ttl)
+
+
+@pytest.mark.asyncio
+async def test_stale_resource_is_served_while_refreshing(monkeypatch):
+    server, reads, release = _report_server(stale_while_revalidate=30)
+    uri = "stocktrim://reports/urgent-orders"
+
+    async with Client(server) as client:
+        await client.read_resource(uri)
+        _age_resources(monkeypatch, server.middleware[-1], 1.05)
+
+        release.clear()
+        stale = await client.read_resource(uri)
+        again = await client.read_resource(uri)
+        monkeypatch.undo()
+        release.set()
+        await _settle()
+        fresh = await client.read_resource(uri)
+
+    assert stale[0].text == again[0].text == "test#1"
+    assert fresh[0].text == "test#2"
+    # The two stale reads shared one background refresh
+    assert len(reads) == 2
+
+
+@pytest.mark.asyncio
+async def test_refresh_ahead_replaces_entry_before_expiry(monkeypatch):
+    server, reads, _ = _report_server(refresh_ahead=0.5, stale_while_revalidate=0)
+    uri = "stocktrim://reports/urgent-orders"
+
+    async with Client(server) as client:
+        await client.read_resource(uri)
+        await client.read_resource(uri)
+        assert len(reads) == 1
+
+        _age_resources(monkeypatch, server.middleware[-1], 0.55)
+        served = await client.read_resource(uri)
+        monkeypatch.undo()
+        await _settle()
+        refreshed = await client.read_resource(uri)
+
+    assert served[0].text == "test#1"
+    assert refreshed[0].text == "test#2"
+
+
+@pytest.mark.asyncio
+async def test_close_cancels_background_refreshes(monkeypatch):
+    server, reads, release = _report_server(stale_while_revalidate=30)
+    middleware = server.middleware[-1]
+    uri = "stocktrim://reports/urgent-orders"
+
+    async with Client(server) as client:
+        await client.read_resource(uri)
+        _age_resources(monkeypatch, middleware, 1.05)
+        release.clear()
+        await client.read_resource(uri)
+        await _settle()
+        (refresh,) = middleware._refreshing.values()
+
+        await middleware.close()
+
+    assert refresh.cancelled()
+    assert not middleware._refreshing
+    assert len(reads) == 1
+
+
+@pytest.mark.asyncio
+async def test_purged_resource_is_not_served_stale():
+    server, _, _ = _report_server(stale_while_revalidate=30)
+    middleware = server.middleware[-1]
+    uri = "stocktrim://reports/urgent-orders"
+
+    async with Client(server) as client:
+        await client.read_resource(uri)
+        await middleware.invalidate("order_plan:*")
+        result = await client.read_resource(uri)
+
+    assert result[0].text == "test#2"
+
+
+@pytest.mark.asyncio
+async def test_background_refresh_runs_outside_the_finished_request(monkeypatch):
+    @asynccontextmanager
+    async def lifespan(_: FastMCP):
+        yield {"name": "lifespan"}
+
+    server = FastMCP("test", lifespan=lifespan)
+    requests: list[object] = []
+    release = asyncio.Event()
+    release.set()
+
+    @server.resource("stocktrim://reports/urgent-orders")
+    async def urgent_orders(ctx: Context) -> str:
+        await release.wait()
+        requests.append(ctx.request_context)
+        return f"{get_services(ctx)['name']}#{len(requests)}"
+
+    middleware = TaggedResponseCachingMiddleware(
+        read_resource_settings=ReadResourceSettings(ttl=1), stale_while_revalidate=30
+    )
+    server.add_middleware(middleware)
+    uri = "stocktrim://reports/urgent-orders"
+
+    async with Client(server) as client:
+        await client.read_resource(uri)
+        _age_resources(monkeypatch, middleware, 1.05)
+        release.clear()
+        stale = await client.read_resource(uri)
+        monkeypatch.undo()
+
+        # The triggering request has returned; only now does the refresh read
+        release.set()
+        await _settle()
+        fresh = await client.read_resource(uri)
+
+    assert stale[0].text == "lifespan#1"
+    assert fresh[0].text == "lifespan#2"
+    assert requests[0] is not None
+    assert requests[1] is None
+
+
+@pytest.mark.asyncio
+async def test_primed_resource_is_served_without_reading():
+    server, reads, _ = _report_server()
+    middleware = server.middleware[-1]
+    uri = "stocktrim://reports/urgent-orders"
+
+    assert await middleware.prime_resource(uri, ResourceResult("primed"))
+    async with Client(server) as client:
+        result = await client.read_resource(uri)
+
+    assert result[0].text == "primed"
+    assert reads == []
+
+
+@pytest.mark.asyncio
+async def test_excluded_resource_is_not_primed():
+    server, _, _ = _report_server(
+        excluded_resources=["stocktrim://reports/urgent-orders"]
+    )
+    middleware = server.middleware[-1]
+    uri = "stocktrim://reports/urgent-orders"
+
+    assert not await middleware.prime_resource(uri, ResourceResult("primed"))
+    async with Client(server) as client:
+        result = await client.read_resource(uri)
+
+    assert result[0].text == "test#1"
+
+
+def test_invalid_refresh_settings_raise():
+    with pytest.raises(ValueError, match="refresh_ahead"):
+        TaggedResponseCachingMiddleware(refresh_ahead=1.5)
+    with pytest.raises(ValueError, match="stale_while_revalidate"):
+        TaggedResponseCachingMiddleware(stale_while_revalidate=-1)
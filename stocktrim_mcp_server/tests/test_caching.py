@@ -33,6 +33,15 @@ def test_response_caching_middleware_registered() -> None:
     assert _get_caching_middleware() is not None
 
 
+def test_import_does_not_open_cache_backend(monkeypatch, tmp_path) -> None:
+    """The backend is opened by the lifespan, not when server.py is imported."""
+    monkeypatch.setenv("STOCKTRIM_MCP_CACHE_URL", f"sqlite:///{tmp_path}/c.db")
+    from stocktrim_mcp_server.server import _cache_storage
+
+    assert _get_caching_middleware()._backend is _cache_storage
+    assert not (tmp_path / "c.db").exists()
+
+
 def test_mutating_tools_are_excluded_from_cache() -> None:
     """Every create/delete/set/configure tool is in the cache exclusion list.
 
@@ -104,3 +113,20 @@ def test_read_resource_ttl_favors_freshness() -> None:
     ttl = middleware._read_resource_settings.get("ttl")
     assert ttl is not None, "read_resource TTL should be set explicitly"
     assert 0 < ttl <= 120, f"read_resource TTL too long for discovery: {ttl}"
+
+
+def test_every_mutating_tool_purges_cache_tags() -> None:
+    """Each mutating tool declares the entity tags it purges on success.
+
+    A mutating tool without tags would leave tagged reads of its entity cached
+    for the full (longer) tagged TTL.
+    """
+    from stocktrim_mcp_server.cache_tags import (
+        MUTATION_TAGS,
+        TaggedResponseCachingMiddleware,
+    )
+    from stocktrim_mcp_server.server import _MUTATING_TOOLS
+
+    assert isinstance(_get_caching_middleware(), TaggedResponseCachingMiddleware)
+    missing = set(_MUTATING_TOOLS) - set(MUTATION_TAGS)
+    assert not missing, f"mutating tools without invalidation tags: {missing}"
@@ -0,0 +1,69 @@
+"""Tests for batch order plan analytics."""
+
+from stocktrim_mcp_server.order_plan_analytics import (
+    column,
+    group_costs,
+    select_urgent,
+)
+from stocktrim_public_api_client.client_types import UNSET
+from stocktrim_public_api_client.generated.models import SkuOptimizedResultsDto
+from stocktrim_public_api_client.lazy_models import LazySkuOptimizedResultsDto
+
+
+def _row(code, days, **kwargs):
+    return SkuOptimizedResultsDto(
+        product_code=code, days_until_stock_out=days, **kwargs
+    )
+
+
+def test_column_unwraps_unset():
+    rows = [_row("A", 3), _row("B", UNSET)]
+
+    assert column(rows, "days_until_stock_out") == [3, None]
+
+
+def test_select_urgent_filters_and_sorts_stably():
+    rows = [
+        _row("A", 10),
+        _row("B", 2),
+        _row("C", None),
+        _row("D", 40),
+        _row("E", 2, sku_cost=1.5),
+    ]
+
+    urgent = select_urgent(rows, 30, ["product_code", "sku_cost"])
+
+    assert urgent["product_code"] == ["B", "E", "A"]
+    assert urgent["days_until_stock_out"] == [2, 2, 10]
+    assert urgent["sku_cost"] == [None, 1.5, None]
+
+
+def test_select_urgent_only_decodes_selected_lazy_rows():
+    rows = [
+        LazySkuOptimizedResultsDto({"productCode": "A", "daysUntilStockOut": 1}),
+        LazySkuOptimizedResultsDto({"productCode": "B", "daysUntilStockOut": 90}),
+    ]
+
+    urgent = select_urgent(rows, 30, ["product_code"])
+
+    assert urgent["product_code"] == ["A"]
+    assert "product_code" not in rows[1]._values
+
+
+def test_group_costs_rolls_up_per_key():
+    groups = group_costs(
+        ["S1", "S2", "S2", "S1", "S2"],
+        [2.0, None, 1.0, 3.0, 4.0],
+        [5.0, 1.0, 10.0, None, 1.0],
+    )
+
+    assert [(g.key, g.positions, g.total_cost) for g in groups] == [
+        ("S2", [1, 2, 4], 14.0),
+        ("S1", [0, 3], 10.0),
+    ]
+
+
+def test_group_costs_without_cost_data():
+    groups = group_costs(["S1", "S2"], [None, None], [1.0, 2.0])
+
+    assert [(g.key, g.total_cost) for g in groups] == [("S1", None), ("S2", None)]
@@ -11,6 +11,7 @@ from stocktrim_mcp_server.resources.foundation import (
     _get_products_catalog_resource,
     _get_supplier_resource,
 )
+from stocktrim_mcp_server.services.catalog import CatalogIndex
 from stocktrim_public_api_client.generated.models.customer_dto import CustomerDto
 from stocktrim_public_api_client.generated.models.location_response_dto import (
     LocationResponseDto,
@@ -108,6 +109,22 @@ async def test_get_products_catalog_success(mock_context):
     services.products.list_all.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_get_products_catalog_uses_loaded_snapshot(mock_context):
+    """A loaded catalog snapshot serves the resource without an API call."""
+    services = mock_context.request_context.lifespan_context
+    services.catalog.is_loaded = True
+    services.catalog.ensure_fresh.return_value = CatalogIndex(
+        [ProductsResponseDto(product_id="prod-1", product_code_readable="WIDGET-001")],
+        loaded_at=0.0,
+    )
+
+    result = await _get_products_catalog_resource(mock_context)
+
+    assert [p["product_code"] for p in result["products"]] == ["WIDGET-001"]
+    services.products.list_all.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_get_products_catalog_limits_results(mock_context):
     """Test that catalog limits results to 50 items."""
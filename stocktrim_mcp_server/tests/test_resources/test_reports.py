@@ -9,6 +9,7 @@ from stocktrim_mcp_server.resources.reports import (
     _get_supplier_directory_report,
     _get_urgent_orders_report,
 )
+from stocktrim_mcp_server.services.order_plan import OrderPlanSnapshot
 from stocktrim_public_api_client.generated.models.sku_optimized_results_dto import (
     SkuOptimizedResultsDto,
 )
@@ -27,6 +28,7 @@ def mock_reports_context(mock_context):
     services = mock_context.request_context.lifespan_context
     services.client = AsyncMock()
     services.client.order_plan = AsyncMock()
+    services.order_plan = OrderPlanSnapshot(services.client)
     services.suppliers = AsyncMock()
     return mock_context
 
@@ -106,28 +108,6 @@ async def test_get_inventory_status_report_limits_results(mock_reports_context):
     assert "Limited to 50 items" in result["note"]
 
 
-@pytest.mark.asyncio
-async def test_get_inventory_status_report_handles_single_object(mock_reports_context):
-    """Test report handles single object response (not a list)."""
-    # Setup
-    services = mock_reports_context.request_context.lifespan_context
-    forecast_item = SkuOptimizedResultsDto(
-        product_code="WIDGET-001",
-        days_until_stock_out=5,
-        stock_on_hand=20,
-        order_quantity=100,
-    )
-    services.client.order_plan.query.return_value = forecast_item
-
-    # Execute
-    result = await _get_inventory_status_report(30, mock_reports_context)
-
-    # Verify
-    assert result["total_items"] == 1
-    assert len(result["items"]) == 1
-    assert result["items"][0]["product_code"] == "WIDGET-001"
-
-
 @pytest.mark.asyncio
 async def test_get_inventory_status_report_skips_items_without_code(
     mock_reports_context,
@@ -331,26 +311,6 @@ async def test_get_supplier_directory_limits_to_50(mock_reports_context):
     assert "Limited to 50 suppliers" in result["note"]
 
 
-@pytest.mark.asyncio
-async def test_get_supplier_directory_handles_single_object(mock_reports_context):
-    """Test directory handles single object response (not a list)."""
-    # Setup
-    services = mock_reports_context.request_context.lifespan_context
-    supplier = SupplierResponseDto(
-        supplier_code="SUP-001",
-        supplier_name="Supplier One",
-    )
-    services.suppliers.list_all.return_value = supplier
-
-    # Execute
-    result = await _get_supplier_directory_report(mock_reports_context)
-
-    # Verify
-    assert result["total_suppliers"] == 1
-    assert len(result["suppliers"]) == 1
-    assert result["suppliers"][0]["supplier_code"] == "SUP-001"
-
-
 @pytest.mark.asyncio
 async def test_get_supplier_directory_handles_error(mock_reports_context):
     """Test that supplier directory handles errors gracefully."""
@@ -0,0 +1,16 @@
+"""Tests for server status resources."""
+
+import pytest
+
+from stocktrim_mcp_server.resources.status import _get_server_status
+
+
+@pytest.mark.asyncio
+async def test_get_server_status_reports_warmup(mock_context):
+    warmer = mock_context.request_context.lifespan_context.warmer
+    warmer.status.return_value = {"ready": False, "progress": 0.25, "steps": []}
+
+    result = await _get_server_status(mock_context)
+
+    assert result["report_type"] == "server_status"
+    assert result["warmup"]["progress"] == 0.25
@@ -0,0 +1,170 @@
+"""Tests for the shared product catalog snapshot."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from stocktrim_mcp_server.cache_tags import TaggedResponseCachingMiddleware
+from stocktrim_mcp_server.context import ServerContext
+from stocktrim_mcp_server.services.catalog import CatalogSnapshot
+from stocktrim_public_api_client.generated.models.products_response_dto import (
+    ProductsResponseDto,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def products():
+    return [
+        ProductsResponseDto(
+            product_id="p-1",
+            product_code_readable="WIDGET-001",
+            supplier_code="SUP-001",
+            category="Widgets",
+        ),
+        ProductsResponseDto(
+            product_id="p-2",
+            product_code_readable="WIDGET-002",
+            supplier_code="SUP-001",
+            category="Widgets",
+        ),
+        ProductsResponseDto(
+            product_id="p-3",
+            product_code_readable="GADGET-001",
+            supplier_code="SUP-002",
+        ),
+    ]
+
+
+@pytest.fixture
+def mock_client(products):
+    client = MagicMock()
+    client.products.get_all_paginated = AsyncMock(return_value=products)
+    return client
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def catalog(mock_client, clock):
+    return CatalogSnapshot(mock_client, max_age=60, clock=clock)
+
+
+@pytest.mark.asyncio
+async def test_indexes_by_id_code_supplier_and_category(catalog):
+    await catalog.ensure_fresh()
+
+    assert catalog.get_by_product_id("p-3").product_code_readable == "GADGET-001"
+    assert catalog.get_by_code("WIDGET-002").product_id == "p-2"
+    assert catalog.get_by_code("MISSING") is None
+    assert [p.product_id for p in catalog.list_by_supplier("SUP-001")] == [
+        "p-1",
+        "p-2",
+    ]
+    assert len(catalog.list_by_category("Widgets")) == 2
+    assert catalog.list_by_category("Nope") == []
+    assert catalog.supplier_code_for("GADGET-001") == "SUP-002"
+
+
+@pytest.mark.asyncio
+async def test_search_matches_code_name_and_category(catalog):
+    index = await catalog.ensure_fresh()
+
+    assert [p.product_id for p in index.search("widget-00")] == ["p-1", "p-2"]
+    assert [p.product_id for p in index.search("WIDGETS")] == ["p-1", "p-2"]
+    assert [p.product_id for p in index.search("gadget")] == ["p-3"]
+    assert index.search("sprocket") == []
+
+
+@pytest.mark.asyncio
+async def test_lookup_before_load_raises(catalog):
+    with pytest.raises(RuntimeError, match="not loaded"):
+        catalog.get_by_code("WIDGET-001")
+
+
+@pytest.mark.asyncio
+async def test_catalog_downloaded_once_while_fresh(catalog, mock_client, clock):
+    await catalog.ensure_fresh()
+    clock.now += 30
+    await catalog.ensure_fresh()
+
+    mock_client.products.get_all_paginated.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_first_loads_share_one_download(catalog, mock_client):
+    await asyncio.gather(*(catalog.ensure_fresh() for _ in range(5)))
+
+    mock_client.products.get_all_paginated.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_stale_snapshot_is_served_while_refreshing(
+    catalog, mock_client, clock, products
+):
+    await catalog.ensure_fresh()
+    new_product = ProductsResponseDto(product_id="p-4", product_code_readable="NEW")
+    mock_client.products.get_all_paginated.return_value = [*products, new_product]
+
+    clock.now += 61
+    index = await catalog.ensure_fresh()
+
+    # The stale index is returned immediately; the refresh runs in the background
+    assert "NEW" not in index.by_code
+    await catalog._refresh_task
+    assert catalog.get_by_code("NEW") is new_product
+    assert not catalog.is_stale
+
+
+@pytest.mark.asyncio
+async def test_failed_background_refresh_keeps_existing_data(
+    catalog, mock_client, clock
+):
+    await catalog.ensure_fresh()
+    mock_client.products.get_all_paginated.side_effect = RuntimeError("boom")
+
+    catalog.invalidate()
+    await catalog.ensure_fresh()
+    await catalog._refresh_task
+
+    assert catalog.get_by_code("WIDGET-001") is not None
+    assert catalog.is_stale
+
+
+@pytest.mark.asyncio
+async def test_initial_load_failure_propagates(catalog, mock_client):
+    mock_client.products.get_all_paginated.side_effect = RuntimeError("boom")
+
+    with pytest.raises(RuntimeError, match="boom"):
+        await catalog.ensure_fresh()
+    assert not catalog.is_loaded
+
+
+@pytest.mark.asyncio
+async def test_product_writes_invalidate_the_catalog(mock_client):
+    context = ServerContext(mock_client)
+    context.order_plan.invalidate = MagicMock()
+    await context.catalog.ensure_fresh()
+    response_cache = TaggedResponseCachingMiddleware()
+    response_cache.add_invalidation_listener(context.purge_snapshots)
+
+    await response_cache.invalidate("supplier:SUP-001")
+    assert not context.catalog.is_stale
+
+    await response_cache.invalidate("product:WIDGET-001")
+    assert context.catalog.is_stale
+    context.order_plan.invalidate.assert_not_called()
+
+    await response_cache.invalidate("order_plan:*")
+    context.order_plan.invalidate.assert_called_once()
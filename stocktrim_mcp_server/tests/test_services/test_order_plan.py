@@ -0,0 +1,176 @@
+"""Tests for the shared order plan snapshot."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from stocktrim_mcp_server.services.order_plan import OrderPlanSnapshot
+from stocktrim_public_api_client.generated.models import OrderPlanFilterCriteria
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def mock_client():
+    client = MagicMock()
+    client.order_plan.query = AsyncMock(
+        side_effect=lambda criteria, lazy: [MagicMock(), MagicMock()]
+    )
+    return client
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def snapshot(mock_client, clock):
+    return OrderPlanSnapshot(mock_client, max_age=60, clock=clock)
+
+
+@pytest.mark.asyncio
+async def test_same_criteria_share_one_query(snapshot, mock_client):
+    first = await snapshot.query()
+    second = await snapshot.query(OrderPlanFilterCriteria())
+
+    mock_client.order_plan.query.assert_awaited_once_with(None, lazy=True)
+    assert first == second
+    assert first is not second
+    assert (snapshot.hits, snapshot.misses) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_callers_get_their_own_list(snapshot):
+    rows = await snapshot.query()
+    rows.clear()
+
+    assert len(await snapshot.query()) == 2
+
+
+@pytest.mark.asyncio
+async def test_criteria_are_cached_separately(snapshot, mock_client):
+    await snapshot.query(OrderPlanFilterCriteria(supplier="SUP-001"))
+    await snapshot.query(OrderPlanFilterCriteria(supplier="SUP-002"))
+    await snapshot.query(OrderPlanFilterCriteria(supplier="SUP-001"))
+
+    assert mock_client.order_plan.query.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrent_queries_are_coalesced(snapshot, mock_client):
+    release = asyncio.Event()
+
+    async def slow_query(criteria, lazy):
+        await release.wait()
+        return [MagicMock()]
+
+    mock_client.order_plan.query = AsyncMock(side_effect=slow_query)
+    waiters = [asyncio.create_task(snapshot.query()) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*waiters)
+
+    assert mock_client.order_plan.query.await_count == 1
+    assert results[0] == results[1] == results[2]
+
+
+@pytest.mark.asyncio
+async def test_entries_expire_after_max_age(snapshot, mock_client, clock):
+    await snapshot.query()
+    clock.now += 61
+    await snapshot.query()
+
+    assert mock_client.order_plan.query.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_forecast_completion_starts_new_generation(snapshot, mock_client):
+    await snapshot.query()
+    snapshot.forecast_completed()
+    await snapshot.query()
+
+    assert snapshot.generation == 1
+    assert mock_client.order_plan.query.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_query_racing_forecast_completion_is_not_kept(snapshot, mock_client):
+    async def query_during_forecast(criteria, lazy):
+        snapshot.forecast_completed()
+        return [MagicMock()]
+
+    mock_client.order_plan.query = AsyncMock(side_effect=query_during_forecast)
+    await snapshot.query()
+    await snapshot.query()
+
+    assert mock_client.order_plan.query.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_invalidate_drops_entries(snapshot, mock_client):
+    await snapshot.query()
+    snapshot.invalidate()
+    await snapshot.query()
+
+    assert mock_client.order_plan.query.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_least_recently_used_criteria_are_evicted(mock_client, clock):
+    snapshot = OrderPlanSnapshot(mock_client, max_entries=2, clock=clock)
+    for supplier in ("A", "B", "A", "C", "A"):
+        await snapshot.query(OrderPlanFilterCriteria(supplier=supplier))
+
+    # B was evicted when C arrived; A stayed recently used throughout
+    assert mock_client.order_plan.query.await_count == 3
+    await snapshot.query(OrderPlanFilterCriteria(supplier="B"))
+    assert mock_client.order_plan.query.await_count == 4
+
+
+@pytest.mark.asyncio
+async def test_failed_query_is_not_cached(snapshot, mock_client):
+    mock_client.order_plan.query = AsyncMock(
+        side_effect=[RuntimeError("boom"), [MagicMock()]]
+    )
+
+    with pytest.raises(RuntimeError, match="boom"):
+        await snapshot.query()
+    assert len(await snapshot.query()) == 1
+
+
+@pytest.mark.asyncio
+async def test_write_during_load_forces_fresh_fetch(snapshot, mock_client):
+    release = asyncio.Event()
+    calls = 0
+
+    async def query(criteria, lazy):
+        nonlocal calls
+        calls += 1
+        version = calls
+        if version == 1:
+            await release.wait()
+        return [f"rows-v{version}"]
+
+    mock_client.order_plan.query = AsyncMock(side_effect=query)
+    before_write = asyncio.create_task(snapshot.query())
+    await asyncio.sleep(0)
+
+    # A mutation purges order_plan:* while the first load is still running
+    snapshot.invalidate()
+    after_write = asyncio.create_task(snapshot.query())
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await before_write == ["rows-v1"]
+    assert await after_write == ["rows-v2"]
+    # The pre-write rows were not stored either
+    assert await snapshot.query() == ["rows-v2"]
+    assert calls == 2
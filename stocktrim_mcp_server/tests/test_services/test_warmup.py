@@ -0,0 +1,180 @@
+"""Tests for background cache warm-up."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from stocktrim_mcp_server.context import ServerContext
+from stocktrim_mcp_server.resources.foundation import _get_products_catalog_resource
+from stocktrim_mcp_server.services.warmup import (
+    WARMUP_TARGETS,
+    parse_warmup_targets,
+)
+from stocktrim_mcp_server.tools.foundation.products import (
+    SearchProductsResponse,
+    search_products,
+)
+from stocktrim_mcp_server.tools.tool_result_utils import unwrap_tool_result
+from stocktrim_public_api_client import EntityCache
+from stocktrim_public_api_client.generated.models import (
+    LocationResponseDto,
+    ProductsResponseDto,
+    SupplierResponseDto,
+)
+
+
+@pytest.fixture
+def mock_client():
+    client = MagicMock()
+    client.entity_cache = EntityCache(ttl=60)
+    client.products.get_all_paginated = AsyncMock(
+        return_value=[
+            ProductsResponseDto(
+                product_id="p-1", product_code_readable="WIDGET-001", name="Widget"
+            )
+        ]
+    )
+    client.products.get_all = AsyncMock()
+    client.suppliers.get_all = AsyncMock(
+        return_value=[
+            SupplierResponseDto(supplier_code="SUP-001", supplier_name="Acme")
+        ]
+    )
+    client.locations.get_all = AsyncMock(
+        return_value=[LocationResponseDto(location_code="MAIN")]
+    )
+    client.order_plan.query = AsyncMock(return_value=[MagicMock(), MagicMock()])
+    return client
+
+
+@pytest.fixture
+def services(mock_client):
+    return ServerContext(client=mock_client)
+
+
+@pytest.mark.asyncio
+async def test_warmup_prefetches_every_target(services, mock_client):
+    services.warmer.start(WARMUP_TARGETS)
+    assert not services.warmer.ready
+
+    assert await services.warmer.wait_ready(timeout=1)
+
+    status = services.warmer.status()
+    assert status["ready"] is True
+    assert status["progress"] == 1.0
+    assert [(s["name"], s["state"], s["items"]) for s in status["steps"]] == [
+        ("catalog", "done", 1),
+        ("suppliers", "done", 1),
+        ("locations", "done", 1),
+        ("order_plan", "done", 2),
+    ]
+    assert services.catalog.is_loaded
+    assert mock_client.entity_cache.get("product", "WIDGET-001") is not None
+    assert mock_client.entity_cache.get("supplier", "SUP-001") is not None
+
+
+@pytest.mark.asyncio
+async def test_failed_target_does_not_stop_warmup(services, mock_client):
+    mock_client.suppliers.get_all.side_effect = RuntimeError("boom")
+
+    services.warmer.start(["suppliers", "locations"])
+    await services.warmer.wait_ready(timeout=1)
+
+    steps = services.warmer.status()["steps"]
+    assert (steps[0]["state"], steps[0]["error"]) == ("failed", "boom")
+    assert steps[1]["state"] == "done"
+
+
+@pytest.mark.asyncio
+async def test_progress_is_reported_while_running(services, mock_client):
+    release = asyncio.Event()
+
+    async def slow_query(*args, **kwargs):
+        await release.wait()
+        return []
+
+    mock_client.order_plan.query = AsyncMock(side_effect=slow_query)
+    services.warmer.start(["locations", "order_plan"])
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+    status = services.warmer.status()
+    assert status["ready"] is False
+    assert status["progress"] == 0.5
+    assert status["steps"][1]["state"] == "running"
+
+    await services.warmer.close()
+    assert services.warmer.status()["steps"][1]["state"] == "cancelled"
+
+
+@pytest.mark.asyncio
+async def test_primer_receives_warmed_records(services, mock_client):
+    primed: dict[str, list] = {}
+
+    async def primer(target, records):
+        primed[target] = list(records)
+
+    services.warmer.start(["suppliers", "locations"], primer=primer)
+    await services.warmer.wait_ready(timeout=1)
+
+    assert primed == {
+        "suppliers": mock_client.suppliers.get_all.return_value,
+        "locations": mock_client.locations.get_all.return_value,
+    }
+
+
+@pytest.mark.asyncio
+async def test_primer_failure_keeps_warmed_target_done(services):
+    primer = AsyncMock(side_effect=RuntimeError("cache down"))
+
+    services.warmer.start(["suppliers"], primer=primer)
+    await services.warmer.wait_ready(timeout=1)
+
+    assert services.warmer.status()["steps"][0]["state"] == "done"
+
+
+@pytest.mark.asyncio
+async def test_warmed_server_serves_catalog_reads_without_api_calls(
+    services, mock_client
+):
+    services.warmer.start(["catalog"])
+    await services.warmer.wait_ready(timeout=1)
+    context = MagicMock()
+    context.request_context.lifespan_context = services
+
+    result = await search_products(search_query="widget", context=context)
+    catalog = await _get_products_catalog_resource(context)
+
+    found = unwrap_tool_result(result, SearchProductsResponse)
+    assert [p.code for p in found.products] == ["WIDGET-001"]
+    assert [p["product_code"] for p in catalog["products"]] == ["WIDGET-001"]
+    # Only warm-up's download reached the API
+    mock_client.products.get_all_paginated.assert_awaited_once()
+    mock_client.products.get_all.assert_not_awaited()
+    mock_client.order_plan.query.assert_not_awaited()
+
+
+def test_no_targets_means_ready(services):
+    services.warmer.start([])
+    assert services.warmer.ready
+    assert services.warmer.status()["progress"] == 1.0
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (None, list(WARMUP_TARGETS)),
+        ("all", list(WARMUP_TARGETS)),
+        ("none", []),
+        ("", []),
+        ("order_plan, catalog", ["catalog", "order_plan"]),
+    ],
+)
+def test_parse_warmup_targets(value, expected):
+    assert parse_warmup_targets(value) == expected
+
+
+def test_parse_warmup_targets_rejects_unknown():
+    with pytest.raises(ValueError, match="Unknown warm-up targets"):
+        parse_warmup_targets("catalog,widgets")
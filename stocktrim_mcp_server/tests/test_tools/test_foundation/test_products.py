@@ -10,6 +10,7 @@ from fastmcp.server.elicitation import (
     DeclinedElicitation,
 )
 
+from stocktrim_mcp_server.services.catalog import CatalogIndex
 from stocktrim_mcp_server.tools.foundation.products import (
     CreateProductResponse,
     DeleteProductResponse,
@@ -203,6 +204,36 @@ async def test_search_products_empty(mock_product_context):
     assert len(response.products) == 0
 
 
+@pytest.mark.asyncio
+async def test_search_products_uses_loaded_catalog(mock_product_context):
+    """A loaded catalog snapshot is searched without an API call."""
+    services = mock_product_context.request_context.lifespan_context
+    services.catalog.is_loaded = True
+    services.catalog.ensure_fresh.return_value = CatalogIndex(
+        [
+            ProductsResponseDto(
+                product_id="p-1",
+                product_code_readable="WIDGET-001",
+                name="Blue Widget",
+                cost=15.5,
+                price=25.0,
+            ),
+            ProductsResponseDto(
+                product_id="p-2", product_code_readable="GADGET-001", name="Gadget"
+            ),
+        ],
+        loaded_at=0.0,
+    )
+
+    response = await _call_search(search_query="widget", context=mock_product_context)
+
+    assert response.total_count == 1
+    assert response.products[0].code == "WIDGET-001"
+    assert response.products[0].cost_price == 15.5
+    assert response.products[0].is_active is True
+    services.client.order_plan.query.assert_not_called()
+
+
 # ============================================================================
 # Test create_product
 # ============================================================================
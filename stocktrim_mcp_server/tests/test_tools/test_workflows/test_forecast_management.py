@@ -5,6 +5,7 @@ from unittest.mock import AsyncMock, Mock
 
 import pytest
 
+from stocktrim_mcp_server.services.order_plan import OrderPlanSnapshot
 from stocktrim_mcp_server.tools.tool_result_utils import unwrap_tool_result
 from stocktrim_mcp_server.tools.workflows.forecast_management import (
     ForecastsGetForProductsRequest,
@@ -29,6 +30,7 @@ from stocktrim_public_api_client.generated.models.products_response_dto import (
 from stocktrim_public_api_client.generated.models.sku_optimized_results_dto import (
     SkuOptimizedResultsDto,
 )
+from stocktrim_public_api_client.helpers.forecasting import Forecasting
 
 
 async def _call_manage_group(*args: Any, **kw: Any) -> ManageForecastGroupResponse:
@@ -65,15 +67,15 @@ def fast_polling_loop(monkeypatch):
     """Make ``forecasts_update_and_monitor``'s polling loop run at zero
     wall-clock cost.
 
-    The impl loops on ``time.time() - start_time > timeout_seconds`` with an
-    ``asyncio.sleep(poll_interval_seconds)`` between iterations; using real
-    sleeps blocks CI for the full ``timeout_seconds`` (30+) every test run
-    (Copilot review, PR #188). Patches: ``asyncio.sleep`` becomes a no-op,
-    and ``time.time`` returns 0 once (for ``start_time``) then a value past
-    any plausible ``timeout_seconds`` so iteration 2's elapsed check exits
-    immediately.
+    ``Forecasting.wait_for_completion`` polls until ``time.time()`` passes its
+    deadline, sleeping between polls; using real sleeps blocks CI for the full
+    ``timeout_seconds`` (30+) every test run (Copilot review, PR #188).
+    Patches: ``asyncio.sleep`` becomes a no-op, and every ``time.time`` call
+    advances the clock past any plausible ``timeout_seconds``, so the first
+    poll after the deadline is computed times out immediately.
     """
     import asyncio
+    import itertools
 
     from stocktrim_mcp_server.tools.workflows import forecast_management
 
@@ -81,7 +83,7 @@ def fast_polling_loop(monkeypatch):
         return None
 
     monkeypatch.setattr(asyncio, "sleep", _no_sleep)
-    times = iter([0.0] + [10_000.0] * 100)
+    times = itertools.count(0.0, 10_000.0)
     monkeypatch.setattr(forecast_management.time, "time", lambda: next(times))
 
 
@@ -280,7 +282,7 @@ async def test_forecasts_update_and_monitor_trigger_only(mock_context):
     # Setup
     services = mock_context.request_context.lifespan_context
     services.client = Mock()
-    services.client.forecasting = Mock()
+    services.client.forecasting = Forecasting(Mock(spec=[]))
     services.client.forecasting.run_calculations = AsyncMock()
 
     # Execute
@@ -303,7 +305,7 @@ async def test_forecasts_update_and_monitor_wait_success(mock_context):
     # Setup
     services = mock_context.request_context.lifespan_context
     services.client = Mock()
-    services.client.forecasting = Mock()
+    services.client.forecasting = Forecasting(Mock(spec=[]))
     services.client.forecasting.run_calculations = AsyncMock()
 
     # Mock status progression: processing -> complete
@@ -344,7 +346,7 @@ async def test_forecasts_update_and_monitor_timeout(mock_context, fast_polling_l
     # Setup
     services = mock_context.request_context.lifespan_context
     services.client = Mock()
-    services.client.forecasting = Mock()
+    services.client.forecasting = Forecasting(Mock(spec=[]))
     services.client.forecasting.run_calculations = AsyncMock()
 
     # Mock status that never completes
@@ -377,7 +379,7 @@ async def test_forecasts_update_and_monitor_error(mock_context):
     # Setup
     services = mock_context.request_context.lifespan_context
     services.client = Mock()
-    services.client.forecasting = Mock()
+    services.client.forecasting = Forecasting(Mock(spec=[]))
     services.client.forecasting.run_calculations = AsyncMock(
         side_effect=Exception("API Error")
     )
@@ -405,7 +407,7 @@ async def test_forecasts_update_and_monitor_keeps_triggered_when_polling_fails(
     while a background calculation is still running (Copilot review, PR #188)."""
     services = mock_context.request_context.lifespan_context
     services.client = Mock()
-    services.client.forecasting = Mock()
+    services.client.forecasting = Forecasting(Mock(spec=[]))
     services.client.forecasting.run_calculations = AsyncMock()
     services.client.forecasting.get_processing_status = AsyncMock(
         side_effect=Exception("status check exploded")
@@ -431,7 +433,7 @@ async def test_forecasts_update_and_monitor_rounds_progress_percentage(
     (Copilot review, PR #188 — int(99.7) == 99 surprised callers)."""
     services = mock_context.request_context.lifespan_context
     services.client = Mock()
-    services.client.forecasting = Mock()
+    services.client.forecasting = Forecasting(Mock(spec=[]))
     services.client.forecasting.run_calculations = AsyncMock()
     services.client.forecasting.get_processing_status = AsyncMock(
         return_value=ProcessingStatusResponseDto(
@@ -542,6 +544,7 @@ async def test_forecasts_get_for_products_with_filters(mock_context):
     services = mock_context.request_context.lifespan_context
     services.client = Mock()
     services.client.order_plan = Mock()
+    services.order_plan = OrderPlanSnapshot(services.client)
 
     # Mock forecast data
     mock_items = [
@@ -594,6 +597,7 @@ async def test_forecasts_get_for_products_empty_results(mock_context):
     services = mock_context.request_context.lifespan_context
     services.client = Mock()
     services.client.order_plan = Mock()
+    services.order_plan = OrderPlanSnapshot(services.client)
     services.client.order_plan.query = AsyncMock(return_value=[])
 
     # Execute
@@ -617,6 +621,7 @@ async def test_forecasts_get_for_products_sorting(mock_context):
     services = mock_context.request_context.lifespan_context
     services.client = Mock()
     services.client.order_plan = Mock()
+    services.order_plan = OrderPlanSnapshot(services.client)
 
     # Mock unsorted data
     mock_items = [
@@ -658,6 +663,7 @@ async def test_forecasts_get_for_products_priority_indicators(mock_context):
     services = mock_context.request_context.lifespan_context
     services.client = Mock()
     services.client.order_plan = Mock()
+    services.order_plan = OrderPlanSnapshot(services.client)
 
     # Mock items with different urgency levels
     mock_items = [
@@ -711,6 +717,7 @@ async def test_forecasts_get_for_products_truncated_for_size_only_when_dropped(
     services = mock_context.request_context.lifespan_context
     services.client = Mock()
     services.client.order_plan = Mock()
+    services.order_plan = OrderPlanSnapshot(services.client)
 
     # Build 30 items, each with the default per-item byte estimate. With
     # ESTIMATED_CHARS_PER_FORECAST_ITEM=500 and MAX_RESPONSE_SIZE_BYTES=400_000,
@@ -744,6 +751,7 @@ async def test_forecasts_get_for_products_filter_by_codes(mock_context):
     services = mock_context.request_context.lifespan_context
     services.client = Mock()
     services.client.order_plan = Mock()
+    services.order_plan = OrderPlanSnapshot(services.client)
 
     # Mock data with various products
     mock_items = [
@@ -793,6 +801,7 @@ async def test_forecasts_get_for_products_error(mock_context):
     services = mock_context.request_context.lifespan_context
     services.client = Mock()
     services.client.order_plan = Mock()
+    services.order_plan = OrderPlanSnapshot(services.client)
     services.client.order_plan.query = AsyncMock(side_effect=Exception("API Error"))
 
     # Execute
@@ -816,6 +825,7 @@ async def test_forecasts_get_for_products_missing_days_is_unknown_priority(
     services = mock_context.request_context.lifespan_context
     services.client = Mock()
     services.client.order_plan = Mock()
+    services.order_plan = OrderPlanSnapshot(services.client)
 
     mock_items = [
         SkuOptimizedResultsDto(
@@ -869,6 +879,7 @@ async def test_forecasts_get_for_products_summary_stats(mock_context):
     services = mock_context.request_context.lifespan_context
     services.client = Mock()
     services.client.order_plan = Mock()
+    services.order_plan = OrderPlanSnapshot(services.client)
 
     mock_items = [
         SkuOptimizedResultsDto(
@@ -919,6 +930,7 @@ async def test_forecasts_get_for_products_falls_back_to_pref_filters(mock_contex
     services = mock_context.request_context.lifespan_context
     services.client = Mock()
     services.client.order_plan = Mock()
+    services.order_plan = OrderPlanSnapshot(services.client)
     services.client.order_plan.query = AsyncMock(return_value=[])
 
     # No filter args supplied — must inherit all three from prefs.
@@ -950,6 +962,7 @@ async def test_forecasts_get_for_products_explicit_args_override_prefs(mock_cont
     services = mock_context.request_context.lifespan_context
     services.client = Mock()
     services.client.order_plan = Mock()
+    services.order_plan = OrderPlanSnapshot(services.client)
     services.client.order_plan.query = AsyncMock(return_value=[])
 
     request = ForecastsGetForProductsRequest(
@@ -1,12 +1,15 @@
 """Tests for supplier onboarding workflow tools."""
 
+import asyncio
 from typing import Any
 from unittest.mock import AsyncMock
 
 import pytest
 
+from stocktrim_mcp_server.services.catalog import CatalogIndex
 from stocktrim_mcp_server.tools.tool_result_utils import unwrap_tool_result
 from stocktrim_mcp_server.tools.workflows.supplier_onboarding import (
+    _CATALOG_REFRESH_MIN_CODES,
     CreateSupplierWithProductsRequest,
     CreateSupplierWithProductsResponse,
     SupplierProductMapping,
@@ -33,6 +36,9 @@ def mock_supplier_onboarding_context(mock_context):
     services.products = AsyncMock()
     services.client = AsyncMock()
     services.client.products = AsyncMock()
+    # An empty catalog: every code falls back to products.get_by_code
+    services.catalog.is_stale = True
+    services.catalog.refresh.return_value = CatalogIndex([], loaded_at=0.0)
     return mock_context
 
 
@@ -330,3 +336,163 @@ async def test_create_supplier_with_products_mapping_api_error(
     assert response.mappings_successful == 0
     assert response.mapping_details[0].success is False
     assert "API Error" in (response.mapping_details[0].error or "")
+
+
+@pytest.mark.asyncio
+async def test_create_supplier_with_products_maps_concurrently(
+    mock_supplier_onboarding_context, sample_supplier
+):
+    """Test mappings run concurrently, fetching each product once."""
+    services = mock_supplier_onboarding_context.request_context.lifespan_context
+    services.suppliers.create.return_value = sample_supplier
+
+    in_flight = 0
+    max_in_flight = 0
+
+    async def get_by_code(code):
+        return ProductsResponseDto(
+            product_id=f"id-{code}",
+            product_code_readable=code,
+            suppliers=[ProductSupplier(supplier_id="old", supplier_name="Old")],
+        )
+
+    async def create(update):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return ProductsResponseDto(product_id=update.product_id)
+
+    services.products.get_by_code.side_effect = get_by_code
+    services.client.products.create.side_effect = create
+
+    codes = [f"P-{i}" for i in range(5)]
+    request = CreateSupplierWithProductsRequest(
+        supplier_code="SUP-001",
+        supplier_name="Test Supplier",
+        product_mappings=[
+            *(SupplierProductMapping(product_code=code) for code in codes),
+            SupplierProductMapping(product_code="P-0", supplier_product_code="ALT"),
+        ],
+    )
+    response = await _call_create(request, mock_supplier_onboarding_context)
+
+    assert [d.product_code for d in response.mapping_details] == [*codes, "P-0"]
+    assert response.mappings_successful == 6
+    assert max_in_flight > 1
+    # Each distinct product is fetched once
+    assert services.products.get_by_code.await_count == 5
+    # The second P-0 mapping builds on the first one's supplier list
+    p0_updates = [
+        call.args[0]
+        for call in services.client.products.create.await_args_list
+        if call.args[0].product_id == "id-P-0"
+    ]
+    assert [len(u.suppliers) for u in p0_updates] == [2, 3]
+    assert p0_updates[1].suppliers[-1].supplier_sku_code == "ALT"
+
+
+def _catalog_product(code: str) -> ProductsResponseDto:
+    return ProductsResponseDto(
+        product_id=f"id-{code}", product_code_readable=code, suppliers=[]
+    )
+
+
+async def _get_missing(code: str) -> ProductsResponseDto:
+    return _catalog_product(code)
+
+
+def _mapping_request(*codes: str) -> CreateSupplierWithProductsRequest:
+    return CreateSupplierWithProductsRequest(
+        supplier_code="SUP-001",
+        supplier_name="Test Supplier",
+        product_mappings=[SupplierProductMapping(product_code=c) for c in codes],
+    )
+
+
+@pytest.mark.asyncio
+async def test_create_supplier_with_products_resolves_codes_from_catalog(
+    mock_supplier_onboarding_context, sample_supplier
+):
+    """Codes in a fresh catalog snapshot are not looked up one by one."""
+    services = mock_supplier_onboarding_context.request_context.lifespan_context
+    services.suppliers.create.return_value = sample_supplier
+    services.catalog.is_stale = False
+    services.catalog.index = CatalogIndex(
+        [_catalog_product("P-1"), _catalog_product("P-2")], loaded_at=0.0
+    )
+    services.products.get_by_code.side_effect = _get_missing
+
+    response = await _call_create(
+        _mapping_request("P-1", "P-2", "P-3"), mock_supplier_onboarding_context
+    )
+
+    assert response.mappings_successful == 3
+    services.catalog.refresh.assert_not_awaited()
+    services.products.get_by_code.assert_awaited_once_with("P-3")
+    updated = {
+        call.args[0].product_id
+        for call in services.client.products.create.await_args_list
+    }
+    assert updated == {"id-P-1", "id-P-2", "id-P-3"}
+
+
+@pytest.mark.asyncio
+async def test_create_supplier_with_few_products_skips_stale_catalog(
+    mock_supplier_onboarding_context, sample_supplier
+):
+    """A stale snapshot isn't downloaded again for a handful of codes."""
+    services = mock_supplier_onboarding_context.request_context.lifespan_context
+    services.suppliers.create.return_value = sample_supplier
+    services.products.get_by_code.side_effect = _get_missing
+
+    response = await _call_create(
+        _mapping_request("P-1", "P-2", "P-3"), mock_supplier_onboarding_context
+    )
+
+    assert response.mappings_successful == 3
+    services.catalog.refresh.assert_not_awaited()
+    assert services.products.get_by_code.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_create_supplier_with_many_products_refreshes_stale_catalog(
+    mock_supplier_onboarding_context, sample_supplier
+):
+    """Enough codes make one catalog download cheaper than per-code lookups."""
+    services = mock_supplier_onboarding_context.request_context.lifespan_context
+    services.suppliers.create.return_value = sample_supplier
+    codes = [f"P-{i}" for i in range(_CATALOG_REFRESH_MIN_CODES)]
+    services.catalog.refresh.return_value = CatalogIndex(
+        [_catalog_product(code) for code in codes[1:]], loaded_at=0.0
+    )
+    services.products.get_by_code.side_effect = _get_missing
+
+    response = await _call_create(
+        _mapping_request(*codes), mock_supplier_onboarding_context
+    )
+
+    assert response.mappings_successful == len(codes)
+    services.catalog.refresh.assert_awaited_once()
+    services.products.get_by_code.assert_awaited_once_with("P-0")
+
+
+@pytest.mark.asyncio
+async def test_create_supplier_with_products_catalog_failure_falls_back(
+    mock_supplier_onboarding_context, sample_supplier
+):
+    """If the catalog can't be loaded, every code is looked up individually."""
+    services = mock_supplier_onboarding_context.request_context.lifespan_context
+    services.suppliers.create.return_value = sample_supplier
+    services.catalog.refresh.side_effect = RuntimeError("catalog down")
+    services.products.get_by_code.side_effect = _get_missing
+    codes = [f"P-{i}" for i in range(_CATALOG_REFRESH_MIN_CODES)]
+
+    response = await _call_create(
+        _mapping_request(*codes), mock_supplier_onboarding_context
+    )
+
+    assert response.mappings_successful == len(codes)
+    services.catalog.refresh.assert_awaited_once()
+    assert services.products.get_by_code.await_count == len(codes)
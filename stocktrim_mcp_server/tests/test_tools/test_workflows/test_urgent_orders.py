@@ -5,6 +5,7 @@ from unittest.mock import AsyncMock
 import pytest
 from fastmcp.tools import ToolResult
 
+from stocktrim_mcp_server.services.catalog import CatalogSnapshot
 from stocktrim_mcp_server.tools.tool_result_utils import (
     tool_result_text,
     unwrap_tool_result,
@@ -64,17 +65,19 @@ def mock_urgent_context(mock_context):
     mock_client.order_plan = AsyncMock()
     mock_client.purchase_orders_v2 = AsyncMock()
 
-    # Mock products service for supplier lookup with supplier_code
+    # Catalog snapshot backed by the mock client for supplier lookup
     product_with_supplier = ProductsResponseDto(
         product_id="prod-123",
         product_code_readable="WIDGET-001",
         name="Test Widget",
         supplier_code="SUP-001",  # Add supplier code for lookup
     )
+    mock_client.products.get_all_paginated = AsyncMock(
+        return_value=[product_with_supplier]
+    )
 
     services = mock_context.request_context.lifespan_context
-    services.products = AsyncMock()
-    services.products.list_all.return_value = [product_with_supplier]
+    services.catalog = CatalogSnapshot(mock_client)
 
     return mock_context
 
@@ -166,10 +169,8 @@ async def test_review_urgent_orders_multiple_suppliers(mock_urgent_context):
         supplier_code="SUP-002",
     )
 
-    services = mock_urgent_context.request_context.lifespan_context
-    services.products.list_all.return_value = [product1, product2]
-
     mock_client = mock_urgent_context.request_context.lifespan_context.client
+    mock_client.products.get_all_paginated.return_value = [product1, product2]
     mock_client.order_plan.query.return_value = [item1, item2]
 
     # Execute
@@ -692,3 +693,19 @@ async def test_generate_purchase_orders_dry_run_skips_api_call(mock_urgent_conte
     assert response.total_count == 0
     assert response.purchase_orders == []
     mock_client.purchase_orders_v2.generate_from_order_plan.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_review_urgent_orders_reuses_catalog_snapshot(
+    mock_urgent_context, urgent_order_item
+):
+    """The product catalog is downloaded once, not on every review."""
+    mock_client = mock_urgent_context.request_context.lifespan_context.client
+    mock_client.order_plan.query.return_value = [urgent_order_item]
+
+    request = ReviewUrgentOrdersRequest(days_threshold=30)
+    await _review(request, mock_urgent_context)
+    response = await _review(request, mock_urgent_context)
+
+    assert response.suppliers[0].supplier_code == "SUP-001"
+    mock_client.products.get_all_paginated.assert_awaited_once()
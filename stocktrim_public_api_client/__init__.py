@@ -7,6 +7,11 @@ retries and custom authentication.
 
 __version__ = "0.13.0"
 
+from .entity_cache import EntityCache
+from .forecast_events import ForecastCompleted, ForecastEvents
+from .http_cache import HTTPCache
+from .rate_limiting import AdaptiveRateLimiter
+from .scheduling import Priority, RequestScheduler, request_priority
 from .stocktrim_client import StockTrimClient
 from .utils import (
     APIError,
@@ -24,9 +29,20 @@ from .utils import (
 __all__ = [
     # Exceptions
     "APIError",
+    # Rate limiting
+    "AdaptiveRateLimiter",
     "AuthenticationError",
+    # Caching
+    "EntityCache",
+    # Forecast completion events
+    "ForecastCompleted",
+    "ForecastEvents",
+    "HTTPCache",
     "NotFoundError",
     "PermissionError",
+    # Request scheduling
+    "Priority",
+    "RequestScheduler",
     "ServerError",
     # Main client
     "StockTrimClient",
@@ -35,5 +51,6 @@ __all__ = [
     "get_error_message",
     "is_error",
     "is_success",
+    "request_priority",
     "unwrap",
 ]
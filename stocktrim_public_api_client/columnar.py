@@ -0,0 +1,275 @@
+"""Column-oriented results for bulk analytics.
+
+Loading order plan results into pandas row by row (``SkuOptimizedResultsDto``
+objects, then ``to_dict()`` on each) builds every row twice before pandas
+copies it a third time. :class:`ColumnarResults` instead collects the raw
+JSON of each page straight into one list per field and converts those to
+typed arrays at the end, so no per-row model is ever created.
+
+Only scalar fields become columns (numbers, booleans, strings, enums, dates
+and datetimes); list and nested-object fields are left out. Datetimes are
+stored as UTC; values without an offset are taken to be UTC already.
+
+The array backends are optional and not dependencies of this package;
+install the one you need alongside it::
+
+    pip install pyarrow   # to_arrow(), to_pandas(), write_parquet()
+    pip install numpy     # to_numpy()
+
+Example:
+    ```python
+    async with StockTrimClient() as client:
+        results = await client.order_plan.query_columns()
+        results.write_parquet("order_plan.parquet")
+        df = results.to_pandas()
+    ```
+"""
+
+from __future__ import annotations
+
+import datetime
+import importlib
+from collections.abc import Iterable, Mapping, Sequence
+from enum import Enum, IntEnum
+from os import PathLike
+from typing import TYPE_CHECKING, Any, Literal
+
+import attrs
+from dateutil.parser import isoparse
+
+from .generated import models as generated_models
+from .lazy_models import json_keys
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+    import pyarrow as pa
+
+ColumnKind = Literal["float", "int", "bool", "str", "datetime", "date"]
+
+# Scalar annotations and the column kind they map to
+_SCALAR_KINDS: dict[str, ColumnKind] = {
+    "float": "float",
+    "int": "int",
+    "bool": "bool",
+    "str": "str",
+    "UUID": "str",
+    "datetime.datetime": "datetime",
+    "datetime.date": "date",
+}
+
+
+def column_kinds(model: type) -> dict[str, tuple[str, ColumnKind]]:
+    """Columns available for a generated model.
+
+    Args:
+        model: Generated attrs model class, e.g. ``SkuOptimizedResultsDto``.
+
+    Returns:
+        ``{attribute name: (JSON key, column kind)}`` for every scalar field,
+        in declaration order.
+    """
+    keys = json_keys(model)
+    kinds: dict[str, tuple[str, ColumnKind]] = {}
+    for field in attrs.fields(model):
+        if field.name not in keys:
+            continue
+        kind = _kind_for(str(field.type))
+        if kind is not None:
+            kinds[field.name] = (keys[field.name], kind)
+    return kinds
+
+
+def _kind_for(annotation: str) -> ColumnKind | None:
+    types = [t for t in annotation.split(" | ") if t not in ("None", "Unset")]
+    if len(types) != 1:
+        return None
+    (type_name,) = types
+    if type_name in _SCALAR_KINDS:
+        return _SCALAR_KINDS[type_name]
+    cls = getattr(generated_models, type_name, None)
+    if isinstance(cls, type) and issubclass(cls, Enum):
+        # Enum columns hold the wire values
+        return "int" if issubclass(cls, IntEnum) else "str"
+    return None
+
+
+class ColumnarResults:
+    """Rows of one generated model stored as one list per field.
+
+    Rows are added as raw JSON objects with :meth:`extend`; datetime and date
+    strings are parsed as they arrive, every other value is kept as decoded.
+    Missing and ``null`` values are stored as ``None``.
+
+    Args:
+        model: Generated model the rows belong to.
+        columns: Attribute names to keep (default: every scalar field).
+
+    Raises:
+        ValueError: If ``columns`` names a field that isn't a scalar field of
+            ``model``.
+    """
+
+    def __init__(self, model: type, columns: Iterable[str] | None = None):
+        kinds = column_kinds(model)
+        if columns is not None:
+            columns = list(columns)
+            unknown = [name for name in columns if name not in kinds]
+            if unknown:
+                raise ValueError(
+                    f"Not scalar fields of {model.__name__}: {', '.join(unknown)}"
+                )
+            kinds = {name: kinds[name] for name in columns}
+
+        self.model = model
+        self._kinds = kinds
+        self._data: dict[str, list[Any]] = {name: [] for name in kinds}
+        self._length = 0
+
+    def extend(self, rows: Sequence[Mapping[str, Any]]) -> None:
+        """Append raw JSON rows (camelCase keys, as returned by the API).
+
+        Args:
+            rows: JSON objects, e.g. one page of results.
+        """
+        for name, (key, kind) in self._kinds.items():
+            column = self._data[name]
+            if kind == "datetime":
+                column.extend(_parse_datetime(row.get(key)) for row in rows)
+            elif kind == "date":
+                column.extend(_parse_date(row.get(key)) for row in rows)
+            else:
+                column.extend(row.get(key) for row in rows)
+        self._length += len(rows)
+
+    def __len__(self) -> int:
+        return self._length
+
+    @property
+    def column_names(self) -> list[str]:
+        """Attribute names of the columns, in model order."""
+        return list(self._kinds)
+
+    def column(self, name: str) -> list[Any]:
+        """Values of one column as a Python list (not a copy)."""
+        return self._data[name]
+
+    def to_numpy(self) -> dict[str, np.ndarray]:
+        """Convert to a dict of typed NumPy arrays.
+
+        Float columns use ``NaN`` and datetime/date columns ``NaT`` for
+        missing values. Integer and boolean columns are ``int64``/``bool``
+        when complete, otherwise ``float64`` (with ``NaN``) and ``object``.
+        String columns are ``object`` arrays.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        np = _require("numpy")
+        arrays: dict[str, np.ndarray] = {}
+        for name, (_, kind) in self._kinds.items():
+            values = self._data[name]
+            complete = None not in values
+            if kind == "float" or (kind == "int" and not complete):
+                arrays[name] = np.array(
+                    [np.nan if v is None else v for v in values], dtype=np.float64
+                )
+            elif kind == "int":
+                arrays[name] = np.array(values, dtype=np.int64)
+            elif kind == "bool" and complete:
+                arrays[name] = np.array(values, dtype=np.bool_)
+            elif kind in ("datetime", "date"):
+                unit = "datetime64[us]" if kind == "datetime" else "datetime64[D]"
+                arrays[name] = np.array(
+                    [
+                        np.datetime64("NaT") if v is None else _naive_utc(v)
+                        for v in values
+                    ],
+                    dtype=unit,
+                )
+            else:
+                arrays[name] = np.array(values, dtype=object)
+        return arrays
+
+    def to_arrow(self) -> pa.Table:
+        """Convert to a PyArrow table with a typed, nullable schema.
+
+        Raises:
+            ImportError: If PyArrow is not installed.
+        """
+        pa = _require("pyarrow")
+        types = {
+            "float": pa.float64(),
+            "int": pa.int64(),
+            "bool": pa.bool_(),
+            "str": pa.string(),
+            "datetime": pa.timestamp("us", tz="UTC"),
+            "date": pa.date32(),
+        }
+        return pa.table(
+            {
+                name: pa.array(self._data[name], type=types[kind])
+                for name, (_, kind) in self._kinds.items()
+            }
+        )
+
+    def to_pandas(self) -> pd.DataFrame:
+        """Convert to a pandas DataFrame (through :meth:`to_arrow`).
+
+        Raises:
+            ImportError: If PyArrow or pandas is not installed.
+        """
+        return self.to_arrow().to_pandas()
+
+    def write_parquet(self, path: str | PathLike[str], **kwargs: Any) -> None:
+        """Write the results to a Parquet file.
+
+        Args:
+            path: Destination file.
+            **kwargs: Passed to ``pyarrow.parquet.write_table`` (e.g.
+                ``compression="zstd"``).
+
+        Raises:
+            ImportError: If PyArrow is not installed.
+        """
+        pq = _require("pyarrow.parquet", "pyarrow")
+        pq.write_table(self.to_arrow(), path, **kwargs)
+
+
+def _require(module: str, package: str | None = None) -> Any:
+    """Import an optional array backend, with an install hint if missing."""
+    try:
+        return importlib.import_module(module)
+    except ImportError as e:
+        package = package or module
+        raise ImportError(
+            f"{package} is required for this conversion (pip install {package})"
+        ) from e
+
+
+def _parse_datetime(value: Any) -> datetime.datetime | None:
+    if not isinstance(value, str):
+        return None
+    try:
+        parsed = isoparse(value)
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=datetime.UTC)
+    return parsed.astimezone(datetime.UTC)
+
+
+def _parse_date(value: Any) -> datetime.date | None:
+    if not isinstance(value, str):
+        return None
+    try:
+        return isoparse(value).date()
+    except ValueError:
+        return None
+
+
+def _naive_utc(value: datetime.date) -> datetime.date:
+    """NumPy datetime64 has no time zones; datetimes here are already UTC."""
+    if isinstance(value, datetime.datetime):
+        return value.replace(tzinfo=None)
+    return value
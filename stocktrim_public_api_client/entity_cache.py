@@ -0,0 +1,158 @@
+"""In-process entity cache for the StockTrim domain helpers.
+
+Lookups such as ``client.products.find_by_code("WIDGET-001")`` are often
+repeated many times within a few seconds by automation that walks the same
+codes. The :class:`EntityCache` lets a :class:`StockTrimClient` remember those
+lookups for a short time instead of going back to the network.
+
+The cache is opt-in: pass an instance to the client to enable it.
+
+Example:
+    ```python
+    from stocktrim_public_api_client import EntityCache, StockTrimClient
+
+    async with StockTrimClient(entity_cache=EntityCache(ttl=60)) as client:
+        await client.products.find_by_code("WIDGET-001")  # network
+        await client.products.find_by_code("WIDGET-001")  # cached
+    ```
+
+Entries are keyed by ``(entity type, code)``. An entity can be stored under
+several codes at once (for example a product's ``product_id`` and its
+``product_code_readable``); invalidating any one of them drops the entity
+under all of its codes. Helpers invalidate entries automatically when the same
+client creates, updates or deletes that entity. Changes made by other clients
+or directly in StockTrim are only picked up once the TTL expires.
+
+Only found entities are cached; a lookup that finds nothing is not remembered.
+Cached objects are returned as-is, so callers should treat them as read-only.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+PRODUCT = "product"
+SUPPLIER = "supplier"
+CUSTOMER = "customer"
+
+
+@dataclass
+class _Entry:
+    """A cached entity together with every key it is stored under."""
+
+    value: Any
+    expires_at: float
+    keys: tuple[tuple[str, str], ...] = field(default_factory=tuple)
+
+
+class EntityCache:
+    """Bounded LRU cache of helper lookups with per-entry TTL.
+
+    Args:
+        ttl: Seconds an entry stays valid after it is stored (default: 60).
+        max_size: Maximum number of keys held before the least recently used
+            entries are evicted (default: 1024).
+        clock: Monotonic time source, overridable for testing.
+
+    Raises:
+        ValueError: If ``ttl`` is not positive or ``max_size`` is less than 1.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 60.0,
+        max_size: int = 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if ttl <= 0:
+            raise ValueError(f"ttl must be positive, got {ttl}")
+        if max_size < 1:
+            raise ValueError(f"max_size must be at least 1, got {max_size}")
+        self.ttl = ttl
+        self.max_size = max_size
+        self._clock = clock
+        self._entries: OrderedDict[tuple[str, str], _Entry] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """Number of keys currently held (including not-yet-purged expired ones)."""
+        return len(self._entries)
+
+    def get(self, kind: str, code: str) -> Any | None:
+        """Return the cached entity for ``(kind, code)``, or None on a miss.
+
+        Args:
+            kind: Entity type, e.g. ``"product"``.
+            code: Code the entity was stored under.
+
+        Returns:
+            The cached entity, or None if absent or expired.
+        """
+        key = (kind, code)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        if entry.expires_at <= self._clock():
+            self._drop(entry)
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry.value
+
+    def put(self, kind: str, codes: Iterable[str | None], value: Any) -> None:
+        """Store an entity under one or more codes.
+
+        Empty and ``None`` codes are skipped. Any entity previously stored under
+        one of the codes is invalidated first.
+
+        Args:
+            kind: Entity type, e.g. ``"product"``.
+            codes: Codes the entity can be looked up by.
+            value: The entity to cache.
+        """
+        keys = tuple(dict.fromkeys((kind, code) for code in codes if code))
+        if not keys:
+            return
+        for key in keys:
+            existing = self._entries.get(key)
+            if existing is not None:
+                self._drop(existing)
+        entry = _Entry(value=value, expires_at=self._clock() + self.ttl, keys=keys)
+        for key in keys:
+            self._entries[key] = entry
+        while len(self._entries) > self.max_size:
+            _, oldest = next(iter(self._entries.items()))
+            self._drop(oldest)
+
+    def invalidate(self, kind: str, code: str | None = None) -> None:
+        """Drop cached entities of ``kind``.
+
+        Args:
+            kind: Entity type, e.g. ``"product"``.
+            code: Code to invalidate. The entity is dropped under all of its
+                codes. If None, every entity of ``kind`` is dropped.
+        """
+        if code is None:
+            for key in [key for key in self._entries if key[0] == kind]:
+                self._entries.pop(key, None)
+            return
+        entry = self._entries.get((kind, code))
+        if entry is not None:
+            self._drop(entry)
+
+    def clear(self) -> None:
+        """Drop every cached entity."""
+        self._entries.clear()
+
+    def _drop(self, entry: _Entry) -> None:
+        """Remove an entry under every key that still points at it."""
+        for key in entry.keys:
+            if self._entries.get(key) is entry:
+                del self._entries[key]
@@ -0,0 +1,142 @@
+"""Notifications of forecast recalculations finishing.
+
+The order plan, forecasts and everything derived from them only change when
+StockTrim finishes a forecast recalculation. :class:`ForecastEvents` lets
+caches built on that data (snapshots, report caches, MCP resources) refresh
+exactly then, instead of serving stale data for a full TTL or refetching when
+nothing has changed.
+
+Every :class:`StockTrimClient` has one, as ``client.forecast_events``. It is
+fed by the client's own status checks: each
+``client.forecasting.get_processing_status()`` call (including those made by
+``wait_for_completion``) reports the status it saw, and a transition from
+processing to idle notifies every subscriber once.
+
+Example:
+    ```python
+    async with StockTrimClient() as client:
+        client.forecast_events.subscribe(lambda event: plan_cache.clear())
+
+        await client.forecasting.run_calculations()
+        await client.forecasting.wait_for_completion()  # plan_cache cleared
+    ```
+
+Only status checks made through this client are seen; a recalculation that
+finishes while nobody polls is noticed at the next status check.
+"""
+
+from __future__ import annotations
+
+import inspect
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+from .generated.models.processing_status_response_dto import (
+    ProcessingStatusResponseDto,
+)
+from .utils import unwrap_unset
+
+
+@dataclass(frozen=True)
+class ForecastCompleted:
+    """A forecast recalculation finished.
+
+    Attributes:
+        status: Processing status that showed the run had finished.
+        completed_at: Wall-clock time (``time.time()``) it was observed.
+        generation: Number of completions observed by this client so far,
+            usable as a cache key component.
+    """
+
+    status: ProcessingStatusResponseDto
+    completed_at: float
+    generation: int
+
+
+ForecastListener = Callable[[ForecastCompleted], Awaitable[None] | None]
+
+
+class ForecastEvents:
+    """Publishes :class:`ForecastCompleted` when processing goes from running to done.
+
+    Subscribers may be plain functions or coroutine functions; they are
+    called in subscription order. An exception raised by a subscriber is
+    logged and does not stop the others or the status check that observed
+    the completion.
+
+    Args:
+        logger: Logger for subscriber failures (default: this module's).
+        clock: Wall-clock time source, overridable for testing.
+    """
+
+    def __init__(
+        self,
+        logger: logging.Logger | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._logger = logger or logging.getLogger(__name__)
+        self._clock = clock
+        self._listeners: list[ForecastListener] = []
+        self._processing = False
+        self.generation = 0
+        self.last_completed: ForecastCompleted | None = None
+
+    @property
+    def processing(self) -> bool:
+        """Whether the last observed status showed a recalculation running."""
+        return self._processing
+
+    def subscribe(self, listener: ForecastListener) -> Callable[[], None]:
+        """Call ``listener`` with every :class:`ForecastCompleted` event.
+
+        Args:
+            listener: Function or coroutine function taking the event.
+
+        Returns:
+            A callable that unsubscribes the listener.
+        """
+        self._listeners.append(listener)
+
+        def unsubscribe() -> None:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+        return unsubscribe
+
+    def mark_started(self) -> None:
+        """Record that a recalculation was triggered.
+
+        Called by ``run_calculations()``, so a run that finishes before the
+        first status check still counts as a completion.
+        """
+        self._processing = True
+
+    async def observe(self, status: ProcessingStatusResponseDto) -> bool:
+        """Record a processing status and notify subscribers on completion.
+
+        Args:
+            status: Status returned by the processing status endpoint.
+
+        Returns:
+            Whether this status completed a running recalculation.
+        """
+        processing = bool(unwrap_unset(status.is_processing, False))
+        completed = self._processing and not processing
+        self._processing = processing
+        if completed:
+            self.generation += 1
+            event = ForecastCompleted(status, self._clock(), self.generation)
+            self.last_completed = event
+            await self._publish(event)
+        return completed
+
+    async def _publish(self, event: ForecastCompleted) -> None:
+        for listener in list(self._listeners):
+            try:
+                result = listener(event)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception:
+                self._logger.exception("Forecast completion listener failed")
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
-from typing import Any, TypeVar, cast
+from typing import Any, ClassVar, TypeVar
 
 from attrs import define as _attrs_define
 
@@ -23,6 +23,12 @@ class BillOfMaterialsRequestDto:
     component_id: str
     quantity: float | None | Unset = UNSET
 
+    _JSON_KEYS: ClassVar[dict[str, str]] = {
+        "product_id": "productId",
+        "component_id": "componentId",
+        "quantity": "quantity",
+    }
+
     def to_dict(self) -> dict[str, Any]:
         product_id = self.product_id
 
@@ -54,14 +60,7 @@ class BillOfMaterialsRequestDto:
 
         component_id = d.pop("componentId")
 
-        def _parse_quantity(data: object) -> float | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(float | None | Unset, data)
-
-        quantity = _parse_quantity(d.pop("quantity", UNSET))
+        quantity: float | None | Unset = d.pop("quantity", UNSET)
 
         bill_of_materials_request_dto = cls(
             product_id=product_id,
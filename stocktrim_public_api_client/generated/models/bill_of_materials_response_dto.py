@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, TypeVar, cast
+from typing import TYPE_CHECKING, Any, ClassVar, TypeVar
 
 from attrs import define as _attrs_define
 
@@ -35,6 +35,16 @@ class BillOfMaterialsResponseDto:
     sku_product: ProductsResponseDto | Unset = UNSET
     quantity: float | None | Unset = UNSET
 
+    _JSON_KEYS: ClassVar[dict[str, str]] = {
+        "product_id": "productId",
+        "component_id": "componentId",
+        "id": "id",
+        "assembly_time_days": "assemblyTimeDays",
+        "sku_component": "skuComponent",
+        "sku_product": "skuProduct",
+        "quantity": "quantity",
+    }
+
     def to_dict(self) -> dict[str, Any]:
         product_id = self.product_id
 
@@ -94,14 +104,7 @@ class BillOfMaterialsResponseDto:
 
         id = d.pop("id", UNSET)
 
-        def _parse_assembly_time_days(data: object) -> int | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(int | None | Unset, data)
-
-        assembly_time_days = _parse_assembly_time_days(d.pop("assemblyTimeDays", UNSET))
+        assembly_time_days: int | None | Unset = d.pop("assemblyTimeDays", UNSET)
 
         _sku_component = d.pop("skuComponent", UNSET)
         sku_component: ProductsResponseDto | Unset
@@ -117,14 +120,7 @@ class BillOfMaterialsResponseDto:
         else:
             sku_product = ProductsResponseDto.from_dict(_sku_product)
 
-        def _parse_quantity(data: object) -> float | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(float | None | Unset, data)
-
-        quantity = _parse_quantity(d.pop("quantity", UNSET))
+        quantity: float | None | Unset = d.pop("quantity", UNSET)
 
         bill_of_materials_response_dto = cls(
             product_id=product_id,
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
-from typing import Any, TypeVar, cast
+from typing import Any, ClassVar, TypeVar
 
 from attrs import define as _attrs_define
 
@@ -39,6 +39,20 @@ class CustomerDto:
     phone: None | str | Unset = UNSET
     city: None | str | Unset = UNSET
 
+    _JSON_KEYS: ClassVar[dict[str, str]] = {
+        "code": "code",
+        "name": "name",
+        "street_address": "streetAddress",
+        "address_line_1": "addressLine1",
+        "address_line_2": "addressLine2",
+        "state": "state",
+        "country": "country",
+        "post_code": "postCode",
+        "email_address": "emailAddress",
+        "phone": "phone",
+        "city": "city",
+    }
+
     def to_dict(self) -> dict[str, Any]:
         code: None | str | Unset
         if isinstance(self.code, Unset):
@@ -138,104 +152,27 @@ class CustomerDto:
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
         d = dict(src_dict)
 
-        def _parse_code(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
-
-        code = _parse_code(d.pop("code", UNSET))
-
-        def _parse_name(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
-
-        name = _parse_name(d.pop("name", UNSET))
-
-        def _parse_street_address(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
-
-        street_address = _parse_street_address(d.pop("streetAddress", UNSET))
-
-        def _parse_address_line_1(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
-
-        address_line_1 = _parse_address_line_1(d.pop("addressLine1", UNSET))
-
-        def _parse_address_line_2(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
-
-        address_line_2 = _parse_address_line_2(d.pop("addressLine2", UNSET))
-
-        def _parse_state(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
-
-        state = _parse_state(d.pop("state", UNSET))
-
-        def _parse_country(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
-
-        country = _parse_country(d.pop("country", UNSET))
-
-        def _parse_post_code(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
-
-        post_code = _parse_post_code(d.pop("postCode", UNSET))
-
-        def _parse_email_address(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
-
-        email_address = _parse_email_address(d.pop("emailAddress", UNSET))
-
-        def _parse_phone(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
-
-        phone = _parse_phone(d.pop("phone", UNSET))
-
-        def _parse_city(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
-
-        city = _parse_city(d.pop("city", UNSET))
+        code: None | str | Unset = d.pop("code", UNSET)
+
+        name: None | str | Unset = d.pop("name", UNSET)
+
+        street_address: None | str | Unset = d.pop("streetAddress", UNSET)
+
+        address_line_1: None | str | Unset = d.pop("addressLine1", UNSET)
+
+        address_line_2: None | str | Unset = d.pop("addressLine2", UNSET)
+
+        state: None | str | Unset = d.pop("state", UNSET)
+
+        country: None | str | Unset = d.pop("country", UNSET)
+
+        post_code: None | str | Unset = d.pop("postCode", UNSET)
+
+        email_address: None | str | Unset = d.pop("emailAddress", UNSET)
+
+        phone: None | str | Unset = d.pop("phone", UNSET)
+
+        city: None | str | Unset = d.pop("city", UNSET)
 
         customer_dto = cls(
             code=code,
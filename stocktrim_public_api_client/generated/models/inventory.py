@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
-from typing import Any, TypeVar, cast
+from typing import Any, ClassVar, TypeVar
 
 from attrs import define as _attrs_define
 
@@ -27,6 +27,14 @@ class Inventory:
     stock_on_hand: float | Unset = UNSET
     stock_on_order: float | Unset = UNSET
 
+    _JSON_KEYS: ClassVar[dict[str, str]] = {
+        "product_id": "productId",
+        "location_code": "locationCode",
+        "location_name": "locationName",
+        "stock_on_hand": "stockOnHand",
+        "stock_on_order": "stockOnOrder",
+    }
+
     def to_dict(self) -> dict[str, Any]:
         product_id: None | str | Unset
         if isinstance(self.product_id, Unset):
@@ -70,32 +78,11 @@ class Inventory:
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
         d = dict(src_dict)
 
-        def _parse_product_id(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
-
-        product_id = _parse_product_id(d.pop("productId", UNSET))
-
-        def _parse_location_code(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
-
-        location_code = _parse_location_code(d.pop("locationCode", UNSET))
+        product_id: None | str | Unset = d.pop("productId", UNSET)
 
-        def _parse_location_name(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
+        location_code: None | str | Unset = d.pop("locationCode", UNSET)
 
-        location_name = _parse_location_name(d.pop("locationName", UNSET))
+        location_name: None | str | Unset = d.pop("locationName", UNSET)
 
         stock_on_hand = d.pop("stockOnHand", UNSET)
 
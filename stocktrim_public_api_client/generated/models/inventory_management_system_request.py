@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
-from typing import Any, TypeVar
+from typing import Any, ClassVar, TypeVar
 
 from attrs import define as _attrs_define
 
@@ -20,6 +20,10 @@ class InventoryManagementSystemRequest:
 
     api: ApiEnum | Unset = UNSET
 
+    _JSON_KEYS: ClassVar[dict[str, str]] = {
+        "api": "api",
+    }
+
     def to_dict(self) -> dict[str, Any]:
         api: str | Unset = UNSET
         if not isinstance(self.api, Unset):
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
-from typing import Any, TypeVar, cast
+from typing import Any, ClassVar, TypeVar
 
 from attrs import define as _attrs_define
 
@@ -19,6 +19,10 @@ class InventoryManagementSystemResponse:
 
     name: None | str | Unset = UNSET
 
+    _JSON_KEYS: ClassVar[dict[str, str]] = {
+        "name": "name",
+    }
+
     def to_dict(self) -> dict[str, Any]:
         name: None | str | Unset
         if isinstance(self.name, Unset):
@@ -38,14 +42,7 @@ class InventoryManagementSystemResponse:
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
         d = dict(src_dict)
 
-        def _parse_name(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
-
-        name = _parse_name(d.pop("name", UNSET))
+        name: None | str | Unset = d.pop("name", UNSET)
 
         inventory_management_system_response = cls(
             name=name,
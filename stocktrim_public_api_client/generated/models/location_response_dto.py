@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
-from typing import Any, TypeVar, cast
+from typing import Any, ClassVar, TypeVar
 
 from attrs import define as _attrs_define
 
@@ -25,6 +25,13 @@ class LocationResponseDto:
     location_name: None | str | Unset = UNSET
     external_id: None | str | Unset = UNSET
 
+    _JSON_KEYS: ClassVar[dict[str, str]] = {
+        "location_code": "locationCode",
+        "id": "id",
+        "location_name": "locationName",
+        "external_id": "externalId",
+    }
+
     def to_dict(self) -> dict[str, Any]:
         location_code = self.location_code
 
@@ -65,23 +72,9 @@ class LocationResponseDto:
 
         id = d.pop("id", UNSET)
 
-        def _parse_location_name(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
-
-        location_name = _parse_location_name(d.pop("locationName", UNSET))
-
-        def _parse_external_id(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
+        location_name: None | str | Unset = d.pop("locationName", UNSET)
 
-        external_id = _parse_external_id(d.pop("externalId", UNSET))
+        external_id: None | str | Unset = d.pop("externalId", UNSET)
 
         location_response_dto = cls(
             location_code=location_code,
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
-from typing import Any, TypeVar, cast
+from typing import Any, ClassVar, TypeVar, cast
 
 from attrs import define as _attrs_define
 
@@ -46,6 +46,23 @@ class OrderPlanFilterCriteria:
     per_page: int | Unset = UNSET
     has_next_page: bool | None | Unset = UNSET
 
+    _JSON_KEYS: ClassVar[dict[str, str]] = {
+        "exclude_manufactured": "excludeManufactured",
+        "current_status": "currentStatus",
+        "location_id": "locationId",
+        "location": "location",
+        "customer_id": "customerId",
+        "customer": "customer",
+        "supplier_id": "supplierId",
+        "supplier": "supplier",
+        "category": "category",
+        "search_string": "searchString",
+        "sort_order": "sortOrder",
+        "page": "page",
+        "per_page": "perPage",
+        "has_next_page": "hasNextPage",
+    }
+
     def to_dict(self) -> dict[str, Any]:
         exclude_manufactured: bool | None | Unset
         if isinstance(self.exclude_manufactured, Unset):
@@ -163,127 +180,33 @@ class OrderPlanFilterCriteria:
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
         d = dict(src_dict)
 
-        def _parse_exclude_manufactured(data: object) -> bool | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(bool | None | Unset, data)
+        exclude_manufactured: bool | None | Unset = d.pop("excludeManufactured", UNSET)
 
-        exclude_manufactured = _parse_exclude_manufactured(
-            d.pop("excludeManufactured", UNSET)
-        )
+        current_status = _parse_current_status(d.pop("currentStatus", UNSET))
 
-        def _parse_current_status(data: object) -> CurrentStatusEnum | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            try:
-                if not isinstance(data, str):
-                    raise TypeError()
-                current_status_type_1 = CurrentStatusEnum(data)
-
-                return current_status_type_1
-            except (TypeError, ValueError, AttributeError, KeyError):
-                pass
-            return cast(CurrentStatusEnum | None | Unset, data)
+        location_id: int | None | Unset = d.pop("locationId", UNSET)
 
-        current_status = _parse_current_status(d.pop("currentStatus", UNSET))
+        location: None | str | Unset = d.pop("location", UNSET)
+
+        customer_id: int | None | Unset = d.pop("customerId", UNSET)
+
+        customer: None | str | Unset = d.pop("customer", UNSET)
+
+        supplier_id: int | None | Unset = d.pop("supplierId", UNSET)
 
-        def _parse_location_id(data: object) -> int | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(int | None | Unset, data)
-
-        location_id = _parse_location_id(d.pop("locationId", UNSET))
-
-        def _parse_location(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
-
-        location = _parse_location(d.pop("location", UNSET))
-
-        def _parse_customer_id(data: object) -> int | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(int | None | Unset, data)
-
-        customer_id = _parse_customer_id(d.pop("customerId", UNSET))
-
-        def _parse_customer(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
-
-        customer = _parse_customer(d.pop("customer", UNSET))
-
-        def _parse_supplier_id(data: object) -> int | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(int | None | Unset, data)
-
-        supplier_id = _parse_supplier_id(d.pop("supplierId", UNSET))
-
-        def _parse_supplier(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
-
-        supplier = _parse_supplier(d.pop("supplier", UNSET))
-
-        def _parse_category(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
-
-        category = _parse_category(d.pop("category", UNSET))
-
-        def _parse_search_string(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
-
-        search_string = _parse_search_string(d.pop("searchString", UNSET))
-
-        def _parse_sort_order(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
-
-        sort_order = _parse_sort_order(d.pop("sortOrder", UNSET))
+        supplier: None | str | Unset = d.pop("supplier", UNSET)
+
+        category: None | str | Unset = d.pop("category", UNSET)
+
+        search_string: None | str | Unset = d.pop("searchString", UNSET)
+
+        sort_order: None | str | Unset = d.pop("sortOrder", UNSET)
 
         page = d.pop("page", UNSET)
 
         per_page = d.pop("perPage", UNSET)
 
-        def _parse_has_next_page(data: object) -> bool | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(bool | None | Unset, data)
-
-        has_next_page = _parse_has_next_page(d.pop("hasNextPage", UNSET))
+        has_next_page: bool | None | Unset = d.pop("hasNextPage", UNSET)
 
         order_plan_filter_criteria = cls(
             exclude_manufactured=exclude_manufactured,
@@ -303,3 +226,19 @@ class OrderPlanFilterCriteria:
         )
 
         return order_plan_filter_criteria
+
+
+def _parse_current_status(data: object) -> CurrentStatusEnum | None | Unset:
+    if data is None:
+        return data
+    if isinstance(data, Unset):
+        return data
+    try:
+        if not isinstance(data, str):
+            raise TypeError()
+        current_status_type_1 = CurrentStatusEnum(data)
+
+        return current_status_type_1
+    except (TypeError, ValueError, AttributeError, KeyError):
+        pass
+    return cast(CurrentStatusEnum | None | Unset, data)
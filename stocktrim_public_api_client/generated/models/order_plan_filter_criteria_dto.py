@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
-from typing import Any, TypeVar, cast
+from typing import Any, ClassVar, TypeVar, cast
 
 from attrs import define as _attrs_define
 
@@ -26,6 +26,13 @@ class OrderPlanFilterCriteriaDto:
     location_codes: list[str] | None | Unset = UNSET
     supplier_codes: list[str] | None | Unset = UNSET
 
+    _JSON_KEYS: ClassVar[dict[str, str]] = {
+        "search_string": "searchString",
+        "current_status": "currentStatus",
+        "location_codes": "locationCodes",
+        "supplier_codes": "supplierCodes",
+    }
+
     def to_dict(self) -> dict[str, Any]:
         search_string: None | str | Unset
         if isinstance(self.search_string, Unset):
@@ -73,14 +80,7 @@ class OrderPlanFilterCriteriaDto:
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
         d = dict(src_dict)
 
-        def _parse_search_string(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
-
-        search_string = _parse_search_string(d.pop("searchString", UNSET))
+        search_string: None | str | Unset = d.pop("searchString", UNSET)
 
         _current_status = d.pop("currentStatus", UNSET)
         current_status: CurrentStatusEnum | Unset
@@ -89,38 +89,8 @@ class OrderPlanFilterCriteriaDto:
         else:
             current_status = CurrentStatusEnum(_current_status)
 
-        def _parse_location_codes(data: object) -> list[str] | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            try:
-                if not isinstance(data, list):
-                    raise TypeError()
-                location_codes_type_0 = cast(list[str], data)
-
-                return location_codes_type_0
-            except (TypeError, ValueError, AttributeError, KeyError):
-                pass
-            return cast(list[str] | None | Unset, data)
-
         location_codes = _parse_location_codes(d.pop("locationCodes", UNSET))
 
-        def _parse_supplier_codes(data: object) -> list[str] | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            try:
-                if not isinstance(data, list):
-                    raise TypeError()
-                supplier_codes_type_0 = cast(list[str], data)
-
-                return supplier_codes_type_0
-            except (TypeError, ValueError, AttributeError, KeyError):
-                pass
-            return cast(list[str] | None | Unset, data)
-
         supplier_codes = _parse_supplier_codes(d.pop("supplierCodes", UNSET))
 
         order_plan_filter_criteria_dto = cls(
@@ -131,3 +101,35 @@ class OrderPlanFilterCriteriaDto:
         )
 
         return order_plan_filter_criteria_dto
+
+
+def _parse_location_codes(data: object) -> list[str] | None | Unset:
+    if data is None:
+        return data
+    if isinstance(data, Unset):
+        return data
+    try:
+        if not isinstance(data, list):
+            raise TypeError()
+        location_codes_type_0 = cast(list[str], data)
+
+        return location_codes_type_0
+    except (TypeError, ValueError, AttributeError, KeyError):
+        pass
+    return cast(list[str] | None | Unset, data)
+
+
+def _parse_supplier_codes(data: object) -> list[str] | None | Unset:
+    if data is None:
+        return data
+    if isinstance(data, Unset):
+        return data
+    try:
+        if not isinstance(data, list):
+            raise TypeError()
+        supplier_codes_type_0 = cast(list[str], data)
+
+        return supplier_codes_type_0
+    except (TypeError, ValueError, AttributeError, KeyError):
+        pass
+    return cast(list[str] | None | Unset, data)
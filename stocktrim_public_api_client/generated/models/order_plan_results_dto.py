@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, TypeVar, cast
+from typing import TYPE_CHECKING, Any, ClassVar, TypeVar, cast
 
 from attrs import define as _attrs_define
 
@@ -26,6 +26,11 @@ class OrderPlanResultsDto:
     results: list[SkuOptimizedResultsDto] | None | Unset = UNSET
     filter_criteria: OrderPlanFilterCriteria | Unset = UNSET
 
+    _JSON_KEYS: ClassVar[dict[str, str]] = {
+        "results": "results",
+        "filter_criteria": "filterCriteria",
+    }
+
     def to_dict(self) -> dict[str, Any]:
         results: list[dict[str, Any]] | None | Unset
         if isinstance(self.results, Unset):
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
-from typing import Any, TypeVar, cast
+from typing import Any, ClassVar, TypeVar
 
 from attrs import define as _attrs_define
 
@@ -23,6 +23,12 @@ class ProcessingStatusRequestDto:
     percentage_complete: int | Unset = UNSET
     status_message: None | str | Unset = UNSET
 
+    _JSON_KEYS: ClassVar[dict[str, str]] = {
+        "is_processing": "isProcessing",
+        "percentage_complete": "percentageComplete",
+        "status_message": "statusMessage",
+    }
+
     def to_dict(self) -> dict[str, Any]:
         is_processing = self.is_processing
 
@@ -53,14 +59,7 @@ class ProcessingStatusRequestDto:
 
         percentage_complete = d.pop("percentageComplete", UNSET)
 
-        def _parse_status_message(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
-
-        status_message = _parse_status_message(d.pop("statusMessage", UNSET))
+        status_message: None | str | Unset = d.pop("statusMessage", UNSET)
 
         processing_status_request_dto = cls(
             is_processing=is_processing,
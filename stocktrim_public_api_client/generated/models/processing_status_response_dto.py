@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
-from typing import Any, TypeVar, cast
+from typing import Any, ClassVar, TypeVar
 
 from attrs import define as _attrs_define
 
@@ -25,6 +25,13 @@ class ProcessingStatusResponseDto:
     percentage_complete: int | Unset = UNSET
     status_message: None | str | Unset = UNSET
 
+    _JSON_KEYS: ClassVar[dict[str, str]] = {
+        "id": "id",
+        "is_processing": "isProcessing",
+        "percentage_complete": "percentageComplete",
+        "status_message": "statusMessage",
+    }
+
     def to_dict(self) -> dict[str, Any]:
         id = self.id
 
@@ -61,14 +68,7 @@ class ProcessingStatusResponseDto:
 
         percentage_complete = d.pop("percentageComplete", UNSET)
 
-        def _parse_status_message(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
-
-        status_message = _parse_status_message(d.pop("statusMessage", UNSET))
+        status_message: None | str | Unset = d.pop("statusMessage", UNSET)
 
         processing_status_response_dto = cls(
             id=id,
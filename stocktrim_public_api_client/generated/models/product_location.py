@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
-from typing import Any, TypeVar, cast
+from typing import Any, ClassVar, TypeVar
 
 from attrs import define as _attrs_define
 
@@ -25,6 +25,13 @@ class ProductLocation:
     stock_on_hand: float | None | Unset = UNSET
     stock_on_order: float | None | Unset = UNSET
 
+    _JSON_KEYS: ClassVar[dict[str, str]] = {
+        "location_code": "locationCode",
+        "location_name": "locationName",
+        "stock_on_hand": "stockOnHand",
+        "stock_on_order": "stockOnOrder",
+    }
+
     def to_dict(self) -> dict[str, Any]:
         location_code = self.location_code
 
@@ -67,32 +74,11 @@ class ProductLocation:
         d = dict(src_dict)
         location_code = d.pop("locationCode")
 
-        def _parse_location_name(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
-
-        location_name = _parse_location_name(d.pop("locationName", UNSET))
-
-        def _parse_stock_on_hand(data: object) -> float | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(float | None | Unset, data)
-
-        stock_on_hand = _parse_stock_on_hand(d.pop("stockOnHand", UNSET))
+        location_name: None | str | Unset = d.pop("locationName", UNSET)
 
-        def _parse_stock_on_order(data: object) -> float | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(float | None | Unset, data)
+        stock_on_hand: float | None | Unset = d.pop("stockOnHand", UNSET)
 
-        stock_on_order = _parse_stock_on_order(d.pop("stockOnOrder", UNSET))
+        stock_on_order: float | None | Unset = d.pop("stockOnOrder", UNSET)
 
         product_location = cls(
             location_code=location_code,
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
-from typing import Any, TypeVar, cast
+from typing import Any, ClassVar, TypeVar
 
 from attrs import define as _attrs_define
 
@@ -23,6 +23,12 @@ class ProductSupplier:
     supplier_name: None | str | Unset = UNSET
     supplier_sku_code: None | str | Unset = UNSET
 
+    _JSON_KEYS: ClassVar[dict[str, str]] = {
+        "supplier_id": "supplierId",
+        "supplier_name": "supplierName",
+        "supplier_sku_code": "supplierSkuCode",
+    }
+
     def to_dict(self) -> dict[str, Any]:
         supplier_id = self.supplier_id
 
@@ -57,23 +63,9 @@ class ProductSupplier:
         d = dict(src_dict)
         supplier_id = d.pop("supplierId")
 
-        def _parse_supplier_name(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
-
-        supplier_name = _parse_supplier_name(d.pop("supplierName", UNSET))
-
-        def _parse_supplier_sku_code(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
+        supplier_name: None | str | Unset = d.pop("supplierName", UNSET)
 
-        supplier_sku_code = _parse_supplier_sku_code(d.pop("supplierSkuCode", UNSET))
+        supplier_sku_code: None | str | Unset = d.pop("supplierSkuCode", UNSET)
 
         product_supplier = cls(
             supplier_id=supplier_id,
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, TypeVar, cast
+from typing import TYPE_CHECKING, Any, ClassVar, TypeVar, cast
 
 from attrs import define as _attrs_define
 
@@ -96,6 +96,46 @@ class ProductsRequestDto:
     width: float | None | Unset = UNSET
     length: float | None | Unset = UNSET
 
+    _JSON_KEYS: ClassVar[dict[str, str]] = {
+        "product_id": "productId",
+        "product_code_readable": "productCodeReadable",
+        "name": "name",
+        "category": "category",
+        "sub_category": "subCategory",
+        "service_level": "serviceLevel",
+        "lead_time": "leadTime",
+        "stock_on_hand": "stockOnHand",
+        "stock_on_order": "stockOnOrder",
+        "cost": "cost",
+        "price": "price",
+        "supplier_code": "supplierCode",
+        "suppliers": "suppliers",
+        "forecast_period": "forecastPeriod",
+        "manufacturing_time": "manufacturingTime",
+        "order_frequency": "orderFrequency",
+        "minimum_order_quantity": "minimumOrderQuantity",
+        "minimum_shelf_level": "minimumShelfLevel",
+        "maximum_shelf_level": "maximumShelfLevel",
+        "batch_size": "batchSize",
+        "barcode": "barcode",
+        "discontinued": "discontinued",
+        "unstocked": "unstocked",
+        "option1": "option1",
+        "option2": "option2",
+        "option3": "option3",
+        "overridden_demand": "overriddenDemand",
+        "overridden_demand_period": "overriddenDemandPeriod",
+        "stock_locations": "stockLocations",
+        "parent_id": "parentId",
+        "variant_type": "variantType",
+        "variant": "variant",
+        "ignore_seasonality": "ignoreSeasonality",
+        "weight": "weight",
+        "height": "height",
+        "width": "width",
+        "length": "length",
+    }
+
     def to_dict(self) -> dict[str, Any]:
         product_id = self.product_id
 
@@ -417,106 +457,27 @@ class ProductsRequestDto:
         d = dict(src_dict)
         product_id = d.pop("productId")
 
-        def _parse_product_code_readable(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
-
-        product_code_readable = _parse_product_code_readable(
-            d.pop("productCodeReadable", UNSET)
-        )
-
-        def _parse_name(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
-
-        name = _parse_name(d.pop("name", UNSET))
-
-        def _parse_category(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
-
-        category = _parse_category(d.pop("category", UNSET))
-
-        def _parse_sub_category(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
-
-        sub_category = _parse_sub_category(d.pop("subCategory", UNSET))
-
-        def _parse_service_level(data: object) -> float | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(float | None | Unset, data)
-
-        service_level = _parse_service_level(d.pop("serviceLevel", UNSET))
-
-        def _parse_lead_time(data: object) -> int | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(int | None | Unset, data)
-
-        lead_time = _parse_lead_time(d.pop("leadTime", UNSET))
+        product_code_readable: None | str | Unset = d.pop("productCodeReadable", UNSET)
 
-        def _parse_stock_on_hand(data: object) -> float | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(float | None | Unset, data)
+        name: None | str | Unset = d.pop("name", UNSET)
 
-        stock_on_hand = _parse_stock_on_hand(d.pop("stockOnHand", UNSET))
+        category: None | str | Unset = d.pop("category", UNSET)
 
-        def _parse_stock_on_order(data: object) -> float | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(float | None | Unset, data)
+        sub_category: None | str | Unset = d.pop("subCategory", UNSET)
 
-        stock_on_order = _parse_stock_on_order(d.pop("stockOnOrder", UNSET))
+        service_level: float | None | Unset = d.pop("serviceLevel", UNSET)
 
-        def _parse_cost(data: object) -> float | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(float | None | Unset, data)
+        lead_time: int | None | Unset = d.pop("leadTime", UNSET)
 
-        cost = _parse_cost(d.pop("cost", UNSET))
+        stock_on_hand: float | None | Unset = d.pop("stockOnHand", UNSET)
 
-        def _parse_price(data: object) -> float | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(float | None | Unset, data)
+        stock_on_order: float | None | Unset = d.pop("stockOnOrder", UNSET)
 
-        price = _parse_price(d.pop("price", UNSET))
+        cost: float | None | Unset = d.pop("cost", UNSET)
 
-        def _parse_supplier_code(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
+        price: float | None | Unset = d.pop("price", UNSET)
 
-        supplier_code = _parse_supplier_code(d.pop("supplierCode", UNSET))
+        supplier_code: None | str | Unset = d.pop("supplierCode", UNSET)
 
         def _parse_suppliers(data: object) -> list[ProductSupplier] | None | Unset:
             if data is None:
@@ -542,149 +503,38 @@ class ProductsRequestDto:
 
         suppliers = _parse_suppliers(d.pop("suppliers", UNSET))
 
-        def _parse_forecast_period(data: object) -> int | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(int | None | Unset, data)
-
-        forecast_period = _parse_forecast_period(d.pop("forecastPeriod", UNSET))
-
-        def _parse_manufacturing_time(data: object) -> int | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(int | None | Unset, data)
-
-        manufacturing_time = _parse_manufacturing_time(
-            d.pop("manufacturingTime", UNSET)
-        )
-
-        def _parse_order_frequency(data: object) -> int | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(int | None | Unset, data)
-
-        order_frequency = _parse_order_frequency(d.pop("orderFrequency", UNSET))
-
-        def _parse_minimum_order_quantity(data: object) -> float | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(float | None | Unset, data)
-
-        minimum_order_quantity = _parse_minimum_order_quantity(
-            d.pop("minimumOrderQuantity", UNSET)
-        )
+        forecast_period: int | None | Unset = d.pop("forecastPeriod", UNSET)
 
-        def _parse_minimum_shelf_level(data: object) -> float | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(float | None | Unset, data)
-
-        minimum_shelf_level = _parse_minimum_shelf_level(
-            d.pop("minimumShelfLevel", UNSET)
-        )
+        manufacturing_time: int | None | Unset = d.pop("manufacturingTime", UNSET)
 
-        def _parse_maximum_shelf_level(data: object) -> float | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(float | None | Unset, data)
+        order_frequency: int | None | Unset = d.pop("orderFrequency", UNSET)
 
-        maximum_shelf_level = _parse_maximum_shelf_level(
-            d.pop("maximumShelfLevel", UNSET)
+        minimum_order_quantity: float | None | Unset = d.pop(
+            "minimumOrderQuantity", UNSET
         )
 
-        def _parse_batch_size(data: object) -> float | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(float | None | Unset, data)
-
-        batch_size = _parse_batch_size(d.pop("batchSize", UNSET))
-
-        def _parse_barcode(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
-
-        barcode = _parse_barcode(d.pop("barcode", UNSET))
-
-        def _parse_discontinued(data: object) -> bool | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(bool | None | Unset, data)
-
-        discontinued = _parse_discontinued(d.pop("discontinued", UNSET))
-
-        def _parse_unstocked(data: object) -> bool | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(bool | None | Unset, data)
+        minimum_shelf_level: float | None | Unset = d.pop("minimumShelfLevel", UNSET)
 
-        unstocked = _parse_unstocked(d.pop("unstocked", UNSET))
+        maximum_shelf_level: float | None | Unset = d.pop("maximumShelfLevel", UNSET)
 
-        def _parse_option1(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
-
-        option1 = _parse_option1(d.pop("option1", UNSET))
+        batch_size: float | None | Unset = d.pop("batchSize", UNSET)
 
-        def _parse_option2(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
+        barcode: None | str | Unset = d.pop("barcode", UNSET)
 
-        option2 = _parse_option2(d.pop("option2", UNSET))
+        discontinued: bool | None | Unset = d.pop("discontinued", UNSET)
 
-        def _parse_option3(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
+        unstocked: bool | None | Unset = d.pop("unstocked", UNSET)
 
-        option3 = _parse_option3(d.pop("option3", UNSET))
+        option1: None | str | Unset = d.pop("option1", UNSET)
 
-        def _parse_overridden_demand(data: object) -> float | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(float | None | Unset, data)
+        option2: None | str | Unset = d.pop("option2", UNSET)
 
-        overridden_demand = _parse_overridden_demand(d.pop("overriddenDemand", UNSET))
+        option3: None | str | Unset = d.pop("option3", UNSET)
 
-        def _parse_overridden_demand_period(data: object) -> int | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(int | None | Unset, data)
+        overridden_demand: float | None | Unset = d.pop("overriddenDemand", UNSET)
 
-        overridden_demand_period = _parse_overridden_demand_period(
-            d.pop("overriddenDemandPeriod", UNSET)
+        overridden_demand_period: int | None | Unset = d.pop(
+            "overriddenDemandPeriod", UNSET
         )
 
         def _parse_stock_locations(
@@ -713,79 +563,21 @@ class ProductsRequestDto:
 
         stock_locations = _parse_stock_locations(d.pop("stockLocations", UNSET))
 
-        def _parse_parent_id(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
-
-        parent_id = _parse_parent_id(d.pop("parentId", UNSET))
-
-        def _parse_variant_type(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
-
-        variant_type = _parse_variant_type(d.pop("variantType", UNSET))
-
-        def _parse_variant(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
-
-        variant = _parse_variant(d.pop("variant", UNSET))
-
-        def _parse_ignore_seasonality(data: object) -> bool | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(bool | None | Unset, data)
-
-        ignore_seasonality = _parse_ignore_seasonality(
-            d.pop("ignoreSeasonality", UNSET)
-        )
+        parent_id: None | str | Unset = d.pop("parentId", UNSET)
 
-        def _parse_weight(data: object) -> float | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(float | None | Unset, data)
+        variant_type: None | str | Unset = d.pop("variantType", UNSET)
 
-        weight = _parse_weight(d.pop("weight", UNSET))
-
-        def _parse_height(data: object) -> float | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(float | None | Unset, data)
+        variant: None | str | Unset = d.pop("variant", UNSET)
 
-        height = _parse_height(d.pop("height", UNSET))
+        ignore_seasonality: bool | None | Unset = d.pop("ignoreSeasonality", UNSET)
 
-        def _parse_width(data: object) -> float | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(float | None | Unset, data)
+        weight: float | None | Unset = d.pop("weight", UNSET)
 
-        width = _parse_width(d.pop("width", UNSET))
+        height: float | None | Unset = d.pop("height", UNSET)
 
-        def _parse_length(data: object) -> float | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(float | None | Unset, data)
+        width: float | None | Unset = d.pop("width", UNSET)
 
-        length = _parse_length(d.pop("length", UNSET))
+        length: float | None | Unset = d.pop("length", UNSET)
 
         products_request_dto = cls(
             product_id=product_id,
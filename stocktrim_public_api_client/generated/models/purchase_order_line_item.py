@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import datetime
 from collections.abc import Mapping
-from typing import Any, TypeVar, cast
+from typing import Any, ClassVar, TypeVar, cast
 
 from attrs import define as _attrs_define
 from dateutil.parser import isoparse
@@ -27,6 +27,13 @@ class PurchaseOrderLineItem:
     received_date: datetime.datetime | None | Unset = UNSET
     unit_price: float | None | Unset = UNSET
 
+    _JSON_KEYS: ClassVar[dict[str, str]] = {
+        "product_id": "productId",
+        "quantity": "quantity",
+        "received_date": "receivedDate",
+        "unit_price": "unitPrice",
+    }
+
     def to_dict(self) -> dict[str, Any]:
         product_id = self.product_id
 
@@ -68,31 +75,9 @@ class PurchaseOrderLineItem:
 
         quantity = d.pop("quantity")
 
-        def _parse_received_date(data: object) -> datetime.datetime | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            try:
-                if not isinstance(data, str):
-                    raise TypeError()
-                received_date_type_0 = isoparse(data)
-
-                return received_date_type_0
-            except (TypeError, ValueError, AttributeError, KeyError):
-                pass
-            return cast(datetime.datetime | None | Unset, data)
-
         received_date = _parse_received_date(d.pop("receivedDate", UNSET))
 
-        def _parse_unit_price(data: object) -> float | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(float | None | Unset, data)
-
-        unit_price = _parse_unit_price(d.pop("unitPrice", UNSET))
+        unit_price: float | None | Unset = d.pop("unitPrice", UNSET)
 
         purchase_order_line_item = cls(
             product_id=product_id,
@@ -102,3 +87,19 @@ class PurchaseOrderLineItem:
         )
 
         return purchase_order_line_item
+
+
+def _parse_received_date(data: object) -> datetime.datetime | None | Unset:
+    if data is None:
+        return data
+    if isinstance(data, Unset):
+        return data
+    try:
+        if not isinstance(data, str):
+            raise TypeError()
+        received_date_type_0 = isoparse(data)
+
+        return received_date_type_0
+    except (TypeError, ValueError, AttributeError, KeyError):
+        pass
+    return cast(datetime.datetime | None | Unset, data)
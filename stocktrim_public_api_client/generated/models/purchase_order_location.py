@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
-from typing import Any, TypeVar, cast
+from typing import Any, ClassVar, TypeVar
 
 from attrs import define as _attrs_define
 
@@ -21,6 +21,11 @@ class PurchaseOrderLocation:
     location_code: None | str | Unset = UNSET
     location_name: None | str | Unset = UNSET
 
+    _JSON_KEYS: ClassVar[dict[str, str]] = {
+        "location_code": "locationCode",
+        "location_name": "locationName",
+    }
+
     def to_dict(self) -> dict[str, Any]:
         location_code: None | str | Unset
         if isinstance(self.location_code, Unset):
@@ -48,23 +53,9 @@ class PurchaseOrderLocation:
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
         d = dict(src_dict)
 
-        def _parse_location_code(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
-
-        location_code = _parse_location_code(d.pop("locationCode", UNSET))
-
-        def _parse_location_name(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
+        location_code: None | str | Unset = d.pop("locationCode", UNSET)
 
-        location_name = _parse_location_name(d.pop("locationName", UNSET))
+        location_name: None | str | Unset = d.pop("locationName", UNSET)
 
         purchase_order_location = cls(
             location_code=location_code,
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import datetime
 from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, TypeVar, cast
+from typing import TYPE_CHECKING, Any, ClassVar, TypeVar, cast
 
 from attrs import define as _attrs_define
 from dateutil.parser import isoparse
@@ -50,6 +50,21 @@ class PurchaseOrderResponseDto:
     location: None | PurchaseOrderLocation | Unset = UNSET
     status: PurchaseOrderStatusDto | Unset = UNSET
 
+    _JSON_KEYS: ClassVar[dict[str, str]] = {
+        "supplier": "supplier",
+        "purchase_order_line_items": "purchaseOrderLineItems",
+        "id": "id",
+        "message": "message",
+        "order_date": "orderDate",
+        "created_date": "createdDate",
+        "fully_received_date": "fullyReceivedDate",
+        "external_id": "externalId",
+        "reference_number": "referenceNumber",
+        "client_reference_number": "clientReferenceNumber",
+        "location": "location",
+        "status": "status",
+    }
+
     def to_dict(self) -> dict[str, Any]:
         from ..models.purchase_order_location import PurchaseOrderLocation
 
@@ -175,97 +190,22 @@ class PurchaseOrderResponseDto:
 
         id = d.pop("id", UNSET)
 
-        def _parse_message(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
-
-        message = _parse_message(d.pop("message", UNSET))
-
-        def _parse_order_date(data: object) -> datetime.datetime | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            try:
-                if not isinstance(data, str):
-                    raise TypeError()
-                order_date_type_0 = isoparse(data)
-
-                return order_date_type_0
-            except (TypeError, ValueError, AttributeError, KeyError):
-                pass
-            return cast(datetime.datetime | None | Unset, data)
+        message: None | str | Unset = d.pop("message", UNSET)
 
         order_date = _parse_order_date(d.pop("orderDate", UNSET))
 
-        def _parse_created_date(data: object) -> datetime.datetime | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            try:
-                if not isinstance(data, str):
-                    raise TypeError()
-                created_date_type_0 = isoparse(data)
-
-                return created_date_type_0
-            except (TypeError, ValueError, AttributeError, KeyError):
-                pass
-            return cast(datetime.datetime | None | Unset, data)
-
         created_date = _parse_created_date(d.pop("createdDate", UNSET))
 
-        def _parse_fully_received_date(
-            data: object,
-        ) -> datetime.datetime | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            try:
-                if not isinstance(data, str):
-                    raise TypeError()
-                fully_received_date_type_0 = isoparse(data)
-
-                return fully_received_date_type_0
-            except (TypeError, ValueError, AttributeError, KeyError):
-                pass
-            return cast(datetime.datetime | None | Unset, data)
-
         fully_received_date = _parse_fully_received_date(
             d.pop("fullyReceivedDate", UNSET)
         )
 
-        def _parse_external_id(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
-
-        external_id = _parse_external_id(d.pop("externalId", UNSET))
+        external_id: None | str | Unset = d.pop("externalId", UNSET)
 
-        def _parse_reference_number(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
-
-        reference_number = _parse_reference_number(d.pop("referenceNumber", UNSET))
+        reference_number: None | str | Unset = d.pop("referenceNumber", UNSET)
 
-        def _parse_client_reference_number(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
-
-        client_reference_number = _parse_client_reference_number(
-            d.pop("clientReferenceNumber", UNSET)
+        client_reference_number: None | str | Unset = d.pop(
+            "clientReferenceNumber", UNSET
         )
 
         def _parse_location(data: object) -> None | PurchaseOrderLocation | Unset:
@@ -310,3 +250,53 @@ class PurchaseOrderResponseDto:
         )
 
         return purchase_order_response_dto
+
+
+def _parse_order_date(data: object) -> datetime.datetime | None | Unset:
+    if data is None:
+        return data
+    if isinstance(data, Unset):
+        return data
+    try:
+        if not isinstance(data, str):
+            raise TypeError()
+        order_date_type_0 = isoparse(data)
+
+        return order_date_type_0
+    except (TypeError, ValueError, AttributeError, KeyError):
+        pass
+    return cast(datetime.datetime | None | Unset, data)
+
+
+def _parse_created_date(data: object) -> datetime.datetime | None | Unset:
+    if data is None:
+        return data
+    if isinstance(data, Unset):
+        return data
+    try:
+        if not isinstance(data, str):
+            raise TypeError()
+        created_date_type_0 = isoparse(data)
+
+        return created_date_type_0
+    except (TypeError, ValueError, AttributeError, KeyError):
+        pass
+    return cast(datetime.datetime | None | Unset, data)
+
+
+def _parse_fully_received_date(
+    data: object,
+) -> datetime.datetime | None | Unset:
+    if data is None:
+        return data
+    if isinstance(data, Unset):
+        return data
+    try:
+        if not isinstance(data, str):
+            raise TypeError()
+        fully_received_date_type_0 = isoparse(data)
+
+        return fully_received_date_type_0
+    except (TypeError, ValueError, AttributeError, KeyError):
+        pass
+    return cast(datetime.datetime | None | Unset, data)
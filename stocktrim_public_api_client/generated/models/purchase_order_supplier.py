@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
-from typing import Any, TypeVar, cast
+from typing import Any, ClassVar, TypeVar
 
 from attrs import define as _attrs_define
 
@@ -21,6 +21,11 @@ class PurchaseOrderSupplier:
     supplier_code: None | str | Unset = UNSET
     supplier_name: None | str | Unset = UNSET
 
+    _JSON_KEYS: ClassVar[dict[str, str]] = {
+        "supplier_code": "supplierCode",
+        "supplier_name": "supplierName",
+    }
+
     def to_dict(self) -> dict[str, Any]:
         supplier_code: None | str | Unset
         if isinstance(self.supplier_code, Unset):
@@ -48,23 +53,9 @@ class PurchaseOrderSupplier:
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
         d = dict(src_dict)
 
-        def _parse_supplier_code(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
-
-        supplier_code = _parse_supplier_code(d.pop("supplierCode", UNSET))
-
-        def _parse_supplier_name(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
+        supplier_code: None | str | Unset = d.pop("supplierCode", UNSET)
 
-        supplier_name = _parse_supplier_name(d.pop("supplierName", UNSET))
+        supplier_name: None | str | Unset = d.pop("supplierName", UNSET)
 
         purchase_order_supplier = cls(
             supplier_code=supplier_code,
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import datetime
 from collections.abc import Mapping
-from typing import Any, TypeVar, cast
+from typing import Any, ClassVar, TypeVar
 
 from attrs import define as _attrs_define
 from dateutil.parser import isoparse
@@ -41,6 +41,20 @@ class SalesOrderResponseDto:
     customer_code: None | str | Unset = UNSET
     customer_name: None | str | Unset = UNSET
 
+    _JSON_KEYS: ClassVar[dict[str, str]] = {
+        "product_id": "productId",
+        "order_date": "orderDate",
+        "quantity": "quantity",
+        "id": "id",
+        "location_id": "locationId",
+        "external_reference_id": "externalReferenceId",
+        "unit_price": "unitPrice",
+        "location_code": "locationCode",
+        "location_name": "locationName",
+        "customer_code": "customerCode",
+        "customer_name": "customerName",
+    }
+
     def to_dict(self) -> dict[str, Any]:
         product_id = self.product_id
 
@@ -129,61 +143,17 @@ class SalesOrderResponseDto:
 
         location_id = d.pop("locationId", UNSET)
 
-        def _parse_external_reference_id(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
+        external_reference_id: None | str | Unset = d.pop("externalReferenceId", UNSET)
 
-        external_reference_id = _parse_external_reference_id(
-            d.pop("externalReferenceId", UNSET)
-        )
+        unit_price: float | None | Unset = d.pop("unitPrice", UNSET)
+
+        location_code: None | str | Unset = d.pop("locationCode", UNSET)
+
+        location_name: None | str | Unset = d.pop("locationName", UNSET)
+
+        customer_code: None | str | Unset = d.pop("customerCode", UNSET)
 
-        def _parse_unit_price(data: object) -> float | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(float | None | Unset, data)
-
-        unit_price = _parse_unit_price(d.pop("unitPrice", UNSET))
-
-        def _parse_location_code(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
-
-        location_code = _parse_location_code(d.pop("locationCode", UNSET))
-
-        def _parse_location_name(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
-
-        location_name = _parse_location_name(d.pop("locationName", UNSET))
-
-        def _parse_customer_code(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
-
-        customer_code = _parse_customer_code(d.pop("customerCode", UNSET))
-
-        def _parse_customer_name(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
-
-        customer_name = _parse_customer_name(d.pop("customerName", UNSET))
+        customer_name: None | str | Unset = d.pop("customerName", UNSET)
 
         sales_order_response_dto = cls(
             product_id=product_id,
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import datetime
 from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, TypeVar, cast
+from typing import TYPE_CHECKING, Any, ClassVar, TypeVar, cast
 
 from attrs import define as _attrs_define
 from dateutil.parser import isoparse
@@ -35,6 +35,15 @@ class SalesOrderWithLineItemsRequestDto:
     customer_name: None | str | Unset = UNSET
     sale_order_line_items: list[SalesOrderRequestDto] | None | Unset = UNSET
 
+    _JSON_KEYS: ClassVar[dict[str, str]] = {
+        "order_date": "orderDate",
+        "location_code": "locationCode",
+        "location_name": "locationName",
+        "customer_code": "customerCode",
+        "customer_name": "customerName",
+        "sale_order_line_items": "saleOrderLineItems",
+    }
+
     def to_dict(self) -> dict[str, Any]:
         order_date = self.order_date.isoformat()
 
@@ -103,41 +112,13 @@ class SalesOrderWithLineItemsRequestDto:
         d = dict(src_dict)
         order_date = isoparse(d.pop("orderDate"))
 
-        def _parse_location_code(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
-
-        location_code = _parse_location_code(d.pop("locationCode", UNSET))
-
-        def _parse_location_name(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
+        location_code: None | str | Unset = d.pop("locationCode", UNSET)
 
-        location_name = _parse_location_name(d.pop("locationName", UNSET))
+        location_name: None | str | Unset = d.pop("locationName", UNSET)
 
-        def _parse_customer_code(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
-
-        customer_code = _parse_customer_code(d.pop("customerCode", UNSET))
-
-        def _parse_customer_name(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
+        customer_code: None | str | Unset = d.pop("customerCode", UNSET)
 
-        customer_name = _parse_customer_name(d.pop("customerName", UNSET))
+        customer_name: None | str | Unset = d.pop("customerName", UNSET)
 
         def _parse_sale_order_line_items(
             data: object,
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, TypeVar, cast
+from typing import TYPE_CHECKING, Any, ClassVar, TypeVar, cast
 
 from attrs import define as _attrs_define
 
@@ -27,6 +27,12 @@ class SetInventoryRequest:
     update_overall_all_on_hand_to_be_sum_of_location: bool | Unset = UNSET
     inventory: list[Inventory] | None | Unset = UNSET
 
+    _JSON_KEYS: ClassVar[dict[str, str]] = {
+        "update_overall_all_on_order_to_be_sum_of_location": "updateOverallAllOnOrderToBeSumOfLocation",
+        "update_overall_all_on_hand_to_be_sum_of_location": "updateOverallAllOnHandToBeSumOfLocation",
+        "inventory": "inventory",
+    }
+
     def to_dict(self) -> dict[str, Any]:
         update_overall_all_on_order_to_be_sum_of_location = (
             self.update_overall_all_on_order_to_be_sum_of_location
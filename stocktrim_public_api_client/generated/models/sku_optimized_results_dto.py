@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import datetime
 from collections.abc import Mapping
-from typing import Any, TypeVar, cast
+from typing import Any, ClassVar, TypeVar, cast
 from uuid import UUID
 
 from attrs import define as _attrs_define
@@ -188,6 +188,92 @@ class SkuOptimizedResultsDto:
     sku_code_parent: None | str | Unset = UNSET
     child_variants_count: int | Unset = UNSET
 
+    _JSON_KEYS: ClassVar[dict[str, str]] = {
+        "id": "id",
+        "sku_property_id": "skuPropertyId",
+        "sku_id": "skuId",
+        "location_id": "locationId",
+        "channel_id": "channelId",
+        "sku_grouping_id": "skuGroupingId",
+        "sku_optimized_results_group_id": "skuOptimizedResultsGroupId",
+        "tenant_id": "tenantId",
+        "calculated_date_time": "calculatedDateTime",
+        "effective_to_date_time": "effectiveToDateTime",
+        "reorder_point": "reorderPoint",
+        "order_quantity": "orderQuantity",
+        "lead_demand": "leadDemand",
+        "forecast_period_demand": "forecastPeriodDemand",
+        "overridden_future_demand_effective_from_now": "overriddenFutureDemandEffectiveFromNow",
+        "safety_stock_level": "safetyStockLevel",
+        "economic_order_quantity": "economicOrderQuantity",
+        "optimial_stock_cycle": "optimialStockCycle",
+        "lead_time_days": "leadTimeDays",
+        "reorder_frequency_days": "reorderFrequencyDays",
+        "order_count": "orderCount",
+        "latest_order_date": "latestOrderDate",
+        "first_purchase_date": "firstPurchaseDate",
+        "minimum_order_quantity": "minimumOrderQuantity",
+        "batch_size": "batchSize",
+        "stock_on_hand": "stockOnHand",
+        "stock_on_order": "stockOnOrder",
+        "finished_good_stock_on_hand": "finishedGoodStockOnHand",
+        "finished_good_stock_on_order": "finishedGoodStockOnOrder",
+        "finished_good_quantity_used": "finishedGoodQuantityUsed",
+        "component_stock_on_hand": "componentStockOnHand",
+        "days_until_replenishment_due": "daysUntilReplenishmentDue",
+        "days_until_stock_out": "daysUntilStockOut",
+        "is_uncertain": "isUncertain",
+        "orders_in_previous_lead_time": "ordersInPreviousLeadTime",
+        "avg_daily_orders_last_120_days": "avgDailyOrdersLast120Days",
+        "lead_demand_prediction_based_on_average": "leadDemandPredictionBasedOnAverage",
+        "lead_demand_prediction_based_on_linear_regression": "leadDemandPredictionBasedOnLinearRegression",
+        "lead_demand_prediction_based_on_2_nd_order_polynomial_regression": "leadDemandPredictionBasedOn2ndOrderPolynomialRegression",
+        "lead_demand_prediction_based_on_last_month": "leadDemandPredictionBasedOnLastMonth",
+        "lead_demand_prediction_based_on_previous_leadtime_days": "leadDemandPredictionBasedOnPreviousLeadtimeDays",
+        "standard_dev": "standardDev",
+        "service_factor": "serviceFactor",
+        "max_r_squared": "maxRSquared",
+        "min_r_squared": "minRSquared",
+        "max_range": "maxRange",
+        "parent_quantity": "parentQuantity",
+        "most_accurate_algorithm_type_id": "mostAccurateAlgorithmTypeId",
+        "error_text": "errorText",
+        "category": "category",
+        "sub_category": "subCategory",
+        "brand": "brand",
+        "product_type": "productType",
+        "option1": "option1",
+        "option2": "option2",
+        "option3": "option3",
+        "size": "size",
+        "product_code": "productCode",
+        "name": "name",
+        "sku_cost": "skuCost",
+        "sku_price": "skuPrice",
+        "is_discontinued": "isDiscontinued",
+        "is_unstocked": "isUnstocked",
+        "product_of_count": "productOfCount",
+        "component_of_count": "componentOfCount",
+        "customer_count": "customerCount",
+        "location_count": "locationCount",
+        "location_name": "locationName",
+        "show_forecast_for_all_locations": "showForecastForAllLocations",
+        "manufacturing_time": "manufacturingTime",
+        "minimum_shelf_level": "minimumShelfLevel",
+        "maximum_shelf_level": "maximumShelfLevel",
+        "service_level": "serviceLevel",
+        "weight": "weight",
+        "height": "height",
+        "width": "width",
+        "length": "length",
+        "dimensions_cubic_meters": "dimensionsCubicMeters",
+        "external_id": "externalId",
+        "sku_code": "skuCode",
+        "external_id_parent": "externalIdParent",
+        "sku_code_parent": "skuCodeParent",
+        "child_variants_count": "childVariantsCount",
+    }
+
     def to_dict(self) -> dict[str, Any]:
         id = self.id
 
@@ -851,76 +937,19 @@ class SkuOptimizedResultsDto:
         d = dict(src_dict)
         id = d.pop("id", UNSET)
 
-        def _parse_sku_property_id(data: object) -> int | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(int | None | Unset, data)
-
-        sku_property_id = _parse_sku_property_id(d.pop("skuPropertyId", UNSET))
-
-        def _parse_sku_id(data: object) -> int | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(int | None | Unset, data)
-
-        sku_id = _parse_sku_id(d.pop("skuId", UNSET))
-
-        def _parse_location_id(data: object) -> int | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(int | None | Unset, data)
-
-        location_id = _parse_location_id(d.pop("locationId", UNSET))
-
-        def _parse_channel_id(data: object) -> int | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(int | None | Unset, data)
-
-        channel_id = _parse_channel_id(d.pop("channelId", UNSET))
-
-        def _parse_sku_grouping_id(data: object) -> int | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(int | None | Unset, data)
-
-        sku_grouping_id = _parse_sku_grouping_id(d.pop("skuGroupingId", UNSET))
-
-        def _parse_sku_optimized_results_group_id(data: object) -> int | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(int | None | Unset, data)
-
-        sku_optimized_results_group_id = _parse_sku_optimized_results_group_id(
-            d.pop("skuOptimizedResultsGroupId", UNSET)
-        )
+        sku_property_id: int | None | Unset = d.pop("skuPropertyId", UNSET)
+
+        sku_id: int | None | Unset = d.pop("skuId", UNSET)
+
+        location_id: int | None | Unset = d.pop("locationId", UNSET)
 
-        def _parse_tenant_id(data: object) -> None | Unset | UUID:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            try:
-                if not isinstance(data, str):
-                    raise TypeError()
-                tenant_id_type_0 = UUID(data)
-
-                return tenant_id_type_0
-            except (TypeError, ValueError, AttributeError, KeyError):
-                pass
-            return cast(None | Unset | UUID, data)
+        channel_id: int | None | Unset = d.pop("channelId", UNSET)
+
+        sku_grouping_id: int | None | Unset = d.pop("skuGroupingId", UNSET)
+
+        sku_optimized_results_group_id: int | None | Unset = d.pop(
+            "skuOptimizedResultsGroupId", UNSET
+        )
 
         tenant_id = _parse_tenant_id(d.pop("tenantId", UNSET))
 
@@ -931,537 +960,145 @@ class SkuOptimizedResultsDto:
         else:
             calculated_date_time = isoparse(_calculated_date_time)
 
-        def _parse_effective_to_date_time(
-            data: object,
-        ) -> datetime.datetime | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            try:
-                if not isinstance(data, str):
-                    raise TypeError()
-                effective_to_date_time_type_0 = isoparse(data)
-
-                return effective_to_date_time_type_0
-            except (TypeError, ValueError, AttributeError, KeyError):
-                pass
-            return cast(datetime.datetime | None | Unset, data)
-
         effective_to_date_time = _parse_effective_to_date_time(
             d.pop("effectiveToDateTime", UNSET)
         )
 
-        def _parse_reorder_point(data: object) -> float | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(float | None | Unset, data)
-
-        reorder_point = _parse_reorder_point(d.pop("reorderPoint", UNSET))
-
-        def _parse_order_quantity(data: object) -> float | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(float | None | Unset, data)
-
-        order_quantity = _parse_order_quantity(d.pop("orderQuantity", UNSET))
-
-        def _parse_lead_demand(data: object) -> float | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(float | None | Unset, data)
-
-        lead_demand = _parse_lead_demand(d.pop("leadDemand", UNSET))
-
-        def _parse_forecast_period_demand(data: object) -> float | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(float | None | Unset, data)
-
-        forecast_period_demand = _parse_forecast_period_demand(
-            d.pop("forecastPeriodDemand", UNSET)
-        )
-
-        def _parse_overridden_future_demand_effective_from_now(
-            data: object,
-        ) -> float | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(float | None | Unset, data)
-
-        overridden_future_demand_effective_from_now = (
-            _parse_overridden_future_demand_effective_from_now(
-                d.pop("overriddenFutureDemandEffectiveFromNow", UNSET)
-            )
-        )
+        reorder_point: float | None | Unset = d.pop("reorderPoint", UNSET)
 
-        def _parse_safety_stock_level(data: object) -> float | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(float | None | Unset, data)
+        order_quantity: float | None | Unset = d.pop("orderQuantity", UNSET)
 
-        safety_stock_level = _parse_safety_stock_level(d.pop("safetyStockLevel", UNSET))
+        lead_demand: float | None | Unset = d.pop("leadDemand", UNSET)
 
-        def _parse_economic_order_quantity(data: object) -> float | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(float | None | Unset, data)
+        forecast_period_demand: float | None | Unset = d.pop(
+            "forecastPeriodDemand", UNSET
+        )
 
-        economic_order_quantity = _parse_economic_order_quantity(
-            d.pop("economicOrderQuantity", UNSET)
+        overridden_future_demand_effective_from_now: float | None | Unset = d.pop(
+            "overriddenFutureDemandEffectiveFromNow", UNSET
         )
 
-        def _parse_optimial_stock_cycle(data: object) -> float | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(float | None | Unset, data)
+        safety_stock_level: float | None | Unset = d.pop("safetyStockLevel", UNSET)
 
-        optimial_stock_cycle = _parse_optimial_stock_cycle(
-            d.pop("optimialStockCycle", UNSET)
+        economic_order_quantity: float | None | Unset = d.pop(
+            "economicOrderQuantity", UNSET
         )
 
-        def _parse_lead_time_days(data: object) -> int | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(int | None | Unset, data)
-
-        lead_time_days = _parse_lead_time_days(d.pop("leadTimeDays", UNSET))
+        optimial_stock_cycle: float | None | Unset = d.pop("optimialStockCycle", UNSET)
 
-        def _parse_reorder_frequency_days(data: object) -> int | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(int | None | Unset, data)
+        lead_time_days: int | None | Unset = d.pop("leadTimeDays", UNSET)
 
-        reorder_frequency_days = _parse_reorder_frequency_days(
-            d.pop("reorderFrequencyDays", UNSET)
+        reorder_frequency_days: int | None | Unset = d.pop(
+            "reorderFrequencyDays", UNSET
         )
 
         order_count = d.pop("orderCount", UNSET)
 
-        def _parse_latest_order_date(data: object) -> datetime.datetime | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            try:
-                if not isinstance(data, str):
-                    raise TypeError()
-                latest_order_date_type_0 = isoparse(data)
-
-                return latest_order_date_type_0
-            except (TypeError, ValueError, AttributeError, KeyError):
-                pass
-            return cast(datetime.datetime | None | Unset, data)
-
         latest_order_date = _parse_latest_order_date(d.pop("latestOrderDate", UNSET))
 
-        def _parse_first_purchase_date(
-            data: object,
-        ) -> datetime.datetime | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            try:
-                if not isinstance(data, str):
-                    raise TypeError()
-                first_purchase_date_type_0 = isoparse(data)
-
-                return first_purchase_date_type_0
-            except (TypeError, ValueError, AttributeError, KeyError):
-                pass
-            return cast(datetime.datetime | None | Unset, data)
-
         first_purchase_date = _parse_first_purchase_date(
             d.pop("firstPurchaseDate", UNSET)
         )
 
-        def _parse_minimum_order_quantity(data: object) -> int | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(int | None | Unset, data)
-
-        minimum_order_quantity = _parse_minimum_order_quantity(
-            d.pop("minimumOrderQuantity", UNSET)
-        )
-
-        def _parse_batch_size(data: object) -> int | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(int | None | Unset, data)
-
-        batch_size = _parse_batch_size(d.pop("batchSize", UNSET))
-
-        def _parse_stock_on_hand(data: object) -> float | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(float | None | Unset, data)
-
-        stock_on_hand = _parse_stock_on_hand(d.pop("stockOnHand", UNSET))
-
-        def _parse_stock_on_order(data: object) -> float | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(float | None | Unset, data)
-
-        stock_on_order = _parse_stock_on_order(d.pop("stockOnOrder", UNSET))
-
-        def _parse_finished_good_stock_on_hand(data: object) -> float | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(float | None | Unset, data)
-
-        finished_good_stock_on_hand = _parse_finished_good_stock_on_hand(
-            d.pop("finishedGoodStockOnHand", UNSET)
+        minimum_order_quantity: int | None | Unset = d.pop(
+            "minimumOrderQuantity", UNSET
         )
 
-        def _parse_finished_good_stock_on_order(data: object) -> float | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(float | None | Unset, data)
+        batch_size: int | None | Unset = d.pop("batchSize", UNSET)
 
-        finished_good_stock_on_order = _parse_finished_good_stock_on_order(
-            d.pop("finishedGoodStockOnOrder", UNSET)
-        )
+        stock_on_hand: float | None | Unset = d.pop("stockOnHand", UNSET)
 
-        def _parse_finished_good_quantity_used(data: object) -> float | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(float | None | Unset, data)
+        stock_on_order: float | None | Unset = d.pop("stockOnOrder", UNSET)
 
-        finished_good_quantity_used = _parse_finished_good_quantity_used(
-            d.pop("finishedGoodQuantityUsed", UNSET)
+        finished_good_stock_on_hand: float | None | Unset = d.pop(
+            "finishedGoodStockOnHand", UNSET
         )
 
-        def _parse_component_stock_on_hand(data: object) -> float | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(float | None | Unset, data)
-
-        component_stock_on_hand = _parse_component_stock_on_hand(
-            d.pop("componentStockOnHand", UNSET)
+        finished_good_stock_on_order: float | None | Unset = d.pop(
+            "finishedGoodStockOnOrder", UNSET
         )
 
-        def _parse_days_until_replenishment_due(data: object) -> int | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(int | None | Unset, data)
-
-        days_until_replenishment_due = _parse_days_until_replenishment_due(
-            d.pop("daysUntilReplenishmentDue", UNSET)
+        finished_good_quantity_used: float | None | Unset = d.pop(
+            "finishedGoodQuantityUsed", UNSET
         )
 
-        def _parse_days_until_stock_out(data: object) -> int | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(int | None | Unset, data)
+        component_stock_on_hand: float | None | Unset = d.pop(
+            "componentStockOnHand", UNSET
+        )
 
-        days_until_stock_out = _parse_days_until_stock_out(
-            d.pop("daysUntilStockOut", UNSET)
+        days_until_replenishment_due: int | None | Unset = d.pop(
+            "daysUntilReplenishmentDue", UNSET
         )
 
+        days_until_stock_out: int | None | Unset = d.pop("daysUntilStockOut", UNSET)
+
         is_uncertain = d.pop("isUncertain", UNSET)
 
         orders_in_previous_lead_time = d.pop("ordersInPreviousLeadTime", UNSET)
 
         avg_daily_orders_last_120_days = d.pop("avgDailyOrdersLast120Days", UNSET)
 
-        def _parse_lead_demand_prediction_based_on_average(
-            data: object,
-        ) -> float | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(float | None | Unset, data)
-
-        lead_demand_prediction_based_on_average = (
-            _parse_lead_demand_prediction_based_on_average(
-                d.pop("leadDemandPredictionBasedOnAverage", UNSET)
-            )
+        lead_demand_prediction_based_on_average: float | None | Unset = d.pop(
+            "leadDemandPredictionBasedOnAverage", UNSET
         )
 
-        def _parse_lead_demand_prediction_based_on_linear_regression(
-            data: object,
-        ) -> float | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(float | None | Unset, data)
-
-        lead_demand_prediction_based_on_linear_regression = (
-            _parse_lead_demand_prediction_based_on_linear_regression(
-                d.pop("leadDemandPredictionBasedOnLinearRegression", UNSET)
-            )
+        lead_demand_prediction_based_on_linear_regression: float | None | Unset = d.pop(
+            "leadDemandPredictionBasedOnLinearRegression", UNSET
         )
 
-        def _parse_lead_demand_prediction_based_on_2_nd_order_polynomial_regression(
-            data: object,
-        ) -> float | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(float | None | Unset, data)
-
-        lead_demand_prediction_based_on_2_nd_order_polynomial_regression = (
-            _parse_lead_demand_prediction_based_on_2_nd_order_polynomial_regression(
-                d.pop("leadDemandPredictionBasedOn2ndOrderPolynomialRegression", UNSET)
-            )
-        )
+        lead_demand_prediction_based_on_2_nd_order_polynomial_regression: (
+            float | None | Unset
+        ) = d.pop("leadDemandPredictionBasedOn2ndOrderPolynomialRegression", UNSET)
 
-        def _parse_lead_demand_prediction_based_on_last_month(
-            data: object,
-        ) -> float | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(float | None | Unset, data)
-
-        lead_demand_prediction_based_on_last_month = (
-            _parse_lead_demand_prediction_based_on_last_month(
-                d.pop("leadDemandPredictionBasedOnLastMonth", UNSET)
-            )
+        lead_demand_prediction_based_on_last_month: float | None | Unset = d.pop(
+            "leadDemandPredictionBasedOnLastMonth", UNSET
         )
 
-        def _parse_lead_demand_prediction_based_on_previous_leadtime_days(
-            data: object,
-        ) -> float | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(float | None | Unset, data)
-
-        lead_demand_prediction_based_on_previous_leadtime_days = (
-            _parse_lead_demand_prediction_based_on_previous_leadtime_days(
-                d.pop("leadDemandPredictionBasedOnPreviousLeadtimeDays", UNSET)
-            )
+        lead_demand_prediction_based_on_previous_leadtime_days: float | None | Unset = (
+            d.pop("leadDemandPredictionBasedOnPreviousLeadtimeDays", UNSET)
         )
 
-        def _parse_standard_dev(data: object) -> float | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(float | None | Unset, data)
-
-        standard_dev = _parse_standard_dev(d.pop("standardDev", UNSET))
-
-        def _parse_service_factor(data: object) -> float | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(float | None | Unset, data)
-
-        service_factor = _parse_service_factor(d.pop("serviceFactor", UNSET))
-
-        def _parse_max_r_squared(data: object) -> float | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(float | None | Unset, data)
-
-        max_r_squared = _parse_max_r_squared(d.pop("maxRSquared", UNSET))
-
-        def _parse_min_r_squared(data: object) -> float | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(float | None | Unset, data)
-
-        min_r_squared = _parse_min_r_squared(d.pop("minRSquared", UNSET))
-
-        def _parse_max_range(data: object) -> float | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(float | None | Unset, data)
-
-        max_range = _parse_max_range(d.pop("maxRange", UNSET))
-
-        def _parse_parent_quantity(data: object) -> float | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(float | None | Unset, data)
-
-        parent_quantity = _parse_parent_quantity(d.pop("parentQuantity", UNSET))
-
-        def _parse_most_accurate_algorithm_type_id(data: object) -> int | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(int | None | Unset, data)
-
-        most_accurate_algorithm_type_id = _parse_most_accurate_algorithm_type_id(
-            d.pop("mostAccurateAlgorithmTypeId", UNSET)
+        standard_dev: float | None | Unset = d.pop("standardDev", UNSET)
+
+        service_factor: float | None | Unset = d.pop("serviceFactor", UNSET)
+
+        max_r_squared: float | None | Unset = d.pop("maxRSquared", UNSET)
+
+        min_r_squared: float | None | Unset = d.pop("minRSquared", UNSET)
+
+        max_range: float | None | Unset = d.pop("maxRange", UNSET)
+
+        parent_quantity: float | None | Unset = d.pop("parentQuantity", UNSET)
+
+        most_accurate_algorithm_type_id: int | None | Unset = d.pop(
+            "mostAccurateAlgorithmTypeId", UNSET
         )
 
-        def _parse_error_text(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
-
-        error_text = _parse_error_text(d.pop("errorText", UNSET))
-
-        def _parse_category(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
-
-        category = _parse_category(d.pop("category", UNSET))
-
-        def _parse_sub_category(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
-
-        sub_category = _parse_sub_category(d.pop("subCategory", UNSET))
-
-        def _parse_brand(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
-
-        brand = _parse_brand(d.pop("brand", UNSET))
-
-        def _parse_product_type(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
-
-        product_type = _parse_product_type(d.pop("productType", UNSET))
-
-        def _parse_option1(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
-
-        option1 = _parse_option1(d.pop("option1", UNSET))
-
-        def _parse_option2(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
-
-        option2 = _parse_option2(d.pop("option2", UNSET))
-
-        def _parse_option3(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
-
-        option3 = _parse_option3(d.pop("option3", UNSET))
-
-        def _parse_size(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
-
-        size = _parse_size(d.pop("size", UNSET))
-
-        def _parse_product_code(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
-
-        product_code = _parse_product_code(d.pop("productCode", UNSET))
-
-        def _parse_name(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
-
-        name = _parse_name(d.pop("name", UNSET))
-
-        def _parse_sku_cost(data: object) -> float | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(float | None | Unset, data)
-
-        sku_cost = _parse_sku_cost(d.pop("skuCost", UNSET))
-
-        def _parse_sku_price(data: object) -> float | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(float | None | Unset, data)
-
-        sku_price = _parse_sku_price(d.pop("skuPrice", UNSET))
+        error_text: None | str | Unset = d.pop("errorText", UNSET)
+
+        category: None | str | Unset = d.pop("category", UNSET)
+
+        sub_category: None | str | Unset = d.pop("subCategory", UNSET)
+
+        brand: None | str | Unset = d.pop("brand", UNSET)
+
+        product_type: None | str | Unset = d.pop("productType", UNSET)
+
+        option1: None | str | Unset = d.pop("option1", UNSET)
+
+        option2: None | str | Unset = d.pop("option2", UNSET)
+
+        option3: None | str | Unset = d.pop("option3", UNSET)
+
+        size: None | str | Unset = d.pop("size", UNSET)
+
+        product_code: None | str | Unset = d.pop("productCode", UNSET)
+
+        name: None | str | Unset = d.pop("name", UNSET)
+
+        sku_cost: float | None | Unset = d.pop("skuCost", UNSET)
+
+        sku_price: float | None | Unset = d.pop("skuPrice", UNSET)
 
         is_discontinued = d.pop("isDiscontinued", UNSET)
 
@@ -1475,141 +1112,37 @@ class SkuOptimizedResultsDto:
 
         location_count = d.pop("locationCount", UNSET)
 
-        def _parse_location_name(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
-
-        location_name = _parse_location_name(d.pop("locationName", UNSET))
+        location_name: None | str | Unset = d.pop("locationName", UNSET)
 
         show_forecast_for_all_locations = d.pop("showForecastForAllLocations", UNSET)
 
-        def _parse_manufacturing_time(data: object) -> float | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(float | None | Unset, data)
+        manufacturing_time: float | None | Unset = d.pop("manufacturingTime", UNSET)
 
-        manufacturing_time = _parse_manufacturing_time(
-            d.pop("manufacturingTime", UNSET)
-        )
+        minimum_shelf_level: float | None | Unset = d.pop("minimumShelfLevel", UNSET)
 
-        def _parse_minimum_shelf_level(data: object) -> float | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(float | None | Unset, data)
+        maximum_shelf_level: float | None | Unset = d.pop("maximumShelfLevel", UNSET)
 
-        minimum_shelf_level = _parse_minimum_shelf_level(
-            d.pop("minimumShelfLevel", UNSET)
-        )
+        service_level: float | None | Unset = d.pop("serviceLevel", UNSET)
 
-        def _parse_maximum_shelf_level(data: object) -> float | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(float | None | Unset, data)
+        weight: float | None | Unset = d.pop("weight", UNSET)
 
-        maximum_shelf_level = _parse_maximum_shelf_level(
-            d.pop("maximumShelfLevel", UNSET)
-        )
-
-        def _parse_service_level(data: object) -> float | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(float | None | Unset, data)
-
-        service_level = _parse_service_level(d.pop("serviceLevel", UNSET))
-
-        def _parse_weight(data: object) -> float | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(float | None | Unset, data)
-
-        weight = _parse_weight(d.pop("weight", UNSET))
-
-        def _parse_height(data: object) -> float | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(float | None | Unset, data)
-
-        height = _parse_height(d.pop("height", UNSET))
-
-        def _parse_width(data: object) -> float | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(float | None | Unset, data)
-
-        width = _parse_width(d.pop("width", UNSET))
-
-        def _parse_length(data: object) -> float | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(float | None | Unset, data)
-
-        length = _parse_length(d.pop("length", UNSET))
-
-        def _parse_dimensions_cubic_meters(data: object) -> float | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(float | None | Unset, data)
-
-        dimensions_cubic_meters = _parse_dimensions_cubic_meters(
-            d.pop("dimensionsCubicMeters", UNSET)
-        )
-
-        def _parse_external_id(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
+        height: float | None | Unset = d.pop("height", UNSET)
 
-        external_id = _parse_external_id(d.pop("externalId", UNSET))
+        width: float | None | Unset = d.pop("width", UNSET)
 
-        def _parse_sku_code(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
+        length: float | None | Unset = d.pop("length", UNSET)
 
-        sku_code = _parse_sku_code(d.pop("skuCode", UNSET))
+        dimensions_cubic_meters: float | None | Unset = d.pop(
+            "dimensionsCubicMeters", UNSET
+        )
 
-        def _parse_external_id_parent(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
+        external_id: None | str | Unset = d.pop("externalId", UNSET)
 
-        external_id_parent = _parse_external_id_parent(d.pop("externalIdParent", UNSET))
+        sku_code: None | str | Unset = d.pop("skuCode", UNSET)
 
-        def _parse_sku_code_parent(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
+        external_id_parent: None | str | Unset = d.pop("externalIdParent", UNSET)
 
-        sku_code_parent = _parse_sku_code_parent(d.pop("skuCodeParent", UNSET))
+        sku_code_parent: None | str | Unset = d.pop("skuCodeParent", UNSET)
 
         child_variants_count = d.pop("childVariantsCount", UNSET)
 
@@ -1700,3 +1233,71 @@ class SkuOptimizedResultsDto:
         )
 
         return sku_optimized_results_dto
+
+
+def _parse_tenant_id(data: object) -> None | Unset | UUID:
+    if data is None:
+        return data
+    if isinstance(data, Unset):
+        return data
+    try:
+        if not isinstance(data, str):
+            raise TypeError()
+        tenant_id_type_0 = UUID(data)
+
+        return tenant_id_type_0
+    except (TypeError, ValueError, AttributeError, KeyError):
+        pass
+    return cast(None | Unset | UUID, data)
+
+
+def _parse_effective_to_date_time(
+    data: object,
+) -> datetime.datetime | None | Unset:
+    if data is None:
+        return data
+    if isinstance(data, Unset):
+        return data
+    try:
+        if not isinstance(data, str):
+            raise TypeError()
+        effective_to_date_time_type_0 = isoparse(data)
+
+        return effective_to_date_time_type_0
+    except (TypeError, ValueError, AttributeError, KeyError):
+        pass
+    return cast(datetime.datetime | None | Unset, data)
+
+
+def _parse_latest_order_date(data: object) -> datetime.datetime | None | Unset:
+    if data is None:
+        return data
+    if isinstance(data, Unset):
+        return data
+    try:
+        if not isinstance(data, str):
+            raise TypeError()
+        latest_order_date_type_0 = isoparse(data)
+
+        return latest_order_date_type_0
+    except (TypeError, ValueError, AttributeError, KeyError):
+        pass
+    return cast(datetime.datetime | None | Unset, data)
+
+
+def _parse_first_purchase_date(
+    data: object,
+) -> datetime.datetime | None | Unset:
+    if data is None:
+        return data
+    if isinstance(data, Unset):
+        return data
+    try:
+        if not isinstance(data, str):
+            raise TypeError()
+        first_purchase_date_type_0 = isoparse(data)
+
+        return first_purchase_date_type_0
+    except (TypeError, ValueError, AttributeError, KeyError):
+        pass
+    return cast(datetime.datetime | None | Unset, data)
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
-from typing import Any, TypeVar, cast
+from typing import Any, ClassVar, TypeVar
 
 from attrs import define as _attrs_define
 
@@ -41,6 +41,21 @@ class SupplierRequestDto:
     country: None | str | Unset = UNSET
     post_code: None | str | Unset = UNSET
 
+    _JSON_KEYS: ClassVar[dict[str, str]] = {
+        "supplier_code": "supplierCode",
+        "supplier_name": "supplierName",
+        "email_address": "emailAddress",
+        "primary_contact_name": "primaryContactName",
+        "external_id": "externalId",
+        "default_lead_time": "defaultLeadTime",
+        "street_address": "streetAddress",
+        "address_line_1": "addressLine1",
+        "address_line_2": "addressLine2",
+        "state": "state",
+        "country": "country",
+        "post_code": "postCode",
+    }
+
     def to_dict(self) -> dict[str, Any]:
         supplier_code = self.supplier_code
 
@@ -147,106 +162,27 @@ class SupplierRequestDto:
         d = dict(src_dict)
         supplier_code = d.pop("supplierCode")
 
-        def _parse_supplier_name(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
-
-        supplier_name = _parse_supplier_name(d.pop("supplierName", UNSET))
-
-        def _parse_email_address(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
-
-        email_address = _parse_email_address(d.pop("emailAddress", UNSET))
-
-        def _parse_primary_contact_name(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
-
-        primary_contact_name = _parse_primary_contact_name(
-            d.pop("primaryContactName", UNSET)
-        )
+        supplier_name: None | str | Unset = d.pop("supplierName", UNSET)
+
+        email_address: None | str | Unset = d.pop("emailAddress", UNSET)
+
+        primary_contact_name: None | str | Unset = d.pop("primaryContactName", UNSET)
+
+        external_id: None | str | Unset = d.pop("externalId", UNSET)
+
+        default_lead_time: int | None | Unset = d.pop("defaultLeadTime", UNSET)
+
+        street_address: None | str | Unset = d.pop("streetAddress", UNSET)
+
+        address_line_1: None | str | Unset = d.pop("addressLine1", UNSET)
+
+        address_line_2: None | str | Unset = d.pop("addressLine2", UNSET)
+
+        state: None | str | Unset = d.pop("state", UNSET)
+
+        country: None | str | Unset = d.pop("country", UNSET)
 
-        def _parse_external_id(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
-
-        external_id = _parse_external_id(d.pop("externalId", UNSET))
-
-        def _parse_default_lead_time(data: object) -> int | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(int | None | Unset, data)
-
-        default_lead_time = _parse_default_lead_time(d.pop("defaultLeadTime", UNSET))
-
-        def _parse_street_address(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
-
-        street_address = _parse_street_address(d.pop("streetAddress", UNSET))
-
-        def _parse_address_line_1(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
-
-        address_line_1 = _parse_address_line_1(d.pop("addressLine1", UNSET))
-
-        def _parse_address_line_2(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
-
-        address_line_2 = _parse_address_line_2(d.pop("addressLine2", UNSET))
-
-        def _parse_state(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
-
-        state = _parse_state(d.pop("state", UNSET))
-
-        def _parse_country(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
-
-        country = _parse_country(d.pop("country", UNSET))
-
-        def _parse_post_code(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
-
-        post_code = _parse_post_code(d.pop("postCode", UNSET))
+        post_code: None | str | Unset = d.pop("postCode", UNSET)
 
         supplier_request_dto = cls(
             supplier_code=supplier_code,
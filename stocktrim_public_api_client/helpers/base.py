@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from stocktrim_public_api_client.entity_cache import EntityCache
+
 if TYPE_CHECKING:
     from stocktrim_public_api_client.stocktrim_client import StockTrimClient
 
@@ -24,3 +26,9 @@ class Base:
             client: The StockTrimClient instance to use for API calls.
         """
         self._client = client
+
+    @property
+    def _entity_cache(self) -> EntityCache | None:
+        """The client's entity cache, or None when caching is not enabled."""
+        cache = getattr(self._client, "entity_cache", None)
+        return cache if isinstance(cache, EntityCache) else None
@@ -0,0 +1,120 @@
+"""Chunked, concurrent submission of many single-item requests.
+
+Most StockTrim write endpoints take one entity per request, so importing or
+updating thousands of records one ``await`` at a time costs
+``items x round-trip``. :func:`submit_many` reads the input in chunks and
+keeps up to ``concurrency`` requests in flight within each chunk. A failing
+item does not stop the run: every item gets a :class:`BulkItemResult` in the
+returned :class:`BulkReport`, in input order.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Generic, TypeVar
+
+from stocktrim_public_api_client.helpers.pagination import DEFAULT_CONCURRENCY
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+DEFAULT_CHUNK_SIZE = 100
+"""Default number of input items read and submitted per chunk."""
+
+
+@dataclass
+class BulkItemResult(Generic[T, R]):
+    """Outcome of submitting one item.
+
+    Attributes:
+        index: Position of the item in the input.
+        item: The submitted item.
+        result: Value returned for the item, if it succeeded.
+        error: Exception raised for the item, if it failed.
+    """
+
+    index: int
+    item: T
+    result: R | None = None
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the item was submitted successfully."""
+        return self.error is None
+
+
+@dataclass
+class BulkReport(Generic[T, R]):
+    """Per-item results of a bulk submission, in input order."""
+
+    results: list[BulkItemResult[T, R]] = field(default_factory=list)
+
+    @property
+    def succeeded(self) -> list[BulkItemResult[T, R]]:
+        """Results of the items that were submitted successfully."""
+        return [r for r in self.results if r.ok]
+
+    @property
+    def failed(self) -> list[BulkItemResult[T, R]]:
+        """Results of the items that raised an error."""
+        return [r for r in self.results if not r.ok]
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+
+async def submit_many(
+    items: Iterable[T],
+    submit: Callable[[T], Awaitable[R]],
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> BulkReport[T, R]:
+    """Submit every item, ``concurrency`` at a time, collecting per-item results.
+
+    ``items`` is consumed lazily, ``chunk_size`` items at a time; each chunk
+    completes before the next is read, so generators of any length can be
+    passed. Exceptions raised by ``submit`` are recorded on the item's
+    result; cancellation still propagates.
+
+    Args:
+        items: Items to submit.
+        submit: Coroutine function submitting a single item.
+        chunk_size: Number of items read and submitted per chunk.
+        concurrency: Maximum number of requests in flight at once.
+
+    Returns:
+        BulkReport with one result per input item.
+
+    Raises:
+        ValueError: If ``chunk_size`` or ``concurrency`` is less than 1.
+
+    Example:
+        >>> report = await submit_many(products, client.products.create)
+        >>> print(len(report.succeeded), len(report.failed))
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(index: int, item: T) -> BulkItemResult[T, R]:
+        async with semaphore:
+            try:
+                return BulkItemResult(index, item, result=await submit(item))
+            except Exception as e:
+                return BulkItemResult(index, item, error=e)
+
+    report: BulkReport[T, R] = BulkReport()
+    numbered = enumerate(items)
+    while chunk := list(itertools.islice(numbered, chunk_size)):
+        report.results.extend(
+            await asyncio.gather(*(run(index, item) for index, item in chunk))
+        )
+    return report
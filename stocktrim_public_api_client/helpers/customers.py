@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing import Any, cast
 
+from stocktrim_public_api_client.entity_cache import CUSTOMER
 from stocktrim_public_api_client.generated.api.customers import (
     get_api_customers,
     get_api_customers_code,
@@ -11,7 +12,7 @@ from stocktrim_public_api_client.generated.api.customers import (
 )
 from stocktrim_public_api_client.generated.models.customer_dto import CustomerDto
 from stocktrim_public_api_client.helpers.base import Base
-from stocktrim_public_api_client.utils import unwrap
+from stocktrim_public_api_client.utils import unwrap, unwrap_unset
 
 
 class Customers(Base):
@@ -36,6 +37,9 @@ class Customers(Base):
     async def get(self, code: str) -> CustomerDto:
         """Get a specific customer by code.
 
+        When the client has an entity cache, the customer is served from it
+        until it expires or this client updates it.
+
         Args:
             code: The customer code.
 
@@ -45,11 +49,20 @@ class Customers(Base):
         Example:
             >>> customer = await client.customers.get("CUST-001")
         """
+        cache = self._entity_cache
+        if cache is not None:
+            cached = cache.get(CUSTOMER, code)
+            if cached is not None:
+                return cast(CustomerDto, cached)
+
         response = await get_api_customers_code.asyncio_detailed(
             client=self._client,
             code=code,
         )
-        return cast(CustomerDto, unwrap(response))
+        customer = cast(CustomerDto, unwrap(response))
+        if cache is not None:
+            cache.put(CUSTOMER, (code, unwrap_unset(customer.code)), customer)
+        return customer
 
     async def update(self, customer: CustomerDto) -> list[CustomerDto]:
         """Update a customer (create or update based on code).
@@ -70,6 +83,9 @@ class Customers(Base):
             client=self._client,
             body=customer,
         )
+        cache = self._entity_cache
+        if cache is not None and (code := unwrap_unset(customer.code)):
+            cache.invalidate(CUSTOMER, code)
         result = unwrap(response)
         if isinstance(result, list):
             return cast(list[CustomerDto], result)
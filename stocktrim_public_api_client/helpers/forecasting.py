@@ -3,9 +3,14 @@
 from __future__ import annotations
 
 import asyncio
+import logging
+import random
 import time
-from typing import cast
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, cast
 
+from stocktrim_public_api_client.forecast_events import ForecastEvents
 from stocktrim_public_api_client.generated.api.processing_status import (
     get_api_processing_status,
 )
@@ -16,7 +21,72 @@ from stocktrim_public_api_client.generated.models.processing_status_response_dto
     ProcessingStatusResponseDto,
 )
 from stocktrim_public_api_client.helpers.base import Base
-from stocktrim_public_api_client.utils import unwrap
+from stocktrim_public_api_client.utils import unwrap, unwrap_unset
+
+if TYPE_CHECKING:
+    from stocktrim_public_api_client.stocktrim_client import StockTrimClient
+
+logger = logging.getLogger(__name__)
+
+# Samples used to estimate the progress rate; older ones describe an earlier
+# phase of the calculation
+_RATE_WINDOW = 5
+
+
+def next_poll_delay(
+    samples: Sequence[tuple[float, float]],
+    min_interval: float,
+    max_interval: float,
+    jitter: float = 0.1,
+) -> float:
+    """Seconds to wait before the next processing status check.
+
+    With progress in the recent samples, the remaining time is estimated
+    from the rate of ``percentage_complete`` and the next poll is scheduled at
+    half of it, so polls are sparse early in a long calculation and close
+    together near its end. Without progress the delay doubles with every
+    stalled poll. The result is bounded by ``min_interval`` and
+    ``max_interval`` and then spread by ``jitter`` so waiters in different
+    processes do not poll in lockstep.
+
+    Args:
+        samples: ``(time, percentage_complete)`` of each poll of the current
+            calculation, oldest first.
+        min_interval: Minimum delay in seconds.
+        max_interval: Maximum delay in seconds.
+        jitter: Relative random spread of the delay, e.g. 0.1 for +/-10%.
+
+    Returns:
+        Delay in seconds.
+    """
+    delay = min_interval
+    window = samples[-_RATE_WINDOW:]
+    if len(window) >= 2:
+        (t0, p0), (t1, p1) = window[0], window[-1]
+        if p1 > p0 and t1 > t0:
+            rate = (p1 - p0) / (t1 - t0)
+            delay = max(100 - p1, 0) / rate / 2
+        else:
+            stalled = 0
+            for _, percentage in reversed(samples[:-1]):
+                if percentage != p1:
+                    break
+                stalled += 1
+            delay = min_interval * 2**stalled
+    delay = min(max(delay, min_interval), max_interval)
+    return delay * random.uniform(1 - jitter, 1 + jitter)
+
+
+@dataclass
+class _Waiter:
+    """A caller of wait_for_completion served by the shared poll loop."""
+
+    future: asyncio.Future[ProcessingStatusResponseDto]
+    deadline: float
+    timeout: float
+    poll_interval: float
+    max_poll_interval: float
+    on_status: Callable[[ProcessingStatusResponseDto], None] | None
 
 
 class Forecasting(Base):
@@ -26,6 +96,22 @@ class Forecasting(Base):
     processing status.
     """
 
+    def __init__(self, client: StockTrimClient) -> None:
+        """Initialize with a client instance.
+
+        Args:
+            client: The StockTrimClient instance to use for API calls.
+        """
+        super().__init__(client)
+        self._waiters: list[_Waiter] = []
+        self._poller: asyncio.Task[None] | None = None
+
+    @property
+    def _forecast_events(self) -> ForecastEvents | None:
+        """The client's forecast completion events, if it has them."""
+        events = getattr(self._client, "forecast_events", None)
+        return events if isinstance(events, ForecastEvents) else None
+
     async def run_calculations(self) -> None:
         """Trigger forecast recalculation for all products.
 
@@ -50,6 +136,8 @@ class Forecasting(Base):
             client=self._client,
         )
         unwrap(response)  # Raises on error, otherwise returns None
+        if (events := self._forecast_events) is not None:
+            events.mark_started()
 
     async def get_processing_status(self) -> ProcessingStatusResponseDto:
         """Get current processing status.
@@ -60,6 +148,9 @@ class Forecasting(Base):
             - percentage_complete: Progress percentage (0-100)
             - status_message: Current status description
 
+        Every status is reported to ``client.forecast_events``, which notifies
+        its subscribers when a running calculation is seen to have finished.
+
         Example:
             >>> status = await client.forecasting.get_processing_status()
             >>> if status.is_processing:
@@ -71,21 +162,38 @@ class Forecasting(Base):
         response = await get_api_processing_status.asyncio_detailed(
             client=self._client,
         )
-        return cast(ProcessingStatusResponseDto, unwrap(response))
+        status = cast(ProcessingStatusResponseDto, unwrap(response))
+        if (events := self._forecast_events) is not None:
+            await events.observe(status)
+        return status
 
     async def wait_for_completion(
         self,
-        poll_interval: int = 5,
-        timeout: int = 600,
+        poll_interval: float = 5,
+        timeout: float = 600,
+        max_poll_interval: float = 60,
+        on_status: Callable[[ProcessingStatusResponseDto], None] | None = None,
     ) -> ProcessingStatusResponseDto:
         """Wait for forecast calculation to complete.
 
-        Polls the processing status at regular intervals until the calculation
-        is complete or the timeout is reached.
+        Polls the processing status until the calculation is complete or the
+        timeout is reached. Polls are adaptive: the next one is scheduled at
+        about half the remaining time estimated from ``percentage_complete``
+        progress, backing off exponentially while progress stalls, with
+        random jitter and bounded by ``poll_interval`` and
+        ``max_poll_interval``.
+
+        Concurrent waiters on the same client share one poll loop, so many
+        callers waiting on the same calculation cost one status check per
+        poll. The loop polls as often as its most demanding waiter asks.
 
         Args:
-            poll_interval: Seconds between status checks (default: 5).
+            poll_interval: Minimum seconds between status checks (default: 5).
             timeout: Maximum seconds to wait (default: 600 = 10 minutes).
+            max_poll_interval: Maximum seconds between status checks
+                (default: 60).
+            on_status: Called with every status polled while waiting, e.g. to
+                report progress.
 
         Returns:
             Final ProcessingStatusResponseDto when complete.
@@ -102,23 +210,80 @@ class Forecasting(Base):
             ... )
             >>> print(f"Complete: {final_status.status_message}")
         """
-        start_time = time.time()
-
-        while True:
-            status = await self.get_processing_status()
+        waiter = _Waiter(
+            future=asyncio.get_running_loop().create_future(),
+            deadline=time.time() + timeout,
+            timeout=timeout,
+            poll_interval=poll_interval,
+            max_poll_interval=max(max_poll_interval, poll_interval),
+            on_status=on_status,
+        )
+        self._waiters.append(waiter)
+        if self._poller is None or self._poller.done():
+            self._poller = asyncio.create_task(self._poll_until_idle())
+        try:
+            return await waiter.future
+        finally:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+            if not self._waiters and self._poller and not self._poller.done():
+                self._poller.cancel()
 
-            # Check if done
+    async def _poll_until_idle(self) -> None:
+        """Poll on behalf of every current waiter until processing stops."""
+        samples: list[tuple[float, float]] = []
+        while self._waiters:
+            try:
+                status = await self.get_processing_status()
+            except Exception as e:
+                self._settle(self._waiters, error=e)
+                return
+            for waiter in list(self._waiters):
+                if waiter.on_status is not None:
+                    try:
+                        waiter.on_status(status)
+                    except Exception:
+                        logger.exception("Forecast status callback failed")
             if not status.is_processing:
-                return status
-
-            # Check timeout
-            elapsed = time.time() - start_time
-            if elapsed > timeout:
-                raise TimeoutError(
-                    f"Forecast calculation did not complete within {timeout} seconds. "
-                    f"Last status: {status.status_message} "
-                    f"({status.percentage_complete}% complete)"
+                self._settle(self._waiters, result=status)
+                return
+
+            now = time.time()
+            samples.append((now, float(unwrap_unset(status.percentage_complete, 0))))
+            expired = [w for w in self._waiters if now > w.deadline]
+            for waiter in expired:
+                self._settle(
+                    [waiter],
+                    error=TimeoutError(
+                        f"Forecast calculation did not complete within "
+                        f"{waiter.timeout} seconds. "
+                        f"Last status: {status.status_message} "
+                        f"({status.percentage_complete}% complete)"
+                    ),
                 )
+            if not self._waiters:
+                return
+
+            delay = next_poll_delay(
+                samples,
+                min_interval=min(w.poll_interval for w in self._waiters),
+                max_interval=min(w.max_poll_interval for w in self._waiters),
+            )
+            # Wake up in time to poll once more before the first deadline
+            until_deadline = min(w.deadline for w in self._waiters) - now
+            await asyncio.sleep(max(min(delay, until_deadline), 0))
 
-            # Wait before next poll
-            await asyncio.sleep(poll_interval)
+    def _settle(
+        self,
+        waiters: list[_Waiter],
+        result: ProcessingStatusResponseDto | None = None,
+        error: BaseException | None = None,
+    ) -> None:
+        for waiter in list(waiters):
+            if not waiter.future.done():
+                if error is not None:
+                    waiter.future.set_exception(error)
+                else:
+                    waiter.future.set_result(result)
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
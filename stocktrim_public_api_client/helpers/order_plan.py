@@ -2,7 +2,16 @@
 
 from __future__ import annotations
 
-from stocktrim_public_api_client.client_types import UNSET, Unset
+from collections.abc import AsyncIterator, Iterable
+from contextlib import aclosing
+from http import HTTPStatus
+from typing import Any, Literal, overload
+
+import attrs
+import httpx
+
+from stocktrim_public_api_client.client_types import UNSET, Response, Unset
+from stocktrim_public_api_client.columnar import ColumnarResults
 from stocktrim_public_api_client.generated.api.order_plan import post_api_order_plan
 from stocktrim_public_api_client.generated.models.order_plan_filter_criteria import (
     OrderPlanFilterCriteria,
@@ -10,12 +19,35 @@ from stocktrim_public_api_client.generated.models.order_plan_filter_criteria imp
 from stocktrim_public_api_client.generated.models.order_plan_results_dto import (
     OrderPlanResultsDto,
 )
+from stocktrim_public_api_client.generated.models.problem_details import (
+    ProblemDetails,
+)
 from stocktrim_public_api_client.generated.models.sku_optimized_results_dto import (
     SkuOptimizedResultsDto,
 )
 from stocktrim_public_api_client.helpers.base import Base
+from stocktrim_public_api_client.helpers.pagination import (
+    DEFAULT_CONCURRENCY,
+    Page,
+    iter_items,
+    iter_pages,
+    paginate,
+)
+from stocktrim_public_api_client.lazy_models import (
+    LazyModel,
+    LazySkuOptimizedResultsDto,
+)
 from stocktrim_public_api_client.utils import unwrap, unwrap_unset
 
+ORDER_PLAN_PAGE_SIZE = 100
+"""Default number of order plan rows requested per page."""
+
+ORDER_PLAN_PATH = "/api/OrderPlan"
+"""Endpoint queried by ``post_api_order_plan``; used directly for raw rows."""
+
+LazyOrderPlanRow = LazyModel[SkuOptimizedResultsDto]
+"""Order plan row decoded on attribute access (see ``lazy=True``)."""
+
 
 class OrderPlan(Base):
     """Order plan and forecast management.
@@ -24,10 +56,28 @@ class OrderPlan(Base):
     from StockTrim's demand planning system.
     """
 
+    @overload
     async def query(
         self,
         filter_criteria: OrderPlanFilterCriteria | None = None,
-    ) -> list[SkuOptimizedResultsDto]:
+        *,
+        lazy: Literal[False] = False,
+    ) -> list[SkuOptimizedResultsDto]: ...
+
+    @overload
+    async def query(
+        self,
+        filter_criteria: OrderPlanFilterCriteria | None = None,
+        *,
+        lazy: Literal[True],
+    ) -> list[LazyOrderPlanRow]: ...
+
+    async def query(
+        self,
+        filter_criteria: OrderPlanFilterCriteria | None = None,
+        *,
+        lazy: bool = False,
+    ) -> list[SkuOptimizedResultsDto] | list[LazyOrderPlanRow]:
         """Query order plan with optional filters.
 
         The order plan contains forecast results with demand predictions,
@@ -36,9 +86,14 @@ class OrderPlan(Base):
         Args:
             filter_criteria: Optional filters for the order plan query.
                 Can filter by location, supplier, category, status, etc.
+            lazy: Return rows that decode each field on first access instead
+                of fully parsed models. Much cheaper for large plans when only
+                a few fields are read; see
+                :mod:`stocktrim_public_api_client.lazy_models`.
 
         Returns:
-            List of SkuOptimizedResultsDto objects containing forecast data.
+            List of SkuOptimizedResultsDto objects containing forecast data
+            (lazy views of them when ``lazy=True``).
 
         Example:
             >>> # Get all order plan items
@@ -53,10 +108,19 @@ class OrderPlan(Base):
             ...     location="WAREHOUSE-A",
             ... )
             >>> items = await client.order_plan.query(criteria)
+            >>>
+            >>> # Only decode the fields that are read
+            >>> rows = await client.order_plan.query(lazy=True)
+            >>> codes = [row.product_code for row in rows]
         """
+        criteria = filter_criteria or OrderPlanFilterCriteria()
+        if lazy:
+            rows = self._raw_rows(await self._post_raw(criteria))
+            return [LazySkuOptimizedResultsDto(row) for row in rows]
+
         response = await post_api_order_plan.asyncio_detailed(
             client=self._client,
-            body=filter_criteria or OrderPlanFilterCriteria(),
+            body=criteria,
         )
         result = unwrap(response)
 
@@ -67,6 +131,293 @@ class OrderPlan(Base):
         # Fallback to empty list
         return []
 
+    @overload
+    async def query_page(
+        self,
+        filter_criteria: OrderPlanFilterCriteria | None = None,
+        page: int = 0,
+        per_page: int = ORDER_PLAN_PAGE_SIZE,
+        *,
+        lazy: Literal[False] = False,
+    ) -> Page[SkuOptimizedResultsDto]: ...
+
+    @overload
+    async def query_page(
+        self,
+        filter_criteria: OrderPlanFilterCriteria | None = None,
+        page: int = 0,
+        per_page: int = ORDER_PLAN_PAGE_SIZE,
+        *,
+        lazy: Literal[True],
+    ) -> Page[LazyOrderPlanRow]: ...
+
+    async def query_page(
+        self,
+        filter_criteria: OrderPlanFilterCriteria | None = None,
+        page: int = 0,
+        per_page: int = ORDER_PLAN_PAGE_SIZE,
+        *,
+        lazy: bool = False,
+    ) -> Page[SkuOptimizedResultsDto] | Page[LazyOrderPlanRow]:
+        """Fetch a single page of the order plan.
+
+        The request's ``page``/``per_page`` override any values already set on
+        ``filter_criteria``; the caller's object is not modified.
+
+        Args:
+            filter_criteria: Optional filters for the order plan query.
+            page: Page number to fetch (default: 0).
+            per_page: Rows per page (default: 100).
+            lazy: Return lazily decoded rows (see query()).
+
+        Returns:
+            Page holding the rows and the server's ``hasNextPage`` flag
+            (``None`` if the server didn't report it).
+
+        Example:
+            >>> page = await client.order_plan.query_page(page=0, per_page=50)
+            >>> print(len(page.items), page.has_next)
+        """
+        return await self._fetch_page(filter_criteria, page, per_page, lazy)
+
+    @overload
+    def iter_query(
+        self,
+        filter_criteria: OrderPlanFilterCriteria | None = None,
+        per_page: int = ORDER_PLAN_PAGE_SIZE,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        *,
+        lazy: Literal[False] = False,
+    ) -> AsyncIterator[SkuOptimizedResultsDto]: ...
+
+    @overload
+    def iter_query(
+        self,
+        filter_criteria: OrderPlanFilterCriteria | None = None,
+        per_page: int = ORDER_PLAN_PAGE_SIZE,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        *,
+        lazy: Literal[True],
+    ) -> AsyncIterator[LazyOrderPlanRow]: ...
+
+    def iter_query(
+        self,
+        filter_criteria: OrderPlanFilterCriteria | None = None,
+        per_page: int = ORDER_PLAN_PAGE_SIZE,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        *,
+        lazy: bool = False,
+    ) -> AsyncIterator[SkuOptimizedResultsDto] | AsyncIterator[LazyOrderPlanRow]:
+        """Stream the order plan page by page, following ``hasNextPage``.
+
+        Rows are yielded as soon as their page arrives, so memory stays bounded
+        by ``per_page x concurrency`` rather than the size of the plan. Paging
+        starts at ``filter_criteria.page`` when set, otherwise page 0.
+
+        Args:
+            filter_criteria: Optional filters for the order plan query.
+            per_page: Rows per page (default: 100).
+            concurrency: Maximum number of page requests in flight at once
+                (default: 4). Pass 1 to fetch pages sequentially.
+            lazy: Yield lazily decoded rows (see query()).
+
+        Returns:
+            Async iterator of SkuOptimizedResultsDto objects in page order.
+
+        Example:
+            >>> async for item in client.order_plan.iter_query(per_page=200):
+            ...     print(item.product_code, item.order_quantity)
+        """
+        return iter_items(
+            lambda page: self._fetch_page(filter_criteria, page, per_page, lazy),
+            page_size=per_page,
+            concurrency=concurrency,
+            first_page=self._first_page(filter_criteria),
+        )
+
+    @overload
+    async def query_all(
+        self,
+        filter_criteria: OrderPlanFilterCriteria | None = None,
+        per_page: int = ORDER_PLAN_PAGE_SIZE,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        *,
+        lazy: Literal[False] = False,
+    ) -> list[SkuOptimizedResultsDto]: ...
+
+    @overload
+    async def query_all(
+        self,
+        filter_criteria: OrderPlanFilterCriteria | None = None,
+        per_page: int = ORDER_PLAN_PAGE_SIZE,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        *,
+        lazy: Literal[True],
+    ) -> list[LazyOrderPlanRow]: ...
+
+    async def query_all(
+        self,
+        filter_criteria: OrderPlanFilterCriteria | None = None,
+        per_page: int = ORDER_PLAN_PAGE_SIZE,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        *,
+        lazy: bool = False,
+    ) -> list[SkuOptimizedResultsDto] | list[LazyOrderPlanRow]:
+        """Fetch the complete order plan using server-side pagination.
+
+        Unlike query(), which asks for everything in one response, this requests
+        ``per_page`` rows at a time with up to ``concurrency`` pages in flight.
+
+        Args:
+            filter_criteria: Optional filters for the order plan query.
+            per_page: Rows per page (default: 100).
+            concurrency: Maximum number of page requests in flight at once
+                (default: 4). Pass 1 to fetch pages sequentially.
+            lazy: Return lazily decoded rows (see query()).
+
+        Returns:
+            List of all SkuOptimizedResultsDto objects across all pages.
+
+        Example:
+            >>> items = await client.order_plan.query_all(concurrency=8)
+        """
+        return await paginate(
+            lambda page: self._fetch_page(filter_criteria, page, per_page, lazy),
+            page_size=per_page,
+            concurrency=concurrency,
+            first_page=self._first_page(filter_criteria),
+        )
+
+    async def query_columns(
+        self,
+        filter_criteria: OrderPlanFilterCriteria | None = None,
+        per_page: int = ORDER_PLAN_PAGE_SIZE,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        columns: Iterable[str] | None = None,
+    ) -> ColumnarResults:
+        """Fetch the complete order plan in columnar form for analytics.
+
+        Pages are fetched like query_all(), but each page's JSON rows go
+        straight into per-field columns; no SkuOptimizedResultsDto is built.
+        Convert the result with ``to_arrow()``, ``to_pandas()``,
+        ``to_numpy()`` or ``write_parquet()`` (PyArrow/NumPy required).
+
+        Args:
+            filter_criteria: Optional filters for the order plan query.
+            per_page: Rows per page (default: 100).
+            concurrency: Maximum number of page requests in flight at once
+                (default: 4). Pass 1 to fetch pages sequentially.
+            columns: Attribute names to keep, e.g. ``["product_code",
+                "order_quantity"]`` (default: every scalar field).
+
+        Returns:
+            ColumnarResults holding one column per field.
+
+        Raises:
+            ValueError: If ``columns`` names an unknown or non-scalar field.
+
+        Example:
+            >>> results = await client.order_plan.query_columns(
+            ...     columns=["product_code", "supplier_code", "order_quantity"]
+            ... )
+            >>> results.write_parquet("order_plan.parquet")
+        """
+        results = ColumnarResults(SkuOptimizedResultsDto, columns)
+        pages = iter_pages(
+            lambda page: self._fetch_raw_page(
+                attrs.evolve(
+                    filter_criteria or OrderPlanFilterCriteria(),
+                    page=page,
+                    per_page=per_page,
+                )
+            ),
+            page_size=per_page,
+            concurrency=concurrency,
+            first_page=self._first_page(filter_criteria),
+        )
+        async with aclosing(pages):
+            async for rows in pages:
+                results.extend(rows)
+        return results
+
+    async def _fetch_page(
+        self,
+        filter_criteria: OrderPlanFilterCriteria | None,
+        page: int,
+        per_page: int,
+        lazy: bool,
+    ) -> Page[Any]:
+        """Implementation of query_page() shared by the paginated queries."""
+        criteria = attrs.evolve(
+            filter_criteria or OrderPlanFilterCriteria(),
+            page=page,
+            per_page=per_page,
+        )
+        if lazy:
+            raw = await self._fetch_raw_page(criteria)
+            return Page(
+                [LazySkuOptimizedResultsDto(row) for row in raw.items],
+                has_next=raw.has_next,
+            )
+
+        response = await post_api_order_plan.asyncio_detailed(
+            client=self._client,
+            body=criteria,
+        )
+        result = unwrap(response)
+
+        if not isinstance(result, OrderPlanResultsDto):
+            return Page([], has_next=False)
+
+        has_next = None
+        echoed = unwrap_unset(result.filter_criteria)
+        if echoed is not None:
+            has_next = unwrap_unset(echoed.has_next_page)
+        return Page(result.results or [], has_next=has_next)
+
+    async def _fetch_raw_page(
+        self, criteria: OrderPlanFilterCriteria
+    ) -> Page[dict[str, Any]]:
+        """Fetch one page as raw JSON rows, without building models."""
+        data = await self._post_raw(criteria)
+        if data is None:
+            return Page([], has_next=False)
+        echoed = data.get("filterCriteria")
+        return Page(
+            self._raw_rows(data),
+            has_next=echoed.get("hasNextPage") if isinstance(echoed, dict) else None,
+        )
+
+    async def _post_raw(
+        self, criteria: OrderPlanFilterCriteria
+    ) -> dict[str, Any] | None:
+        """POST the query and return the decoded JSON without building models.
+
+        Error responses go through unwrap() so they raise the same exceptions
+        as the eager path.
+        """
+        response = await self._client.get_async_httpx_client().post(
+            ORDER_PLAN_PATH, json=criteria.to_dict()
+        )
+        if response.status_code != 200:
+            unwrap(_error_response(response))
+            return None
+        data = response.json()
+        return data if isinstance(data, dict) else None
+
+    @staticmethod
+    def _raw_rows(data: dict[str, Any] | None) -> list[dict[str, Any]]:
+        """The ``results`` rows of a raw order plan response."""
+        rows = data.get("results") if data else None
+        return rows if isinstance(rows, list) else []
+
+    @staticmethod
+    def _first_page(filter_criteria: OrderPlanFilterCriteria | None) -> int:
+        """Page to start from: the caller's ``page`` if set, otherwise 0."""
+        if filter_criteria is None:
+            return 0
+        return unwrap_unset(filter_criteria.page, 0)
+
     async def get_urgent_items(
         self,
         days_threshold: int = 30,
@@ -159,3 +510,20 @@ class OrderPlan(Base):
             category=category,
         )
         return await self.query(criteria)
+
+
+def _error_response(response: httpx.Response) -> Response[ProblemDetails | None]:
+    """Wrap a raw error response for unwrap(), keeping any ProblemDetails body."""
+    parsed = None
+    try:
+        body = response.json()
+    except ValueError:
+        body = None
+    if isinstance(body, dict):
+        parsed = ProblemDetails.from_dict(body)
+    return Response(
+        status_code=HTTPStatus(response.status_code),
+        content=response.content,
+        headers=response.headers,
+        parsed=parsed,
+    )
@@ -0,0 +1,202 @@
+"""Concurrent page-fetching engine shared by the paginated helpers.
+
+StockTrim's list endpoints paginate by page number and mostly don't report a
+total count, so the only way to find the end of a collection is to request
+pages until one comes back short (or 404s). Endpoints that do report whether
+another page exists (such as the order plan's ``hasNextPage``) can return a
+:class:`Page` instead of a bare list. Fetching those pages strictly one after
+another makes every full-catalog read cost ``pages x round-trip``.
+
+This module keeps a bounded window of page requests in flight while still
+handing pages back in page order, so callers see exactly the same sequence of
+items as the sequential loop would have produced. Items can be collected into
+a list (:func:`paginate`) or streamed one at a time (:func:`iter_items`), in
+which case memory stays bounded by ``page_size x concurrency``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import aclosing
+from typing import Generic, NamedTuple, TypeVar
+
+from stocktrim_public_api_client.utils import NotFoundError
+
+T = TypeVar("T")
+
+
+class Page(NamedTuple, Generic[T]):
+    """A page of results together with the server's "more pages" flag.
+
+    Attributes:
+        items: Items on this page.
+        has_next: Whether the server reports another page. ``None`` means the
+            server didn't say, in which case the short-page rule applies.
+    """
+
+    items: list[T]
+    has_next: bool | None = None
+
+
+PageFetcher = Callable[[int], Awaitable[list[T] | Page[T]]]
+"""Coroutine function that fetches a single page given its page number."""
+
+DEFAULT_CONCURRENCY = 4
+"""Default number of page requests kept in flight at once."""
+
+
+async def _fetch_or_empty(fetch_page: PageFetcher[T], page: int) -> Page[T]:
+    """Fetch a page, treating 404 as the end of the collection.
+
+    Several StockTrim list endpoints answer a page past the end with 404
+    instead of an empty array.
+    """
+    try:
+        result = await fetch_page(page)
+    except NotFoundError:
+        return Page([], has_next=False)
+    return result if isinstance(result, Page) else Page(result)
+
+
+async def iter_pages(
+    fetch_page: PageFetcher[T],
+    *,
+    page_size: int,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    first_page: int = 0,
+) -> AsyncIterator[list[T]]:
+    """Yield pages in order while keeping up to ``concurrency`` requests in flight.
+
+    Iteration stops at the first empty page or the first 404. If the fetcher
+    returns a :class:`Page` with ``has_next`` set, that flag decides whether
+    another page follows; otherwise the first page shorter than ``page_size``
+    ends the collection. Requests already in flight for pages past the end are
+    cancelled, so at most ``concurrency - 1`` extra requests are issued beyond
+    the last page.
+
+    Args:
+        fetch_page: Coroutine function returning the items on a given page,
+            either as a list or as a :class:`Page`.
+        page_size: Number of items a full page contains. A shorter page marks
+            the end of the collection unless the server says otherwise.
+        concurrency: Maximum number of page requests in flight at once.
+            ``1`` reproduces the original sequential behaviour.
+        first_page: Page number to start from (default: 0).
+
+    Yields:
+        Each non-empty page of items, in page order.
+
+    Raises:
+        ValueError: If ``page_size`` or ``concurrency`` is less than 1.
+
+    Example:
+        >>> async for page in iter_pages(fetch, page_size=50, concurrency=4):
+        ...     print(len(page))
+    """
+    if page_size < 1:
+        raise ValueError(f"page_size must be at least 1, got {page_size}")
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+
+    in_flight: deque[asyncio.Task[Page[T]]] = deque()
+    next_page = first_page
+    try:
+        while True:
+            while len(in_flight) < concurrency:
+                in_flight.append(
+                    asyncio.ensure_future(_fetch_or_empty(fetch_page, next_page))
+                )
+                next_page += 1
+
+            items, has_next = await in_flight.popleft()
+            if not items:
+                return
+
+            yield items
+
+            if has_next is False or (has_next is None and len(items) < page_size):
+                return
+    finally:
+        for task in in_flight:
+            task.cancel()
+        if in_flight:
+            await asyncio.gather(*in_flight, return_exceptions=True)
+
+
+async def paginate(
+    fetch_page: PageFetcher[T],
+    *,
+    page_size: int,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    first_page: int = 0,
+) -> list[T]:
+    """Fetch every page and return all items as a single list in page order.
+
+    See :func:`iter_pages` for the termination rules.
+
+    Args:
+        fetch_page: Coroutine function returning the items on a given page,
+            either as a list or as a :class:`Page`.
+        page_size: Number of items a full page contains.
+        concurrency: Maximum number of page requests in flight at once.
+        first_page: Page number to start from (default: 0).
+
+    Returns:
+        All items across all pages.
+
+    Example:
+        >>> products = await paginate(
+        ...     lambda page: client.products.get_all(page_no=str(page)),
+        ...     page_size=50,
+        ... )
+    """
+    items: list[T] = []
+    async for page in iter_pages(
+        fetch_page,
+        page_size=page_size,
+        concurrency=concurrency,
+        first_page=first_page,
+    ):
+        items.extend(page)
+    return items
+
+
+async def iter_items(
+    fetch_page: PageFetcher[T],
+    *,
+    page_size: int,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    first_page: int = 0,
+) -> AsyncIterator[T]:
+    """Stream every item across all pages, one at a time, in page order.
+
+    Only the pages currently in flight are held in memory. Breaking out of the
+    loop early cancels any outstanding page requests once the generator is
+    closed.
+
+    Args:
+        fetch_page: Coroutine function returning the items on a given page,
+            either as a list or as a :class:`Page`.
+        page_size: Number of items a full page contains.
+        concurrency: Maximum number of page requests in flight at once.
+        first_page: Page number to start from (default: 0).
+
+    Yields:
+        Each item, in page order.
+
+    Example:
+        >>> async for product in iter_items(fetch, page_size=50):
+        ...     print(product.product_code_readable)
+    """
+    pages = iter_pages(
+        fetch_page,
+        page_size=page_size,
+        concurrency=concurrency,
+        first_page=first_page,
+    )
+    async with aclosing(pages):
+        async for page in pages:
+            for item in page:
+                yield item
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator, Iterable
 from typing import cast
 
 from stocktrim_public_api_client.client_types import UNSET, Unset
+from stocktrim_public_api_client.entity_cache import PRODUCT
 from stocktrim_public_api_client.generated.api.products import (
     delete_api_products,
     get_api_products,
@@ -17,7 +19,20 @@ from stocktrim_public_api_client.generated.models.products_response_dto import (
     ProductsResponseDto,
 )
 from stocktrim_public_api_client.helpers.base import Base
-from stocktrim_public_api_client.utils import unwrap
+from stocktrim_public_api_client.helpers.bulk import (
+    DEFAULT_CHUNK_SIZE,
+    BulkReport,
+    submit_many,
+)
+from stocktrim_public_api_client.helpers.pagination import (
+    DEFAULT_CONCURRENCY,
+    iter_items,
+    paginate,
+)
+from stocktrim_public_api_client.utils import unwrap, unwrap_unset
+
+PRODUCTS_PAGE_SIZE = 50
+"""Number of products the API returns per page."""
 
 
 class Products(Base):
@@ -85,7 +100,55 @@ class Products(Base):
             client=self._client,
             body=product,
         )
-        return cast(ProductsResponseDto, unwrap(response))
+        created = cast(ProductsResponseDto, unwrap(response))
+        # POST /api/Products is an upsert, so any cached copy is now stale.
+        if (cache := self._entity_cache) is not None:
+            for code in (
+                product.product_id,
+                unwrap_unset(product.product_code_readable),
+                created.product_id,
+                unwrap_unset(created.product_code_readable),
+            ):
+                if code:
+                    cache.invalidate(PRODUCT, code)
+        return created
+
+    async def upsert_many(
+        self,
+        products: Iterable[ProductsRequestDto],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> BulkReport[ProductsRequestDto, ProductsResponseDto]:
+        """Create or update many products with several requests in flight.
+
+        The API upserts one product per request, so this reads ``products``
+        ``chunk_size`` at a time and posts up to ``concurrency`` of them
+        concurrently. A failed product doesn't stop the run; check
+        ``report.failed`` afterwards.
+
+        Args:
+            products: Products to create or update (any iterable, consumed
+                lazily).
+            chunk_size: Number of products read and submitted per chunk
+                (default: 100).
+            concurrency: Maximum number of requests in flight at once
+                (default: 4).
+
+        Returns:
+            BulkReport with one result per product, in input order. Each
+            result holds the ProductsResponseDto or the raised exception.
+
+        Example:
+            >>> report = await client.products.upsert_many(updates, concurrency=8)
+            >>> for failure in report.failed:
+            ...     print(failure.item.product_id, failure.error)
+        """
+        return await submit_many(
+            products,
+            self.create,
+            chunk_size=chunk_size,
+            concurrency=concurrency,
+        )
 
     async def delete(self, product_id: str | Unset = UNSET) -> None:
         """Delete product(s).
@@ -101,6 +164,10 @@ class Products(Base):
             client=self._client,
             product_id=product_id,
         )
+        if (cache := self._entity_cache) is not None:
+            cache.invalidate(
+                PRODUCT, None if isinstance(product_id, Unset) else product_id
+            )
 
     # Convenience methods
 
@@ -108,7 +175,9 @@ class Products(Base):
         """Find a single product by exact code match.
 
         This is a convenience method that wraps get_all() and returns the first
-        matching product or None if not found.
+        matching product or None if not found. When the client has an entity
+        cache, found products are served from it until they expire or this
+        client modifies them.
 
         Args:
             code: The exact product code to search for.
@@ -121,8 +190,21 @@ class Products(Base):
             >>> if product:
             ...     print(f"Found: {product.description}")
         """
+        cache = self._entity_cache
+        if cache is not None:
+            cached = cache.get(PRODUCT, code)
+            if cached is not None:
+                return cast(ProductsResponseDto, cached)
+
         products = await self.get_all(code=code)
-        return products[0] if products else None
+        product = products[0] if products else None
+        if cache is not None and product is not None:
+            cache.put(
+                PRODUCT,
+                (code, product.product_id, unwrap_unset(product.product_code_readable)),
+                product,
+            )
+        return product
 
     async def find_by_exact_code(self, code: str) -> list[ProductsResponseDto]:
         """Find products by exact code match, returning a list.
@@ -160,11 +242,19 @@ class Products(Base):
         product = await self.find_by_code(code)
         return product is not None
 
-    async def get_all_paginated(self) -> list[ProductsResponseDto]:
+    async def get_all_paginated(
+        self,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> list[ProductsResponseDto]:
         """Get ALL products by paginating through all pages.
 
         This method automatically handles pagination to fetch the complete
-        product catalog from StockTrim.
+        product catalog from StockTrim. Up to ``concurrency`` pages are requested
+        at once; results are still returned in page order.
+
+        Args:
+            concurrency: Maximum number of page requests in flight at once
+                (default: 4). Pass 1 to fetch pages sequentially.
 
         Returns:
             List of all ProductsResponseDto objects across all pages.
@@ -173,22 +263,37 @@ class Products(Base):
             >>> all_products = await client.products.get_all_paginated()
             >>> print(f"Total products: {len(all_products)}")
         """
-        all_products = []
-        page_no = "0"
+        # StockTrim API uses string page numbers and doesn't document pagination.
+        # Pages hold 50 products; a shorter page means we've reached the end.
+        return await paginate(
+            lambda page: self.get_all(page_no=str(page)),
+            page_size=PRODUCTS_PAGE_SIZE,
+            concurrency=concurrency,
+        )
 
-        while True:
-            products_page = await self.get_all(page_no=page_no)
-            if not products_page:
-                break
+    def iter_all(
+        self,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> AsyncIterator[ProductsResponseDto]:
+        """Stream ALL products, one at a time, as pages arrive.
 
-            all_products.extend(products_page)
+        Unlike get_all_paginated(), products are yielded as soon as their page
+        has been fetched, so memory stays bounded by the page size rather than
+        the catalog size.
 
-            # StockTrim API uses string page numbers and doesn't document pagination
-            # We'll assume if we get fewer results, we're done
-            # Typical page size appears to be 50
-            if len(products_page) < 50:
-                break
+        Args:
+            concurrency: Maximum number of page requests in flight at once
+                (default: 4). Pass 1 to fetch pages sequentially.
 
-            page_no = str(int(page_no) + 1)
+        Returns:
+            Async iterator of ProductsResponseDto objects in page order.
 
-        return all_products
+        Example:
+            >>> async for product in client.products.iter_all():
+            ...     print(product.product_code_readable)
+        """
+        return iter_items(
+            lambda page: self.get_all(page_no=str(page)),
+            page_size=PRODUCTS_PAGE_SIZE,
+            concurrency=concurrency,
+        )
@@ -7,6 +7,7 @@ generate_from_order_plan feature.
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
 from typing import cast
 
 from stocktrim_public_api_client.client_types import UNSET, Unset
@@ -25,6 +26,11 @@ from stocktrim_public_api_client.generated.models.purchase_order_status_dto impo
     PurchaseOrderStatusDto,
 )
 from stocktrim_public_api_client.helpers.base import Base
+from stocktrim_public_api_client.helpers.pagination import (
+    DEFAULT_CONCURRENCY,
+    iter_items,
+    paginate,
+)
 from stocktrim_public_api_client.utils import unwrap
 
 
@@ -130,6 +136,37 @@ class PurchaseOrdersV2(Base):
             else []
         )
 
+    def iter_all(
+        self,
+        status: PurchaseOrderStatusDto | Unset = UNSET,
+        page_size: int = 50,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> AsyncIterator[PurchaseOrderResponseDto]:
+        """Stream ALL purchase orders, one at a time, as pages arrive.
+
+        Args:
+            status: Optional status filter (Draft, Approved, Sent, Received).
+            page_size: Items requested per page (default: 50).
+            concurrency: Maximum number of page requests in flight at once
+                (default: 4). Pass 1 to fetch pages sequentially.
+
+        Returns:
+            Async iterator of PurchaseOrderResponseDto objects in page order.
+
+        Example:
+            >>> async for po in client.purchase_orders_v2.iter_all():
+            ...     print(f"PO {po.reference_number}: {po.status}")
+        """
+        return iter_items(
+            lambda page: self.get_all_paginated(
+                page=page,
+                page_size=page_size,
+                status=status,
+            ),
+            page_size=page_size,
+            concurrency=concurrency,
+        )
+
     async def get_by_reference(
         self,
         reference_number: str,
@@ -164,6 +201,7 @@ class PurchaseOrdersV2(Base):
         self,
         supplier_code: str,
         status: PurchaseOrderStatusDto | Unset = UNSET,
+        concurrency: int = DEFAULT_CONCURRENCY,
     ) -> list[PurchaseOrderResponseDto]:
         """Get all purchase orders for a specific supplier.
 
@@ -179,6 +217,8 @@ class PurchaseOrdersV2(Base):
         Args:
             supplier_code: Supplier code to filter by.
             status: Optional status filter.
+            concurrency: Maximum number of page requests in flight at once
+                (default: 4). Pass 1 to fetch pages sequentially.
 
         Returns:
             List of PurchaseOrderResponseDto objects for the supplier.
@@ -188,32 +228,18 @@ class PurchaseOrdersV2(Base):
             >>> for po in pos:
             ...     print(f"PO {po.reference_number}: {po.status}")
         """
-        all_pos: list[PurchaseOrderResponseDto] = []
-        page = 0
         page_size = 50
-
-        while True:
-            pos = await self.get_all_paginated(
+        pos = await paginate(
+            lambda page: self.get_all_paginated(
                 page=page,
                 page_size=page_size,
                 status=status,
-            )
-
-            if not pos:
-                break
-
-            # Filter by supplier code
-            supplier_pos = [
-                po
-                for po in pos
-                if po.supplier and po.supplier.supplier_code == supplier_code
-            ]
-            all_pos.extend(supplier_pos)
-
-            # Check if we got less than page_size (last page)
-            if len(pos) < page_size:
-                break
-
-            page += 1
-
-        return all_pos
+            ),
+            page_size=page_size,
+            concurrency=concurrency,
+        )
+        return [
+            po
+            for po in pos
+            if po.supplier and po.supplier.supplier_code == supplier_code
+        ]
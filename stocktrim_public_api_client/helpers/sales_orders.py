@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
 from typing import cast
 
 from stocktrim_public_api_client.client_types import UNSET, Unset
@@ -58,6 +59,29 @@ class SalesOrders(Base):
             else []
         )
 
+    async def iter_all(
+        self,
+        product_id: str | Unset = UNSET,
+    ) -> AsyncIterator[SalesOrderResponseDto]:
+        """Iterate over sales orders, optionally filtered by product ID.
+
+        Provides the same streaming interface as the paginated helpers. Note that
+        the sales orders endpoint is not paginated, so the full response is
+        fetched before the first order is yielded.
+
+        Args:
+            product_id: Optional product ID to filter by.
+
+        Yields:
+            SalesOrderResponseDto objects.
+
+        Example:
+            >>> async for order in client.sales_orders.iter_all():
+            ...     print(order.external_reference_id)
+        """
+        for order in await self.get_all(product_id=product_id):
+            yield order
+
     async def create(self, order: SalesOrderRequestDto) -> SalesOrderResponseDto:
         """Create a new sales order using the idempotent bulk endpoint.
 
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
 from typing import cast
 
 from stocktrim_public_api_client.client_types import UNSET, Unset
+from stocktrim_public_api_client.entity_cache import SUPPLIER
 from stocktrim_public_api_client.generated.api.suppliers import (
     delete_api_suppliers,
     get_api_suppliers,
@@ -20,7 +22,7 @@ from stocktrim_public_api_client.generated.models.supplier_response_dto import (
     SupplierResponseDto,
 )
 from stocktrim_public_api_client.helpers.base import Base
-from stocktrim_public_api_client.utils import unwrap
+from stocktrim_public_api_client.utils import unwrap, unwrap_unset
 
 
 class Suppliers(Base):
@@ -72,6 +74,25 @@ class Suppliers(Base):
             unwrap(response),
         )
 
+    async def iter_all(self) -> AsyncIterator[SupplierResponseDto]:
+        """Iterate over all suppliers.
+
+        Provides the same streaming interface as the paginated helpers. Note that
+        the suppliers bulk endpoint is not paginated, so the full response is
+        fetched before the first supplier is yielded.
+
+        Yields:
+            SupplierResponseDto objects.
+
+        Example:
+            >>> async for supplier in client.suppliers.iter_all():
+            ...     print(supplier.supplier_code)
+        """
+        result = await self.get_all()
+        suppliers = result if isinstance(result, list) else [result]
+        for supplier in suppliers:
+            yield supplier
+
     async def create(
         self, suppliers: list[SupplierRequestDto]
     ) -> list[SupplierResponseDto]:
@@ -98,6 +119,9 @@ class Suppliers(Base):
             client=self._client,
             body=suppliers,
         )
+        if (cache := self._entity_cache) is not None:
+            for supplier in suppliers:
+                cache.invalidate(SUPPLIER, supplier.supplier_code)
         result = unwrap(response)
         return (
             cast(list[SupplierResponseDto], result) if isinstance(result, list) else []
@@ -116,6 +140,13 @@ class Suppliers(Base):
             client=self._client,
             supplier_code_or_name=supplier_code_or_name,
         )
+        if (cache := self._entity_cache) is not None:
+            cache.invalidate(
+                SUPPLIER,
+                None
+                if isinstance(supplier_code_or_name, Unset)
+                else supplier_code_or_name,
+            )
 
     # Convenience methods
 
@@ -123,7 +154,9 @@ class Suppliers(Base):
         """Find a single supplier by exact code match.
 
         This method handles the API's inconsistent return type (single vs list)
-        and always returns a single object or None.
+        and always returns a single object or None. When the client has an entity
+        cache, found suppliers are served from it until they expire or this
+        client modifies them.
 
         Args:
             code: The exact supplier code to search for.
@@ -136,11 +169,31 @@ class Suppliers(Base):
             >>> if supplier:
             ...     print(f"Found: {supplier.name}")
         """
+        cache = self._entity_cache
+        if cache is not None:
+            cached = cache.get(SUPPLIER, code)
+            if cached is not None:
+                return cast(SupplierResponseDto, cached)
+
         result = await self.get_all(code=code)
         # Handle API returning either single object or list
+        supplier: SupplierResponseDto | None
         if isinstance(result, list):
-            return cast(SupplierResponseDto, result[0]) if result else None
-        return result
+            supplier = cast(SupplierResponseDto, result[0]) if result else None
+        else:
+            supplier = result
+        if cache is not None and supplier is not None:
+            # Also index by name so delete(supplier_code_or_name=<name>) evicts it
+            cache.put(
+                SUPPLIER,
+                (
+                    code,
+                    unwrap_unset(supplier.supplier_code),
+                    unwrap_unset(supplier.supplier_name),
+                ),
+                supplier,
+            )
+        return supplier
 
     async def create_one(
         self, supplier: SupplierRequestDto
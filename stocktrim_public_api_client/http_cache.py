@@ -0,0 +1,315 @@
+"""HTTP response cache with conditional revalidation for StockTrim GETs.
+
+Full-catalog reads such as ``GET /api/Products`` or ``GET /api/Suppliers``
+return multi-megabyte bodies that rarely change between calls. The
+:class:`HTTPCache` stores successful GET responses so they don't have to be
+transferred again:
+
+- responses carrying an ``ETag`` or ``Last-Modified`` validator are always
+  revalidated with ``If-None-Match`` / ``If-Modified-Since``; a
+  ``304 Not Modified`` answer replays the stored body;
+- responses without validators are served from the cache for ``ttl``
+  seconds (or the response's ``Cache-Control: max-age``), then fetched again;
+- ``Cache-Control: no-store`` responses are never stored;
+- a successful POST, PUT, PATCH or DELETE through the same client drops the
+  cached responses for that path.
+
+Entries are held in a bounded in-memory LRU. With a ``directory``, they are
+also written to disk and survive restarts; a memory miss falls back to the
+disk copy. Disk reads and writes run in a worker thread, so a multi-megabyte
+body never blocks the event loop.
+
+The cache is opt-in: pass an instance to the client to enable it.
+
+Example:
+    ```python
+    from stocktrim_public_api_client import HTTPCache, StockTrimClient
+
+    cache = HTTPCache(ttl=120, directory="~/.cache/stocktrim")
+    async with StockTrimClient(http_cache=cache) as client:
+        await client.products.get_all()  # network
+        await client.products.get_all()  # served or revalidated from cache
+    ```
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import hashlib
+import json
+import re
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import httpx
+
+_MAX_AGE_RE = re.compile(r"max-age\s*=\s*(\d+)", re.IGNORECASE)
+
+# Request headers that select a different response for the same URL
+_VARY_HEADERS = ("api-auth-id", "accept")
+
+# Disk writes between checks of the on-disk entry count
+_PRUNE_EVERY = 64
+
+
+@dataclass
+class CachedResponse:
+    """A stored GET response.
+
+    Attributes:
+        status_code: Response status code.
+        headers: Response headers, without body encoding headers.
+        content: Decoded response body.
+        stored_at: Wall-clock time the response was stored or last revalidated.
+        expires_at: Wall-clock time after which the entry must not be served
+            without fetching again, or None if it is revalidated on every use.
+    """
+
+    status_code: int
+    headers: list[tuple[str, str]]
+    content: bytes
+    stored_at: float
+    expires_at: float | None = None
+
+    def header(self, name: str) -> str | None:
+        """Value of the first header called ``name``, if any."""
+        name = name.lower()
+        return next((v for k, v in self.headers if k.lower() == name), None)
+
+    @property
+    def has_validators(self) -> bool:
+        """Whether the entry can be revalidated with a conditional request."""
+        return bool(self.header("etag") or self.header("last-modified"))
+
+
+def cache_control(headers: httpx.Headers) -> tuple[bool, float | None]:
+    """Parse ``Cache-Control``: whether storing is allowed, and ``max-age``."""
+    value = ",".join(headers.get_list("cache-control"))
+    if "no-store" in value.lower():
+        return False, None
+    match = _MAX_AGE_RE.search(value)
+    return True, float(match.group(1)) if match else None
+
+
+class HTTPCache:
+    """Bounded LRU of GET responses with optional disk backing.
+
+    Args:
+        ttl: Seconds a response without validators is served before it is
+            fetched again (default: 60).
+        max_size: Maximum number of responses held in memory (default: 256).
+        directory: Optional directory persisting entries across restarts.
+        max_disk_entries: Maximum number of entry files kept in ``directory``
+            (default: 4096); the oldest are removed beyond it.
+        clock: Wall-clock time source, overridable for testing.
+
+    Raises:
+        ValueError: If ``ttl`` is not positive or a size is less than 1.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 60.0,
+        max_size: int = 256,
+        directory: str | Path | None = None,
+        max_disk_entries: int = 4096,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if ttl <= 0:
+            raise ValueError(f"ttl must be positive, got {ttl}")
+        if max_size < 1:
+            raise ValueError(f"max_size must be at least 1, got {max_size}")
+        if max_disk_entries < 1:
+            raise ValueError(
+                f"max_disk_entries must be at least 1, got {max_disk_entries}"
+            )
+        self.ttl = ttl
+        self.max_size = max_size
+        self.max_disk_entries = max_disk_entries
+        self.directory = Path(directory).expanduser() if directory else None
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+        self._clock = clock
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._disk_writes = 0
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+
+    # Keys
+
+    @staticmethod
+    def _digest(value: str) -> str:
+        return hashlib.sha256(value.encode()).hexdigest()[:32]
+
+    def key_for(self, request: httpx.Request) -> str:
+        """Cache key of a GET request: its path, URL and varying headers."""
+        path = self._digest(request.url.path.lower())
+        identity = "\n".join(
+            [str(request.url), *(request.headers.get(h, "") for h in _VARY_HEADERS)]
+        )
+        return f"{path}_{self._digest(identity)}"
+
+    # Lookup and storage
+
+    async def get(self, key: str) -> CachedResponse | None:
+        """The entry stored under ``key``, if any (expired entries included)."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            return entry
+        if self.directory is None:
+            return None
+        entry = await asyncio.to_thread(self._read_disk, self.directory, key)
+        # A response stored while the file was read is newer than the file
+        if (current := self._entries.get(key)) is not None:
+            return current
+        if entry is not None:
+            self._remember(key, entry)
+        return entry
+
+    def is_fresh(self, entry: CachedResponse) -> bool:
+        """Whether ``entry`` may be served without contacting the server."""
+        return entry.expires_at is not None and self._clock() < entry.expires_at
+
+    async def store(self, key: str, response: httpx.Response) -> CachedResponse | None:
+        """Store a read 200 response, unless it forbids storage.
+
+        Returns:
+            The stored entry, or None if the response was not stored.
+        """
+        storable, max_age = cache_control(response.headers)
+        if response.status_code != 200 or not storable:
+            return None
+        now = self._clock()
+        entry = CachedResponse(
+            status_code=response.status_code,
+            headers=strip_body_headers(response.headers),
+            content=response.content,
+            stored_at=now,
+        )
+        if not entry.has_validators:
+            entry.expires_at = now + (self.ttl if max_age is None else max_age)
+        self._remember(key, entry)
+        await self._persist(key, entry)
+        return entry
+
+    async def refresh(
+        self, key: str, entry: CachedResponse, not_modified: httpx.Response
+    ) -> None:
+        """Record a ``304 Not Modified`` revalidation of ``entry``.
+
+        Updated validators and caching headers from the 304 replace the stored ones.
+        """
+        updates = strip_body_headers(not_modified.headers)
+        replaced = {name.lower() for name, _ in updates}
+        entry.headers = [
+            (name, value)
+            for name, value in entry.headers
+            if name.lower() not in replaced
+        ] + updates
+        entry.stored_at = self._clock()
+        self._remember(key, entry)
+        await self._persist(key, entry)
+
+    async def invalidate_path(self, path: str) -> None:
+        """Drop every cached response for ``path``, whatever its query string."""
+        prefix = f"{self._digest(path.lower())}_"
+        for key in [k for k in self._entries if k.startswith(prefix)]:
+            del self._entries[key]
+        if self.directory is not None:
+            await asyncio.to_thread(self._unlink_disk, self.directory, f"{prefix}*")
+
+    async def clear(self) -> None:
+        """Drop every entry, in memory and on disk."""
+        self._entries.clear()
+        if self.directory is not None:
+            await asyncio.to_thread(self._unlink_disk, self.directory, "*")
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remember(self, key: str, entry: CachedResponse) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    async def _persist(self, key: str, entry: CachedResponse) -> None:
+        if self.directory is None:
+            return
+        fields = asdict(entry)
+        content = fields.pop("content")
+        meta = json.dumps(fields).encode()
+        written = await asyncio.to_thread(
+            self._write_disk, self.directory, key, meta, content
+        )
+        if written:
+            self._disk_writes += 1
+            if self._disk_writes % _PRUNE_EVERY == 0:
+                await asyncio.to_thread(
+                    self._prune_disk, self.directory, self.max_disk_entries
+                )
+
+    # Disk backing: one file per entry, a JSON header line followed by the body.
+    # These run in a worker thread (asyncio.to_thread), off the event loop.
+
+    @staticmethod
+    def _read_disk(directory: Path, key: str) -> CachedResponse | None:
+        try:
+            raw = (directory / f"{key}.entry").read_bytes()
+            meta, _, content = raw.partition(b"\n")
+            fields = json.loads(meta)
+            fields["headers"] = [tuple(h) for h in fields["headers"]]
+            return CachedResponse(content=content, **fields)
+        except (OSError, ValueError, TypeError, KeyError):
+            return None
+
+    @staticmethod
+    def _write_disk(directory: Path, key: str, meta: bytes, content: bytes) -> bool:
+        target = directory / f"{key}.entry"
+        # Unique per write, so concurrent writes of one key never share a file
+        temporary = directory / f"{key}.{uuid.uuid4().hex}.tmp"
+        try:
+            temporary.write_bytes(meta + b"\n" + content)
+            temporary.replace(target)
+        except OSError:
+            temporary.unlink(missing_ok=True)
+            return False
+        return True
+
+    @staticmethod
+    def _unlink_disk(directory: Path, pattern: str) -> None:
+        for file in directory.glob(f"{pattern}.entry"):
+            file.unlink(missing_ok=True)
+
+    @staticmethod
+    def _prune_disk(directory: Path, max_entries: int) -> None:
+        files = list(directory.glob("*.entry"))
+        if len(files) <= max_entries:
+            return
+        with contextlib.suppress(OSError):
+            files.sort(key=lambda f: f.stat().st_mtime)
+        for file in files[: len(files) - max_entries]:
+            file.unlink(missing_ok=True)
+
+
+# The stored body is already decoded, so these no longer describe it
+BODY_HEADERS = frozenset(["content-encoding", "content-length", "transfer-encoding"])
+
+
+def strip_body_headers(headers: httpx.Headers) -> list[tuple[str, str]]:
+    """Headers without those describing the wire encoding of the body."""
+    return [
+        (name, value)
+        for name, value in headers.multi_items()
+        if name.lower() not in BODY_HEADERS
+    ]
+
+
+__all__ = ["CachedResponse", "HTTPCache", "cache_control", "strip_body_headers"]
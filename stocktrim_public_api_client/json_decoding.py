@@ -0,0 +1,125 @@
+"""Selectable JSON decoders for API responses.
+
+Every generated ``_parse_response`` calls ``response.json()``, which uses the
+standard library decoder. For large payloads (order plan results with
+thousands of rows) that decode step is a noticeable share of CPU time, so the
+client can swap in `orjson <https://github.com/ijl/orjson>`_ or
+`msgspec <https://jcristharif.com/msgspec/>`_ when either is installed.
+
+Neither library is a dependency of this package; install one alongside it::
+
+    pip install orjson
+
+Decode errors from every backend are raised as :class:`json.JSONDecodeError`
+(a ``ValueError``), matching the standard library behaviour the rest of the
+client already handles.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+from typing import Any, Literal
+
+import httpx
+
+JSONDecoderName = Literal["auto", "stdlib", "orjson", "msgspec"]
+JSONDecoder = Callable[[bytes], Any]
+
+#: Backends tried, in order, when ``"auto"`` is requested
+AUTO_PREFERENCE: tuple[JSONDecoderName, ...] = ("orjson", "msgspec")
+
+
+def _stdlib_decoder() -> JSONDecoder:
+    return json.loads
+
+
+def _orjson_decoder() -> JSONDecoder:
+    import orjson
+
+    return orjson.loads
+
+
+def _msgspec_decoder() -> JSONDecoder:
+    import msgspec
+
+    decoder = msgspec.json.Decoder()
+
+    def decode(content: bytes) -> Any:
+        try:
+            return decoder.decode(content)
+        except msgspec.DecodeError as e:
+            doc = content.decode("utf-8", errors="replace")
+            raise json.JSONDecodeError(str(e), doc, 0) from e
+
+    return decode
+
+
+_BACKENDS: dict[JSONDecoderName, Callable[[], JSONDecoder]] = {
+    "stdlib": _stdlib_decoder,
+    "orjson": _orjson_decoder,
+    "msgspec": _msgspec_decoder,
+}
+
+
+def get_json_decoder(
+    name: JSONDecoderName = "auto",
+) -> tuple[JSONDecoderName, JSONDecoder]:
+    """Resolve a JSON decoder by name.
+
+    Args:
+        name: ``"orjson"``, ``"msgspec"`` or ``"stdlib"`` to pick a specific
+            backend, or ``"auto"`` for the fastest installed one (falling back
+            to the standard library).
+
+    Returns:
+        Tuple of (resolved backend name, decode function taking bytes).
+
+    Raises:
+        ValueError: If ``name`` is not a known backend.
+        ImportError: If a specific backend is requested but not installed.
+
+    Example:
+        >>> name, decode = get_json_decoder("stdlib")
+        >>> name, decode(b'{"a": 1}')
+        ('stdlib', {'a': 1})
+    """
+    if name == "auto":
+        for candidate in AUTO_PREFERENCE:
+            try:
+                return candidate, _BACKENDS[candidate]()
+            except ImportError:
+                continue
+        return "stdlib", _stdlib_decoder()
+
+    if name not in _BACKENDS:
+        raise ValueError(
+            f"Unknown JSON decoder {name!r}; expected one of "
+            f"'auto', {', '.join(repr(n) for n in _BACKENDS)}"
+        )
+    try:
+        return name, _BACKENDS[name]()
+    except ImportError as e:
+        raise ImportError(
+            f"JSON decoder {name!r} requested but not installed (pip install {name})"
+        ) from e
+
+
+def install_json_decoder(response: httpx.Response, decoder: JSONDecoder) -> None:
+    """Make ``response.json()`` use ``decoder``.
+
+    Calls that pass keyword arguments (which only the standard library
+    understands) keep the original behaviour.
+
+    Args:
+        response: Response to patch in place.
+        decoder: Function decoding the raw body bytes.
+    """
+    stdlib_json = response.json
+
+    def json_(**kwargs: Any) -> Any:
+        if kwargs:
+            return stdlib_json(**kwargs)
+        return decoder(response.content)
+
+    response.json = json_  # type: ignore[method-assign]
@@ -0,0 +1,269 @@
+"""Lazily decoded views over generated models.
+
+Generated ``from_dict`` methods decode every field of a row up front: each
+datetime goes through ``isoparse``, each nested object is built, whether or
+not the caller ever reads it. ``SkuOptimizedResultsDto`` has over 80 fields,
+while most consumers of the order plan read fewer than ten, so large pulls
+spend most of their time and memory on values nobody looks at.
+
+A lazy model keeps the raw JSON object and decodes an attribute the first
+time it is read, then remembers the result. Attribute names, types and
+``UNSET`` handling match the generated model, so code that only reads
+attributes works with either.
+
+Example:
+    ```python
+    from stocktrim_public_api_client.lazy_models import (
+        LazySkuOptimizedResultsDto,
+    )
+
+    row = LazySkuOptimizedResultsDto(
+        {"productCode": "WIDGET-001", "orderQuantity": 5}
+    )
+    row.product_code  # "WIDGET-001"
+    row.calculated_date_time  # UNSET; nothing else was decoded
+    full = row.to_model()  # the eager SkuOptimizedResultsDto
+    ```
+"""
+
+from __future__ import annotations
+
+import functools
+from collections.abc import Callable, Mapping
+from enum import Enum
+from typing import Any, ClassVar, Generic, TypeVar
+from uuid import UUID
+
+import attrs
+from dateutil.parser import isoparse
+
+from .client_types import UNSET
+from .generated import models as generated_models
+from .generated.models.sku_optimized_results_dto import SkuOptimizedResultsDto
+
+T = TypeVar("T")
+Decoder = Callable[[Any], Any]
+
+# Annotations whose JSON value is used as-is
+_PASSTHROUGH_TYPES = {"Any", "bool", "float", "int", "str", "dict[str, Any]"}
+
+# Marks fields this module can't decode on its own; they fall back to from_dict
+_EAGER: Any = object()
+
+
+class LazyModel(Generic[T]):
+    """Read-only view over a raw JSON object that decodes fields on demand.
+
+    Subclasses are created with :func:`lazy_model`; don't instantiate this
+    class directly.
+
+    Unlike the generated ``from_dict``, a missing required field is reported
+    as ``UNSET`` rather than raising ``KeyError``. Call :meth:`to_model` for
+    full validation.
+
+    Args:
+        raw: One JSON object as returned by the API (camelCase keys).
+    """
+
+    __slots__ = ("_model", "_raw", "_values")
+
+    #: Generated model class this view mirrors
+    model: ClassVar[type]
+    #: attribute name -> (JSON key, decoder or None for pass-through)
+    _fields: ClassVar[dict[str, tuple[str, Decoder | None]]] = {}
+
+    def __init__(self, raw: Mapping[str, Any]):
+        self._raw = raw
+        self._values: dict[str, Any] = {}
+        self._model: T | None = None
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            key, decode = self._fields[name]
+        except KeyError:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            ) from None
+
+        values = self._values
+        if name in values:
+            return values[name]
+
+        if decode is _EAGER:
+            value = getattr(self.to_model(), name)
+        else:
+            value = self._raw.get(key, UNSET)
+            if decode is not None and value is not None and value is not UNSET:
+                value = decode(value)
+        values[name] = value
+        return value
+
+    @property
+    def raw(self) -> Mapping[str, Any]:
+        """The undecoded JSON object."""
+        return self._raw
+
+    def to_model(self) -> T:
+        """Decode every field into the generated model (cached).
+
+        Returns:
+            The eager model instance, as ``from_dict`` would build it.
+        """
+        if self._model is None:
+            self._model = self.model.from_dict(self._raw)
+        return self._model
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a copy of the raw JSON object."""
+        return dict(self._raw)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._raw!r})"
+
+
+@functools.cache
+def lazy_model(model: type[T]) -> type[LazyModel[T]]:
+    """Create (or return the cached) lazy view class for a generated model.
+
+    Args:
+        model: Generated attrs model class, e.g. ``ProductsResponseDto``.
+
+    Returns:
+        A :class:`LazyModel` subclass named ``Lazy<Model>``.
+
+    Example:
+        >>> from stocktrim_public_api_client.generated.models import (
+        ...     ProductsResponseDto,
+        ... )
+        >>> LazyProduct = lazy_model(ProductsResponseDto)
+        >>> LazyProduct({"productId": "123"}).product_id
+        '123'
+    """
+    fields = {
+        name: (key, _decoder_for(str(attrs.fields_dict(model)[name].type)))
+        for name, key in json_keys(model).items()
+    }
+    return type(
+        f"Lazy{model.__name__}",
+        (LazyModel,),
+        {
+            "__slots__": (),
+            "__doc__": f"Lazily decoded view of :class:`{model.__name__}`.",
+            "model": model,
+            "_fields": fields,
+        },
+    )
+
+
+@functools.cache
+def json_keys(model: type) -> dict[str, str]:
+    """Map a generated model's attribute names to their JSON keys.
+
+    Keys come from the ``_JSON_KEYS`` map that ``scripts/regenerate_client.py``
+    writes into every generated model. The generator's snake_case conversion
+    can't be inverted in general (``last120Days`` and ``2ndOrder`` both end up
+    with a number as a separate word), so keys are never guessed.
+
+    Args:
+        model: Generated attrs model class.
+
+    Returns:
+        ``{attribute name: JSON key}`` for every ``__init__`` field, in
+        declaration order.
+
+    Raises:
+        TypeError: If the model has no key map, or the map is missing a field
+            (the generated client is out of date; regenerate it).
+    """
+    keys: dict[str, str] | None = getattr(model, "_JSON_KEYS", None)
+    if keys is None:
+        raise TypeError(
+            f"{model.__name__} has no _JSON_KEYS map; "
+            "regenerate the client with scripts/regenerate_client.py"
+        )
+    names = [field.name for field in attrs.fields(model) if field.init]
+    missing = [name for name in names if name not in keys]
+    if missing:
+        raise TypeError(
+            f"{model.__name__}._JSON_KEYS has no key for {', '.join(missing)}; "
+            "regenerate the client with scripts/regenerate_client.py"
+        )
+    return {name: keys[name] for name in names}
+
+
+def _decoder_for(annotation: str) -> Decoder | None:
+    """Decoder for a field from its (string) type annotation.
+
+    Returns None for values used as-is and ``_EAGER`` for types that need
+    the generated ``from_dict`` (e.g. unions of several non-null types).
+    """
+    types = [t for t in annotation.split(" | ") if t not in ("None", "Unset")]
+    if len(types) != 1:
+        return _EAGER
+    (type_name,) = types
+
+    if type_name in _PASSTHROUGH_TYPES:
+        return None
+    if type_name.startswith("list[") and type_name.endswith("]"):
+        item_decoder = _decoder_for(type_name[5:-1])
+        if item_decoder is None:
+            return None
+        if item_decoder is _EAGER:
+            return _EAGER
+        return functools.partial(_decode_list, item_decoder)
+    if type_name == "datetime.datetime":
+        return _decode_datetime
+    if type_name == "datetime.date":
+        return _decode_date
+    if type_name == "UUID":
+        return _decode_uuid
+
+    cls = getattr(generated_models, type_name, None)
+    if isinstance(cls, type) and issubclass(cls, Enum):
+        return cls
+    if isinstance(cls, type) and attrs.has(cls):
+        return functools.partial(_decode_model, cls)
+    return _EAGER
+
+
+def _decode_list(item_decoder: Decoder, value: Any) -> Any:
+    if not isinstance(value, list):
+        return value
+    return [item_decoder(item) for item in value]
+
+
+def _decode_datetime(value: Any) -> Any:
+    if not isinstance(value, str):
+        return value
+    try:
+        return isoparse(value)
+    except ValueError:
+        return value
+
+
+def _decode_date(value: Any) -> Any:
+    if not isinstance(value, str):
+        return value
+    try:
+        return isoparse(value).date()
+    except ValueError:
+        return value
+
+
+def _decode_uuid(value: Any) -> Any:
+    if not isinstance(value, str):
+        return value
+    try:
+        return UUID(value)
+    except ValueError:
+        return value
+
+
+def _decode_model(cls: Any, value: Any) -> Any:
+    if not isinstance(value, Mapping):
+        return value
+    return cls.from_dict(value)
+
+
+LazySkuOptimizedResultsDto = lazy_model(SkuOptimizedResultsDto)
+"""Lazy view of an order plan row (:class:`SkuOptimizedResultsDto`)."""
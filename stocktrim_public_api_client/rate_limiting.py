@@ -0,0 +1,192 @@
+"""Client-side adaptive rate limiting for StockTrim requests.
+
+Concurrent helpers (paginated reads, bulk upserts, parallel workflow steps)
+can send requests faster than StockTrim accepts them. Without pacing, a burst
+runs into a wall of ``429 Too Many Requests`` responses, every request backs
+off at once, and throughput swings between bursts and idle retry sleeps.
+
+The :class:`AdaptiveRateLimiter` paces outgoing requests with a token bucket
+and adjusts its rate from the server's feedback (AIMD):
+
+- every successful response raises the rate by ``increase`` requests/second,
+  up to ``max_rate``;
+- a ``429`` multiplies the rate by ``decrease`` (down to ``min_rate``), empties
+  the bucket and, when the response has a ``Retry-After`` header, holds every
+  request until that time.
+
+Responses to requests sent before the latest slow-down do not slow it down
+again, so one burst of 429s halves the rate once rather than once per request.
+
+The limiter is opt-in: pass an instance to the client to enable it.
+
+Example:
+    ```python
+    from stocktrim_public_api_client import (
+        AdaptiveRateLimiter,
+        StockTrimClient,
+    )
+
+    async with StockTrimClient(
+        rate_limiter=AdaptiveRateLimiter(rate=5)
+    ) as client:
+        ...
+    ```
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from datetime import UTC
+from email.utils import parsedate_to_datetime
+
+
+def parse_retry_after(value: str | None, now: float | None = None) -> float | None:
+    """Seconds to wait according to a ``Retry-After`` header value.
+
+    Args:
+        value: Header value, either delay seconds or an HTTP date.
+        now: Current wall-clock time (defaults to ``time.time()``), used for
+            HTTP dates.
+
+    Returns:
+        Non-negative delay in seconds, or None if the value is missing or
+        cannot be parsed.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=UTC)
+    now = time.time() if now is None else now
+    return max(0.0, retry_at.timestamp() - now)
+
+
+class AdaptiveRateLimiter:
+    """Token bucket whose refill rate adapts to 429 responses.
+
+    Args:
+        rate: Initial rate in requests per second (default: 10).
+        burst: Bucket capacity, i.e. how many requests may be sent back to
+            back after an idle period (default: ``rate``, at least 1).
+        min_rate: Lowest rate a run of 429s can push the limiter to
+            (default: 0.5).
+        max_rate: Highest rate successful responses can raise it to
+            (default: ``rate``).
+        increase: Requests/second added per successful response (default: 0.1).
+        decrease: Factor applied to the rate on a 429 (default: 0.5).
+        clock: Monotonic time source, overridable for testing.
+        sleep: Coroutine function used to wait, overridable for testing.
+
+    Raises:
+        ValueError: If the rates are not positive and ordered
+            ``min_rate <= rate <= max_rate``, ``burst`` is less than 1,
+            ``increase`` is negative, or ``decrease`` is not between 0 and 1.
+    """
+
+    def __init__(
+        self,
+        rate: float = 10.0,
+        burst: float | None = None,
+        min_rate: float = 0.5,
+        max_rate: float | None = None,
+        increase: float = 0.1,
+        decrease: float = 0.5,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ) -> None:
+        max_rate = rate if max_rate is None else max_rate
+        burst = max(1.0, rate) if burst is None else burst
+        if not 0 < min_rate <= rate <= max_rate:
+            raise ValueError(
+                "rates must satisfy 0 < min_rate <= rate <= max_rate, got "
+                f"min_rate={min_rate}, rate={rate}, max_rate={max_rate}"
+            )
+        if burst < 1:
+            raise ValueError(f"burst must be at least 1, got {burst}")
+        if increase < 0:
+            raise ValueError(f"increase must not be negative, got {increase}")
+        if not 0 < decrease < 1:
+            raise ValueError(f"decrease must be between 0 and 1, got {decrease}")
+
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.decrease = decrease
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = burst
+        self._updated_at = clock()
+        self._blocked_until = 0.0
+        self._last_decrease = float("-inf")
+        self._lock = asyncio.Lock()
+        self.throttled = 0
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(0.0, now - self._updated_at)
+        self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+        self._updated_at = now
+
+    async def acquire(self) -> float:
+        """Wait until a request may be sent, then take a token for it.
+
+        Waiters are served in arrival order.
+
+        Returns:
+            The clock time at which the token was granted; pass it to
+            :meth:`on_rate_limited` if the request is rejected.
+        """
+        async with self._lock:
+            while True:
+                now = self._clock()
+                if now < self._blocked_until:
+                    await self._sleep(self._blocked_until - now)
+                    continue
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return now
+                await self._sleep((1 - self._tokens) / self.rate)
+
+    def on_success(self) -> None:
+        """Record an accepted request, raising the rate additively."""
+        self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def on_rate_limited(self, sent_at: float, retry_after: float | None = None) -> None:
+        """Record a 429 response, slowing down multiplicatively.
+
+        Args:
+            sent_at: Value returned by :meth:`acquire` for the rejected request.
+            retry_after: Delay from the response's ``Retry-After`` header, if any.
+        """
+        now = self._clock()
+        self.throttled += 1
+        if retry_after is not None:
+            self._blocked_until = max(self._blocked_until, now + retry_after)
+        if sent_at <= self._last_decrease:
+            # Already slowed down for the burst this request belonged to
+            return
+        self._refill(now)
+        self.rate = max(self.min_rate, self.rate * self.decrease)
+        self._tokens = 0.0
+        self._last_decrease = now
+
+    def __repr__(self) -> str:
+        return (
+            f"AdaptiveRateLimiter(rate={self.rate:.2f}, burst={self.burst}, "
+            f"min_rate={self.min_rate}, max_rate={self.max_rate})"
+        )
+
+
+__all__ = ["AdaptiveRateLimiter", "parse_retry_after"]
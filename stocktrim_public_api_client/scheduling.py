@@ -0,0 +1,251 @@
+"""Priority scheduling and per-endpoint concurrency limits for StockTrim requests.
+
+One :class:`StockTrimClient` is often shared by latency-sensitive calls (an
+interactive product lookup) and long background jobs (catalog downloads,
+order plan pulls). Without coordination the background job's requests fill
+the connection pool and the interactive call waits behind all of them.
+
+A :class:`RequestScheduler` admits requests in priority order:
+
+- ``max_concurrency`` caps how many requests are in flight overall;
+- ``limits`` caps individual endpoints, e.g. ``{"POST /api/OrderPlan": 2}``;
+- requests are admitted by :class:`Priority` first and arrival order second,
+  so a ``HIGH`` request overtakes queued ``NORMAL`` and ``LOW`` ones.
+
+A queued request that is only held back by its own endpoint's cap does not
+block requests to other endpoints. Priorities are strict: ``LOW`` requests
+wait as long as higher-priority ones keep arriving.
+
+The priority of requests is set with the :func:`request_priority` context
+manager and applies to every request made inside it, including from tasks
+created inside it.
+
+Example:
+    ```python
+    from stocktrim_public_api_client import (
+        Priority,
+        RequestScheduler,
+        StockTrimClient,
+        request_priority,
+    )
+
+    scheduler = RequestScheduler(
+        max_concurrency=8, limits={"POST /api/OrderPlan": 2}
+    )
+    async with StockTrimClient(scheduler=scheduler) as client:
+        with request_priority(Priority.LOW):
+            await client.products.get_all_paginated()
+    ```
+"""
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import contextlib
+import itertools
+from collections.abc import AsyncIterator, Iterator, Mapping
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from enum import IntEnum
+
+
+class Priority(IntEnum):
+    """Scheduling class of a request; lower values are admitted first."""
+
+    HIGH = 0
+    NORMAL = 1
+    LOW = 2
+
+
+_current_priority: ContextVar[Priority] = ContextVar(
+    "stocktrim_request_priority", default=Priority.NORMAL
+)
+
+
+def current_priority() -> Priority:
+    """Priority applied to requests made in the current context."""
+    return _current_priority.get()
+
+
+@contextlib.contextmanager
+def request_priority(priority: Priority) -> Iterator[None]:
+    """Run the enclosed requests with ``priority``.
+
+    Args:
+        priority: Priority of every request made inside the block.
+    """
+    token = _current_priority.set(priority)
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+@dataclass(order=True)
+class _Waiter:
+    """A queued request, ordered by priority then arrival."""
+
+    priority: int
+    seq: int
+    endpoint: str | None = field(compare=False)
+    future: asyncio.Future[None] = field(compare=False)
+
+
+class RequestScheduler:
+    """Admits requests by priority within global and per-endpoint limits.
+
+    Args:
+        max_concurrency: Maximum requests in flight overall, or None for no
+            overall cap.
+        limits: Per-endpoint caps keyed by ``"METHOD /path"`` or ``"/path"``
+            (any method). A rule matches its path and every path below it,
+            case-insensitively; the first matching rule applies.
+
+    Raises:
+        ValueError: If a limit is less than 1 or a rule is malformed.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int | None = None,
+        limits: Mapping[str, int] | None = None,
+    ) -> None:
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError(
+                f"max_concurrency must be at least 1, got {max_concurrency}"
+            )
+        self.max_concurrency = max_concurrency
+        self.limits = dict(limits or {})
+        self._rules: list[tuple[str, str | None, str]] = []
+        for rule, limit in self.limits.items():
+            if limit < 1:
+                raise ValueError(f"limit for {rule!r} must be at least 1, got {limit}")
+            method, _, path = rule.strip().rpartition(" ")
+            if not path.startswith("/"):
+                raise ValueError(f"rule must be '[METHOD] /path', got {rule!r}")
+            self._rules.append(
+                (rule, method.strip().upper() or None, path.rstrip("/").lower())
+            )
+        self._in_flight = 0
+        self._endpoint_in_flight: dict[str, int] = dict.fromkeys(self.limits, 0)
+        self._waiters: list[_Waiter] = []
+        self._seq = itertools.count()
+
+    @property
+    def in_flight(self) -> int:
+        """Number of requests currently admitted."""
+        return self._in_flight
+
+    @property
+    def queued(self) -> int:
+        """Number of requests waiting to be admitted."""
+        return len(self._waiters)
+
+    def endpoint_for(self, method: str, path: str) -> str | None:
+        """The limit rule that applies to a request, if any."""
+        method = method.upper()
+        path = path.rstrip("/").lower()
+        for rule, rule_method, rule_path in self._rules:
+            if rule_method not in (None, method):
+                continue
+            if path == rule_path or path.startswith(rule_path + "/"):
+                return rule
+        return None
+
+    @contextlib.asynccontextmanager
+    async def slot(
+        self, method: str, path: str, priority: Priority | None = None
+    ) -> AsyncIterator[None]:
+        """Hold an admission slot for one request.
+
+        Args:
+            method: HTTP method of the request.
+            path: URL path of the request.
+            priority: Priority of the request (default: :func:`current_priority`).
+        """
+        endpoint = self.endpoint_for(method, path)
+        await self._acquire(
+            endpoint, current_priority() if priority is None else priority
+        )
+        try:
+            yield
+        finally:
+            self._release(endpoint)
+
+    def _full(self) -> bool:
+        return (
+            self.max_concurrency is not None and self._in_flight >= self.max_concurrency
+        )
+
+    def _fits(self, endpoint: str | None) -> bool:
+        if self._full():
+            return False
+        return (
+            endpoint is None
+            or self._endpoint_in_flight[endpoint] < self.limits[endpoint]
+        )
+
+    def _admit(self, endpoint: str | None) -> None:
+        self._in_flight += 1
+        if endpoint is not None:
+            self._endpoint_in_flight[endpoint] += 1
+
+    async def _acquire(self, endpoint: str | None, priority: Priority) -> None:
+        waiter = _Waiter(
+            int(priority),
+            next(self._seq),
+            endpoint,
+            asyncio.get_running_loop().create_future(),
+        )
+        bisect.insort(self._waiters, waiter)
+        self._dispatch()
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # Admitted just as we were cancelled: hand the slot back
+                self._release(endpoint)
+            else:
+                with contextlib.suppress(ValueError):
+                    self._waiters.remove(waiter)
+            raise
+
+    def _release(self, endpoint: str | None) -> None:
+        self._in_flight -= 1
+        if endpoint is not None:
+            self._endpoint_in_flight[endpoint] -= 1
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        """Admit queued requests in order while they fit."""
+        remaining: list[_Waiter] = []
+        for position, waiter in enumerate(self._waiters):
+            if self._full():
+                # Nothing else can be admitted until a slot is released
+                remaining.extend(self._waiters[position:])
+                break
+            if waiter.future.done():
+                # Cancelled while queued
+                continue
+            if self._fits(waiter.endpoint):
+                self._admit(waiter.endpoint)
+                waiter.future.set_result(None)
+            else:
+                remaining.append(waiter)
+        self._waiters = remaining
+
+    def __repr__(self) -> str:
+        return (
+            f"RequestScheduler(max_concurrency={self.max_concurrency}, "
+            f"limits={self.limits}, in_flight={self._in_flight}, "
+            f"queued={len(self._waiters)})"
+        )
+
+
+__all__ = [
+    "Priority",
+    "RequestScheduler",
+    "current_priority",
+    "request_priority",
+]
@@ -6,12 +6,13 @@ custom header authentication, and error handling for all API calls without any
 decorators or wrapper methods needed.
 """
 
+import asyncio
 import contextlib
 import json
 import logging
 import os
 import time
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Collection
 from typing import TYPE_CHECKING, Any, cast
 
 import httpx
@@ -19,8 +20,19 @@ from dotenv import load_dotenv
 from httpx import AsyncHTTPTransport
 from httpx_retries import Retry, RetryTransport
 
+from .entity_cache import EntityCache
+from .forecast_events import ForecastEvents
 from .generated.client import AuthenticatedClient
 from .generated.models.problem_details import ProblemDetails
+from .http_cache import CachedResponse, HTTPCache, strip_body_headers
+from .json_decoding import (
+    JSONDecoder,
+    JSONDecoderName,
+    get_json_decoder,
+    install_json_decoder,
+)
+from .rate_limiting import AdaptiveRateLimiter, parse_retry_after
+from .scheduling import RequestScheduler
 from .utils import unwrap_unset
 
 if TYPE_CHECKING:
@@ -71,8 +83,10 @@ class IdempotentOnlyRetry(Retry):
     Custom Retry class that only retries idempotent methods (GET, HEAD, OPTIONS, TRACE)
     on server errors (5xx status codes).
 
-    StockTrim doesn't have rate limiting (429), so we only need to handle 5xx errors
-    and we only retry idempotent methods to avoid duplicate operations.
+    Server errors may arrive after a write was applied, so only idempotent methods
+    are retried for them to avoid duplicate operations. A 429 (only in
+    ``status_forcelist`` when client-side rate limiting is enabled) means the
+    request was rejected unprocessed, so it is retried for every method.
     """
 
     # Idempotent methods that are always safe to retry
@@ -107,6 +121,10 @@ class IdempotentOnlyRetry(Retry):
         if self._current_method is None:
             return True
 
+        # Rate limited requests were never processed - safe to resend
+        if status_code == 429:
+            return True
+
         # Server errors (5xx) - only retry idempotent methods
         return self._current_method in self.IDEMPOTENT_METHODS
 
@@ -505,11 +523,356 @@ class AuthHeaderTransport(AsyncHTTPTransport):
         return await self._wrapped_transport.handle_async_request(request)
 
 
+class JSONDecodingTransport(AsyncHTTPTransport):
+    """
+    Transport layer that swaps the JSON decoder used by ``response.json()``.
+
+    Generated API modules parse every response body with ``response.json()``.
+    This transport patches each response so that call uses a faster decoder
+    (orjson or msgspec) instead of the standard library, without touching the
+    generated code. See :mod:`stocktrim_public_api_client.json_decoding`.
+    """
+
+    def __init__(
+        self,
+        decoder: JSONDecoder,
+        wrapped_transport: AsyncHTTPTransport | None = None,
+        **kwargs: Any,
+    ):
+        """
+        Initialize the JSON decoding transport.
+
+        Args:
+            decoder: Function decoding raw response bytes into Python objects.
+            wrapped_transport: The transport to wrap. If None, creates a new AsyncHTTPTransport.
+            **kwargs: Additional arguments passed to AsyncHTTPTransport if wrapped_transport is None.
+        """
+        super().__init__()
+        if wrapped_transport is None:
+            wrapped_transport = AsyncHTTPTransport(**kwargs)
+        self._wrapped_transport = wrapped_transport
+        self.decoder = decoder
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Forward the request and install the decoder on the response."""
+        response = await self._wrapped_transport.handle_async_request(request)
+        install_json_decoder(response, self.decoder)
+        return response
+
+
+class RateLimitingTransport(AsyncHTTPTransport):
+    """
+    Transport layer that paces requests through an AdaptiveRateLimiter.
+
+    Each request waits for a token before it is sent. The response is then
+    fed back to the limiter: a 429 slows it down (honoring ``Retry-After``),
+    any other non-5xx response lets it speed back up. See
+    :mod:`stocktrim_public_api_client.rate_limiting`.
+    """
+
+    def __init__(
+        self,
+        limiter: AdaptiveRateLimiter,
+        wrapped_transport: AsyncHTTPTransport | None = None,
+        **kwargs: Any,
+    ):
+        """
+        Initialize the rate limiting transport.
+
+        Args:
+            limiter: Rate limiter shared by every request through this transport.
+            wrapped_transport: The transport to wrap. If None, creates a new AsyncHTTPTransport.
+            **kwargs: Additional arguments passed to AsyncHTTPTransport if wrapped_transport is None.
+        """
+        super().__init__()
+        if wrapped_transport is None:
+            wrapped_transport = AsyncHTTPTransport(**kwargs)
+        self._wrapped_transport = wrapped_transport
+        self.limiter = limiter
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Wait for a token, send the request and report the outcome."""
+        sent_at = await self.limiter.acquire()
+        response = await self._wrapped_transport.handle_async_request(request)
+        if response.status_code == 429:
+            self.limiter.on_rate_limited(
+                sent_at, parse_retry_after(response.headers.get("Retry-After"))
+            )
+        elif response.status_code < 500:
+            self.limiter.on_success()
+        return response
+
+
+class SchedulingTransport(AsyncHTTPTransport):
+    """
+    Transport layer that admits requests through a RequestScheduler.
+
+    Each request waits for a slot, honoring the scheduler's overall and
+    per-endpoint concurrency limits and the priority set with
+    :func:`~stocktrim_public_api_client.scheduling.request_priority`. See
+    :mod:`stocktrim_public_api_client.scheduling`.
+    """
+
+    def __init__(
+        self,
+        scheduler: RequestScheduler,
+        wrapped_transport: AsyncHTTPTransport | None = None,
+        **kwargs: Any,
+    ):
+        """
+        Initialize the scheduling transport.
+
+        Args:
+            scheduler: Scheduler shared by every request through this transport.
+            wrapped_transport: The transport to wrap. If None, creates a new AsyncHTTPTransport.
+            **kwargs: Additional arguments passed to AsyncHTTPTransport if wrapped_transport is None.
+        """
+        super().__init__()
+        if wrapped_transport is None:
+            wrapped_transport = AsyncHTTPTransport(**kwargs)
+        self._wrapped_transport = wrapped_transport
+        self.scheduler = scheduler
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Send the request once the scheduler admits it.
+
+        The slot is held until the response body has been read, so the
+        concurrency limits cover the whole transfer, not just the headers.
+        """
+        async with self.scheduler.slot(request.method, request.url.path):
+            response = await self._wrapped_transport.handle_async_request(request)
+            try:
+                await response.aread()
+            except BaseException:
+                await response.aclose()
+                raise
+            return response
+
+
+def _replay_response(
+    request: httpx.Request,
+    status_code: int,
+    headers: list[tuple[str, str]],
+    content: bytes,
+    decoder: JSONDecoder | None,
+    extensions: dict[str, Any] | None = None,
+) -> httpx.Response:
+    """Build a fresh response for ``request`` from an already-read one."""
+    response = httpx.Response(
+        status_code=status_code,
+        headers=headers,
+        content=content,
+        request=request,
+        extensions={
+            name: value
+            for name, value in (extensions or {}).items()
+            if name in ("http_version", "reason_phrase")
+        },
+    )
+    if decoder is not None:
+        install_json_decoder(response, decoder)
+    return response
+
+
+# Read-only queries sent as POST, safe to share between identical callers
+DEFAULT_COALESCED_QUERIES = ("POST /api/OrderPlan",)
+
+
+class CoalescingTransport(AsyncHTTPTransport):
+    """
+    Transport layer that shares one upstream call between identical requests.
+
+    While a GET or HEAD request is in flight, identical requests (same method,
+    URL and headers) wait for its response instead of sending their own.
+    Read-only queries sent with another method (``"METHOD /path"`` entries in
+    ``read_only``) are shared too when their bodies are also identical.
+
+    The upstream call runs in its own task, so cancelling the caller that
+    started it does not fail the others. Every caller gets its own response
+    object carrying the shared status, headers and body.
+    """
+
+    COALESCED_METHODS = frozenset(["GET", "HEAD"])
+
+    def __init__(
+        self,
+        wrapped_transport: AsyncHTTPTransport | None = None,
+        read_only: Collection[str] = DEFAULT_COALESCED_QUERIES,
+        decoder: JSONDecoder | None = None,
+        **kwargs: Any,
+    ):
+        """
+        Initialize the coalescing transport.
+
+        Args:
+            wrapped_transport: The transport to wrap. If None, creates a new AsyncHTTPTransport.
+            read_only: ``"METHOD /path"`` entries for non-GET requests that only
+                read data and may be shared.
+            decoder: JSON decoder to install on shared responses, if responses
+                use a non-stdlib decoder.
+            **kwargs: Additional arguments passed to AsyncHTTPTransport if wrapped_transport is None.
+        """
+        super().__init__()
+        if wrapped_transport is None:
+            wrapped_transport = AsyncHTTPTransport(**kwargs)
+        self._wrapped_transport = wrapped_transport
+        self.read_only = frozenset(
+            (method.upper(), path.lower())
+            for method, _, path in (entry.partition(" ") for entry in read_only)
+        )
+        self.decoder = decoder
+        self._in_flight: dict[tuple[Any, ...], asyncio.Task[httpx.Response]] = {}
+        self.coalesced = 0
+
+    def _key(self, request: httpx.Request) -> tuple[Any, ...] | None:
+        """Identity of a shareable request, or None if it must go out alone."""
+        method = request.method.upper()
+        if method in self.COALESCED_METHODS:
+            body = b""
+        elif (method, request.url.path.lower()) in self.read_only:
+            try:
+                body = request.content
+            except httpx.RequestNotRead:
+                return None
+        else:
+            return None
+        headers = tuple(sorted(request.headers.multi_items()))
+        return (method, str(request.url), headers, body)
+
+    async def _fetch(self, request: httpx.Request) -> httpx.Response:
+        response = await self._wrapped_transport.handle_async_request(request)
+        try:
+            await response.aread()
+        finally:
+            await response.aclose()
+        return response
+
+    def _forget(self, key: tuple[Any, ...], task: asyncio.Task[httpx.Response]) -> None:
+        self._in_flight.pop(key, None)
+        if not task.cancelled():
+            # Mark the error retrieved even if every caller has gone away
+            task.exception()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Send the request, or wait for an identical one already in flight."""
+        key = self._key(request)
+        if key is None:
+            return await self._wrapped_transport.handle_async_request(request)
+
+        task = self._in_flight.get(key)
+        leader = task is None
+        if task is None:
+            task = asyncio.create_task(self._fetch(request))
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            self.coalesced += 1
+
+        shared = await asyncio.shield(task)
+        if leader:
+            return shared
+
+        return _replay_response(
+            request,
+            shared.status_code,
+            strip_body_headers(shared.headers),
+            shared.content,
+            self.decoder,
+            shared.extensions,
+        )
+
+
+class CachingTransport(AsyncHTTPTransport):
+    """
+    Transport layer that serves GET requests from an HTTPCache.
+
+    Stored responses with an ``ETag`` or ``Last-Modified`` validator are
+    revalidated with a conditional request, and a ``304 Not Modified`` is
+    answered with the stored body. Stored responses without validators are
+    served without a request until their TTL expires. Successful writes drop
+    the cached responses for their path. See
+    :mod:`stocktrim_public_api_client.http_cache`.
+    """
+
+    UNSAFE_METHODS = frozenset(["POST", "PUT", "PATCH", "DELETE"])
+
+    def __init__(
+        self,
+        cache: HTTPCache,
+        wrapped_transport: AsyncHTTPTransport | None = None,
+        decoder: JSONDecoder | None = None,
+        **kwargs: Any,
+    ):
+        """
+        Initialize the caching transport.
+
+        Args:
+            cache: Cache holding the stored responses.
+            wrapped_transport: The transport to wrap. If None, creates a new AsyncHTTPTransport.
+            decoder: JSON decoder to install on responses served from the cache,
+                if responses use a non-stdlib decoder.
+            **kwargs: Additional arguments passed to AsyncHTTPTransport if wrapped_transport is None.
+        """
+        super().__init__()
+        if wrapped_transport is None:
+            wrapped_transport = AsyncHTTPTransport(**kwargs)
+        self._wrapped_transport = wrapped_transport
+        self.cache = cache
+        self.decoder = decoder
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Serve, revalidate or fetch and store a GET; pass other methods through."""
+        method = request.method.upper()
+        if method != "GET":
+            response = await self._wrapped_transport.handle_async_request(request)
+            if method in self.UNSAFE_METHODS and response.status_code < 400:
+                await self.cache.invalidate_path(request.url.path)
+            return response
+
+        key = self.cache.key_for(request)
+        entry = await self.cache.get(key)
+        if entry is not None and self.cache.is_fresh(entry):
+            self.cache.hits += 1
+            return self._replay(request, entry)
+
+        if entry is not None and entry.has_validators:
+            if etag := entry.header("etag"):
+                request.headers["If-None-Match"] = etag
+            if last_modified := entry.header("last-modified"):
+                request.headers["If-Modified-Since"] = last_modified
+
+        response = await self._wrapped_transport.handle_async_request(request)
+        if entry is not None and response.status_code == 304:
+            await response.aclose()
+            await self.cache.refresh(key, entry, response)
+            self.cache.revalidated += 1
+            return self._replay(request, entry)
+
+        self.cache.misses += 1
+        if response.status_code == 200:
+            try:
+                await response.aread()
+            finally:
+                await response.aclose()
+            await self.cache.store(key, response)
+        return response
+
+    def _replay(self, request: httpx.Request, entry: CachedResponse) -> httpx.Response:
+        return _replay_response(
+            request, entry.status_code, entry.headers, entry.content, self.decoder
+        )
+
+
 def create_resilient_transport(
     api_auth_signature: str,
     max_retries: int = 5,
     logger: logging.Logger | None = None,
     total_retry_timeout: float | None = 60.0,
+    json_decoder: JSONDecoderName = "stdlib",
+    rate_limiter: AdaptiveRateLimiter | None = None,
+    scheduler: RequestScheduler | None = None,
+    coalesce_requests: bool = False,
+    http_cache: HTTPCache | None = None,
     **kwargs: Any,
 ) -> tuple[RetryTransport, ErrorLoggingTransport]:
     """
@@ -517,8 +880,13 @@ def create_resilient_transport(
 
     This function chains multiple transport layers:
     1. AsyncHTTPTransport (base HTTP transport)
+       - JSONDecodingTransport (only when a non-stdlib ``json_decoder`` is used)
     2. AuthHeaderTransport (adds StockTrim api-auth-signature header)
     3. ErrorLoggingTransport (logs detailed 4xx errors)
+       - RateLimitingTransport (only when a ``rate_limiter`` is given)
+       - SchedulingTransport (only when a ``scheduler`` is given)
+       - CoalescingTransport (only when ``coalesce_requests`` is true)
+       - CachingTransport (only when an ``http_cache`` is given)
     4. RetryTransport (handles retries for 5xx errors on idempotent methods only)
 
     Note: The api-auth-id header is set by the parent AuthenticatedClient using
@@ -534,6 +902,18 @@ def create_resilient_transport(
             even if ``max_retries`` would allow more. Defaults to 60s, which
             comfortably covers full exponential backoff (1+2+4+8+16=31s) plus
             slack for ``Retry-After`` headers; set ``None`` to disable.
+        json_decoder: JSON decoder backing ``response.json()``: ``"stdlib"``
+            (default), ``"orjson"``, ``"msgspec"``, or ``"auto"`` for the
+            fastest one installed.
+        rate_limiter: Optional AdaptiveRateLimiter pacing every request attempt,
+            retries included. When given, 429 responses are also retried, for
+            all methods.
+        scheduler: Optional RequestScheduler admitting every request attempt by
+            priority within its concurrency limits.
+        coalesce_requests: Share one upstream call between identical GET
+            requests (and order plan queries) that are in flight at the same time.
+        http_cache: Optional HTTPCache storing GET responses, revalidated with
+            ``If-None-Match``/``If-Modified-Since`` when they carry validators.
         **kwargs: Additional arguments passed to the base AsyncHTTPTransport.
             Common parameters include:
             - http2 (bool): Enable HTTP/2 support
@@ -549,7 +929,7 @@ def create_resilient_transport(
 
     Note:
         StockTrim API simplifications compared to other APIs:
-        - No rate limiting (429) handling - StockTrim doesn't rate limit
+        - No 429 handling unless client-side rate limiting is enabled
         - No pagination transport - StockTrim doesn't use pagination
         - Only retries 5xx errors on idempotent methods (GET, HEAD, OPTIONS, TRACE)
 
@@ -570,7 +950,15 @@ def create_resilient_transport(
 
     # Build the transport chain from inside out:
     # 1. Base AsyncHTTPTransport
-    base_transport = AsyncHTTPTransport(**kwargs)
+    base_transport: AsyncHTTPTransport = AsyncHTTPTransport(**kwargs)
+
+    # Optionally decode response bodies with a faster JSON parser
+    decoder_name, decoder = get_json_decoder(json_decoder)
+    if decoder_name != "stdlib":
+        base_transport = JSONDecodingTransport(
+            decoder=decoder,
+            wrapped_transport=base_transport,
+        )
 
     # 2. Wrap with StockTrim api-auth-signature header
     # Note: api-auth-id is handled by AuthenticatedClient's native mechanism
@@ -585,6 +973,38 @@ def create_resilient_transport(
         logger=logger,
     )
 
+    # Optionally pace each attempt (inside the retry layer so retries wait too)
+    limited_transport: AsyncHTTPTransport = error_logging_transport
+    status_forcelist = [502, 503, 504]  # Only 5xx server errors
+    if rate_limiter is not None:
+        limited_transport = RateLimitingTransport(
+            limiter=rate_limiter,
+            wrapped_transport=error_logging_transport,
+        )
+        status_forcelist.append(429)
+
+    # Optionally admit attempts by priority (before they queue for a rate token)
+    if scheduler is not None:
+        limited_transport = SchedulingTransport(
+            scheduler=scheduler,
+            wrapped_transport=limited_transport,
+        )
+
+    # Optionally share identical in-flight reads (before they take a slot)
+    if coalesce_requests:
+        limited_transport = CoalescingTransport(
+            wrapped_transport=limited_transport,
+            decoder=decoder if decoder_name != "stdlib" else None,
+        )
+
+    # Optionally answer GETs from the cache (before any other limiting layer)
+    if http_cache is not None:
+        limited_transport = CachingTransport(
+            cache=http_cache,
+            wrapped_transport=limited_transport,
+            decoder=decoder if decoder_name != "stdlib" else None,
+        )
+
     # 4. Finally wrap with retry logic (outermost layer)
     # Use IdempotentOnlyRetry which only retries idempotent methods for 5xx errors
     retry = IdempotentOnlyRetry(
@@ -592,7 +1012,7 @@ def create_resilient_transport(
         backoff_factor=1.0,  # Exponential backoff: 1, 2, 4, 8, 16 seconds
         total_timeout=total_retry_timeout,  # Cumulative cap on retry sleep time
         respect_retry_after_header=True,  # Honor server's Retry-After header if present
-        status_forcelist=[502, 503, 504],  # Only 5xx server errors (no 429)
+        status_forcelist=status_forcelist,
         allowed_methods=[
             "HEAD",
             "GET",
@@ -605,7 +1025,7 @@ def create_resilient_transport(
         ],  # Accept all, filter in is_retryable_status_code
     )
     retry_transport = RetryTransport(
-        transport=error_logging_transport,
+        transport=limited_transport,
         retry=retry,
     )
 
@@ -626,7 +1046,7 @@ class StockTrimClient(AuthenticatedClient):
     - Minimal configuration - just works out of the box
 
     Simplifications vs other APIs:
-    - No rate limiting handling - StockTrim doesn't rate limit
+    - No rate limiting unless an AdaptiveRateLimiter is passed
     - No automatic pagination - StockTrim API doesn't paginate
     - Only retries idempotent methods (GET, HEAD, OPTIONS, TRACE) on 5xx errors
 
@@ -657,6 +1077,12 @@ class StockTrimClient(AuthenticatedClient):
         max_retries: int = 5,
         logger: logging.Logger | None = None,
         total_retry_timeout: float | None = 60.0,
+        entity_cache: EntityCache | None = None,
+        json_decoder: JSONDecoderName = "stdlib",
+        rate_limiter: AdaptiveRateLimiter | None = None,
+        scheduler: RequestScheduler | None = None,
+        coalesce_requests: bool = False,
+        http_cache: HTTPCache | None = None,
         **httpx_kwargs: Any,
     ):
         """
@@ -673,6 +1099,24 @@ class StockTrimClient(AuthenticatedClient):
             logger: Logger instance for capturing client operations. If None, creates a default logger.
             total_retry_timeout: Cumulative cap (seconds) on sleep time across retry
                 attempts for a single request. Defaults to 60s; pass ``None`` to disable.
+            entity_cache: Optional EntityCache used by the domain helpers to remember
+                lookups such as ``products.find_by_code``. Disabled by default.
+            json_decoder: JSON decoder used to parse response bodies: ``"stdlib"``
+                (default), ``"orjson"``, ``"msgspec"``, or ``"auto"`` to use the
+                fastest one installed. Speeds up large responses such as order
+                plan results.
+            rate_limiter: Optional AdaptiveRateLimiter that paces requests and
+                backs off on 429 responses, which are then retried. Disabled by
+                default.
+            scheduler: Optional RequestScheduler enforcing overall and
+                per-endpoint concurrency limits and admitting requests by
+                priority (see ``request_priority``). Disabled by default.
+            coalesce_requests: Share one upstream call between identical GET
+                requests (and order plan queries) in flight at the same time.
+                Disabled by default.
+            http_cache: Optional HTTPCache storing GET responses (in memory and
+                optionally on disk) and revalidating them with ETag /
+                Last-Modified. Disabled by default.
             **httpx_kwargs: Additional arguments passed to the base AsyncHTTPTransport.
                 Common parameters include:
                 - http2 (bool): Enable HTTP/2 support
@@ -684,6 +1128,7 @@ class StockTrimClient(AuthenticatedClient):
 
         Raises:
             ValueError: If no API credentials are provided and environment variables are not set.
+            ImportError: If ``json_decoder`` names a backend that is not installed.
 
         Note:
             Transport-related parameters (http2, limits, verify, etc.) are correctly
@@ -716,6 +1161,13 @@ class StockTrimClient(AuthenticatedClient):
         self.logger = logger or logging.getLogger(__name__)
         self.max_retries = max_retries
         self.total_retry_timeout = total_retry_timeout
+        self.entity_cache = entity_cache
+        self.json_decoder = get_json_decoder(json_decoder)[0]
+        self.rate_limiter = rate_limiter
+        self.scheduler = scheduler
+        self.coalesce_requests = coalesce_requests
+        self.http_cache = http_cache
+        self.forecast_events = ForecastEvents(logger=self.logger)
 
         # Extract client-level parameters that shouldn't go to the transport
         # Event hooks for observability - start with our defaults
@@ -745,6 +1197,11 @@ class StockTrimClient(AuthenticatedClient):
             api_auth_signature=api_auth_signature,
             max_retries=max_retries,
             total_retry_timeout=total_retry_timeout,
+            json_decoder=self.json_decoder,
+            rate_limiter=rate_limiter,
+            scheduler=scheduler,
+            coalesce_requests=coalesce_requests,
+            http_cache=http_cache,
             logger=self.logger,
             **httpx_kwargs,  # Pass through http2, limits, verify, etc.
         )
@@ -910,8 +1367,12 @@ class StockTrimClient(AuthenticatedClient):
 
 __all__ = [
     "AuthHeaderTransport",
+    "CachingTransport",
+    "CoalescingTransport",
     "ErrorLoggingTransport",
     "IdempotentOnlyRetry",
+    "RateLimitingTransport",
+    "SchedulingTransport",
     "StockTrimClient",
     "create_resilient_transport",
 ]
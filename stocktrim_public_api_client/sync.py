@@ -0,0 +1,286 @@
+"""Incremental product sync against a local SQLite snapshot.
+
+The StockTrim API has no "changed since" filter, so spotting catalog changes
+still means reading every product. What this module avoids is everything
+*downstream* of that read: each product is hashed and compared with the hash
+stored from the previous sync, and only the differences are reported as
+:class:`ProductChange` events. Consumers that mirror the catalog elsewhere
+(an ERP, a warehouse table) then do work proportional to churn rather than
+catalog size.
+
+Example:
+    ```python
+    from stocktrim_public_api_client import StockTrimClient
+    from stocktrim_public_api_client.sync import ChangeType, ProductSync
+
+    async with StockTrimClient() as client:
+        with ProductSync(client, "products.sqlite3") as sync:
+            async for change in sync.iter_changes():
+                if change.type is ChangeType.REMOVED:
+                    erp.delete(change.product_id)
+                else:
+                    erp.upsert(change.product)
+            print(sync.watermark)
+    ```
+
+The snapshot is only updated once a full pass completes. If a sync is
+interrupted (error, cancellation, or the consumer stops iterating) nothing is
+written, and the next sync reports the same changes again, so consumers
+should apply events idempotently.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+from collections.abc import AsyncIterator
+from contextlib import aclosing
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from enum import StrEnum
+from pathlib import Path
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, cast
+
+from stocktrim_public_api_client.generated.models.products_response_dto import (
+    ProductsResponseDto,
+)
+from stocktrim_public_api_client.helpers.pagination import DEFAULT_CONCURRENCY
+
+if TYPE_CHECKING:
+    from stocktrim_public_api_client.stocktrim_client import StockTrimClient
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS products (
+    product_id TEXT PRIMARY KEY,
+    content_hash TEXT NOT NULL,
+    payload TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+class ChangeType(StrEnum):
+    """Kind of difference between the stored snapshot and the live catalog."""
+
+    ADDED = "added"
+    CHANGED = "changed"
+    REMOVED = "removed"
+
+
+@dataclass(frozen=True)
+class ProductChange:
+    """A single product difference found during a sync.
+
+    Attributes:
+        type: Whether the product was added, changed or removed.
+        product_id: StockTrim product ID.
+        product: Current product for added/changed events; the last stored
+            copy for removed events.
+    """
+
+    type: ChangeType
+    product_id: str
+    product: ProductsResponseDto
+
+
+@dataclass(frozen=True)
+class SyncReport:
+    """Summary of a completed sync.
+
+    Attributes:
+        added: Number of products added since the previous sync.
+        changed: Number of products whose content changed.
+        removed: Number of products no longer present.
+        unchanged: Number of products with identical content.
+        watermark: Time (UTC) the sync started; stored as the new watermark.
+    """
+
+    added: int
+    changed: int
+    removed: int
+    unchanged: int
+    watermark: datetime
+
+    @property
+    def total_changes(self) -> int:
+        """Number of change events emitted."""
+        return self.added + self.changed + self.removed
+
+
+def content_hash(product: ProductsResponseDto) -> str:
+    """Stable hash of a product's content.
+
+    Args:
+        product: Product to hash.
+
+    Returns:
+        Hex SHA-256 digest of the product's canonical JSON form.
+    """
+    return _sha256(_canonical_json(product.to_dict()))
+
+
+def _canonical_json(data: dict[str, Any]) -> str:
+    return json.dumps(data, sort_keys=True, separators=(",", ":"), default=str)
+
+
+def _sha256(text: str) -> str:
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+class ProductSync:
+    """Diff the live product catalog against a snapshot stored in SQLite.
+
+    Args:
+        client: StockTrimClient used to read the catalog.
+        path: SQLite database file holding the snapshot. Created on first use.
+            Pass ``":memory:"`` for a throwaway snapshot.
+        concurrency: Maximum number of product pages fetched at once.
+    """
+
+    def __init__(
+        self,
+        client: StockTrimClient,
+        path: str | Path,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> None:
+        self._client = client
+        self._concurrency = concurrency
+        self._db = sqlite3.connect(str(path), isolation_level=None)
+        self._db.executescript(_SCHEMA)
+
+    def __enter__(self) -> ProductSync:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._db.close()
+
+    @property
+    def watermark(self) -> datetime | None:
+        """Start time (UTC) of the last completed sync, or None if never synced."""
+        value = self._get_meta("watermark")
+        return datetime.fromisoformat(value) if value else None
+
+    def __len__(self) -> int:
+        """Number of products in the stored snapshot."""
+        return self._db.execute("SELECT COUNT(*) FROM products").fetchone()[0]
+
+    async def iter_changes(self) -> AsyncIterator[ProductChange]:
+        """Stream the differences between the snapshot and the live catalog.
+
+        Added and changed products are yielded as their pages arrive; removed
+        products are yielded after the last page. Nothing is written while
+        events are being yielded: the new snapshot and watermark are stored in
+        one short transaction after the last event, so the database is never
+        locked while the consumer handles an event, and a sync that stops
+        early leaves the snapshot untouched.
+
+        Yields:
+            ProductChange events.
+        """
+        watermark = datetime.now(UTC)
+        stored = dict(self._db.execute("SELECT product_id, content_hash FROM products"))
+        seen: set[str] = set()
+        upserts: list[tuple[str, str, str]] = []
+
+        products = self._client.products.iter_all(concurrency=self._concurrency)
+        async with aclosing(products):
+            async for product in products:
+                payload = _canonical_json(product.to_dict())
+                digest = _sha256(payload)
+                previous = stored.get(product.product_id)
+                seen.add(product.product_id)
+                if previous == digest:
+                    continue
+                stored[product.product_id] = digest
+                upserts.append((product.product_id, digest, payload))
+                yield ProductChange(
+                    ChangeType.CHANGED if previous else ChangeType.ADDED,
+                    product.product_id,
+                    product,
+                )
+
+        removed = [product_id for product_id in stored if product_id not in seen]
+        for product_id in removed:
+            row = self._db.execute(
+                "SELECT payload FROM products WHERE product_id = ?", (product_id,)
+            ).fetchone()
+            yield ProductChange(
+                ChangeType.REMOVED,
+                product_id,
+                ProductsResponseDto.from_dict(json.loads(row[0])),
+            )
+
+        self._store(watermark, upserts, removed)
+
+    async def run(self) -> SyncReport:
+        """Run a full sync, discarding the individual events.
+
+        Returns:
+            Counts of added, changed, removed and unchanged products.
+        """
+        counts = dict.fromkeys(ChangeType, 0)
+        async for change in self.iter_changes():
+            counts[change.type] += 1
+        # iter_changes() stores the watermark once the pass completes
+        watermark = cast(datetime, self.watermark)
+        return SyncReport(
+            added=counts[ChangeType.ADDED],
+            changed=counts[ChangeType.CHANGED],
+            removed=counts[ChangeType.REMOVED],
+            unchanged=len(self) - counts[ChangeType.ADDED] - counts[ChangeType.CHANGED],
+            watermark=watermark,
+        )
+
+    def _store(
+        self,
+        watermark: datetime,
+        upserts: list[tuple[str, str, str]],
+        removed: list[str],
+    ) -> None:
+        """Apply one completed pass to the snapshot in a single transaction."""
+        self._db.execute("BEGIN")
+        try:
+            self._db.executemany(
+                "INSERT INTO products (product_id, content_hash, payload)"
+                " VALUES (?, ?, ?)"
+                " ON CONFLICT (product_id) DO UPDATE SET"
+                " content_hash = excluded.content_hash,"
+                " payload = excluded.payload",
+                upserts,
+            )
+            self._db.executemany(
+                "DELETE FROM products WHERE product_id = ?",
+                [(product_id,) for product_id in removed],
+            )
+            self._set_meta("watermark", watermark.isoformat())
+        except BaseException:
+            self._db.execute("ROLLBACK")
+            raise
+        self._db.execute("COMMIT")
+
+    def _get_meta(self, key: str) -> str | None:
+        row = self._db.execute(
+            "SELECT value FROM meta WHERE key = ?", (key,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value: str) -> None:
+        self._db.execute(
+            "INSERT INTO meta (key, value) VALUES (?, ?)"
+            " ON CONFLICT (key) DO UPDATE SET value = excluded.value",
+            (key, value),
+        )
@@ -0,0 +1,98 @@
+"""Tests for chunked, concurrent bulk submission."""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from stocktrim_public_api_client.generated.models import (
+    ProductsRequestDto,
+    ProductsResponseDto,
+)
+from stocktrim_public_api_client.helpers.bulk import submit_many
+from stocktrim_public_api_client.helpers.products import Products
+from stocktrim_public_api_client.utils import ValidationError
+
+
+class FakeSubmitter:
+    """Echoes items back, failing for negative ones, and tracks concurrency."""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def __call__(self, item: int) -> int:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.001 * (item % 3))
+            if item < 0:
+                raise ValueError(f"bad item {item}")
+            return item * 10
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("chunk_size", "concurrency"), [(1, 1), (5, 3), (100, 8)])
+async def test_submit_many_reports_every_item_in_order(chunk_size, concurrency):
+    submit = FakeSubmitter()
+    items = [0, 1, -2, 3, 4, -5, 6]
+
+    report = await submit_many(
+        items, submit, chunk_size=chunk_size, concurrency=concurrency
+    )
+
+    assert [r.index for r in report.results] == list(range(len(items)))
+    assert [r.result for r in report.succeeded] == [0, 10, 30, 40, 60]
+    assert [r.item for r in report.failed] == [-2, -5]
+    assert all(isinstance(r.error, ValueError) for r in report.failed)
+    assert submit.max_in_flight <= concurrency
+
+
+@pytest.mark.asyncio
+async def test_submit_many_reads_generators_chunk_by_chunk():
+    consumed: list[int] = []
+    submitted_before: list[int] = []
+
+    def items():
+        for i in range(6):
+            consumed.append(i)
+            yield i
+
+    async def submit(item: int) -> int:
+        submitted_before.append(len(consumed))
+        return item
+
+    report = await submit_many(items(), submit, chunk_size=2)
+
+    assert len(report) == 6
+    # No item is submitted before its whole chunk is read, and no later
+    assert submitted_before == [2, 2, 4, 4, 6, 6]
+
+
+@pytest.mark.asyncio
+async def test_submit_many_rejects_invalid_limits():
+    with pytest.raises(ValueError, match="chunk_size"):
+        await submit_many([1], AsyncMock(), chunk_size=0)
+    with pytest.raises(ValueError, match="concurrency"):
+        await submit_many([1], AsyncMock(), concurrency=0)
+
+
+@pytest.mark.asyncio
+async def test_products_upsert_many_uses_create(monkeypatch):
+    products = Products(Mock())
+    requests = [ProductsRequestDto(product_id=str(i)) for i in range(3)]
+
+    async def fake_create(product):
+        if product.product_id == "1":
+            raise ValidationError("Invalid product", 400)
+        return ProductsResponseDto(product_id=product.product_id)
+
+    monkeypatch.setattr(products, "create", fake_create)
+
+    report = await products.upsert_many(requests, chunk_size=2, concurrency=2)
+
+    assert [r.result.product_id for r in report.succeeded] == ["0", "2"]
+    assert [r.item.product_id for r in report.failed] == ["1"]
+    assert isinstance(report.failed[0].error, ValidationError)
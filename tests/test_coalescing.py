@@ -0,0 +1,164 @@
+"""Tests for single-flight coalescing of identical in-flight requests."""
+
+import asyncio
+import gzip
+import json
+
+import httpx
+import pytest
+
+from stocktrim_public_api_client.json_decoding import get_json_decoder
+from stocktrim_public_api_client.stocktrim_client import (
+    CoalescingTransport,
+    create_resilient_transport,
+)
+
+
+class GatedUpstream:
+    """Mock upstream that holds responses until released and counts calls."""
+
+    def __init__(self, status_code: int = 200):
+        self.status_code = status_code
+        self.calls: list[tuple[str, str, bytes]] = []
+        self.release = asyncio.Event()
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.calls.append((request.method, request.url.path, request.content))
+        await self.release.wait()
+        body = json.dumps({"path": request.url.path}).encode()
+        return httpx.Response(
+            self.status_code,
+            headers={"content-encoding": "gzip"},
+            content=gzip.compress(body),
+        )
+
+
+async def _gather_requests(transport, *requests):
+    async with httpx.AsyncClient(
+        transport=transport, base_url="https://api.example.com"
+    ) as client:
+        return await asyncio.gather(*(client.request(*r[:2], **r[2]) for r in requests))
+
+
+@pytest.mark.asyncio
+async def test_identical_gets_share_one_upstream_call():
+    upstream = GatedUpstream()
+    transport = CoalescingTransport(httpx.MockTransport(upstream))
+
+    async def release_soon():
+        await asyncio.sleep(0.01)
+        upstream.release.set()
+
+    responses, _ = await asyncio.gather(
+        _gather_requests(
+            transport,
+            *[("GET", "/api/Products", {"params": {"code": "W-1"}})] * 3,
+            ("GET", "/api/Products", {"params": {"code": "W-2"}}),
+        ),
+        release_soon(),
+    )
+
+    assert len(upstream.calls) == 2
+    assert transport.coalesced == 2
+    assert [r.json() for r in responses] == [{"path": "/api/Products"}] * 4
+    assert {r.request.url.params["code"] for r in responses} == {"W-1", "W-2"}
+    assert not transport._in_flight
+
+
+@pytest.mark.asyncio
+async def test_read_only_posts_coalesce_by_body_and_writes_never_do():
+    upstream = GatedUpstream()
+    transport = CoalescingTransport(httpx.MockTransport(upstream))
+
+    async def release_soon():
+        await asyncio.sleep(0.01)
+        upstream.release.set()
+
+    await asyncio.gather(
+        _gather_requests(
+            transport,
+            ("POST", "/api/OrderPlan", {"json": {"supplier": "A"}}),
+            ("POST", "/api/OrderPlan", {"json": {"supplier": "A"}}),
+            ("POST", "/api/OrderPlan", {"json": {"supplier": "B"}}),
+            ("POST", "/api/Products", {"json": {"code": "W-1"}}),
+            ("POST", "/api/Products", {"json": {"code": "W-1"}}),
+        ),
+        release_soon(),
+    )
+
+    assert sorted((p, body) for _, p, body in upstream.calls) == [
+        ("/api/OrderPlan", b'{"supplier":"A"}'),
+        ("/api/OrderPlan", b'{"supplier":"B"}'),
+        ("/api/Products", b'{"code":"W-1"}'),
+        ("/api/Products", b'{"code":"W-1"}'),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_cancelling_first_caller_does_not_fail_followers():
+    upstream = GatedUpstream()
+    transport = CoalescingTransport(httpx.MockTransport(upstream))
+    first = asyncio.create_task(
+        transport.handle_async_request(httpx.Request("GET", "https://x/api/Products"))
+    )
+    await asyncio.sleep(0)
+    second = asyncio.create_task(
+        transport.handle_async_request(httpx.Request("GET", "https://x/api/Products"))
+    )
+    await asyncio.sleep(0)
+
+    first.cancel()
+    upstream.release.set()
+    response = await second
+
+    assert first.cancelled()
+    assert response.status_code == 200
+    assert len(upstream.calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_upstream_errors_reach_every_caller():
+    async def failing(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.01)
+        raise httpx.ConnectError("boom", request=request)
+
+    transport = CoalescingTransport(httpx.MockTransport(failing))
+    requests = [httpx.Request("GET", "https://x/api/Products") for _ in range(2)]
+
+    results = await asyncio.gather(
+        *(transport.handle_async_request(r) for r in requests),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(r, httpx.ConnectError) for r in results)
+    assert not transport._in_flight
+
+
+@pytest.mark.asyncio
+async def test_shared_copies_use_configured_decoder():
+    pytest.importorskip("orjson")
+    upstream = GatedUpstream()
+    _, decoder = get_json_decoder("orjson")
+    transport = CoalescingTransport(httpx.MockTransport(upstream), decoder=decoder)
+    upstream.release.set()
+
+    first, second = await asyncio.gather(
+        *(
+            transport.handle_async_request(
+                httpx.Request("GET", "https://x/api/Products")
+            )
+            for _ in range(2)
+        )
+    )
+
+    # The follower's response is a copy that still decodes with orjson
+    assert "json" in vars(second)
+    assert first.json() == second.json() == {"path": "/api/Products"}
+
+
+def test_resilient_transport_adds_coalescing_layer():
+    transport, _ = create_resilient_transport(
+        api_auth_signature="sig", coalesce_requests=True
+    )
+
+    assert isinstance(transport._async_transport, CoalescingTransport)
@@ -0,0 +1,144 @@
+"""Tests for column-oriented order plan results."""
+
+import datetime
+import json
+import sys
+from unittest.mock import Mock
+
+import httpx
+import pytest
+
+from stocktrim_public_api_client.columnar import ColumnarResults, column_kinds
+from stocktrim_public_api_client.generated.models import (
+    OrderPlanFilterCriteria,
+    SkuOptimizedResultsDto,
+)
+from stocktrim_public_api_client.helpers.order_plan import OrderPlan
+
+ROWS = [
+    {
+        "productCode": "A",
+        "orderQuantity": 5.5,
+        "daysUntilStockOut": 3,
+        "isUncertain": True,
+        "calculatedDateTime": "2024-05-01T10:30:00.1234567",
+        "avgDailyOrdersLast120Days": 1.5,
+    },
+    {
+        "productCode": "B",
+        "orderQuantity": None,
+        "calculatedDateTime": "2024-05-01T12:30:00+02:00",
+        "variants": [{"id": 1}],
+    },
+]
+
+COLUMNS = [
+    "product_code",
+    "order_quantity",
+    "days_until_stock_out",
+    "is_uncertain",
+    "calculated_date_time",
+]
+
+
+def test_column_kinds_cover_scalar_fields_only():
+    kinds = column_kinds(SkuOptimizedResultsDto)
+
+    assert kinds["product_code"] == ("productCode", "str")
+    assert kinds["order_quantity"] == ("orderQuantity", "float")
+    assert kinds["calculated_date_time"] == ("calculatedDateTime", "datetime")
+    assert kinds["avg_daily_orders_last_120_days"][0] == "avgDailyOrdersLast120Days"
+    assert "variants" not in kinds
+
+
+def test_extend_collects_columns():
+    results = ColumnarResults(SkuOptimizedResultsDto, COLUMNS)
+    results.extend(ROWS)
+
+    assert len(results) == 2
+    assert results.column_names == COLUMNS
+    assert results.column("product_code") == ["A", "B"]
+    assert results.column("order_quantity") == [5.5, None]
+    assert results.column("days_until_stock_out") == [3, None]
+    assert results.column("calculated_date_time") == [
+        datetime.datetime(2024, 5, 1, 10, 30, 0, 123456, tzinfo=datetime.UTC),
+        datetime.datetime(2024, 5, 1, 10, 30, tzinfo=datetime.UTC),
+    ]
+
+
+def test_unknown_columns_are_rejected():
+    with pytest.raises(ValueError, match="variants"):
+        ColumnarResults(SkuOptimizedResultsDto, ["product_code", "variants"])
+
+
+def test_to_numpy_types():
+    np = pytest.importorskip("numpy")
+    results = ColumnarResults(SkuOptimizedResultsDto, COLUMNS)
+    results.extend(ROWS)
+
+    arrays = results.to_numpy()
+
+    assert arrays["order_quantity"].dtype == np.float64
+    assert np.isnan(arrays["order_quantity"][1])
+    assert arrays["days_until_stock_out"].dtype == np.float64
+    assert arrays["calculated_date_time"].dtype == np.dtype("datetime64[us]")
+    assert arrays["product_code"].tolist() == ["A", "B"]
+
+
+def test_to_arrow_and_parquet_round_trip(tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+    results = ColumnarResults(SkuOptimizedResultsDto, COLUMNS)
+    results.extend(ROWS)
+
+    table = results.to_arrow()
+    assert table.num_rows == 2
+    assert table.schema.field("days_until_stock_out").type == pa.int64()
+    assert table.schema.field("calculated_date_time").type == pa.timestamp(
+        "us", tz="UTC"
+    )
+    assert table.column("order_quantity").to_pylist() == [5.5, None]
+
+    path = tmp_path / "order_plan.parquet"
+    results.write_parquet(path)
+    assert pq.read_table(path).equals(table)
+
+
+def test_missing_backend_raises_import_error(monkeypatch):
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+
+    with pytest.raises(ImportError, match="pip install pyarrow"):
+        ColumnarResults(SkuOptimizedResultsDto).to_arrow()
+
+
+@pytest.mark.asyncio
+async def test_order_plan_query_columns_follows_pages():
+    requested: list[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        page = json.loads(request.content)["page"]
+        requested.append(page)
+        return httpx.Response(
+            200,
+            json={
+                "results": [{"productCode": f"P{page}", "orderQuantity": page}],
+                "filterCriteria": {"page": page, "hasNextPage": page < 2},
+            },
+        )
+
+    client = Mock()
+    client.raise_on_unexpected_status = False
+    client.get_async_httpx_client.return_value = httpx.AsyncClient(
+        base_url="https://api.test", transport=httpx.MockTransport(handler)
+    )
+
+    results = await OrderPlan(client).query_columns(
+        OrderPlanFilterCriteria(location="WH-1"),
+        per_page=1,
+        concurrency=1,
+        columns=["product_code", "order_quantity"],
+    )
+
+    assert requested == [0, 1, 2]
+    assert results.column("product_code") == ["P0", "P1", "P2"]
+    assert results.column("order_quantity") == [0, 1, 2]
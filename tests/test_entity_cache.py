@@ -0,0 +1,252 @@
+"""Tests for the opt-in entity cache and its use by the domain helpers."""
+
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from stocktrim_public_api_client import EntityCache
+from stocktrim_public_api_client.entity_cache import PRODUCT, SUPPLIER
+from stocktrim_public_api_client.generated.models.customer_dto import CustomerDto
+from stocktrim_public_api_client.generated.models.products_request_dto import (
+    ProductsRequestDto,
+)
+from stocktrim_public_api_client.generated.models.products_response_dto import (
+    ProductsResponseDto,
+)
+from stocktrim_public_api_client.generated.models.supplier_request_dto import (
+    SupplierRequestDto,
+)
+from stocktrim_public_api_client.generated.models.supplier_response_dto import (
+    SupplierResponseDto,
+)
+from stocktrim_public_api_client.helpers.customers import Customers
+from stocktrim_public_api_client.helpers.products import Products
+from stocktrim_public_api_client.helpers.suppliers import Suppliers
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _ok(parsed):
+    response = Mock()
+    response.status_code = 200
+    response.parsed = parsed
+    return response
+
+
+def _client_with_cache(**kwargs) -> Mock:
+    client = Mock()
+    client.entity_cache = EntityCache(**kwargs)
+    return client
+
+
+class TestEntityCache:
+    def test_get_returns_stored_value_until_ttl_expires(self):
+        clock = FakeClock()
+        cache = EntityCache(ttl=10, clock=clock)
+        cache.put(PRODUCT, ["WIDGET-001"], "widget")
+
+        clock.now = 9.9
+        assert cache.get(PRODUCT, "WIDGET-001") == "widget"
+
+        clock.now = 10.0
+        assert cache.get(PRODUCT, "WIDGET-001") is None
+        assert len(cache) == 0
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_keys_are_scoped_by_entity_type(self):
+        cache = EntityCache()
+        cache.put(PRODUCT, ["ABC"], "product")
+
+        assert cache.get(SUPPLIER, "ABC") is None
+        assert cache.get(PRODUCT, "ABC") == "product"
+
+    def test_least_recently_used_entries_are_evicted(self):
+        cache = EntityCache(max_size=2)
+        cache.put(PRODUCT, ["A"], "a")
+        cache.put(PRODUCT, ["B"], "b")
+        cache.get(PRODUCT, "A")  # B is now least recently used
+        cache.put(PRODUCT, ["C"], "c")
+
+        assert cache.get(PRODUCT, "A") == "a"
+        assert cache.get(PRODUCT, "B") is None
+        assert cache.get(PRODUCT, "C") == "c"
+
+    def test_invalidating_one_code_drops_every_alias(self):
+        cache = EntityCache()
+        cache.put(PRODUCT, ["WIDGET-001", "123", None, ""], "widget")
+        assert len(cache) == 2
+
+        cache.invalidate(PRODUCT, "123")
+
+        assert cache.get(PRODUCT, "WIDGET-001") is None
+        assert len(cache) == 0
+
+    def test_invalidate_without_code_drops_whole_entity_type(self):
+        cache = EntityCache()
+        cache.put(PRODUCT, ["A"], "a")
+        cache.put(PRODUCT, ["B"], "b")
+        cache.put(SUPPLIER, ["S"], "s")
+
+        cache.invalidate(PRODUCT)
+
+        assert len(cache) == 1
+        assert cache.get(SUPPLIER, "S") == "s"
+
+    def test_rejects_invalid_configuration(self):
+        with pytest.raises(ValueError, match="ttl"):
+            EntityCache(ttl=0)
+        with pytest.raises(ValueError, match="max_size"):
+            EntityCache(max_size=0)
+
+
+class TestProductsCaching:
+    @pytest.mark.asyncio
+    async def test_find_by_code_is_served_from_cache(self, monkeypatch):
+        product = ProductsResponseDto(
+            product_id="123", product_code_readable="WIDGET-001"
+        )
+        get_mock = AsyncMock(return_value=_ok([product]))
+        import stocktrim_public_api_client.generated.api.products.get_api_products as get_module
+
+        monkeypatch.setattr(get_module, "asyncio_detailed", get_mock)
+        products = Products(_client_with_cache())
+
+        assert await products.find_by_code("WIDGET-001") is product
+        assert await products.find_by_code("WIDGET-001") is product
+        assert await products.exists("WIDGET-001")
+        get_mock.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_missing_products_are_not_cached(self, monkeypatch):
+        get_mock = AsyncMock(return_value=_ok([]))
+        import stocktrim_public_api_client.generated.api.products.get_api_products as get_module
+
+        monkeypatch.setattr(get_module, "asyncio_detailed", get_mock)
+        products = Products(_client_with_cache())
+
+        assert await products.find_by_code("NOPE") is None
+        assert await products.find_by_code("NOPE") is None
+        assert get_mock.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_create_invalidates_cached_product(self, monkeypatch):
+        product = ProductsResponseDto(
+            product_id="123", product_code_readable="WIDGET-001"
+        )
+        get_mock = AsyncMock(return_value=_ok([product]))
+        import stocktrim_public_api_client.generated.api.products.get_api_products as get_module
+        import stocktrim_public_api_client.generated.api.products.post_api_products as post_module
+
+        monkeypatch.setattr(get_module, "asyncio_detailed", get_mock)
+        monkeypatch.setattr(
+            post_module, "asyncio_detailed", AsyncMock(return_value=_ok(product))
+        )
+        products = Products(_client_with_cache())
+
+        await products.find_by_code("WIDGET-001")
+        await products.create(ProductsRequestDto(product_id="123"))
+        await products.find_by_code("WIDGET-001")
+
+        assert get_mock.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_delete_invalidates_cached_product(self, monkeypatch):
+        product = ProductsResponseDto(
+            product_id="123", product_code_readable="WIDGET-001"
+        )
+        get_mock = AsyncMock(return_value=_ok([product]))
+        import stocktrim_public_api_client.generated.api.products.delete_api_products as delete_module
+        import stocktrim_public_api_client.generated.api.products.get_api_products as get_module
+
+        monkeypatch.setattr(get_module, "asyncio_detailed", get_mock)
+        monkeypatch.setattr(delete_module, "asyncio_detailed", AsyncMock())
+        products = Products(_client_with_cache())
+
+        await products.find_by_code("WIDGET-001")
+        await products.delete(product_id="123")
+        await products.find_by_code("WIDGET-001")
+
+        assert get_mock.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_no_cache_when_client_has_none(self, monkeypatch):
+        """Helpers built on a plain client (or a Mock) never cache."""
+        get_mock = AsyncMock(return_value=_ok([ProductsResponseDto(product_id="1")]))
+        import stocktrim_public_api_client.generated.api.products.get_api_products as get_module
+
+        monkeypatch.setattr(get_module, "asyncio_detailed", get_mock)
+        products = Products(Mock())
+
+        await products.find_by_code("1")
+        await products.find_by_code("1")
+
+        assert get_mock.await_count == 2
+
+
+class TestSuppliersCaching:
+    @pytest.mark.asyncio
+    async def test_create_and_delete_by_name_invalidate(self, monkeypatch):
+        supplier = SupplierResponseDto(supplier_code="SUP-001", supplier_name="Acme")
+        get_mock = AsyncMock(return_value=_ok(supplier))
+        import stocktrim_public_api_client.generated.api.suppliers.delete_api_suppliers as delete_module
+        import stocktrim_public_api_client.generated.api.suppliers.get_api_suppliers as get_module
+        import stocktrim_public_api_client.generated.api.suppliers.post_api_suppliers as post_module
+
+        monkeypatch.setattr(get_module, "asyncio_detailed", get_mock)
+        monkeypatch.setattr(
+            post_module, "asyncio_detailed", AsyncMock(return_value=_ok([supplier]))
+        )
+        monkeypatch.setattr(delete_module, "asyncio_detailed", AsyncMock())
+        suppliers = Suppliers(_client_with_cache())
+
+        await suppliers.find_by_code("SUP-001")
+        await suppliers.find_by_code("SUP-001")
+        assert get_mock.await_count == 1
+
+        await suppliers.create_one(SupplierRequestDto(supplier_code="SUP-001"))
+        await suppliers.find_by_code("SUP-001")
+        assert get_mock.await_count == 2
+
+        await suppliers.delete(supplier_code_or_name="Acme")
+        await suppliers.find_by_code("SUP-001")
+        assert get_mock.await_count == 3
+
+
+class TestCustomersCaching:
+    @pytest.mark.asyncio
+    async def test_get_is_cached_until_update(self, monkeypatch):
+        customer = CustomerDto(code="CUST-001", name="Customer")
+        get_mock = AsyncMock(return_value=_ok(customer))
+        import stocktrim_public_api_client.generated.api.customers.get_api_customers_code as get_module
+        import stocktrim_public_api_client.generated.api.customers.put_api_customers as put_module
+
+        monkeypatch.setattr(get_module, "asyncio_detailed", get_mock)
+        monkeypatch.setattr(
+            put_module, "asyncio_detailed", AsyncMock(return_value=_ok([customer]))
+        )
+        customers = Customers(_client_with_cache())
+
+        assert await customers.get("CUST-001") is customer
+        assert await customers.exists("CUST-001")
+        assert get_mock.await_count == 1
+
+        await customers.update(CustomerDto(code="CUST-001", name="Renamed"))
+        await customers.get("CUST-001")
+        assert get_mock.await_count == 2
+
+
+def test_client_accepts_entity_cache(mock_api_credentials):
+    from stocktrim_public_api_client import StockTrimClient
+
+    cache = EntityCache(ttl=5)
+    client = StockTrimClient(**mock_api_credentials, entity_cache=cache)
+
+    assert client.entity_cache is cache
+    assert client.products._entity_cache is cache
+    assert StockTrimClient(**mock_api_credentials).entity_cache is None
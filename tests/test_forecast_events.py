@@ -0,0 +1,132 @@
+"""Tests for forecast completion events and their use by the forecasting helper."""
+
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+import stocktrim_public_api_client.generated.api.processing_status.get_api_processing_status as status_module
+import stocktrim_public_api_client.generated.api.run_forecast_calculations.post_api_run_forecast_calculations as run_module
+from stocktrim_public_api_client import ForecastEvents, StockTrimClient
+from stocktrim_public_api_client.generated.models.processing_status_response_dto import (
+    ProcessingStatusResponseDto,
+)
+from stocktrim_public_api_client.helpers.forecasting import Forecasting
+
+
+def _status(is_processing: bool, percentage: int = 0) -> ProcessingStatusResponseDto:
+    return ProcessingStatusResponseDto(
+        is_processing=is_processing, percentage_complete=percentage
+    )
+
+
+def _ok(parsed):
+    response = Mock()
+    response.status_code = 200
+    response.parsed = parsed
+    return response
+
+
+class TestForecastEvents:
+    @pytest.mark.asyncio
+    async def test_running_to_done_notifies_once(self):
+        events = ForecastEvents(clock=lambda: 1234.0)
+        seen = []
+        events.subscribe(seen.append)
+
+        assert not await events.observe(_status(False))
+        assert not await events.observe(_status(True, 40))
+        assert events.processing
+        assert await events.observe(_status(False, 100))
+        assert not await events.observe(_status(False, 100))
+
+        assert len(seen) == 1
+        assert seen[0].completed_at == 1234.0
+        assert seen[0].generation == events.generation == 1
+        assert events.last_completed is seen[0]
+
+    @pytest.mark.asyncio
+    async def test_triggered_run_counts_even_if_never_seen_running(self):
+        events = ForecastEvents()
+        seen = []
+        events.subscribe(seen.append)
+
+        events.mark_started()
+        await events.observe(_status(False))
+
+        assert len(seen) == 1
+
+    @pytest.mark.asyncio
+    async def test_async_listeners_are_awaited(self):
+        events = ForecastEvents()
+        listener = AsyncMock()
+        events.subscribe(listener)
+
+        events.mark_started()
+        await events.observe(_status(False))
+
+        listener.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_failing_listener_does_not_stop_others(self, caplog):
+        events = ForecastEvents()
+        seen = []
+        events.subscribe(Mock(side_effect=RuntimeError("boom")))
+        events.subscribe(seen.append)
+
+        events.mark_started()
+        assert await events.observe(_status(False))
+
+        assert len(seen) == 1
+        assert "listener failed" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_unsubscribe(self):
+        events = ForecastEvents()
+        seen = []
+        unsubscribe = events.subscribe(seen.append)
+        unsubscribe()
+        unsubscribe()
+
+        events.mark_started()
+        await events.observe(_status(False))
+
+        assert seen == []
+
+
+class TestForecastingPublishesEvents:
+    @pytest.mark.asyncio
+    async def test_wait_for_completion_publishes_completion(self, monkeypatch):
+        monkeypatch.setattr(
+            run_module, "asyncio_detailed", AsyncMock(return_value=_ok(Mock()))
+        )
+        monkeypatch.setattr(
+            status_module,
+            "asyncio_detailed",
+            AsyncMock(side_effect=[_ok(_status(True, 50)), _ok(_status(False, 100))]),
+        )
+        client = Mock()
+        client.forecast_events = ForecastEvents()
+        seen = []
+        client.forecast_events.subscribe(seen.append)
+        forecasting = Forecasting(client)
+
+        await forecasting.run_calculations()
+        status = await forecasting.wait_for_completion(poll_interval=0)
+
+        assert status.is_processing is False
+        assert [event.status for event in seen] == [status]
+
+    @pytest.mark.asyncio
+    async def test_client_without_events_still_works(self, monkeypatch):
+        monkeypatch.setattr(
+            status_module,
+            "asyncio_detailed",
+            AsyncMock(return_value=_ok(_status(False))),
+        )
+
+        status = await Forecasting(Mock(spec=[])).get_processing_status()
+
+        assert status.is_processing is False
+
+    def test_client_has_forecast_events(self, stocktrim_client: StockTrimClient):
+        assert isinstance(stocktrim_client.forecast_events, ForecastEvents)
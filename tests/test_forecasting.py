@@ -0,0 +1,135 @@
+"""Tests for adaptive, shared polling in Forecasting.wait_for_completion."""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from stocktrim_public_api_client.generated.models.processing_status_response_dto import (
+    ProcessingStatusResponseDto,
+)
+from stocktrim_public_api_client.helpers.forecasting import (
+    Forecasting,
+    next_poll_delay,
+)
+
+
+def _status(is_processing: bool, percentage: int = 0) -> ProcessingStatusResponseDto:
+    return ProcessingStatusResponseDto(
+        is_processing=is_processing,
+        percentage_complete=percentage,
+        status_message="Processing" if is_processing else "Complete",
+    )
+
+
+def _forecasting(*statuses: ProcessingStatusResponseDto) -> Forecasting:
+    forecasting = Forecasting(Mock(spec=[]))
+    forecasting.get_processing_status = AsyncMock(side_effect=list(statuses))
+    return forecasting
+
+
+class TestNextPollDelay:
+    def test_first_poll_uses_min_interval(self):
+        assert next_poll_delay([(0, 0)], 5, 60, jitter=0) == 5
+
+    def test_schedules_half_the_estimated_remaining_time(self):
+        # 1% per second with 90% to go: about 90s left, so poll in 45s
+        assert next_poll_delay([(0, 0), (10, 10)], 5, 60, jitter=0) == 45
+
+    def test_is_bounded_by_min_and_max_interval(self):
+        assert next_poll_delay([(0, 0), (10, 1)], 5, 60, jitter=0) == 60
+        assert next_poll_delay([(0, 0), (10, 98)], 5, 60, jitter=0) == 5
+
+    def test_backs_off_exponentially_while_stalled(self):
+        samples = [(0, 10), (5, 10), (10, 10)]
+        assert next_poll_delay(samples, 5, 60, jitter=0) == 20
+        assert next_poll_delay([*samples, (30, 10)], 5, 60, jitter=0) == 40
+
+    def test_jitter_spreads_delay(self):
+        delays = {next_poll_delay([(0, 0)], 10, 60, jitter=0.1) for _ in range(20)}
+        assert all(9 <= d <= 11 for d in delays)
+        assert len(delays) > 1
+
+
+class TestWaitForCompletion:
+    @pytest.mark.asyncio
+    async def test_returns_final_status_and_reports_progress(self):
+        forecasting = _forecasting(_status(True, 40), _status(False, 100))
+        seen = []
+
+        status = await forecasting.wait_for_completion(
+            poll_interval=0.01, on_status=seen.append
+        )
+
+        assert status.is_processing is False
+        assert [s.percentage_complete for s in seen] == [40, 100]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_waiters_share_one_poll_loop(self):
+        forecasting = _forecasting(
+            _status(True, 10), _status(True, 50), _status(False, 100)
+        )
+
+        results = await asyncio.gather(
+            *(forecasting.wait_for_completion(poll_interval=0.01) for _ in range(5))
+        )
+
+        assert all(r.is_processing is False for r in results)
+        assert forecasting.get_processing_status.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_timeout_raises_and_stops_polling(self):
+        forecasting = Forecasting(Mock(spec=[]))
+        forecasting.get_processing_status = AsyncMock(return_value=_status(True, 30))
+
+        with pytest.raises(TimeoutError, match=r"30% complete"):
+            await forecasting.wait_for_completion(poll_interval=0.01, timeout=0.05)
+        polls = forecasting.get_processing_status.await_count
+        await asyncio.sleep(0.05)
+
+        assert forecasting.get_processing_status.await_count == polls
+
+    @pytest.mark.asyncio
+    async def test_short_timeout_does_not_end_other_waits(self):
+        forecasting = _forecasting(
+            *[_status(True, 10)] * 5, _status(True, 90), _status(False, 100)
+        )
+
+        short = asyncio.create_task(
+            forecasting.wait_for_completion(poll_interval=0.01, timeout=0.02)
+        )
+        long = asyncio.create_task(
+            forecasting.wait_for_completion(poll_interval=0.01, max_poll_interval=0.02)
+        )
+
+        with pytest.raises(TimeoutError):
+            await short
+        assert (await long).is_processing is False
+
+    @pytest.mark.asyncio
+    async def test_status_errors_reach_every_waiter(self):
+        forecasting = Forecasting(Mock(spec=[]))
+        forecasting.get_processing_status = AsyncMock(side_effect=RuntimeError("boom"))
+
+        results = await asyncio.gather(
+            forecasting.wait_for_completion(),
+            forecasting.wait_for_completion(),
+            return_exceptions=True,
+        )
+
+        assert [str(r) for r in results] == ["boom", "boom"]
+        forecasting.get_processing_status.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_cancelling_last_waiter_stops_polling(self):
+        forecasting = Forecasting(Mock(spec=[]))
+        forecasting.get_processing_status = AsyncMock(return_value=_status(True, 30))
+
+        waiter = asyncio.create_task(forecasting.wait_for_completion(poll_interval=1))
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+        await asyncio.sleep(0)
+
+        assert forecasting._poller is not None
+        assert forecasting._poller.done()
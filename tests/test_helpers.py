@@ -121,12 +121,15 @@ class TestHelpersIntegration:
         assert hasattr(stocktrim_client.order_plan, "get_urgent_items")
         assert hasattr(stocktrim_client.order_plan, "get_by_supplier")
         assert hasattr(stocktrim_client.order_plan, "get_by_category")
+        assert hasattr(stocktrim_client.order_plan, "query_all")
+        assert hasattr(stocktrim_client.order_plan, "iter_query")
 
         # PurchaseOrdersV2
         assert hasattr(stocktrim_client.purchase_orders_v2, "generate_from_order_plan")
         assert hasattr(stocktrim_client.purchase_orders_v2, "get_all_paginated")
         assert hasattr(stocktrim_client.purchase_orders_v2, "get_by_reference")
         assert hasattr(stocktrim_client.purchase_orders_v2, "find_by_supplier")
+        assert hasattr(stocktrim_client.purchase_orders_v2, "iter_all")
 
         # Forecasting
         assert hasattr(stocktrim_client.forecasting, "run_calculations")
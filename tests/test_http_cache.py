@@ -0,0 +1,236 @@
+"""Tests for the conditional-request HTTP cache transport."""
+
+import asyncio
+import gzip
+import threading
+
+import httpx
+import pytest
+
+from stocktrim_public_api_client import HTTPCache
+from stocktrim_public_api_client.http_cache import cache_control
+from stocktrim_public_api_client.stocktrim_client import (
+    CachingTransport,
+    create_resilient_transport,
+)
+
+BASE_URL = "https://api.example.com"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class Upstream:
+    """Mock StockTrim returning a versioned body, optionally with validators."""
+
+    def __init__(self, etag: bool = True, cache_control: str | None = None):
+        self.etag = etag
+        self.cache_control = cache_control
+        self.version = 1
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if request.method != "GET":
+            self.version += 1
+            return httpx.Response(200, json={})
+        etag = f'"v{self.version}"'
+        if self.etag and request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304, headers={"ETag": etag})
+        headers = {"content-encoding": "gzip"}
+        if self.etag:
+            headers["ETag"] = etag
+        if self.cache_control:
+            headers["Cache-Control"] = self.cache_control
+        body = f'{{"version": {self.version}, "path": "{request.url.path}"}}'
+        return httpx.Response(
+            200, headers=headers, content=gzip.compress(body.encode())
+        )
+
+
+def _client(upstream: Upstream, cache: HTTPCache) -> httpx.AsyncClient:
+    transport = CachingTransport(cache, httpx.MockTransport(upstream))
+    return httpx.AsyncClient(transport=transport, base_url=BASE_URL)
+
+
+@pytest.mark.asyncio
+async def test_etag_responses_are_revalidated_and_replayed():
+    upstream = Upstream(etag=True)
+    cache = HTTPCache()
+
+    async with _client(upstream, cache) as client:
+        first = await client.get("/api/Products")
+        second = await client.get("/api/Products")
+        upstream.version = 2
+        third = await client.get("/api/Products")
+
+    assert first.json()["version"] == second.json()["version"] == 1
+    assert third.json()["version"] == 2
+    assert [r.headers.get("If-None-Match") for r in upstream.requests] == [
+        None,
+        '"v1"',
+        '"v1"',
+    ]
+    assert (cache.misses, cache.revalidated, cache.hits) == (2, 1, 0)
+    assert second.status_code == 200
+    assert second.headers["ETag"] == '"v1"'
+
+
+@pytest.mark.asyncio
+async def test_responses_without_validators_use_ttl():
+    clock = FakeClock()
+    upstream = Upstream(etag=False)
+    cache = HTTPCache(ttl=30, clock=clock)
+
+    async with _client(upstream, cache) as client:
+        await client.get("/api/Suppliers")
+        cached = await client.get("/api/Suppliers")
+        clock.now += 31
+        await client.get("/api/Suppliers")
+
+    assert cached.json()["version"] == 1
+    assert len(upstream.requests) == 2
+    assert cache.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_max_age_overrides_ttl_and_no_store_is_not_cached():
+    clock = FakeClock()
+    cache = HTTPCache(ttl=30, clock=clock)
+
+    short = Upstream(etag=False, cache_control="public, max-age=5")
+    async with _client(short, cache) as client:
+        await client.get("/api/Locations")
+        clock.now += 6
+        await client.get("/api/Locations")
+    assert len(short.requests) == 2
+
+    never = Upstream(etag=True, cache_control="no-store")
+    async with _client(never, cache) as client:
+        await client.get("/api/Customers")
+        await client.get("/api/Customers")
+    assert [r.headers.get("If-None-Match") for r in never.requests] == [None, None]
+
+
+@pytest.mark.asyncio
+async def test_successful_write_drops_cached_path():
+    upstream = Upstream(etag=False)
+    cache = HTTPCache(ttl=300)
+
+    async with _client(upstream, cache) as client:
+        await client.get("/api/Products", params={"code": "W-1"})
+        await client.get("/api/Suppliers")
+        await client.post("/api/Products", json={"code": "W-1"})
+        refreshed = await client.get("/api/Products", params={"code": "W-1"})
+        await client.get("/api/Suppliers")
+
+    assert refreshed.json()["version"] == 2
+    assert [(r.method, r.url.path) for r in upstream.requests] == [
+        ("GET", "/api/Products"),
+        ("GET", "/api/Suppliers"),
+        ("POST", "/api/Products"),
+        ("GET", "/api/Products"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_cache_keys_separate_tenants():
+    upstream = Upstream(etag=False)
+    cache = HTTPCache()
+
+    async with _client(upstream, cache) as client:
+        await client.get("/api/Products", headers={"api-auth-id": "tenant-a"})
+        await client.get("/api/Products", headers={"api-auth-id": "tenant-b"})
+
+    assert len(upstream.requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_disk_entries_survive_a_new_cache(tmp_path):
+    upstream = Upstream(etag=True)
+
+    async with _client(upstream, HTTPCache(directory=tmp_path)) as client:
+        await client.get("/api/Products")
+
+    restarted = HTTPCache(directory=tmp_path)
+    async with _client(upstream, restarted) as client:
+        response = await client.get("/api/Products")
+
+    assert response.json()["version"] == 1
+    assert upstream.requests[-1].headers["If-None-Match"] == '"v1"'
+    assert restarted.revalidated == 1
+
+    await restarted.invalidate_path("/api/Products")
+    assert not list(tmp_path.glob("*.entry"))
+
+
+@pytest.mark.asyncio
+async def test_memory_is_bounded_lru():
+    cache = HTTPCache(max_size=2)
+    for code in ["A", "B", "C"]:
+        request = httpx.Request("GET", f"{BASE_URL}/api/Products?code={code}")
+        await cache.store(cache.key_for(request), httpx.Response(200, content=b"{}"))
+
+    assert len(cache) == 2
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (None, (True, None)),
+        ("max-age=120", (True, 120.0)),
+        ("private, no-store", (False, None)),
+    ],
+)
+def test_cache_control(value, expected):
+    headers = httpx.Headers({"cache-control": value} if value else {})
+    assert cache_control(headers) == expected
+
+
+def test_resilient_transport_adds_caching_layer():
+    transport, _ = create_resilient_transport(
+        api_auth_signature="sig", http_cache=HTTPCache()
+    )
+
+    assert isinstance(transport._async_transport, CachingTransport)
+
+
+@pytest.mark.asyncio
+async def test_disk_io_runs_off_the_event_loop(tmp_path, monkeypatch):
+    threads: list[int] = []
+    write_disk = HTTPCache._write_disk
+
+    def recording_write(*args):
+        threads.append(threading.get_ident())
+        return write_disk(*args)
+
+    monkeypatch.setattr(HTTPCache, "_write_disk", staticmethod(recording_write))
+    cache = HTTPCache(directory=tmp_path)
+    request = httpx.Request("GET", f"{BASE_URL}/api/Products")
+    await cache.store(cache.key_for(request), httpx.Response(200, content=b"{}"))
+
+    assert threads and threading.get_ident() not in threads
+
+
+@pytest.mark.asyncio
+async def test_concurrent_writes_of_one_key_use_separate_temp_files(tmp_path):
+    cache = HTTPCache(directory=tmp_path)
+    key = cache.key_for(httpx.Request("GET", f"{BASE_URL}/api/Products"))
+
+    await asyncio.gather(
+        *(
+            cache.store(key, httpx.Response(200, content=f'{{"n": {n}}}'.encode()))
+            for n in range(8)
+        )
+    )
+
+    assert [f.name for f in tmp_path.iterdir()] == [f"{key}.entry"]
+    restarted = HTTPCache(directory=tmp_path)
+    entry = await restarted.get(key)
+    assert entry is not None
+    assert entry.content.startswith(b'{"n": ')
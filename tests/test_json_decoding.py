@@ -0,0 +1,123 @@
+"""Tests for selectable JSON response decoding."""
+
+import json
+import sys
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+
+from stocktrim_public_api_client import StockTrimClient
+from stocktrim_public_api_client.json_decoding import (
+    get_json_decoder,
+    install_json_decoder,
+)
+from stocktrim_public_api_client.stocktrim_client import (
+    JSONDecodingTransport,
+    create_resilient_transport,
+)
+
+
+def _find_layer(layer, layer_type):
+    """Walk the _wrapped_transport chain looking for ``layer_type``."""
+    while layer is not None:
+        if isinstance(layer, layer_type):
+            return layer
+        layer = getattr(layer, "_wrapped_transport", None)
+    return None
+
+
+class TestGetJsonDecoder:
+    def test_stdlib(self):
+        name, decode = get_json_decoder("stdlib")
+        assert name == "stdlib"
+        assert decode(b'{"a": [1, 2]}') == {"a": [1, 2]}
+
+    def test_orjson(self):
+        pytest.importorskip("orjson")
+        name, decode = get_json_decoder("orjson")
+        assert name == "orjson"
+        assert decode(b'{"a": 1.5}') == {"a": 1.5}
+
+    def test_auto_falls_back_to_stdlib(self, monkeypatch):
+        monkeypatch.setitem(sys.modules, "orjson", None)
+        monkeypatch.setitem(sys.modules, "msgspec", None)
+
+        assert get_json_decoder("auto")[0] == "stdlib"
+
+    def test_missing_backend_raises_import_error(self, monkeypatch):
+        monkeypatch.setitem(sys.modules, "msgspec", None)
+
+        with pytest.raises(ImportError, match="msgspec"):
+            get_json_decoder("msgspec")
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError, match="Unknown JSON decoder"):
+            get_json_decoder("simdjson")  # type: ignore[arg-type]
+
+    @pytest.mark.parametrize("backend", ["stdlib", "orjson", "msgspec"])
+    def test_decode_errors_are_json_decode_errors(self, backend):
+        pytest.importorskip("json" if backend == "stdlib" else backend)
+        _, decode = get_json_decoder(backend)
+
+        with pytest.raises(json.JSONDecodeError):
+            decode(b"{not json")
+
+
+class TestInstallJsonDecoder:
+    def test_response_json_uses_decoder(self):
+        response = httpx.Response(200, content=b'{"a": 1}')
+        calls = []
+
+        def decoder(content: bytes):
+            calls.append(content)
+            return json.loads(content)
+
+        install_json_decoder(response, decoder)
+
+        assert response.json() == {"a": 1}
+        assert calls == [b'{"a": 1}']
+
+    def test_keyword_arguments_use_stdlib(self):
+        response = httpx.Response(200, content=b'{"a": 1.5}')
+        install_json_decoder(response, lambda content: pytest.fail("not used"))
+
+        assert response.json(parse_float=str) == {"a": "1.5"}
+
+
+class TestJsonDecodingTransport:
+    @pytest.mark.asyncio
+    async def test_installs_decoder_on_responses(self):
+        wrapped = AsyncMock(spec=httpx.AsyncHTTPTransport)
+        wrapped.handle_async_request.return_value = httpx.Response(
+            200, content=b"[1, 2, 3]"
+        )
+        transport = JSONDecodingTransport(
+            decoder=lambda content: ["decoded"], wrapped_transport=wrapped
+        )
+
+        response = await transport.handle_async_request(
+            httpx.Request("GET", "https://example.com")
+        )
+
+        assert response.json() == ["decoded"]
+
+    def test_stdlib_adds_no_layer(self):
+        _, logging_layer = create_resilient_transport(api_auth_signature="sig")
+        assert _find_layer(logging_layer, JSONDecodingTransport) is None
+
+    def test_fast_decoder_adds_layer(self):
+        pytest.importorskip("orjson")
+        _, logging_layer = create_resilient_transport(
+            api_auth_signature="sig", json_decoder="orjson"
+        )
+        assert _find_layer(logging_layer, JSONDecodingTransport) is not None
+
+
+def test_client_json_decoder_option(mock_api_credentials, monkeypatch):
+    assert StockTrimClient(**mock_api_credentials).json_decoder == "stdlib"
+
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    monkeypatch.setitem(sys.modules, "msgspec", None)
+    client = StockTrimClient(**mock_api_credentials, json_decoder="auto")
+    assert client.json_decoder == "stdlib"
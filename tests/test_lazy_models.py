@@ -0,0 +1,202 @@
+"""Tests for lazily decoded model views."""
+
+import datetime
+import inspect
+import json
+from typing import ClassVar
+from unittest.mock import Mock
+
+import attrs
+import httpx
+import pytest
+
+from stocktrim_public_api_client.client_types import UNSET
+from stocktrim_public_api_client.generated.models import (
+    OrderPlanFilterCriteria,
+    ProductsResponseDto,
+    SkuOptimizedResultsDto,
+)
+from stocktrim_public_api_client.helpers.order_plan import OrderPlan
+from stocktrim_public_api_client.lazy_models import (
+    LazySkuOptimizedResultsDto,
+    json_keys,
+    lazy_model,
+)
+from stocktrim_public_api_client.utils import (
+    AuthenticationError,
+    ServerError,
+    ValidationError,
+)
+
+ROW = {
+    "productCode": "WIDGET-001",
+    "name": "Widget",
+    "orderQuantity": 5.0,
+    "calculatedDateTime": "2024-05-01T10:30:00Z",
+    "category": None,
+    "avgDailyOrdersLast120Days": 1.5,
+    "leadDemandPredictionBasedOn2ndOrderPolynomialRegression": 12.0,
+}
+
+
+class TestLazyModel:
+    def test_reads_match_eager_model(self):
+        lazy = LazySkuOptimizedResultsDto(ROW)
+        eager = SkuOptimizedResultsDto.from_dict(ROW)
+
+        for name in (
+            "product_code",
+            "name",
+            "order_quantity",
+            "calculated_date_time",
+            "category",
+            "avg_daily_orders_last_120_days",
+            "lead_demand_prediction_based_on_2_nd_order_polynomial_regression",
+            "location_name",
+        ):
+            assert getattr(lazy, name) == getattr(eager, name)
+
+    def test_decodes_on_first_access_only(self):
+        lazy = LazySkuOptimizedResultsDto(ROW)
+        assert lazy._values == {}
+
+        first = lazy.calculated_date_time
+        assert first == datetime.datetime(2024, 5, 1, 10, 30, tzinfo=datetime.UTC)
+        assert lazy.calculated_date_time is first
+        assert list(lazy._values) == ["calculated_date_time"]
+
+    def test_missing_field_is_unset(self):
+        assert LazySkuOptimizedResultsDto({}).product_code is UNSET
+
+    def test_unknown_attribute_raises(self):
+        with pytest.raises(AttributeError, match="no_such_field"):
+            _ = LazySkuOptimizedResultsDto(ROW).no_such_field
+
+    def test_to_model_and_to_dict(self):
+        lazy = LazySkuOptimizedResultsDto(ROW)
+
+        assert lazy.to_model() == SkuOptimizedResultsDto.from_dict(ROW)
+        assert lazy.to_model() is lazy.to_model()
+        assert lazy.to_dict() == ROW
+
+    def test_lazy_model_is_cached_per_class(self):
+        assert lazy_model(SkuOptimizedResultsDto) is LazySkuOptimizedResultsDto
+        lazy_product = lazy_model(ProductsResponseDto)
+        assert lazy_product.__name__ == "LazyProductsResponseDto"
+        assert lazy_product({"productId": "123"}).product_id == "123"
+
+    def test_json_keys_match_generated_to_dict(self):
+        for model in (SkuOptimizedResultsDto, ProductsResponseDto):
+            source = inspect.getsource(model.to_dict)
+            for key, _ in lazy_model(model)._fields.values():
+                assert f'"{key}"' in source
+
+    def test_json_keys_keep_numbers_attached(self):
+        keys = json_keys(SkuOptimizedResultsDto)
+
+        assert keys["avg_daily_orders_last_120_days"] == "avgDailyOrdersLast120Days"
+        assert keys["product_code"] == "productCode"
+
+    def test_json_keys_without_key_map_raise(self):
+        @attrs.define
+        class Handwritten:
+            product_code: str
+
+        with pytest.raises(TypeError, match="no _JSON_KEYS map"):
+            json_keys(Handwritten)
+
+    def test_json_keys_with_incomplete_key_map_raise(self):
+        @attrs.define
+        class Stale:
+            _JSON_KEYS: ClassVar[dict[str, str]] = {"product_code": "productCode"}
+            product_code: str
+            order_quantity: float
+
+        with pytest.raises(TypeError, match="no key for order_quantity"):
+            json_keys(Stale)
+
+
+def _order_plan_client(handler) -> Mock:
+    client = Mock()
+    client.raise_on_unexpected_status = False
+    client.get_async_httpx_client.return_value = httpx.AsyncClient(
+        base_url="https://api.test", transport=httpx.MockTransport(handler)
+    )
+    return client
+
+
+@pytest.mark.asyncio
+async def test_order_plan_query_lazy_returns_views():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"results": [ROW, ROW]})
+
+    rows = await OrderPlan(_order_plan_client(handler)).query(lazy=True)
+
+    assert [row.product_code for row in rows] == ["WIDGET-001", "WIDGET-001"]
+    assert all(isinstance(row, LazySkuOptimizedResultsDto) for row in rows)
+
+
+@pytest.mark.asyncio
+async def test_order_plan_query_all_lazy_follows_has_next_page():
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        page = body["page"]
+        return httpx.Response(
+            200,
+            json={
+                "results": [{**ROW, "productCode": f"P{page}"}],
+                "filterCriteria": {"page": page, "hasNextPage": page < 2},
+            },
+        )
+
+    rows = await OrderPlan(_order_plan_client(handler)).query_all(
+        OrderPlanFilterCriteria(), per_page=1, concurrency=1, lazy=True
+    )
+
+    assert [row.product_code for row in rows] == ["P0", "P1", "P2"]
+
+
+@pytest.mark.asyncio
+async def test_order_plan_query_lazy_raises_on_error_status():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(401, json={"title": "Unauthorized"})
+
+    with pytest.raises(AuthenticationError):
+        await OrderPlan(_order_plan_client(handler)).query(lazy=True)
+
+
+@pytest.mark.asyncio
+async def test_order_plan_query_lazy_posts_criteria_to_endpoint():
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json={"results": []})
+
+    await OrderPlan(_order_plan_client(handler)).query(
+        OrderPlanFilterCriteria(supplier="SUP-001"), lazy=True
+    )
+
+    assert seen[0].method == "POST"
+    assert seen[0].url.path == "/api/OrderPlan"
+    assert json.loads(seen[0].content) == {"supplier": "SUP-001"}
+
+
+@pytest.mark.asyncio
+async def test_order_plan_query_lazy_reports_problem_details():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            400, json={"title": "Bad filter", "detail": "Unknown supplier"}
+        )
+
+    with pytest.raises(ValidationError, match="Bad filter: Unknown supplier"):
+        await OrderPlan(_order_plan_client(handler)).query(lazy=True)
+
+
+@pytest.mark.asyncio
+async def test_order_plan_query_lazy_server_error_without_json():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(500, text="<html>oops</html>")
+
+    with pytest.raises(ServerError, match="oops"):
+        await OrderPlan(_order_plan_client(handler)).query(lazy=True)
@@ -0,0 +1,338 @@
+"""Tests for the concurrent pagination engine and the helpers built on it."""
+
+import asyncio
+from contextlib import aclosing
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from stocktrim_public_api_client.client_types import Unset
+from stocktrim_public_api_client.generated.models.order_plan_filter_criteria import (
+    OrderPlanFilterCriteria,
+)
+from stocktrim_public_api_client.generated.models.order_plan_results_dto import (
+    OrderPlanResultsDto,
+)
+from stocktrim_public_api_client.generated.models.sku_optimized_results_dto import (
+    SkuOptimizedResultsDto,
+)
+from stocktrim_public_api_client.helpers.order_plan import OrderPlan
+from stocktrim_public_api_client.helpers.pagination import (
+    Page,
+    iter_items,
+    iter_pages,
+    paginate,
+)
+from stocktrim_public_api_client.helpers.products import Products
+from stocktrim_public_api_client.helpers.purchase_orders_v2 import PurchaseOrdersV2
+from stocktrim_public_api_client.helpers.sales_orders import SalesOrders
+from stocktrim_public_api_client.helpers.suppliers import Suppliers
+from stocktrim_public_api_client.utils import NotFoundError
+
+
+class FakePages:
+    """Page source that serves ``total`` integers in pages of ``page_size``.
+
+    Later pages resolve faster than earlier ones so out-of-order completion is
+    exercised whenever several requests are in flight.
+    """
+
+    def __init__(self, total: int, page_size: int, *, missing_is_404: bool = False):
+        self.total = total
+        self.page_size = page_size
+        self.missing_is_404 = missing_is_404
+        self.requested: list[int] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def __call__(self, page: int) -> list[int]:
+        self.requested.append(page)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.001 * max(0, 10 - page))
+            start = page * self.page_size
+            if start >= self.total and self.missing_is_404:
+                raise NotFoundError("Not Found", 404)
+            return list(range(start, min(start + self.page_size, self.total)))
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("concurrency", [1, 3, 8])
+async def test_paginate_preserves_page_order(concurrency):
+    source = FakePages(total=237, page_size=50)
+
+    items = await paginate(source, page_size=50, concurrency=concurrency)
+
+    assert items == list(range(237))
+    assert source.max_in_flight <= concurrency
+
+
+@pytest.mark.asyncio
+async def test_paginate_sequential_requests_only_needed_pages():
+    source = FakePages(total=120, page_size=50)
+
+    await paginate(source, page_size=50, concurrency=1)
+
+    assert source.requested == [0, 1, 2]
+
+
+@pytest.mark.asyncio
+async def test_paginate_stops_on_empty_page_when_collection_is_exact_multiple():
+    source = FakePages(total=100, page_size=50)
+
+    items = await paginate(source, page_size=50, concurrency=4)
+
+    assert items == list(range(100))
+
+
+@pytest.mark.asyncio
+async def test_paginate_treats_404_as_end_of_collection():
+    source = FakePages(total=100, page_size=50, missing_is_404=True)
+
+    items = await paginate(source, page_size=50, concurrency=4)
+
+    assert items == list(range(100))
+
+
+@pytest.mark.asyncio
+async def test_paginate_propagates_other_errors():
+    async def fetch(page: int) -> list[int]:
+        if page == 1:
+            raise RuntimeError("boom")
+        return [page] * 10
+
+    with pytest.raises(RuntimeError, match="boom"):
+        await paginate(fetch, page_size=10, concurrency=3)
+
+
+@pytest.mark.asyncio
+async def test_iter_pages_cancels_requests_past_the_end():
+    cancelled: list[int] = []
+
+    async def fetch(page: int) -> list[int]:
+        if page == 0:
+            return [1, 2]
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(page)
+            raise
+        return []
+
+    pages = [page async for page in iter_pages(fetch, page_size=5, concurrency=3)]
+
+    assert pages == [[1, 2]]
+    assert sorted(cancelled) == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_iter_pages_rejects_invalid_concurrency():
+    with pytest.raises(ValueError, match="concurrency"):
+        await paginate(AsyncMock(return_value=[]), page_size=50, concurrency=0)
+
+
+@pytest.mark.asyncio
+async def test_products_get_all_paginated_fetches_concurrently(monkeypatch):
+    """get_all_paginated passes string page numbers and returns every page."""
+    source = FakePages(total=130, page_size=50)
+
+    async def fake_asyncio_detailed(*, client, code, page_no):
+        response = Mock()
+        response.status_code = 200 if int(page_no) * 50 < 130 else 404
+        response.parsed = await source(int(page_no))
+        return response
+
+    import stocktrim_public_api_client.generated.api.products.get_api_products as get_module
+
+    monkeypatch.setattr(get_module, "asyncio_detailed", fake_asyncio_detailed)
+
+    products = await Products(Mock()).get_all_paginated(concurrency=2)
+
+    assert products == list(range(130))
+    assert source.max_in_flight == 2
+
+
+@pytest.mark.asyncio
+async def test_iter_items_streams_in_order():
+    source = FakePages(total=75, page_size=10)
+
+    items = [item async for item in iter_items(source, page_size=10, concurrency=3)]
+
+    assert items == list(range(75))
+
+
+@pytest.mark.asyncio
+async def test_iter_items_early_close_cancels_outstanding_pages():
+    cancelled: list[int] = []
+
+    async def fetch(page: int) -> list[int]:
+        if page == 0:
+            return list(range(10))
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(page)
+            raise
+        return []
+
+    stream = iter_items(fetch, page_size=10, concurrency=3)
+    async with aclosing(stream):
+        async for item in stream:
+            if item == 2:
+                break
+
+    assert sorted(cancelled) == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_products_iter_all_yields_products(monkeypatch):
+    async def fake_asyncio_detailed(*, client, code, page_no):
+        response = Mock()
+        response.status_code = 200
+        response.parsed = list(range(int(page_no) * 50, int(page_no) * 50 + 50))[
+            : max(0, 60 - int(page_no) * 50)
+        ]
+        return response
+
+    import stocktrim_public_api_client.generated.api.products.get_api_products as get_module
+
+    monkeypatch.setattr(get_module, "asyncio_detailed", fake_asyncio_detailed)
+
+    products = [p async for p in Products(Mock()).iter_all()]
+
+    assert products == list(range(60))
+
+
+@pytest.mark.asyncio
+async def test_purchase_orders_v2_iter_all_stops_on_404(monkeypatch):
+    async def fake_asyncio_detailed(*, client, page, page_size, status):
+        response = Mock()
+        if page < 2:
+            response.status_code = 200
+            response.parsed = [f"po-{page}-{i}" for i in range(page_size)]
+        else:
+            response.status_code = 404
+            response.parsed = None
+            response.content = b""
+        return response
+
+    import stocktrim_public_api_client.generated.api.purchase_orders_v2.get_api_v2_purchase_orders as get_module
+
+    monkeypatch.setattr(get_module, "asyncio_detailed", fake_asyncio_detailed)
+
+    pos = [po async for po in PurchaseOrdersV2(Mock()).iter_all(page_size=5)]
+
+    assert len(pos) == 10
+    assert pos[0] == "po-0-0"
+    assert pos[-1] == "po-1-4"
+
+
+@pytest.mark.asyncio
+async def test_suppliers_iter_all_yields_bulk_results(monkeypatch):
+    response = Mock()
+    response.status_code = 200
+    response.parsed = ["SUP-001", "SUP-002"]
+
+    import stocktrim_public_api_client.generated.api.suppliers_bulk.get_api_suppliers_bulk as get_module
+
+    monkeypatch.setattr(
+        get_module, "asyncio_detailed", AsyncMock(return_value=response)
+    )
+
+    assert [s async for s in Suppliers(Mock()).iter_all()] == ["SUP-001", "SUP-002"]
+
+
+@pytest.mark.asyncio
+async def test_sales_orders_iter_all_yields_orders(monkeypatch):
+    response = Mock()
+    response.status_code = 200
+    response.parsed = ["SO-1", "SO-2", "SO-3"]
+
+    import stocktrim_public_api_client.generated.api.sales_orders.get_api_sales_orders as get_module
+
+    monkeypatch.setattr(
+        get_module, "asyncio_detailed", AsyncMock(return_value=response)
+    )
+
+    orders = [o async for o in SalesOrders(Mock()).iter_all(product_id="123")]
+
+    assert orders == ["SO-1", "SO-2", "SO-3"]
+
+
+@pytest.mark.asyncio
+async def test_page_has_next_overrides_short_page_rule():
+    """A server-reported has_next wins over the page-size heuristic."""
+    pages = {
+        0: Page([1, 2], has_next=True),
+        1: Page([3, 4, 5], has_next=True),
+        2: Page([6, 7, 8], has_next=False),
+    }
+
+    async def fetch(page: int) -> Page[int]:
+        return pages[page]
+
+    assert await paginate(fetch, page_size=3, concurrency=1) == [1, 2, 3, 4, 5, 6, 7, 8]
+
+
+def _order_plan_response(criteria, total: int):
+    """Build a fake order plan response for the requested page."""
+    start = criteria.page * criteria.per_page
+    rows = [
+        SkuOptimizedResultsDto(product_code=f"P{i}")
+        for i in range(start, min(start + criteria.per_page, total))
+    ]
+    response = Mock()
+    response.status_code = 200
+    response.parsed = OrderPlanResultsDto(
+        results=rows,
+        filter_criteria=OrderPlanFilterCriteria(
+            page=criteria.page,
+            per_page=criteria.per_page,
+            has_next_page=start + criteria.per_page < total,
+        ),
+    )
+    return response
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("concurrency", [1, 4])
+async def test_order_plan_query_all_follows_has_next_page(monkeypatch, concurrency):
+    requested: list[OrderPlanFilterCriteria] = []
+
+    async def fake_asyncio_detailed(*, client, body):
+        requested.append(body)
+        return _order_plan_response(body, total=25)
+
+    import stocktrim_public_api_client.generated.api.order_plan.post_api_order_plan as post_module
+
+    monkeypatch.setattr(post_module, "asyncio_detailed", fake_asyncio_detailed)
+
+    criteria = OrderPlanFilterCriteria(category="Widgets")
+    items = await OrderPlan(Mock()).query_all(
+        criteria, per_page=10, concurrency=concurrency
+    )
+
+    assert [item.product_code for item in items] == [f"P{i}" for i in range(25)]
+    assert all(body.category == "Widgets" for body in requested)
+    # The caller's criteria object is left untouched.
+    assert isinstance(criteria.page, Unset)
+
+
+@pytest.mark.asyncio
+async def test_order_plan_iter_query_starts_at_requested_page(monkeypatch):
+    async def fake_asyncio_detailed(*, client, body):
+        return _order_plan_response(body, total=30)
+
+    import stocktrim_public_api_client.generated.api.order_plan.post_api_order_plan as post_module
+
+    monkeypatch.setattr(post_module, "asyncio_detailed", fake_asyncio_detailed)
+
+    stream = OrderPlan(Mock()).iter_query(
+        OrderPlanFilterCriteria(page=1), per_page=10, concurrency=2
+    )
+    items = [item.product_code async for item in stream]
+
+    assert items == [f"P{i}" for i in range(10, 30)]
@@ -0,0 +1,144 @@
+"""Tests for the adaptive client-side rate limiter."""
+
+import httpx
+import pytest
+from httpx_retries import RetryTransport
+
+from stocktrim_public_api_client import AdaptiveRateLimiter
+from stocktrim_public_api_client.rate_limiting import parse_retry_after
+from stocktrim_public_api_client.stocktrim_client import (
+    IdempotentOnlyRetry,
+    RateLimitingTransport,
+    create_resilient_transport,
+)
+
+
+class FakeTime:
+    """Clock whose sleep advances time instantly and records each wait."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.sleeps.append(round(seconds, 6))
+        self.now += seconds
+
+
+def _limiter(clock: FakeTime, **kwargs) -> AdaptiveRateLimiter:
+    return AdaptiveRateLimiter(clock=clock, sleep=clock.sleep, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_acquire_allows_burst_then_paces_at_rate():
+    clock = FakeTime()
+    limiter = _limiter(clock, rate=2, burst=2)
+
+    for _ in range(4):
+        await limiter.acquire()
+
+    assert clock.sleeps == [0.5, 0.5]
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_burst_decreases_once():
+    clock = FakeTime()
+    limiter = _limiter(clock, rate=8, min_rate=1)
+    burst = [await limiter.acquire() for _ in range(3)]
+
+    for sent_at in burst:
+        limiter.on_rate_limited(sent_at)
+
+    assert limiter.rate == 4
+    assert limiter.throttled == 3
+
+    # A request sent after the slow-down that is rejected slows down again
+    sent_at = await limiter.acquire()
+    limiter.on_rate_limited(sent_at)
+    assert limiter.rate == 2
+
+
+def test_success_increases_rate_up_to_max():
+    limiter = AdaptiveRateLimiter(rate=2, min_rate=1, max_rate=2.25, increase=0.1)
+
+    limiter.on_success()
+    assert limiter.rate == pytest.approx(2.1)
+    for _ in range(5):
+        limiter.on_success()
+    assert limiter.rate == 2.25
+
+
+@pytest.mark.asyncio
+async def test_retry_after_holds_requests():
+    clock = FakeTime()
+    limiter = _limiter(clock, rate=100)
+    sent_at = await limiter.acquire()
+
+    limiter.on_rate_limited(sent_at, retry_after=3)
+    await limiter.acquire()
+
+    assert clock.now >= 3
+    assert clock.sleeps[0] == 3
+
+
+def test_invalid_settings_raise():
+    with pytest.raises(ValueError, match="rates"):
+        AdaptiveRateLimiter(rate=5, max_rate=1)
+    with pytest.raises(ValueError, match="burst"):
+        AdaptiveRateLimiter(burst=0.5)
+    with pytest.raises(ValueError, match="decrease"):
+        AdaptiveRateLimiter(decrease=1)
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("2", 2.0),
+        (" 1.5 ", 1.5),
+        ("-4", 0.0),
+        ("Thu, 01 Jan 1970 00:00:30 GMT", 20.0),
+        ("soon", None),
+        (None, None),
+    ],
+)
+def test_parse_retry_after(value, expected):
+    assert parse_retry_after(value, now=10.0) == expected
+
+
+@pytest.mark.asyncio
+async def test_transport_retries_rate_limited_post_and_adapts():
+    clock = FakeTime()
+    limiter = _limiter(clock, rate=4, min_rate=1, increase=0.5)
+    statuses = iter([429, 201])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(next(statuses), headers={"Retry-After": "0"})
+
+    retry = IdempotentOnlyRetry(
+        total=2, backoff_factor=0, status_forcelist=[429], allowed_methods=["POST"]
+    )
+    transport = RetryTransport(
+        transport=RateLimitingTransport(limiter, httpx.MockTransport(handler)),
+        retry=retry,
+    )
+
+    async with httpx.AsyncClient(transport=transport) as client:
+        response = await client.post("https://api.example.com/api/Products")
+
+    assert response.status_code == 201
+    assert limiter.throttled == 1
+    # Halved by the 429, then raised by the successful retry
+    assert limiter.rate == 2.5
+
+
+def test_resilient_transport_retries_429_only_with_limiter():
+    plain, _ = create_resilient_transport(api_auth_signature="sig")
+    limited, _ = create_resilient_transport(
+        api_auth_signature="sig", rate_limiter=AdaptiveRateLimiter()
+    )
+
+    assert 429 not in plain.retry.status_forcelist
+    assert 429 in limited.retry.status_forcelist
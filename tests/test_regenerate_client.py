@@ -0,0 +1,319 @@
+"""Tests for the post-processing rewrites in scripts/regenerate_client.py."""
+
+import importlib.util
+import textwrap
+import weakref
+from pathlib import Path
+
+import attrs
+import pytest
+
+_ROOT = Path(__file__).parent.parent
+_SCRIPT = _ROOT / "scripts" / "regenerate_client.py"
+_MODELS_DIR = _ROOT / "stocktrim_public_api_client" / "generated" / "models"
+
+
+@pytest.fixture(scope="module")
+def regen():
+    spec = importlib.util.spec_from_file_location("regenerate_client", _SCRIPT)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _run(source: str) -> dict:
+    """Execute generated model source and return its namespace."""
+    namespace: dict = {"__name__": "generated_snippet"}
+    exec(compile(source, "<generated>", "exec"), namespace)
+    return namespace
+
+
+MODEL = textwrap.dedent(
+    """\
+    from __future__ import annotations
+
+    from typing import Any, TypeVar
+
+    from attrs import define as _attrs_define
+
+    T = TypeVar("T", bound="Row")
+
+
+    class Unset:
+        pass
+
+
+    UNSET = Unset()
+
+
+    @_attrs_define
+    class Row:
+        product_id: str
+        avg_last_120_days: float | Unset = UNSET
+
+        def to_dict(self) -> dict[str, Any]:
+            product_id = self.product_id
+            avg_last_120_days = self.avg_last_120_days
+
+            field_dict: dict[str, Any] = {}
+            field_dict.update(
+                {
+                    "productId": product_id,
+                }
+            )
+            if avg_last_120_days is not UNSET:
+                field_dict["avgLast120Days"] = avg_last_120_days
+
+            return field_dict
+    """
+)
+
+
+class TestEmitJsonKeys:
+    def test_adds_key_map_from_to_dict(self, regen):
+        source = regen.emit_json_keys(MODEL)
+
+        row = _run(source)["Row"]
+        assert row._JSON_KEYS == {
+            "product_id": "productId",
+            "avg_last_120_days": "avgLast120Days",
+        }
+        assert "from typing import Any, ClassVar, TypeVar" in source
+        # ClassVar attributes are not attrs fields
+        assert row("P1").to_dict() == {"productId": "P1"}
+
+    def test_is_idempotent(self, regen):
+        once = regen.emit_json_keys(MODEL)
+
+        assert regen.emit_json_keys(once) == once
+
+    def test_enum_modules_are_unchanged(self, regen):
+        source = textwrap.dedent(
+            """\
+            from enum import StrEnum
+
+
+            class Status(StrEnum):
+                OPEN = "Open"
+            """
+        )
+
+        assert regen.emit_json_keys(source) == source
+
+
+PARSERS_MODEL = textwrap.dedent(
+    """\
+    from __future__ import annotations
+
+    from collections.abc import Mapping
+    from enum import StrEnum
+    from typing import Any, TypeVar, cast
+
+    from attrs import define as _attrs_define
+
+
+    class Unset:
+        def __bool__(self) -> bool:
+            return False
+
+        def __repr__(self) -> str:
+            return "UNSET"
+
+
+    UNSET: Any = Unset()
+
+
+    class Status(StrEnum):
+        OPEN = "Open"
+
+
+    T = TypeVar("T", bound="Row")
+
+
+    @_attrs_define
+    class Row:
+        name: None | str | Unset = UNSET
+        status: None | Status | Unset = UNSET
+        price: Decimal | None | Unset = UNSET
+        tag: None | str | Unset = UNSET
+
+        @classmethod
+        def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
+            from decimal import Decimal
+
+            d = dict(src_dict)
+
+            def _parse_name(data: object) -> None | str | Unset:
+                if data is None:
+                    return data
+                if isinstance(data, Unset):
+                    return data
+                return cast(None | str | Unset, data)
+
+            name = _parse_name(d.pop("name", UNSET))
+
+            def _parse_status(data: object) -> None | Status | Unset:
+                if data is None:
+                    return data
+                if isinstance(data, Unset):
+                    return data
+                return Status(data)
+
+            status = _parse_status(d.pop("status", UNSET))
+
+            def _parse_price(data: object) -> Decimal | None | Unset:
+                if data is None or isinstance(data, Unset):
+                    return data
+                return Decimal(str(data))
+
+            price = _parse_price(d.pop("price", UNSET))
+
+            def _parse_tag(data: object) -> None | str | Unset:
+                if data is None:
+                    return data
+                if isinstance(data, Unset):
+                    return data
+                return cast(None | str | Unset, data)
+
+            tag = _parse_tag(d.pop("tag", UNSET)) if "tag" in d else UNSET
+
+            return cls(name=name, status=status, price=price, tag=tag)
+    """
+)
+
+PAYLOADS = [
+    {},
+    {"name": "Widget", "status": "Open", "price": 1.5, "tag": "x"},
+    {"name": None, "status": None, "price": None, "tag": None},
+]
+
+
+class TestOptimizeFromDictParsers:
+    def test_passthrough_parser_is_inlined(self, regen):
+        source, inlined, _ = regen.optimize_from_dict_parsers(PARSERS_MODEL)
+
+        assert inlined == 1
+        assert "def _parse_name" not in source
+        assert 'name: None | str | Unset = d.pop("name", UNSET)' in source
+
+    def test_parser_using_module_names_is_hoisted(self, regen):
+        source, _, hoisted = regen.optimize_from_dict_parsers(PARSERS_MODEL)
+
+        assert hoisted == 1
+        assert "\ndef _parse_status(data: object)" in source
+        assert "            def _parse_status" not in source
+        assert 'status = _parse_status(d.pop("status", UNSET))' in source
+
+    def test_parser_using_local_imports_is_left_in_place(self, regen):
+        source, _, _ = regen.optimize_from_dict_parsers(PARSERS_MODEL)
+
+        assert "        def _parse_price(data: object)" in source
+
+    def test_parser_not_called_as_plain_assignment_is_left_in_place(self, regen):
+        source, _, _ = regen.optimize_from_dict_parsers(PARSERS_MODEL)
+
+        assert "        def _parse_tag(data: object)" in source
+        assert "tag = _parse_tag(" in source
+
+    def test_rewritten_model_parses_the_same(self, regen):
+        source, _, _ = regen.optimize_from_dict_parsers(PARSERS_MODEL)
+        original = _run(PARSERS_MODEL)["Row"]
+        rewritten = _run(source)["Row"]
+
+        for payload in PAYLOADS:
+            assert repr(rewritten.from_dict(payload)) == repr(
+                original.from_dict(payload)
+            )
+
+    def test_is_idempotent(self, regen):
+        once, _, _ = regen.optimize_from_dict_parsers(PARSERS_MODEL)
+
+        assert regen.optimize_from_dict_parsers(once) == (once, 0, 0)
+
+    def test_module_without_parsers_is_unchanged(self, regen):
+        source = "class Status:\n    OPEN = 'Open'\n"
+
+        assert regen.optimize_from_dict_parsers(source) == (source, 0, 0)
+
+    def test_checked_in_models_are_already_optimized(self, regen):
+        for model_file in sorted(_MODELS_DIR.glob("*.py")):
+            source = model_file.read_text()
+            assert regen.optimize_from_dict_parsers(source)[1:] == (0, 0), (
+                model_file.name
+            )
+
+
+def _generated_source(module: str) -> str:
+    """A checked-in generated model module, with absolute imports for exec."""
+    source = (_MODELS_DIR / f"{module}.py").read_text()
+    return source.replace(
+        "from ...client_types", "from stocktrim_public_api_client.client_types"
+    ).replace("from ..models.", "from stocktrim_public_api_client.generated.models.")
+
+
+class TestApplyModelOptions:
+    @pytest.fixture
+    def load(self, regen):
+        def load(module: str, class_name: str, **options: bool):
+            rewritten = regen.apply_model_options(_generated_source(module), **options)
+            return rewritten, _run(rewritten)[class_name]
+
+        return load
+
+    def test_no_options_leave_source_unchanged(self, regen):
+        source = _generated_source("problem_details")
+
+        assert regen.apply_model_options(source) == source
+
+    def test_frozen_models_reject_assignment(self, load):
+        source, model = load("problem_details", "ProblemDetails", frozen=True)
+
+        assert "@_attrs_define(frozen=True)\n" in source
+        problem = model.from_dict({"title": "Bad", "traceId": "abc"})
+        with pytest.raises(attrs.exceptions.FrozenInstanceError):
+            problem.title = "Other"
+        assert problem.to_dict() == {"title": "Bad", "traceId": "abc"}
+
+    def test_compact_models_have_no_weakref_slot(self, load):
+        source, model = load(
+            "processing_status_response_dto",
+            "ProcessingStatusResponseDto",
+            compact=True,
+        )
+
+        assert "@_attrs_define(weakref_slot=False)\n" in source
+        with pytest.raises(TypeError):
+            weakref.ref(model())
+
+    def test_compact_models_share_empty_additional_properties(self, load):
+        _, model = load("problem_details", "ProblemDetails", compact=True)
+
+        first = model.from_dict({"title": "A"})
+        second = model.from_dict({"title": "B"})
+        assert first.additional_properties is second.additional_properties
+
+        first["traceId"] = "abc"
+        assert first.to_dict() == {"title": "A", "traceId": "abc"}
+        assert second.to_dict() == {"title": "B"}
+        assert "traceId" not in second
+        with pytest.raises(KeyError):
+            del second["traceId"]
+
+    def test_compact_models_keep_unknown_keys(self, load):
+        _, model = load("problem_details", "ProblemDetails", compact=True)
+        payload = {"title": "Bad", "traceId": "abc"}
+
+        assert model.from_dict(payload).to_dict() == payload
+
+    def test_frozen_and_compact_together(self, load):
+        source, model = load(
+            "problem_details", "ProblemDetails", frozen=True, compact=True
+        )
+
+        assert "@_attrs_define(frozen=True, weakref_slot=False)\n" in source
+        problem = model.from_dict({"title": "Bad"})
+        problem["traceId"] = "abc"
+        assert problem.to_dict() == {"title": "Bad", "traceId": "abc"}
+        with pytest.raises(attrs.exceptions.FrozenInstanceError):
+            problem.title = "Other"
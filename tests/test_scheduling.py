@@ -0,0 +1,193 @@
+"""Tests for priority scheduling and per-endpoint concurrency limits."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from stocktrim_public_api_client import Priority, RequestScheduler, request_priority
+from stocktrim_public_api_client.scheduling import current_priority
+from stocktrim_public_api_client.stocktrim_client import SchedulingTransport
+
+
+async def _settle() -> None:
+    """Let every runnable task advance to its next wait."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_endpoint_limit_caps_only_that_endpoint():
+    scheduler = RequestScheduler(limits={"POST /api/OrderPlan": 2})
+    release = asyncio.Event()
+    running: list[str] = []
+
+    async def request(method: str, path: str) -> None:
+        async with scheduler.slot(method, path):
+            running.append(f"{method} {path}")
+            await release.wait()
+
+    tasks = [
+        asyncio.create_task(request("POST", "/api/OrderPlan")) for _ in range(4)
+    ] + [asyncio.create_task(request("GET", "/api/Products")) for _ in range(3)]
+    await _settle()
+
+    assert running.count("POST /api/OrderPlan") == 2
+    assert running.count("GET /api/Products") == 3
+    assert scheduler.queued == 2
+
+    release.set()
+    await asyncio.gather(*tasks)
+    assert scheduler.in_flight == 0
+    assert scheduler.queued == 0
+
+
+@pytest.mark.asyncio
+async def test_higher_priority_requests_jump_the_queue():
+    scheduler = RequestScheduler(max_concurrency=1)
+    admitted: list[str] = []
+    gate = asyncio.Event()
+
+    async def hold() -> None:
+        async with scheduler.slot("GET", "/api/Products"):
+            await gate.wait()
+
+    async def request(name: str, priority: Priority) -> None:
+        with request_priority(priority):
+            async with scheduler.slot("GET", "/api/Products"):
+                admitted.append(name)
+
+    holder = asyncio.create_task(hold())
+    await _settle()
+    tasks = [
+        asyncio.create_task(request("low", Priority.LOW)),
+        asyncio.create_task(request("normal-1", Priority.NORMAL)),
+        asyncio.create_task(request("high", Priority.HIGH)),
+        asyncio.create_task(request("normal-2", Priority.NORMAL)),
+    ]
+    await _settle()
+    assert admitted == []
+
+    gate.set()
+    await asyncio.gather(holder, *tasks)
+    assert admitted == ["high", "normal-1", "normal-2", "low"]
+
+
+@pytest.mark.asyncio
+async def test_endpoint_blocked_request_does_not_block_others():
+    scheduler = RequestScheduler(max_concurrency=2, limits={"/api/OrderPlan": 1})
+    gate = asyncio.Event()
+    admitted: list[str] = []
+
+    async def request(name: str, path: str, priority: Priority) -> None:
+        async with scheduler.slot("POST", path, priority=priority):
+            admitted.append(name)
+            await gate.wait()
+
+    tasks = [
+        asyncio.create_task(request("plan-1", "/api/OrderPlan", Priority.LOW)),
+        asyncio.create_task(request("plan-2", "/api/OrderPlan", Priority.HIGH)),
+        asyncio.create_task(request("products", "/api/Products", Priority.LOW)),
+    ]
+    await _settle()
+
+    assert admitted == ["plan-1", "products"]
+    gate.set()
+    await asyncio.gather(*tasks)
+    assert admitted == ["plan-1", "products", "plan-2"]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_leaves_the_queue():
+    scheduler = RequestScheduler(max_concurrency=1)
+    gate = asyncio.Event()
+
+    async def request() -> None:
+        async with scheduler.slot("GET", "/api/Products"):
+            await gate.wait()
+
+    holder = asyncio.create_task(request())
+    waiter = asyncio.create_task(request())
+    await _settle()
+    assert scheduler.queued == 1
+
+    waiter.cancel()
+    await asyncio.gather(waiter, return_exceptions=True)
+    assert scheduler.queued == 0
+
+    gate.set()
+    await holder
+    assert scheduler.in_flight == 0
+
+
+def test_endpoint_rules_match_method_and_subpaths():
+    scheduler = RequestScheduler(limits={"POST /api/OrderPlan": 2, "/api/Products/": 3})
+
+    assert scheduler.endpoint_for("post", "/api/orderplan") == "POST /api/OrderPlan"
+    assert scheduler.endpoint_for("GET", "/api/OrderPlan") is None
+    assert scheduler.endpoint_for("POST", "/api/OrderPlanV2") is None
+    assert scheduler.endpoint_for("DELETE", "/api/Products/123") == "/api/Products/"
+
+
+def test_invalid_settings_raise():
+    with pytest.raises(ValueError, match="max_concurrency"):
+        RequestScheduler(max_concurrency=0)
+    with pytest.raises(ValueError, match="at least 1"):
+        RequestScheduler(limits={"/api/OrderPlan": 0})
+    with pytest.raises(ValueError, match="METHOD"):
+        RequestScheduler(limits={"POST api/OrderPlan": 1})
+
+
+def test_request_priority_is_scoped():
+    assert current_priority() is Priority.NORMAL
+    with request_priority(Priority.LOW):
+        assert current_priority() is Priority.LOW
+    assert current_priority() is Priority.NORMAL
+
+
+@pytest.mark.asyncio
+async def test_scheduling_transport_holds_slot_for_request():
+    scheduler = RequestScheduler(limits={"/api/Products": 1})
+    seen: list[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(scheduler.in_flight)
+        return httpx.Response(200, json=[])
+
+    transport = SchedulingTransport(scheduler, httpx.MockTransport(handler))
+    async with httpx.AsyncClient(transport=transport) as client:
+        response = await client.get("https://api.example.com/api/Products")
+
+    assert response.status_code == 200
+    assert seen == [1]
+    assert scheduler.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_scheduling_transport_holds_slot_while_body_streams():
+    scheduler = RequestScheduler(limits={"/api/Products": 1})
+    streaming = 0
+    peak = 0
+
+    class SlowBody(httpx.AsyncByteStream):
+        async def __aiter__(self):
+            nonlocal streaming, peak
+            streaming += 1
+            peak = max(peak, streaming)
+            for chunk in (b"[", b"]"):
+                await _settle()
+                yield chunk
+            streaming -= 1
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, stream=SlowBody())
+
+    transport = SchedulingTransport(scheduler, httpx.MockTransport(handler))
+    async with httpx.AsyncClient(transport=transport) as client:
+        responses = await asyncio.gather(
+            *(client.get("https://api.example.com/api/Products") for _ in range(3))
+        )
+
+    assert [r.json() for r in responses] == [[], [], []]
+    assert peak == 1
+    assert scheduler.in_flight == 0
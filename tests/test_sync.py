@@ -0,0 +1,156 @@
+"""Tests for incremental product sync."""
+
+import gc
+import sqlite3
+from contextlib import aclosing
+from unittest.mock import Mock
+
+import pytest
+
+from stocktrim_public_api_client.generated.models.products_response_dto import (
+    ProductsResponseDto,
+)
+from stocktrim_public_api_client.sync import (
+    ChangeType,
+    ProductSync,
+    content_hash,
+)
+
+
+class FakeCatalog:
+    """Client stand-in whose products.iter_all() streams ``self.items``."""
+
+    def __init__(self, items: list[ProductsResponseDto]):
+        self.items = items
+        self.products = Mock()
+        self.products.iter_all = self._iter_all
+
+    async def _iter_all(self, concurrency: int = 4):
+        for item in list(self.items):
+            yield item
+
+
+def _product(product_id: str, name: str = "Widget") -> ProductsResponseDto:
+    return ProductsResponseDto(
+        product_id=product_id, product_code_readable=product_id, name=name
+    )
+
+
+async def _changes(sync: ProductSync) -> list[tuple[ChangeType, str]]:
+    return [(c.type, c.product_id) async for c in sync.iter_changes()]
+
+
+@pytest.mark.asyncio
+async def test_first_sync_reports_everything_as_added():
+    client = FakeCatalog([_product("A"), _product("B")])
+
+    with ProductSync(client, ":memory:") as sync:
+        assert sync.watermark is None
+        report = await sync.run()
+
+        assert (report.added, report.changed, report.removed) == (2, 0, 0)
+        assert sync.watermark == report.watermark
+        assert len(sync) == 2
+
+
+@pytest.mark.asyncio
+async def test_subsequent_sync_reports_only_churn():
+    client = FakeCatalog([_product("A"), _product("B"), _product("C")])
+
+    with ProductSync(client, ":memory:") as sync:
+        await sync.run()
+        client.items = [_product("A"), _product("B", name="Renamed"), _product("D")]
+
+        changes = await _changes(sync)
+
+        assert changes == [
+            (ChangeType.CHANGED, "B"),
+            (ChangeType.ADDED, "D"),
+            (ChangeType.REMOVED, "C"),
+        ]
+        assert await _changes(sync) == []
+
+
+@pytest.mark.asyncio
+async def test_removed_event_carries_last_stored_product():
+    client = FakeCatalog([_product("A", name="Old name")])
+
+    with ProductSync(client, ":memory:") as sync:
+        await sync.run()
+        client.items = []
+
+        changes = [c async for c in sync.iter_changes()]
+
+        assert len(changes) == 1
+        assert changes[0].type is ChangeType.REMOVED
+        assert changes[0].product.name == "Old name"
+
+
+@pytest.mark.asyncio
+async def test_interrupted_sync_leaves_snapshot_untouched():
+    client = FakeCatalog([_product("A")])
+
+    with ProductSync(client, ":memory:") as sync:
+        first = await sync.run()
+        client.items = [_product("A", name="Changed"), _product("B")]
+
+        stream = sync.iter_changes()
+        async with aclosing(stream):
+            async for _ in stream:
+                break  # consumer stops early
+
+        assert sync.watermark == first.watermark
+        report = await sync.run()
+        assert (report.added, report.changed, report.unchanged) == (1, 1, 0)
+
+
+@pytest.mark.asyncio
+async def test_snapshot_persists_across_instances(tmp_path):
+    path = tmp_path / "products.sqlite3"
+    client = FakeCatalog([_product("A"), _product("B")])
+
+    with ProductSync(client, path) as sync:
+        await sync.run()
+
+    with ProductSync(client, path) as sync:
+        report = await sync.run()
+
+    assert report.total_changes == 0
+    assert report.unchanged == 2
+
+
+def test_content_hash_ignores_object_identity():
+    assert content_hash(_product("A")) == content_hash(_product("A"))
+    assert content_hash(_product("A")) != content_hash(_product("A", name="Other"))
+
+
+@pytest.mark.asyncio
+async def test_database_is_not_locked_while_events_are_handled(tmp_path):
+    path = tmp_path / "products.sqlite3"
+    client = FakeCatalog([_product("A"), _product("B")])
+
+    with ProductSync(client, path) as sync:
+        async for _ in sync.iter_changes():
+            # Another writer (e.g. the consumer's own bookkeeping) isn't blocked
+            other = sqlite3.connect(path, timeout=0)
+            with other:
+                other.execute("INSERT OR REPLACE INTO meta VALUES ('note', 'x')")
+            other.close()
+
+        assert len(sync) == 2
+
+
+@pytest.mark.asyncio
+async def test_abandoned_sync_writes_nothing(tmp_path):
+    path = tmp_path / "products.sqlite3"
+    client = FakeCatalog([_product("A")])
+
+    with ProductSync(client, path) as sync:
+        stream = sync.iter_changes()
+        await anext(stream)
+        del stream  # dropped without aclosing()
+        gc.collect()
+
+        assert len(sync) == 0
+        assert sync.watermark is None
+        assert (await sync.run()).added == 1